@@ -6,6 +6,9 @@ Collection of tools for analysis of Craig-Bampton models.
 import math
 from collections import abc
 import numbers
+from io import StringIO
+import multiprocessing as mp
+from multiprocessing.pool import ThreadPool
 from types import SimpleNamespace
 from warnings import warn
 import numpy as np
@@ -458,12 +461,20 @@ def uset_convert(uset, ref=None, conv="m2e"):
     uset.iloc[pv, 1:] *= lengthconv
     pv = dof == 3
     uset.iloc[pv, 1:] *= lengthconv
+    return uset, _convert_ref(ref, lengthconv)
+
+
+def _convert_ref(ref, lengthconv):
+    """
+    Utility for :func:`uset_convert`: convert `ref` if it is a
+    3-element location
+    """
     try:
         if len(ref) == 3:
             ref = np.atleast_1d(ref) * lengthconv
     except TypeError:
         pass
-    return uset, ref
+    return ref
 
 
 def cbconvert(M, b, conv="m2e", drm=False):
@@ -2006,30 +2017,27 @@ def rbdispchk(
     return _rbdispchk(f, rbdisp, grids, ttl, verbose, tol)
 
 
-@ytools.write_text_file
-def _cbcoordchk(fout, K, bset, refpoint, grids, ttl, verbose, rb_normalizer):
-    """
-    Routine used by :func:`cbcoordchk`. See documentation for
-    :func:`cbcoordchk`.
+def _refpoint_rbmodes(kbb, refpoint):
     """
-    lt = np.size(K, 0)
-    lb = len(bset)
-    lq = lt - lb
+    Utility for :func:`cbcoordchk` and :class:`CBCheck`: solve for the
+    stiffness-based rigid-body modes of the b-set relative to
+    `refpoint`
 
+    Returns ``(rbmodes, krr, rhs)`` where `rbmodes` is b-set x 6 and
+    `krr` and `rhs` are the two sides of the reference point check
+    (None if all b-set DOF are in `refpoint`).
+    """
+    lb = kbb.shape[0]
     if (lb // 6) * 6 != lb:
         raise ValueError("b-set not a multiple of 6.")
 
     if len(refpoint) != 6:
         raise ValueError("reference point must have length of 6.")
 
-    # make refpoint be relative to b-set:
-    refpoint = refpoint - np.min(bset)
-
-    kbb = K[np.ix_(bset, bset)]
     o = locate.flippv(refpoint, lb)
     rbmodes = np.zeros((lb, 6))
     rbmodes[refpoint] = np.eye(6)
-    refpoint_chk = "pass"
+    krr = rhs = None
 
     if o.size > 0:
         kor = kbb[np.ix_(o, refpoint)]
@@ -2044,6 +2052,31 @@ def _cbcoordchk(fout, K, bset, refpoint, grids, ttl, verbose, rb_normalizer):
         #   krr - kro @ inv(koo) @ kor
         krr = kbb[np.ix_(refpoint, refpoint)]
         rhs = -kor.T @ rbmodes[o]
+    return rbmodes, krr, rhs
+
+
+@ytools.write_text_file
+def _cbcoordchk(
+    fout, K, bset, refpoint, grids, ttl, verbose, rb_normalizer, rbsol=None
+):
+    """
+    Routine used by :func:`cbcoordchk`. See documentation for
+    :func:`cbcoordchk`. `rbsol` is the output of
+    :func:`_refpoint_rbmodes` if it has already been computed.
+    """
+    lt = np.size(K, 0)
+    lb = len(bset)
+    lq = lt - lb
+
+    # make refpoint be relative to b-set:
+    refpoint = refpoint - np.min(bset)
+
+    if rbsol is None:
+        rbsol = _refpoint_rbmodes(K[np.ix_(bset, bset)], refpoint)
+    rbmodes, krr, rhs = rbsol
+    refpoint_chk = "pass"
+
+    if krr is not None:
         if not np.allclose(krr, rhs, atol=abs(krr).max() * 1e-8):
             refpoint_chk = "fail"
 
@@ -2272,7 +2305,6 @@ def _solve_eig(fout, k, m, mtype, ktype, types):
     return w, v
 
 
-@ytools.write_text_file
 def cbcheck(
     f,
     Mcb,
@@ -2285,6 +2317,7 @@ def cbcheck(
     em_filt=0,
     rb_norm=None,
     reorder=True,
+    ncpu=None,
 ):
     """
     Run model checks on Craig-Bampton mass and stiffness matrices.
@@ -2373,6 +2406,11 @@ def cbcheck(
         in :func:`cbcoordchk` for the "rb_normalizer" input.
     reorder : bool; optional
         If True, reordering is allowed.
+    ncpu : integer or None; optional
+        Maximum number of threads to use for computing the free-free
+        eigensolution and the rigid-body modes concurrently. If None,
+        it is set to :func:`multiprocessing.cpu_count`. See
+        :class:`CBCheck`.
 
     Returns
     -------
@@ -2456,6 +2494,12 @@ def cbcheck(
 
     Pay special attention to any warning messages.
 
+    This routine creates a :class:`CBCheck` object and calls its
+    :func:`CBCheck.run` method. To run the checks more than once on
+    the same model (for example, with different `bref` or `uref`),
+    use :class:`CBCheck` directly so the eigensolution and
+    rigid-body modes are only computed once.
+
     Example usage::
 
         import numpy as np
@@ -2477,77 +2521,269 @@ def cbcheck(
 
     See also
     --------
-    :func:`rbmultchk`, :func:`rbdispchk`, :func:`cbcoordchk`,
-    :func:`pyyeti.nastran.n2p.addgrid`, :func:`cbconvert`,
-    :func:`cbreorder`, :func:`pyyeti.nastran.op2.OP2.rdn2cop2`
+    :class:`CBCheck`, :func:`rbmultchk`, :func:`rbdispchk`,
+    :func:`cbcoordchk`, :func:`pyyeti.nastran.n2p.addgrid`,
+    :func:`cbconvert`, :func:`cbreorder`,
+    :func:`pyyeti.nastran.op2.OP2.rdn2cop2`
     """
-    n = np.size(Mcb, 0)
+    chk = CBCheck(Mcb, Kcb, bseto, uset=uset, conv=conv, reorder=reorder)
+    return chk.run(f, bref, uref, em_filt=em_filt, rb_norm=rb_norm, ncpu=ncpu)
 
-    # check matrix properties:
-    mtype, types = ytools.mattype(Mcb)
-    ktype = ytools.mattype(Kcb)[0]
-    if mtype & types["symmetric"]:
+
+class CBCheck:
+    """
+    Craig-Bampton model check session with cached decompositions.
+
+    This class does the setup work of :func:`cbcheck` (matrix type
+    checks, unit conversion and reordering) once, and then caches the
+    expensive parts of the checks as they are computed: the free-free
+    eigensolution, the stiffness-based rigid-body modes for each
+    reference set (from the KBB partition), and the geometry-based
+    rigid-body modes for each reference. Calling :func:`run`
+    repeatedly -- for example, to try different `bref`, `uref`,
+    `rb_norm` or `em_filt` settings -- only computes what is not
+    already in the cache.
+
+    Parameters
+    ----------
+    Mcb : 2d ndarray
+        Craig-Bampton mass; see :func:`cbcheck`.
+    Kcb : 2d ndarray
+        Craig-Bampton stiffness; see :func:`cbcheck`.
+    bseto : 1d ndarray
+        Index partition vector specifying location and order of b-set
+        DOF in `Mcb` and `Kcb`; see :func:`cbcheck`.
+    uset : pandas DataFrame; optional for single point interface
+        The b-set USET table; see :func:`cbcheck`.
+    conv : None or 2-element array_like or string; optional
+        Unit conversion option; see :func:`cbcheck`.
+    reorder : bool; optional
+        If True, reordering is allowed; see :func:`cbcheck`.
+
+    Attributes
+    ----------
+    m : 2d ndarray
+        Reordered and converted version of `Mcb`
+    k : 2d ndarray
+        Reordered and converted version of `Kcb`
+    bset : 1d ndarray
+        Location of b-set in `m` and `k`
+    qset : 1d ndarray
+        Location of q-set in `m` and `k`
+    uset : pandas DataFrame
+        Converted, reordered version of the input `uset`
+
+    Notes
+    -----
+    :func:`cbcheck` is a thin wrapper around this class::
+
+        CBCheck(Mcb, Kcb, bseto, uset, conv, reorder).run(
+            f, bref, uref, em_filt, rb_norm)
+
+    The independent decompositions needed by :func:`run` (the
+    eigensolution, the stiffness-based rigid-body modes and the
+    geometry-based rigid-body modes) are computed concurrently in a
+    thread pool; the numpy/scipy linear algebra routines release the
+    GIL. The printed report is the same as that from
+    :func:`cbcheck`.
+
+    The arrays stored in the cache should not be modified.
+
+    Example usage::
+
+        from pyyeti import cb
+        chk = cb.CBCheck(m, k, b, uset=uset)
+        out1 = chk.run('ref1.cbcheck', b[:6])
+        # reuses the eigensolution from above:
+        out2 = chk.run('ref2.cbcheck', b[6:12], uref=[0, 0, 0])
+
+    See also
+    --------
+    :func:`cbcheck`, :func:`cbcoordchk`, :func:`rbdispchk`
+    """
+
+    def __init__(self, Mcb, Kcb, bseto, uset=None, conv=None, reorder=True):
+        n = np.size(Mcb, 0)
+
+        # check matrix properties:
+        self.mtype, self.types = ytools.mattype(Mcb)
+        self.ktype = ytools.mattype(Kcb)[0]
+
+        # some input checks:
+        self._uset_none = uset is None
+        if uset is None:
+            uset = n2p.addgrid(None, 1, "b", 0, [0, 0, 0], 0)
+
+        nb = len(bseto)
+        if uset.shape[0] != nb:
+            raise ValueError(
+                f"number of rows in `uset` is {uset.shape[0]}, but must "
+                f"equal len(b-set) ({nb})"
+            )
+
+        # convert units if necessary:
+        if conv is not None:
+            m = cbconvert(Mcb, bseto, conv)
+            k = cbconvert(Kcb, bseto, conv)
+            uset = uset_convert(uset, None, conv)[0]
+        else:
+            m = Mcb
+            k = Kcb
+
+        if reorder:
+            # reorder mass and stiffness:
+            m = cbreorder(m, bseto)
+            k = cbreorder(k, bseto)
+            i = np.argsort(bseto)
+            uset = uset.iloc[i]
+            bset = np.arange(nb)
+        else:
+            bset = np.sort(bseto)
+            if not (bset == bseto).all():
+                raise ValueError(
+                    "when `reorder` is False, `bseto` must be in ascending order"
+                )
+
+        self.m = m
+        self.k = k
+        self.bset = bset
+        self.qset = locate.flippv(bset, n)
+        self.uset = uset
+        self._n = n
+        self._bseto = np.asarray(bseto)
+        self._conv = conv
+        self._reorder = reorder
+        self._kbb = k[np.ix_(bset, bset)]
+
+        # caches:
+        self._eig = None
+        self._rbs = {}
+        self._rbg = {}
+
+    def _get_bref(self, bref):
+        """Return `bref` relative to the (possibly reordered) model"""
+        if self._reorder:
+            b = locate.index2bool(bref, self._n)
+            return np.nonzero(b[self._bseto])[0]  # where ref is in new bset
+        return np.atleast_1d(bref)
+
+    def _get_uref(self, uref):
+        """Return `uref` (after unit conversion) and its cache key"""
+        if self._uset_none:
+            uref = 1
+        if self._conv is not None:
+            uref = _convert_ref(uref, _get_conv_factors(self._conv)[0])
+        if isinstance(uref, numbers.Integral):
+            return uref, int(uref)
+        return uref, tuple(np.atleast_1d(uref).astype(float))
+
+    def _solve_eig(self):
+        with StringIO() as fout:
+            w, v = _solve_eig(fout, self.k, self.m, self.mtype, self.ktype, self.types)
+            self._eig = (w, v, fout.getvalue())
+
+    def _solve_rbs(self, bref):
+        refpoint = bref - np.min(self.bset)
+        self._rbs[tuple(bref)] = _refpoint_rbmodes(self._kbb, refpoint)
+
+    def _solve_rbg(self, uref, key):
+        self._rbg[key] = n2p.rbgeom_uset(self.uset, uref)
+
+    def _prepare(self, bref, uref, urefkey, ncpu):
+        """
+        Compute the decompositions needed for `bref` and `uref` that
+        are not already cached; independent ones run concurrently
+        """
+        tasks = []
+        if self._eig is None:
+            tasks.append(self._solve_eig)
+        if tuple(bref) not in self._rbs:
+            tasks.append(lambda: self._solve_rbs(bref))
+        if urefkey not in self._rbg:
+            tasks.append(lambda: self._solve_rbg(uref, urefkey))
+        if ncpu is None:
+            ncpu = mp.cpu_count()
+        ncpu = max(1, min(ncpu, len(tasks)))
+        if ncpu == 1:
+            for task in tasks:
+                task()
+        else:
+            with ThreadPool(ncpu) as pool:
+                # .get() re-raises any exception from the tasks:
+                pool.map_async(lambda task: task(), tasks).get()
+
+    def run(self, f, bref, uref=(0, 0, 0), em_filt=0, rb_norm=None, ncpu=None):
+        """
+        Run the Craig-Bampton model checks
+
+        Parameters
+        ----------
+        f : string or file_like or 1 or None
+            Output file; see :func:`cbcheck`.
+        bref : 1d ndarray
+            6-element subset of `bseto` defining the reference DOF;
+            see :func:`cbcheck`. These are relative to the original
+            (input) DOF order.
+        uref : integer or array_like; optional
+            Reference for the geometry-based rigid-body modes; see
+            :func:`cbcheck`. Ignored (set to 1) if `uset` was None.
+        em_filt : scalar; optional
+            Effective mass print filter; see :func:`cbcheck`.
+        rb_norm : bool or None; optional
+            Rigid-body mode normalization option; see
+            :func:`cbcheck`.
+        ncpu : integer or None; optional
+            Maximum number of threads to use for computing the
+            independent decompositions. If None, it is set to
+            :func:`multiprocessing.cpu_count`. Use 1 to compute them
+            sequentially.
+
+        Returns
+        -------
+        SimpleNamespace
+            Same as the output of :func:`cbcheck`.
+        """
+        return _cbcheck_report(f, self, bref, uref, em_filt, rb_norm, ncpu)
+
+
+@ytools.write_text_file
+def _cbcheck_report(f, chk, bref, uref, em_filt, rb_norm, ncpu):
+    """
+    Routine used by :func:`CBCheck.run`. See documentation for
+    :func:`cbcheck`.
+    """
+    types = chk.types
+    if chk.mtype & types["symmetric"]:
         f.write("Mass matrix is symmetric.\n")
     else:
         f.write("Warning: mass matrix is not symmetric.\n")
-    if mtype & types["posdef"]:
+    if chk.mtype & types["posdef"]:
         f.write("Mass matrix is positive definite.\n")
     else:
         f.write("Warning: mass matrix is not positive definite.\n")
-    if ktype & types["symmetric"]:
+    if chk.ktype & types["symmetric"]:
         f.write("Stiffness matrix is symmetric.\n")
     else:
         f.write("Warning: stiffness matrix is not symmetric.\n")
 
-    # some input checks:
-    if uset is None:
-        uset = n2p.addgrid(None, 1, "b", 0, [0, 0, 0], 0)
-        uref = 1
-
-    nb = len(bseto)
-    if uset.shape[0] != nb:
-        raise ValueError(
-            f"number of rows in `uset` is {uset.shape[0]}, but must "
-            f"equal len(b-set) ({nb})"
-        )
-
-    # convert units if necessary:
-    if conv is not None:
-        m = cbconvert(Mcb, bseto, conv)
-        k = cbconvert(Kcb, bseto, conv)
-        uset, uref = uset_convert(uset, uref, conv)
-    else:
-        m = Mcb
-        k = Kcb
-
-    if reorder:
-        # reorder mass and stiffness:
-        m = cbreorder(m, bseto)
-        k = cbreorder(k, bseto)
-        i = np.argsort(bseto)
-        uset = uset.iloc[i]
-
-        # define "new" order of b-set:
-        b = locate.index2bool(bref, n)
-        bset = np.arange(nb)
-        bref = np.nonzero(b[bseto])[0]  # where ref is in new bset
-    else:
-        bset = np.sort(bseto)
-        if not (bset == bseto).all():
-            raise ValueError(
-                "when `reorder` is False, `bseto` must be in ascending order"
-            )
+    m = chk.m
+    k = chk.k
+    bset = chk.bset
+    qset = chk.qset
+    uset = chk.uset
+    bref = chk._get_bref(bref)
+    uref, urefkey = chk._get_uref(uref)
+    chk._prepare(bref, uref, urefkey, ncpu)
 
     # check for appropriate zeros:
-    qset = locate.flippv(bset, n)
     nq = len(qset)
-    B = np.ix_(bset, bset)
     Q = np.ix_(qset, qset)
     QB = np.ix_(qset, bset)
-    mbb = m[B]
+    mbb = m[np.ix_(bset, bset)]
     mqq = m[Q]
-    kbb = k[B]
+    kbb = chk._kbb
     kqq = k[Q]
+    nb = len(bset)
     error_flag = 0
     mattol = 1.0e-12
 
@@ -2642,7 +2878,7 @@ def cbcheck(
     # and stiffness grounding checks.
 
     # use geometry to generate a set of rb-modes:
-    rbg = n2p.rbgeom_uset(uset, uref)
+    rbg = chk._rbg[urefkey]
 
     if rb_norm is None:
         if np.any(np.diff(bref) != 1):
@@ -2665,20 +2901,23 @@ def cbcheck(
         )
 
     # coordinates of boundary points according to stiffness:
-    c_chk = cbcoordchk(
+    rbsol, krr, rhs = chk._rbs[tuple(bref)]
+    c_chk = _cbcoordchk(
+        f,
         k,
         bset,
         bref,
         uset.index.get_level_values("id")[::6],
         ttl,
         True,
-        f,
         rb_normalizer,
+        rbsol=(rbsol.copy(), krr, rhs),
     )
     rbs = c_chk.rbmodes
 
-    # calculate free-free modes:
-    w, v = _solve_eig(f, k, m, mtype, ktype, types)
+    # free-free modes:
+    w, v, eigmsg = chk._eig
+    f.write(eigmsg)
 
     # assuming 6 rigid-body modes
     rbe = linalg.solve(v[bref, :6].T, v[:, :6].T).T
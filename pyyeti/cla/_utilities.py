@@ -5,6 +5,7 @@ from collections import OrderedDict
 from types import SimpleNamespace
 from keyword import iskeyword
 import datetime
+import os
 import importlib
 import numpy as np
 from pyyeti import locate
@@ -13,6 +14,7 @@ from pyyeti import locate
 __all__ = [
     "_is_valid_identifier",
     "get_drfunc",
+    "clear_drfunc_cache",
     "_merge_uf_reds",
     "_get_rpt_headers",
     "_get_numform",
@@ -43,6 +45,11 @@ def _is_valid_identifier(name):
     return name.isidentifier() and not iskeyword(name)
 
 
+# cache of data recovery modules and string functions; see
+# :func:`get_drfunc` and :func:`clear_drfunc_cache`:
+_DRFUNC_CACHE = {}
+
+
 def get_drfunc(filename, funcname, get_psd=False):
     """
     Get data recovery function(s)
@@ -64,14 +71,31 @@ def get_drfunc(filename, funcname, get_psd=False):
     psd_drfunc : function or None; optional
         The PSD-specific data recovery function or None if no such
         function was defined; only returned if `get_psd` is True.
+
+    Notes
+    -----
+    The data recovery modules are cached: `filename` is only
+    executed again if its modification time or size has changed
+    since the last call. Likewise, functions defined by a string
+    (when `funcname` is not a valid identifier) are only compiled
+    once. Since :func:`DR_Results.time_data_recovery` (and similar)
+    get the data recovery functions for every category and every
+    case, this saves many module executions. Use
+    :func:`clear_drfunc_cache` to force a reload.
     """
     if _is_valid_identifier(funcname):
         # force a proper exception if file doesn't exist:
-        with open(filename, "r") as _:
-            pass
-        spec = importlib.util.spec_from_file_location("has_drfuncs", filename)
-        drmod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(drmod)
+        st = os.stat(filename)
+        path = os.path.abspath(filename)
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = _DRFUNC_CACHE.get(path)
+        if entry is None or entry[0] != stamp:
+            spec = importlib.util.spec_from_file_location("has_drfuncs", filename)
+            drmod = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(drmod)
+            _DRFUNC_CACHE[path] = stamp, drmod
+        else:
+            drmod = entry[1]
         func = getattr(drmod, funcname)
         if get_psd:
             psdfunc = getattr(drmod, funcname + "_psd", None)
@@ -79,12 +103,45 @@ def get_drfunc(filename, funcname, get_psd=False):
         return func
 
     # build function and return it:
-    strfunc = "def _func(sol, nas, Vars, se):\n    return " + funcname.strip()
-    g = globals()
-    exec(strfunc, g)
+    key = (None, funcname)
+    func = _DRFUNC_CACHE.get(key)
+    if func is None:
+        strfunc = "def _func(sol, nas, Vars, se):\n    return " + funcname.strip()
+        g = globals()
+        exec(strfunc, g)
+        func = _DRFUNC_CACHE[key] = g["_func"]
     if get_psd:
-        return g["_func"], None
-    return g["_func"]
+        return func, None
+    return func
+
+
+def clear_drfunc_cache(filename=None):
+    """
+    Clear the cache used by :func:`get_drfunc`
+
+    Parameters
+    ----------
+    filename : string or None; optional
+        If None, the entire cache is cleared (including the string
+        functions). Otherwise, only the entry for `filename` is
+        removed (if present) so it will be executed again on the
+        next call to :func:`get_drfunc`.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    Files are automatically reloaded when their modification time
+    or size changes. Clearing the cache is only needed if a file
+    is changed without changing either of those or if some other
+    dependency of the file has changed.
+    """
+    if filename is None:
+        _DRFUNC_CACHE.clear()
+    else:
+        _DRFUNC_CACHE.pop(os.path.abspath(filename), None)
 
 
 def _merge_uf_reds(old, new, method="replace"):
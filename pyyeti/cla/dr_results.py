@@ -4,6 +4,7 @@ DR_Results: manipulating data recovery results
 """
 import os
 import copy
+import pickle
 from collections import OrderedDict
 from types import SimpleNamespace
 import warnings
@@ -45,6 +46,43 @@ def _is_eqsine(opts):
     return False
 
 
+def _batch_case(sol, c, nc, freq):
+    """
+    Get one force case from a stacked batch solution
+
+    Parameters
+    ----------
+    sol : SimpleNamespace
+        Frequency domain solution for `nc` stacked force cases (see
+        :func:`DR_Results.solvepsd`); 2d arrays have ``nc*len(freq)``
+        columns.
+    c : integer
+        Case number, ``0 <= c < nc``
+    nc : integer
+        Number of cases in `sol`
+    freq : 1d ndarray
+        Frequency vector
+
+    Returns
+    -------
+    SimpleNamespace
+        Solution for case `c`; 2d arrays are views into `sol`. If
+        `nc` is 1, this is just `sol`.
+    """
+    if nc == 1:
+        return sol
+    ncol = nc * freq.size
+    out = SimpleNamespace()
+    for name, value in sol.__dict__.items():
+        if name == "f":
+            value = freq
+        elif isinstance(value, np.ndarray) and value.ndim == 2:
+            if value.shape[1] == ncol:
+                value = value[:, c::nc]
+        setattr(out, name, value)
+    return out
+
+
 class DR_Results(OrderedDict):
     """
     Subclass of :class:`collections.OrderedDict` that contains data
@@ -920,6 +958,146 @@ class DR_Results(OrderedDict):
                 sr = 1 / SOL.h if SOL.h else None
                 self._compute_srs(res, dr, resp, "hist", SOL.t, j, first, sr=sr)
 
+    def run_cases(
+        self, cases, solver, DR, nas, domain="time", dosrs=True, executor=None
+    ):
+        """
+        Solve and recover a series of load cases
+
+        Parameters
+        ----------
+        cases : list
+            List of unique strings identifying the cases
+        solver : callable
+            Called as ``sol = solver(case, DR, nas)`` for each case to
+            get the solution, typically by solving the equations of
+            motion (see :mod:`pyyeti.ode`) and then calling
+            :func:`DR_Event.apply_uf`. When running in parallel,
+            `solver` must be picklable (for example, a module level
+            function or a :func:`functools.partial` of one).
+        DR : instance of :class:`DR_Event`
+            Defines data recovery for the event; see
+            :func:`time_data_recovery`.
+        nas : any object
+            Passed on to `solver` and the data recovery functions;
+            see :func:`time_data_recovery`.
+        domain : string; optional
+            Either "time" to use :func:`time_data_recovery` or "freq"
+            to use :func:`frf_data_recovery`.
+        dosrs : bool; optional
+            If False, do not calculate SRSs; default is to calculate
+            them.
+        executor : :class:`pyyeti.srs.SharedExecutor` or None; optional
+            If None, the cases are run one after another in this
+            process. Otherwise, the cases are split into contiguous
+            groups and spread over the worker processes of
+            `executor`. See notes below.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        This routine is equivalent to::
+
+            for j, case in enumerate(cases):
+                sol = solver(case, DR, nas)
+                self.time_data_recovery(
+                    sol, nas, case, DR, len(cases), j, dosrs)
+
+        When `executor` is used, `solver`, `DR`, `nas`, `cases` and
+        the (empty) results structure are pickled once into shared
+        memory; each worker process unpickles them only once, no
+        matter how many cases it runs. Each worker returns the results
+        for its group of cases and these are merged into `self` in
+        case order with the same :func:`extrema` logic used by
+        :func:`time_data_recovery`, so the results are identical to
+        the serial loop.
+
+        The `self` results dictionary is updated (see
+        :class:`DR_Results` for an example).
+        """
+        if domain not in ("time", "freq"):
+            raise ValueError(f'`domain` must be "time" or "freq", not {domain!r}')
+        n = len(cases)
+        if executor is None:
+            recover = (
+                self.time_data_recovery if domain == "time" else self.frf_data_recovery
+            )
+            for j, case in enumerate(cases):
+                sol = solver(case, DR, nas)
+                recover(sol, nas, case, DR, n, j, dosrs)
+            return
+
+        if any(res.ext is not None for res in self.values()):
+            raise ValueError(
+                "`executor` can only be used with empty results (as "
+                "returned by `DR_Event.prepare_results`)"
+            )
+        global _RUN_CASES_ID
+        _RUN_CASES_ID += 1
+        token = (os.getpid(), _RUN_CASES_ID)
+        payload = pickle.dumps(
+            (solver, DR, nas, list(cases), self, domain, dosrs),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        desc = executor.share("drr_payload", np.frombuffer(payload, np.uint8))
+        groups = executor.map(
+            _run_cases_worker,
+            [(j0, j1, token, desc) for j0, j1 in executor.ranges(n)],
+        )
+        for (j0, j1), group in groups:
+            self._merge_cases(group, cases, DR, n, j0, j1, domain)
+
+    def _merge_cases(self, group, cases, DR, n, j0, j1, domain):
+        """Merge results for cases `j0` to `j1` computed by
+        :func:`_run_cases_worker` into `self`"""
+        xname, respname = ("time", "hist") if domain == "time" else ("freq", "frf")
+        for name, res in self.items():
+            gres = group[name]
+            if res.ext is None:
+                # allocate space for all cases; only the number of
+                # rows and the dtype of the response are needed:
+                hist = getattr(gres, respname, None)
+                dtype = float if hist is None else hist.dtype
+                resp = np.zeros((gres.mx.shape[0], 1), dtype)
+                mm = SimpleNamespace(ext=resp)
+                self._init_results_cat(
+                    name,
+                    DR.Info[name],
+                    resp,
+                    respname,
+                    getattr(gres, xname, None),
+                    xname,
+                    mm,
+                    n,
+                    dohist=hist is not None,
+                    dosrs=hasattr(gres, "srs"),
+                )
+                if hasattr(gres, "srs"):
+                    res.srs.type = gres.srs.type
+            for j in range(j0, j1):
+                jj = j - j0
+                case = cases[j]
+                mm = SimpleNamespace(
+                    ext=np.column_stack((gres.mx[:, jj], gres.mn[:, jj])),
+                    ext_x=np.column_stack((gres.mx_x[:, jj], gres.mn_x[:, jj])),
+                )
+                first = res.ext is None
+                extrema(res, mm, case)
+                self._store_maxmin(res, mm, j, case)
+                if hasattr(gres, respname):
+                    getattr(res, respname)[j] = getattr(gres, respname)[jj]
+                if hasattr(gres, "srs"):
+                    for q, srs_all in gres.srs.srs.items():
+                        srs_cur = srs_all[jj]
+                        res.srs.srs[q][j] = srs_cur
+                        if first:
+                            res.srs.ext[q] = srs_cur
+                        else:
+                            res.srs.ext[q] = np.fmax(res.srs.ext[q], srs_cur)
+
     def frf_data_recovery(self, sol, nas, case, DR, n, j, dosrs=True):
         """
         Frequency response data recovery function
@@ -1008,6 +1186,7 @@ class DR_Results(OrderedDict):
         freq,
         verbose=False,
         allow_force_trimming=False,
+        batch=False,
         **kwargs,
     ):
         """
@@ -1040,8 +1219,11 @@ class DR_Results(OrderedDict):
             An instance of :class:`pyyeti.ode.SolveUnc` or
             :class:`pyyeti.ode.FreqDirect` (or similar ... must have
             ``.fsolve`` method)
-        forcepsd : 2d array_like
-            Matrix of force psds; each row is a force
+        forcepsd : 2d or 3d array_like
+            If 2d, matrix of uncorrelated force psds; each row is a
+            force. If 3d, the full cross-spectral density matrix of
+            the forces, ``nforces x nforces x len(freq)``; see
+            :func:`pyyeti.ode.solvepsd`.
         t_frc : 2d array_like
             Transform to put `forcepsd` into the coordinates of the
             equations of motion: ``t_frc @ forcepsd``. Commonly,
@@ -1065,6 +1247,14 @@ class DR_Results(OrderedDict):
             ("drmf"), the default is False. It is advisable to trim
             off zero forces before calling this routine and trim the
             corresponding columns off any "drmf" matrices.
+        batch : bool or integer; optional
+            Specifies how many unit forces are solved together. If
+            False, each force is solved separately. If True, all
+            forces are solved in one call to ``fs.fsolve`` and the
+            data recovery functions are called once on the stacked
+            solution. If an integer, it is the number of forces per
+            call. See :func:`pyyeti.ode.solvepsd` and the notes
+            below.
         **kwargs : keyword arguments for ``fs.fsolve``; optional
             Currently, there are two arguments available:
 
@@ -1130,21 +1320,51 @@ class DR_Results(OrderedDict):
             `forcepsd`, this routine creates ``sol.pg`` sized
             compatibly with `forcepsd` and has only one row of 1.0
             values. See also `allow_force_trimming` above.
+
+        When `batch` is used, the unit forces for several PSDs are
+        stacked column-wise into one ``fs.fsolve`` call: column
+        ``f*nc + c`` of the solution is for force ``i+c`` at
+        frequency `f`, where `nc` is the number of forces in the
+        batch (this is the layout used by
+        :func:`pyyeti.ode.SolveUnc.fsolve_batch`). ``sol.f`` and
+        ``sol.pg`` are stacked the same way, so the usual data
+        recovery functions (which are linear, column-by-column
+        operations) work unchanged on the stacked solution. PSD
+        recovery functions (the "_psd" functions; see
+        :func:`DR_Def.add`) are still called once per force with a
+        view of that force's columns.
+
+        For cross-correlated forces (3d `forcepsd`), the unit FRFs
+        for all forces are kept and the response PSD is the diagonal
+        of ``H @ forcepsd @ H^H`` at each frequency. PSD recovery
+        functions are not supported in that case.
         """
-        forcepsd, t_frc = np.atleast_2d(forcepsd, t_frc)
-        if t_frc.shape[1] != forcepsd.shape[0]:
+        forcepsd = np.asarray(forcepsd)
+        csd = forcepsd.ndim == 3
+        if not csd:
+            forcepsd = np.atleast_2d(forcepsd)
+        t_frc = np.atleast_2d(t_frc)
+        if t_frc.shape[1] != forcepsd.shape[0] or (
+            csd and forcepsd.shape[1] != forcepsd.shape[0]
+        ):
             raise ValueError(
                 "`forcepsd` and `t_frc` are incompatibly "
                 f"sized: {forcepsd.shape} vs {t_frc.shape}"
             )
 
-        nonzero_forces = np.any(forcepsd, axis=1).nonzero()[0]
+        # the auto-spectra; a force with zero psd also has zero csd
+        # with all other forces:
+        autopsd = np.einsum("iif->if", forcepsd) if csd else forcepsd
+        nonzero_forces = np.any(autopsd, axis=1).nonzero()[0]
         nzero = forcepsd.shape[0] - nonzero_forces.size
         if nzero > 0:
             if allow_force_trimming:
                 if verbose:
                     print(f"Trimming off {nzero} " "zero forces")
-                forcepsd = forcepsd[nonzero_forces]
+                if csd:
+                    forcepsd = forcepsd[np.ix_(nonzero_forces, nonzero_forces)]
+                else:
+                    forcepsd = forcepsd[nonzero_forces]
                 t_frc = t_frc[:, nonzero_forces]
             else:
                 # if verbose:
@@ -1156,7 +1376,14 @@ class DR_Results(OrderedDict):
 
         freq = np.atleast_1d(freq)
         rpsd = forcepsd.shape[0]
-        unitforce = np.ones(freq.shape)
+        cpsd = freq.size
+
+        if batch is True:
+            nbatch = rpsd
+        elif batch is False:
+            nbatch = 1
+        else:
+            nbatch = max(1, int(batch))
 
         # initialize categories for data recovery
         drfuncs = {}
@@ -1175,23 +1402,30 @@ class DR_Results(OrderedDict):
             drfuncs[key] = get_drfunc(
                 value.drminfo.drfile, value.drminfo.drfunc, get_psd=True
             )
+            if csd and drfuncs[key][1]:
+                raise ValueError(
+                    f"category {key!r} has a PSD recovery function; these "
+                    "are not supported for cross-correlated (3d) `forcepsd`"
+                )
+
+        if csd:
+            # the FRFs for all forces are needed for the cross terms:
+            frfs = {}
 
         import time
 
-        pg = np.zeros((t_frc.shape[1], freq.size))
         timers = [0, 0, 0]
-        for i in range(rpsd):
+        for i in range(0, rpsd, nbatch):
+            nc = min(nbatch, rpsd - i)
             if verbose:
                 print(f"{case}: processing force {i + 1} of {rpsd}")
-            # solve for unit FRF for i'th force:
-            genforce = t_frc[:, [i]] * unitforce
+            # solve for unit FRF for forces i:i+nc; see notes above
+            # for the layout:
+            genforce = np.tile(t_frc[:, i : i + nc], cpsd)
             t1 = time.time()
-            sol = fs.fsolve(genforce, freq, **kwargs)
-
-            # zeroing line not needed on first loop, but is okay (last
-            # row gets re-zeroed)
-            pg[i - 1] = 0.0
-            pg[i] = unitforce
+            sol = fs.fsolve(genforce, np.repeat(freq, nc), **kwargs)
+            pg = np.zeros((rpsd, cpsd * nc))
+            pg[i : i + nc] = np.tile(np.eye(nc), cpsd)
             sol.pg = pg
             timers[0] += time.time() - t1
 
@@ -1208,14 +1442,41 @@ class DR_Results(OrderedDict):
                 se = value.drminfo.se
                 if drfuncs[key][1]:
                     # use PSD recovery function if present:
-                    drfuncs[key][1](
-                        sol[uf_reds], nas, DR.Vars, se, freq, forcepsd, value, case, i
-                    )
+                    for c in range(nc):
+                        drfuncs[key][1](
+                            _batch_case(sol[uf_reds], c, nc, freq),
+                            nas,
+                            DR.Vars,
+                            se,
+                            freq,
+                            forcepsd,
+                            value,
+                            case,
+                            i + c,
+                        )
                 else:
                     # otherwise, use normal recovery function:
                     resp = drfuncs[key][0](sol[uf_reds], nas, DR.Vars, se)
-                    value._psd[case] += forcepsd[i] * abs(resp) ** 2
+                    # 3d FRF: nrows x freq x nc
+                    resp = resp.reshape(resp.shape[0], cpsd, nc)
+                    if csd:
+                        if key not in frfs:
+                            frfs[key] = np.empty(
+                                (cpsd, resp.shape[0], rpsd), resp.dtype
+                            )
+                        frfs[key][:, :, i : i + nc] = resp.transpose(1, 0, 2)
+                    else:
+                        value._psd[case] += np.einsum(
+                            "fi,rfi->rf", forcepsd[i : i + nc].T, abs(resp) ** 2
+                        )
             timers[2] += time.time() - t1
+
+        if csd:
+            for key, frf in frfs.items():
+                # diag(H @ forcepsd @ H^H) at each frequency; frf is
+                # freq x nrows x nforces:
+                hs = frf @ forcepsd.transpose(2, 0, 1)
+                self[key]._psd[case] = np.einsum("frj,frj->rf", hs, frf.conj()).real
         if verbose:
             print("timers =", timers)
 
@@ -2467,6 +2728,42 @@ class DR_Results(OrderedDict):
         )
 
 
+# unique id for each :func:`DR_Results.run_cases` call; used by the
+# worker processes to know when to reload the shared payload:
+_RUN_CASES_ID = 0
+
+# the payload of the latest call, cached in each worker process:
+_RUN_CASES_CACHE = {}
+
+
+def _run_cases_worker(args):
+    """
+    Worker routine for :func:`DR_Results.run_cases`
+
+    Runs cases `j0` to `j1` and returns ``((j0, j1), results)`` where
+    `results` is a :class:`DR_Results` instance for just these
+    cases. The payload (solver, DR, nas, etc) is unpickled only once
+    per worker process per call of :func:`DR_Results.run_cases`.
+    """
+    j0, j1, token, desc = args
+    if _RUN_CASES_CACHE.get("token") != token:
+        _RUN_CASES_CACHE.clear()
+        payload = srs._attach(desc)
+        _RUN_CASES_CACHE["data"] = pickle.loads(payload.tobytes())
+        _RUN_CASES_CACHE["token"] = token
+    solver, DR, nas, cases, template, domain, dosrs = _RUN_CASES_CACHE["data"]
+    results = copy.deepcopy(template)
+    recover = (
+        results.time_data_recovery if domain == "time" else results.frf_data_recovery
+    )
+    n = j1 - j0
+    for j in range(j0, j1):
+        case = cases[j]
+        sol = solver(case, DR, nas)
+        recover(sol, nas, case, DR, n, j - j0, dosrs)
+    return (j0, j1), results
+
+
 # setup pickling for a little bit of future-proofing:
 def unpickle_drresults(kwargs):
     # pickle_version is not used yet
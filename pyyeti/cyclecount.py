@@ -4,6 +4,8 @@ Tools for cycle counting. Adapted and enhanced from the Yeti version.
 """
 
 import warnings
+import multiprocessing as mp
+from multiprocessing.pool import ThreadPool
 import numpy as np
 import pandas as pd
 from pyyeti import locate
@@ -17,6 +19,10 @@ except ImportError:
         RuntimeWarning,
     )
     import pyyeti.rainflow.py_rain as rain
+from pyyeti.rainflow import py_rain
+
+# the fused, compiled kernel in py_rain is only used with numba:
+_HAVE_NUMBA = py_rain._HAVE_NUMBA
 
 # FIXME: We need the str/repr formatting used in Numpy < 1.14.
 try:
@@ -120,6 +126,114 @@ def rainflow(peaks, getoffsets=False):
     return pd.DataFrame(rf, columns=["amp", "mean", "count"])
 
 
+def rainflow_multi(sig, axis=0, tol=1e-6, ncpu=None):
+    """
+    Rainflow cycle counting of many channels.
+
+    Parameters
+    ----------
+    sig : 2d array_like
+        The signals to count; each channel is a column if `axis` is 0
+        or a row if `axis` is 1.
+    axis : integer; optional
+        The time axis of `sig`.
+    tol : scalar; optional
+        Tolerance value for detecting unique values; see
+        :func:`findap`
+    ncpu : integer or None; optional
+        Number of threads to use. If None, it is set to
+        :func:`multiprocessing.cpu_count` (limited by the number of
+        channels).
+
+    Returns
+    -------
+    rf : 2d ndarray
+        ncycles x 3 matrix with the rainflow cycle count information
+        ``[amp, mean, count]`` for all channels; see :func:`rainflow`.
+    rfptr : 1d ndarray
+        Integer vector of length ``nchannels + 1``; the cycles for
+        channel `i` are ``rf[rfptr[i]:rfptr[i+1]]``. The number of
+        cycles in each channel is ``np.diff(rfptr)``.
+
+    Notes
+    -----
+    For each channel, this routine gives the same result as::
+
+        rainflow(sig[findap(sig, tol)])
+
+    The channels are divided into groups and the peaks of each group
+    are found and counted by a single call each to the ``findap_csr``
+    and ``rainflow_csr`` routines of :mod:`pyyeti.rainflow.c_rain` (or
+    of :mod:`pyyeti.rainflow.py_rain` if the compiled version is not
+    available). Those routines release the global interpreter lock,
+    so the groups are run in parallel threads. Unlike
+    :func:`rainflow`, no pandas DataFrames are created.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pyyeti import cyclecount
+    >>> sig = np.array([[-2, 1, -3, 5, -1, 3, -4, 4, -2],
+    ...                 [0, 2, 1, 3, 0, 1, 1, 0, 0]])
+    >>> rf, rfptr = cyclecount.rainflow_multi(sig, axis=1)
+    >>> np.diff(rfptr)          # doctest: +ELLIPSIS
+    array([7, 4]...)
+    >>> rf[rfptr[1]:rfptr[2]]
+    array([[ 0.5,  1.5,  1. ],
+           [ 1.5,  1.5,  0.5],
+           [ 0.5,  0.5,  1. ],
+           [ 1.5,  1.5,  0.5]])
+    >>> rf[rfptr[0]:rfptr[1]]
+    array([[ 1.5, -0.5,  0.5],
+           [ 2. , -1. ,  0.5],
+           [ 2. ,  1. ,  1. ],
+           [ 4. ,  1. ,  0.5],
+           [ 4.5,  0.5,  0.5],
+           [ 4. ,  0. ,  0.5],
+           [ 3. ,  1. ,  0.5]])
+    """
+    sig = np.asarray(sig, dtype=float)
+    if sig.ndim != 2:
+        raise ValueError("`sig` must be 2d")
+    # each channel is a row (made contiguous per group, in parallel):
+    sig = sig.T if axis == 0 else sig
+    nchan = sig.shape[0]
+    if nchan == 0:
+        return np.zeros((0, 3)), np.zeros(1, np.intp)
+    if ncpu is None:
+        ncpu = mp.cpu_count()
+    ncpu = max(1, min(ncpu, nchan))
+
+    def _count(chans):
+        sigc = np.ascontiguousarray(sig[chans[0] : chans[1]])
+        if rain is py_rain and not _HAVE_NUMBA:
+            # the plain Python search would be very slow:
+            peaks = [y[findap(y, tol)] for y in sigc]
+            indptr = np.zeros(len(peaks) + 1, np.intp)
+            np.cumsum([len(p) for p in peaks], out=indptr[1:])
+            peaks = np.concatenate(peaks)
+        else:
+            peaks, indptr = rain.findap_csr(sigc, tol)
+        return rain.rainflow_csr(peaks, indptr)
+
+    # several groups per thread for load balancing:
+    bounds = np.linspace(0, nchan, min(nchan, 4 * ncpu) + 1).astype(int)
+    groups = list(zip(bounds[:-1], bounds[1:]))
+    if ncpu == 1:
+        results = [_count(g) for g in groups]
+    else:
+        with ThreadPool(ncpu) as pool:
+            results = pool.map(_count, groups)
+
+    rf = np.vstack([r[0] for r in results])
+    rfptr = np.zeros(nchan + 1, np.intp)
+    n = 0
+    for (c0, c1), (rfc, ptr) in zip(groups, results):
+        rfptr[c0 + 1 : c1 + 1] = ptr[1:] + n
+        n += rfc.shape[0]
+    return rf, rfptr
+
+
 def findap(y, tol=1e-6):
     """
     Find alternating local maximum and minimum points in a vector.
@@ -507,3 +621,89 @@ def sigcount(sig, ampbins=10, meanbins=1, right=True, precision=3, retbins=False
     """
     rf = rainflow(sig[findap(sig)])
     return _binify(rf, ampbins, meanbins, right, precision, retbins)
+
+
+def cumcount(sig, ampbins=300, tol=1e-6):
+    """
+    Rainflow count a signal and accumulate counts by amplitude.
+
+    Parameters
+    ----------
+    sig : 1d array_like
+        Signal (vector) to do cycle counting on.
+    ampbins : integer or 1d array_like; optional
+        If integer, it is the number of amplitude levels to use; the
+        levels are ``ampmax * np.arange(ampbins) / ampbins`` where
+        `ampmax` is the maximum cycle amplitude. Otherwise, it is the
+        vector of amplitude levels.
+    tol : scalar; optional
+        Tolerance value for detecting unique values; see
+        :func:`findap`
+
+    Returns
+    -------
+    amps : 1d ndarray
+        The amplitude levels.
+    count : 1d ndarray
+        Cumulative cycle counts: ``count[i]`` is the number of cycles
+        (half cycles count as 0.5) with amplitude ``>= amps[i]``.
+    ampmax : scalar
+        The maximum cycle amplitude (0.0 if there are no cycles).
+
+    Notes
+    -----
+    The result is the same as::
+
+        rf = rainflow(sig[findap(sig, tol)])
+        for i, a in enumerate(amps):
+            count[i] = rf["count"][rf["amp"] >= a].sum()
+
+    but the counting is done by sorting the cycle amplitudes and
+    using a cumulative sum, so the cost does not grow with the
+    product of the number of levels and the number of cycles. If
+    Numba is available, the peak finding and rainflow counting are
+    also fused into a single compiled pass over `sig`.
+
+    This routine is used by :func:`pyyeti.fdepsd.fdepsd`.
+
+    Examples
+    --------
+    >>> from pyyeti import cyclecount
+    >>> amps, count, ampmax = cyclecount.cumcount(
+    ...     [-2, 1, -3, 5, -1, 3, -4, 4, -2], 3)
+    >>> ampmax
+    4.5
+    >>> amps
+    array([ 0. ,  1.5,  3. ])
+    >>> count
+    array([ 4.,  4.,  2.])
+    """
+    sig = np.atleast_1d(sig).ravel()
+    if _HAVE_NUMBA and sig.size > 1:
+        sig = np.ascontiguousarray(sig, dtype=float)
+        stol = abs(tol * abs(np.diff(sig)).max())
+        amp = np.empty(sig.size)
+        cnt = np.empty(sig.size)
+        n = py_rain._rainflow_amps(sig, stol, amp, cnt)
+        amp = amp[:n]
+        cnt = cnt[:n]
+    else:
+        peaks = sig[findap(sig, tol)]
+        if peaks.size > 1:
+            rf = rain.rainflow(peaks)
+            amp = rf[:, 0]
+            cnt = rf[:, 2]
+        else:
+            amp = cnt = np.zeros(0)
+
+    ampmax = amp.max() if amp.size > 0 else 0.0
+    if isinstance(ampbins, (int, np.integer)):
+        amps = ampmax * (np.arange(ampbins, dtype=float) / ampbins)
+    else:
+        amps = np.atleast_1d(ampbins).astype(float)
+
+    # cumulative counts from the top amplitude down:
+    i = np.argsort(amp, kind="stable")
+    rcount = np.zeros(amp.size + 1)
+    rcount[:-1] = np.cumsum(cnt[i][::-1])[::-1]
+    return amps, rcount[np.searchsorted(amp[i], amps, side="left")], ampmax
@@ -2006,6 +2006,41 @@ def _proc_timeslice(timeslice, sr, n):
     return ntimeslice, timeslice
 
 
+def _slice_layout(timeslice, tsoverlap, sr, n):
+    """
+    Utility routine for :func:`waterfall` and its incremental
+    versions (see :func:`pyyeti.srs.srsmap` and
+    :func:`pyyeti.psd.psdmod`)
+
+    Returns ``(ntimeslice, inc, tlen, t)``: the number of points per
+    slice, the number of points between slice starts, the number of
+    slices, and the center time of each slice (signal starting at
+    time 0.0). Slice `j` is ``sig[j * inc : j * inc + ntimeslice]``.
+    """
+    ntimeslice, timeslice = _proc_timeslice(timeslice, sr, n)
+
+    if isinstance(tsoverlap, str):
+        ntsoverlap = int(tsoverlap)
+        if not 0 <= ntsoverlap < ntimeslice:
+            raise ValueError(f"`tsoverlap` must be in [0, {ntimeslice})")
+    else:
+        if not 0 <= tsoverlap < 1:
+            raise ValueError("`tsoverlap` must be in [0, 1)")
+        ntsoverlap = int(round(ntimeslice * tsoverlap))
+
+    # inc = max(1, int(round(ntimeslice * (1.0 - tsoverlap))))
+    inc = max(1, ntimeslice - ntsoverlap)
+    non_overlap = inc / ntimeslice
+    tlen = (n - ntimeslice) // inc + 1
+
+    # make time vector:
+    t0_ = timeslice / 2.0
+    tf = t0_ + (tlen - 1) * timeslice * non_overlap
+    t = np.linspace(t0_, tf, tlen)
+    # print('tlen =', tlen, 'inc =', inc, 't[0], t[-1] =', t[0], t[-1])
+    return ntimeslice, inc, tlen, t
+
+
 def waterfall(
     sig,
     sr,
@@ -2111,6 +2146,11 @@ def waterfall(
     `slicekwargs` only to pass arguments to the supplied functions.
     This makes for more readable code.
 
+    Each time slice is processed from scratch, so the cost grows with
+    the amount of overlap. :func:`pyyeti.srs.srsmap` and
+    :func:`pyyeti.psd.psdmod` have `incremental` options that avoid
+    recomputing the overlapped portions.
+
     Examples
     --------
     Compute a shock response spectrum waterfall for a sine sweep
@@ -2180,29 +2220,9 @@ def waterfall(
     if slicekwargs is None:
         slicekwargs = {}
 
-    ntimeslice, timeslice = _proc_timeslice(timeslice, sr, sig.size)
-
-    if isinstance(tsoverlap, str):
-        ntsoverlap = int(tsoverlap)
-        if not 0 <= ntsoverlap < ntimeslice:
-            raise ValueError(f"`tsoverlap` must be in [0, {ntimeslice})")
-    else:
-        if not 0 <= tsoverlap < 1:
-            raise ValueError("`tsoverlap` must be in [0, 1)")
-        ntsoverlap = int(round(ntimeslice * tsoverlap))
-
-    # inc = max(1, int(round(ntimeslice * (1.0 - tsoverlap))))
-    inc = max(1, ntimeslice - ntsoverlap)
-    non_overlap = inc / ntimeslice
-    tlen = (sig.size - ntimeslice) // inc + 1
+    ntimeslice, inc, tlen, t = _slice_layout(timeslice, tsoverlap, sr, sig.size)
     b = 0
 
-    # make time vector:
-    t0_ = timeslice / 2.0
-    tf = t0_ + (tlen - 1) * timeslice * non_overlap
-    t = np.linspace(t0_, tf, tlen)
-    # print('tlen =', tlen, 'inc =', inc, 't[0], t[-1] =', t[0], t[-1])
-
     if not slicefunc:
 
         def slicefunc(a):
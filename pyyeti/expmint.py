@@ -3,8 +3,13 @@
 Tools for computing the matrix exponential and the integral.
 """
 
+import collections
+import hashlib
+import os
 import warnings
 import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
 import scipy.sparse.linalg.matfuncs as mf
 import scipy.linalg as la
 
@@ -16,6 +21,16 @@ except TypeError:
     pass
 
 
+# cache used by getEPQ; see enable_epq_cache
+_EPQ_CACHE = None
+
+# matrices with at least this many elements and with no more than
+# this fraction of nonzeros are multiplied as sparse matrices in
+# getEPQ2 (for example, diagonal or banded mass and stiffness):
+_SPARSE_MIN_SIZE = 10000
+_SPARSE_DENSITY = 0.05
+
+
 class _ExpmIntPadeHelper(mf._ExpmPadeHelper):
     def __init__(self, A, structure=None, use_exact_onenorm=False):
         """
@@ -980,17 +995,35 @@ class _ExpmPadeHelper_SS(mf._ExpmPadeHelper):
         self.order = order
         self.nss = ssA.shape[0]
         self.shape = (self.nss, A.shape[1])
+        self._sstop, self._ssc = _ss_structure(ssA)
+
+    def ssdot(self, X):
+        """
+        Returns ``ssA @ X`` taking advantage of the structure of `ssA`
+
+        If `ssA` has the 2nd order ODE structure ``[[X, Y], [c I,
+        0]]`` (see :func:`_ss_structure`), only the top half is
+        multiplied; the bottom half is just a scaled copy of the top
+        half of `X`.
+        """
+        if self._ssc is None:
+            return np.asarray(self._sstop @ X)
+        m = self._sstop.shape[0]
+        out = np.empty((2 * m, X.shape[1]), np.result_type(self.ssA, X))
+        out[:m] = self._sstop @ X
+        out[m:] = self._ssc * X[:m]
+        return out
 
     @property
     def A2(self):
         if self._A2 is None:
             n = self.nss
             if self.order == 0:
-                self._A2 = np.dot(self.ssA, self.A[:n])
+                self._A2 = self.ssdot(self.A[:n])
             else:
                 i = (self.A.shape[1] - n) // 2
                 self._A2 = np.zeros(self.shape, float)
-                self._A2[:, : n + i] = np.dot(self.ssA, self.A[:n, : n + i])
+                self._A2[:, : n + i] = self.ssdot(self.A[:n, : n + i])
                 self._A2[:, n + i :] = self.A[:n, n : n + i]
         return self._A2
 
@@ -998,28 +1031,28 @@ class _ExpmPadeHelper_SS(mf._ExpmPadeHelper):
     def A4(self):
         if self._A4 is None:
             n = self.nss
-            self._A4 = np.dot(self.A2[:, :n], self.A2)
+            self._A4 = _dot(self.A2[:, :n], self.A2)
         return self._A4
 
     @property
     def A6(self):
         if self._A6 is None:
             n = self.nss
-            self._A6 = np.dot(self.A4[:, :n], self.A2)
+            self._A6 = _dot(self.A4[:, :n], self.A2)
         return self._A6
 
     @property
     def A8(self):
         if self._A8 is None:
             n = self.nss
-            self._A8 = np.dot(self.A6[:, :n], self.A2)
+            self._A8 = _dot(self.A6[:, :n], self.A2)
         return self._A8
 
     @property
     def A10(self):
         if self._A10 is None:
             n = self.nss
-            self._A10 = np.dot(self.A4[:, :n], self.A6)
+            self._A10 = _dot(self.A4[:, :n], self.A6)
         return self._A10
 
     def pade3(self):
@@ -1027,7 +1060,7 @@ class _ExpmPadeHelper_SS(mf._ExpmPadeHelper):
         n = self.nss
         U = b[1] * self.A
         V = b[0] * self.ident
-        U[:n] += np.dot(self.ssA, b[3] * self.A2)
+        U[:n] += self.ssdot(b[3] * self.A2)
         V[:n] += b[2] * self.A2
         return U, V
 
@@ -1036,7 +1069,7 @@ class _ExpmPadeHelper_SS(mf._ExpmPadeHelper):
         n = self.nss
         U = b[1] * self.A
         V = b[0] * self.ident
-        U[:n] += np.dot(self.ssA, b[5] * self.A4 + b[3] * self.A2)
+        U[:n] += self.ssdot(b[5] * self.A4 + b[3] * self.A2)
         V[:n] += b[4] * self.A4 + b[2] * self.A2
         return U, V
 
@@ -1045,7 +1078,7 @@ class _ExpmPadeHelper_SS(mf._ExpmPadeHelper):
         n = self.nss
         U = b[1] * self.A
         V = b[0] * self.ident
-        U[:n] += np.dot(self.ssA, (b[7] * self.A6 + b[5] * self.A4 + b[3] * self.A2))
+        U[:n] += self.ssdot(b[7] * self.A6 + b[5] * self.A4 + b[3] * self.A2)
         V[:n] += b[6] * self.A6 + b[4] * self.A4 + b[2] * self.A2
         return U, V
 
@@ -1065,9 +1098,8 @@ class _ExpmPadeHelper_SS(mf._ExpmPadeHelper):
         n = self.nss
         U = b[1] * self.A
         V = b[0] * self.ident
-        U[:n] += np.dot(
-            self.ssA,
-            (b[9] * self.A8 + b[7] * self.A6 + b[5] * self.A4 + b[3] * self.A2),
+        U[:n] += self.ssdot(
+            b[9] * self.A8 + b[7] * self.A6 + b[5] * self.A4 + b[3] * self.A2
         )
         V[:n] += b[8] * self.A8 + b[6] * self.A6 + b[4] * self.A4 + b[2] * self.A2
         return U, V
@@ -1096,9 +1128,10 @@ class _ExpmPadeHelper_SS(mf._ExpmPadeHelper):
         n = self.nss
         U = b[1] * B
         V = b[0] * self.ident
-        U2 = np.dot(B6[:, :n], b[13] * B6 + b[11] * B4 + b[9] * B2)
-        V2 = np.dot(B6[:, :n], b[12] * B6 + b[10] * B4 + b[8] * B2)
-        U[:n] += np.dot(B[:n, :n], U2 + b[7] * B6 + b[5] * B4 + b[3] * B2)
+        U2 = _dot(B6[:, :n], b[13] * B6 + b[11] * B4 + b[9] * B2)
+        V2 = _dot(B6[:, :n], b[12] * B6 + b[10] * B4 + b[8] * B2)
+        # B[:n, :n] is ssA * 2 ** -s:
+        U[:n] += 2 ** -s * self.ssdot(U2 + b[7] * B6 + b[5] * B4 + b[3] * B2)
         V[:n] += V2 + b[6] * B6 + b[4] * B4 + b[2] * B2
         return U, V
 
@@ -1106,28 +1139,27 @@ class _ExpmPadeHelper_SS(mf._ExpmPadeHelper):
 def _expm_SS(A, ssA, order):  # , use_exact_onenorm='auto'):
     # Track functions of A to help compute the matrix exponential.
     h = _ExpmPadeHelper_SS(A, ssA, order)
-    structure = None
 
     # Try Pade order 3.
     eta_1 = max(h.d4_loose, h.d6_loose)
     if eta_1 < 1.495585217958292e-002 and mf._ell(h.A, 3) == 0:
         U, V = h.pade3()
-        return mf._solve_P_Q(U, V, structure=structure)
+        return _solve_P_Q_SS(U, V, h.nss)
 
     # Try Pade order 5.
     eta_2 = max(h.d4_tight, h.d6_loose)
     if eta_2 < 2.539398330063230e-001 and mf._ell(h.A, 5) == 0:
         U, V = h.pade5()
-        return mf._solve_P_Q(U, V, structure=structure)
+        return _solve_P_Q_SS(U, V, h.nss)
 
     # Try Pade orders 7 and 9.
     eta_3 = max(h.d6_tight, h.d8_loose)
     if eta_3 < 9.504178996162932e-001 and mf._ell(h.A, 7) == 0:
         U, V = h.pade7()
-        return mf._solve_P_Q(U, V, structure=structure)
+        return _solve_P_Q_SS(U, V, h.nss)
     if eta_3 < 2.097847961257068e000 and mf._ell(h.A, 9) == 0:
         U, V = h.pade9()
-        return mf._solve_P_Q(U, V, structure=structure)
+        return _solve_P_Q_SS(U, V, h.nss)
 
     # Use Pade order 13.
     eta_4 = max(h.d8_loose, h.d10_loose)
@@ -1136,10 +1168,76 @@ def _expm_SS(A, ssA, order):  # , use_exact_onenorm='auto'):
     s = max(int(np.ceil(np.log2(eta_5 / theta_13))), 0)
     s = s + mf._ell(2 ** -s * h.A, 13)
     U, V = h.pade13_scaled(s)
-    X = mf._solve_P_Q(U, V, structure=structure)
-    # X = r_13(A)^(2^s) by repeated squaring.
+    X = _solve_P_Q_SS(U, V, h.nss)
+    # X = r_13(A)^(2^s) by repeated squaring; like `A`, the rows
+    # below `ssA` are zero on the left and small on the right:
+    n = h.nss
     for _ in range(s):
-        X = X.dot(X)
+        Y = np.zeros_like(X)
+        Y[:n] = _dot(X[:n], X)
+        Y[n:, n:] = X[n:, n:] @ X[n:, n:]
+        X = Y
+    return X
+
+
+def _ss_structure(ssA):
+    """
+    Check state-space matrix for the 2nd order ODE structure
+
+    Returns ``(top, c)``. If `ssA` is ``[[X, Y], [c I, 0]]`` (as
+    formed by :class:`pyyeti.ode.SolveExp2`, for example), `top` is
+    ``[X, Y]`` and `c` is the scalar. Otherwise, `top` is `ssA` and
+    `c` is None. Either way, `top` is converted to a sparse matrix if
+    it is mostly zeros (see :func:`_sparsify`).
+    """
+    n = ssA.shape[0]
+    m = n // 2
+    if n > 0 and not n & 1:
+        bl = ssA[m:, :m]
+        c = bl[0, 0]
+        if (
+            c != 0.0
+            and not ssA[m:, m:].any()
+            and np.count_nonzero(bl) == m
+            and (np.diag(bl) == c).all()
+        ):
+            return _sparsify(ssA[:m]), c
+    return _sparsify(ssA), None
+
+
+def _sparsify(M):
+    """Returns `M` as a CSR matrix if it is large and mostly zeros"""
+    if M.size >= _SPARSE_MIN_SIZE and (np.count_nonzero(M) <= _SPARSE_DENSITY * M.size):
+        return sp.csr_matrix(M)
+    return M
+
+
+def _dot(L, R):
+    """Returns ``L @ R``, using a sparse `L` if it is mostly zeros"""
+    return np.asarray(_sparsify(L) @ R)
+
+
+def _solve_P_Q_SS(U, V, n):
+    """
+    Solves ``(V - U) X = (V + U)`` for :func:`_expm_SS`
+
+    Below the first `n` rows (the state-space part), `U` and `V` are
+    zero in the first `n` columns and upper triangular in the rest.
+    The solution is therefore computed by block back-substitution and
+    only the `n` x `n` upper left partition needs to be factored.
+    """
+    P = U + V
+    Q = V - U
+    if Q.shape[0] == n:
+        return la.solve(Q, P)
+    X = np.empty_like(P)
+    X[n:] = la.solve_triangular(Q[n:, n:], P[n:])
+    rhs = P[:n] - Q[:n, n:] @ X[n:]
+    Q11 = _sparsify(Q[:n, :n])
+    if sp.issparse(Q11):
+        X[:n] = spla.splu(Q11.tocsc()).solve(rhs)
+    else:
+        X[:n] = la.solve(Q11, rhs)
     return X
 
 
@@ -1317,6 +1415,210 @@ def getEPQ2(A, h, order=1, B=None, half=False):
     return E, P, Q
 
 
+class EPQCache:
+    """
+    Least-recently-used cache for :func:`getEPQ` results
+
+    Building :class:`pyyeti.ode.SolveExp2` (or any other user of
+    :func:`getEPQ`) for large coupled systems is expensive since the
+    matrix exponential and its integrals must be computed. When the
+    same system is solved many times (for example, per event or in
+    Monte Carlo runs), the cache returns the previously computed
+    result instead. Use :func:`enable_epq_cache` to turn caching on
+    for :func:`getEPQ`.
+
+    Results are keyed on a SHA-1 hash of the contents of `A` (and
+    `B`) along with `h`, `order` and `half`. Copies are returned so
+    that callers may modify the outputs without corrupting the
+    cache.
+    """
+
+    def __init__(self, maxsize=16, path=None):
+        """
+        Instantiates a :class:`EPQCache` object.
+
+        Parameters
+        ----------
+        maxsize : integer or None; optional
+            Maximum number of results kept in memory; when exceeded,
+            the least recently used result is discarded. If None,
+            the in-memory cache is unbounded. Use 0 to only use the
+            disk cache.
+        path : string or None; optional
+            If not None, results are also saved to (and loaded from)
+            this directory as ".npz" files so they can be shared
+            across runs and processes. The directory is created if
+            needed.
+
+        Notes
+        -----
+        The attributes `hits`, `disk_hits` and `misses` count
+        the results found in memory, found on disk, and computed,
+        respectively.
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._cache = collections.OrderedDict()
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def __len__(self):
+        return len(self._cache)
+
+    @staticmethod
+    def key(A, h, order=1, B=None, half=False):
+        """
+        Returns the cache key for the :func:`getEPQ` inputs
+
+        See :func:`getEPQ` for a description of the inputs. The key
+        is a hexadecimal string.
+        """
+        sha = hashlib.sha1()
+        for M in (A, B):
+            if M is None:
+                sha.update(b"None")
+            else:
+                M = np.ascontiguousarray(M)
+                sha.update(repr((M.dtype.str, M.shape)).encode())
+                sha.update(M.tobytes())
+        half = bool(half) and B is None
+        sha.update(repr((float(h), int(order), half)).encode())
+        return sha.hexdigest()
+
+    def get(self, A, h, order=1, B=None, half=False):
+        """
+        Returns E, P, Q from the cache, computing them if needed
+
+        See :func:`getEPQ` for a description of the inputs and
+        outputs.
+        """
+        key = self.key(A, h, order, B, half)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            epq = self._cache[key]
+        else:
+            epq = self._load(key)
+            if epq is None:
+                self.misses += 1
+                epq = _getEPQ(A, h, order, B, half)
+                epq = tuple(_copy_mat(m) for m in epq)
+                self._save(key, epq)
+            else:
+                self.disk_hits += 1
+            self._store(key, epq)
+        return tuple(_copy_mat(m) for m in epq)
+
+    def clear(self, disk=False):
+        """
+        Empty the cache
+
+        Parameters
+        ----------
+        disk : bool; optional
+            If True, the ".npz" files in `path` are deleted as well.
+        """
+        self._cache.clear()
+        if disk and self.path is not None:
+            for name in os.listdir(self.path):
+                if name.endswith(".npz"):
+                    os.remove(os.path.join(self.path, name))
+
+    def _store(self, key, epq):
+        if self.maxsize is None or self.maxsize > 0:
+            self._cache[key] = epq
+            if self.maxsize is not None:
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+    def _load(self, key):
+        if self.path is None:
+            return None
+        fname = os.path.join(self.path, key + ".npz")
+        if not os.path.exists(fname):
+            return None
+        with np.load(fname) as z:
+            E, P, Q = z["E"], z["P"], z["Q"]
+        if Q.ndim == 0:
+            Q = Q[()]
+        return E, P, Q
+
+    def _save(self, key, epq):
+        if self.path is None:
+            return
+        fname = os.path.join(self.path, key + ".npz")
+        # write to a temporary file first so other processes never
+        # see a partial file:
+        tmpname = os.path.join(self.path, f"{key}.{os.getpid()}.tmp.npz")
+        E, P, Q = epq
+        np.savez(tmpname, E=E, P=P, Q=Q)
+        os.replace(tmpname, fname)
+
+
+def _copy_mat(m):
+    """Helper for EPQCache: copy arrays, leave scalars as is"""
+    return np.array(m) if isinstance(m, np.ndarray) else m
+
+
+def enable_epq_cache(maxsize=16, path=None):
+    """
+    Turn on caching of :func:`getEPQ` results
+
+    Parameters
+    ----------
+    maxsize : integer or None; optional
+        Maximum number of results kept in memory; see
+        :class:`EPQCache`.
+    path : string or None; optional
+        Directory for the optional disk cache; see
+        :class:`EPQCache`.
+
+    Returns
+    -------
+    cache : :class:`EPQCache`
+        The new cache object now used by :func:`getEPQ`. Any
+        previously enabled cache is replaced.
+
+    Notes
+    -----
+    Since :class:`pyyeti.ode.SolveExp1`,
+    :class:`pyyeti.ode.SolveExp2` and
+    :class:`pyyeti.ssmodel.SSModel` call :func:`getEPQ`, they use
+    the cache as well. Use :func:`disable_epq_cache` to turn caching
+    off.
+
+    Examples
+    --------
+    >>> from pyyeti import expmint
+    >>> import numpy as np
+    >>> A = np.array([[1., 2.], [3., 4.]])
+    >>> cache = expmint.enable_epq_cache()
+    >>> E, P, Q = expmint.getEPQ(A, .05)
+    >>> E2, P2, Q2 = expmint.getEPQ(A, .05)
+    >>> np.all(E2 == E)
+    True
+    >>> cache.hits, cache.misses
+    (1, 1)
+    >>> expmint.disable_epq_cache()
+    """
+    global _EPQ_CACHE
+    _EPQ_CACHE = EPQCache(maxsize, path)
+    return _EPQ_CACHE
+
+
+def disable_epq_cache():
+    """
+    Turn off caching of :func:`getEPQ` results
+
+    See :func:`enable_epq_cache`.
+    """
+    global _EPQ_CACHE
+    _EPQ_CACHE = None
+
+
 def getEPQ(A, h, order=1, B=None, half=False):
     """
     Returns E, P, Q for the exponential solver given the state-space
@@ -1362,6 +1664,10 @@ def getEPQ(A, h, order=1, B=None, half=False):
     2.097847961257068 [#exp4]_, :func:`getEPQ1` is called; otherwise,
     :func:`getEPQ2` is called.
 
+    If caching has been turned on via :func:`enable_epq_cache`, the
+    result is looked up in (and added to) the cache; see
+    :class:`EPQCache`.
+
     References
     ----------
     .. [#exp4] Nicholas J. Higham (2005)
@@ -1408,6 +1714,13 @@ def getEPQ(A, h, order=1, B=None, half=False):
     >>> Q
     0.0
     """
+    if _EPQ_CACHE is not None:
+        return _EPQ_CACHE.get(A, h, order, B, half)
+    return _getEPQ(A, h, order, B, half)
+
+
+def _getEPQ(A, h, order, B, half):
+    """Uncached version of :func:`getEPQ`"""
     norm1 = h * np.linalg.norm(A, 1)
     if norm1 <= 2.097847961257068:
         return getEPQ1(A, h, order, B, half)
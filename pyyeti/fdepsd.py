@@ -33,29 +33,33 @@ def _mk_par_globals(wn, sig, asv, binamps, count):
     Count_ = _to_np_array(count)
 
 
+def _fde_freq(j, Wn, sig, ASV, BinAmps, Count, coeffunc, Q, dT, verbose):
+    """Utility routine for parallel processing; does the calculations
+    for frequency `j`"""
+    if verbose:
+        print(f"Processing frequency {Wn[j] / 2 / np.pi:8.2f} Hz", end="\r")
+    b, a = coeffunc(Q, dT, Wn[j])
+    resphist = signal.lfilter(b, a, sig)
+    ASV[1, j] = abs(resphist).max()
+    ASV[2, j] = np.var(resphist, ddof=1)
+
+    # use rainflow to count cycles and get cumulative bin counts:
+    BinAmps[j], Count[j], ASV[0, j] = cyclecount.cumcount(resphist, BinAmps.shape[1])
+
+
 def _dofde(args):
     """Utility routine for parallel processing"""
     (j, (coeffunc, Q, dT, verbose)) = args
-    if verbose:
-        print(f"Processing frequency {WN_[j] / 2 / np.pi:8.2f} Hz", end="\r")
-    b, a = coeffunc(Q, dT, WN_[j])
-    resphist = signal.lfilter(b, a, SIG_)
-    ASV_[1, j] = abs(resphist).max()
-    ASV_[2, j] = np.var(resphist, ddof=1)
-
-    # use rainflow to count cycles:
-    ind = cyclecount.findap(resphist)
-    rf = cyclecount.rainflow(resphist[ind])
+    _fde_freq(j, WN_, SIG_, ASV_, BinAmps_, Count_, coeffunc, Q, dT, verbose)
 
-    amp = rf["amp"]
-    count = rf["count"]
-    ASV_[0, j] = amp.max()
-    BinAmps_[j] *= ASV_[0, j]
 
-    # cumulative bin count:
-    for jj in range(BinAmps_.shape[1]):
-        pv = amp >= BinAmps_[j, jj]
-        Count_[j, jj] = np.sum(count[pv])
+def _dofde_shared(args):
+    """Utility routine for processing a range of frequencies in a
+    :class:`pyyeti.srs.SharedExecutor` worker"""
+    (j0, j1, descs, (coeffunc, Q, dT, verbose)) = args
+    Wn, sig, ASV, BinAmps, Count = (srs._attach(desc) for desc in descs)
+    for j in range(j0, j1):
+        _fde_freq(j, Wn, sig, ASV, BinAmps, Count, coeffunc, Q, dT, verbose)
 
 
 def fdepsd(
@@ -73,6 +77,7 @@ def fdepsd(
     parallel="auto",
     maxcpu=14,
     verbose=False,
+    executor=None,
 ):
     r"""
     Compute a fatigue damage equivalent PSD from a signal.
@@ -194,6 +199,12 @@ def fdepsd(
         :func:`multiprocessing.cpu_count`).
     verbose : bool; optional
         If True, routine will print some status information.
+    executor : :class:`pyyeti.srs.SharedExecutor` or None; optional
+        If not None, the frequencies are split up among the
+        persistent worker processes of `executor`, with the data
+        transported through its reusable shared memory buffers. This
+        is done regardless of the size of the problem; `parallel` and
+        `maxcpu` are ignored.
 
     Returns
     -------
@@ -302,6 +313,9 @@ def fdepsd(
               and amplitudes
           e.  Put counts into amplitude bins
 
+          Steps c, d and e are done together by
+          :func:`pyyeti.cyclecount.cumcount`.
+
       3.  Calculate `g1` based on cycle amplitudes from maximum
           amplitude (step 2d) and Mile's (or similar) equation.
       4.  Calculate `g2` to bound `g1` & lower amplitude cycles with
@@ -552,11 +566,31 @@ def fdepsd(
     dT = 1 / sr
     pi = np.pi
     Wn = 2 * pi * freq
-    parallel, ncpu = srs._process_parallel(
-        parallel, LF, sig.size, maxcpu, getresp=False
-    )
+    if executor is not None:
+        parallel, ncpu = "yes", executor.ncpu
+    else:
+        parallel, ncpu = srs._process_parallel(
+            parallel, LF, sig.size, maxcpu, getresp=False
+        )
     # allocate RAM:
-    if parallel == "yes":
+    if executor is not None:
+        descs = [executor.share("fde_wn", Wn), executor.share("fde_sig", sig)]
+        ASV, desc = executor.shared("fde_asv", (3, LF))
+        descs.append(desc)
+        BinAmps, desc = executor.shared("fde_binamps", (LF, nbins))
+        BinAmps[:] = np.arange(nbins, dtype=float) / nbins
+        descs.append(desc)
+        Count, desc = executor.shared("fde_count", (LF, nbins))
+        descs.append(desc)
+        args = (coeffunc, Q, dT, verbose)
+        executor.map(
+            _dofde_shared,
+            [(j0, j1, descs, args) for j0, j1 in executor.ranges(LF)],
+        )
+        Amax, SRSmax, Var = ASV.copy()
+        BinAmps = BinAmps.copy()
+        Count = Count.copy()
+    elif parallel == "yes":
         # global shared vars will be: WN, SIG, ASV, BinAmps, Count
         WN = (srs.copyToSharedArray(Wn), Wn.shape)
         SIG = (srs.copyToSharedArray(sig), sig.shape)
@@ -597,19 +631,9 @@ def fdepsd(
             SRSmax[j] = abs(resphist).max()
             Var[j] = np.var(resphist, ddof=1)
 
-            # use rainflow to count cycles:
-            ind = cyclecount.findap(resphist)
-            rf = cyclecount.rainflow(resphist[ind])
-
-            amp = rf["amp"]
-            count = rf["count"]
-            Amax[j] = amp.max()
-            BinAmps[j] *= Amax[j]
-
-            # cumulative bin count:
-            for jj in range(nbins):
-                pv = amp >= BinAmps[j, jj]
-                Count[j, jj] = np.sum(count[pv])
+            # use rainflow to count cycles and get cumulative bin
+            # counts:
+            BinAmps[j], Count[j], Amax[j] = cyclecount.cumcount(resphist, nbins)
 
     if verbose:
         print()
@@ -17,6 +17,7 @@ import re
 import textwrap
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 import matplotlib.pyplot as plt
 from pyyeti import locate, writer, ytools, guitools
 from pyyeti.nastran import n2p, op4, op2
@@ -27,6 +28,7 @@ __all__ = [
     "fsearch",
     "rdgpwg",
     "rdcards",
+    "clear_bulk_cache",
     "rddmig",
     "mkcomment",
     "wtdmig",
@@ -456,6 +458,534 @@ def _rdcomma(fiter, s, conchar, blank, tolist, keep_name):
     return vals
 
 
+# cache of bulk data files scanned by :func:`rdcards`; see
+# :func:`_get_bulk_text` and :func:`clear_bulk_cache`:
+_BULK_CACHE = {}
+_BULK_CACHE_SIZE = 2
+
+# character classes and state transition table for the vectorized
+# number scanner (:func:`_scan_fields`). Accepted are integers and
+# floats, including the Nastran shortcuts "1.7-4" and "1.7d-4":
+_WS, _DIG, _SGN, _DOT, _EXP, _DEXP, _OTH = range(7)
+_CHARCLASS = np.array([_WS if chr(i).isspace() else _OTH for i in range(256)], np.int8)
+_CHARCLASS[48:58] = _DIG
+_CHARCLASS[[43, 45]] = _SGN
+_CHARCLASS[46] = _DOT
+_CHARCLASS[[69, 101]] = _EXP
+_CHARCLASS[[68, 100]] = _DEXP
+
+# white space characters above 255:
+_UNICODE_WS = [i for i in range(256, 0x3001) if chr(i).isspace()]
+
+
+def _charclass(chars):
+    """Return character class (`_WS`, `_DIG`, etc) of each code"""
+    if chars.dtype != np.uint8:
+        high = chars > 255
+        if high.any():
+            chars = np.where(
+                high, np.where(np.isin(chars, _UNICODE_WS), 32, 255), chars
+            )
+    return _CHARCLASS[chars]
+
+
+# states: 0 start, 1 sign, 2 integer, 3 "1.", 4 ".", 5 fraction,
+# 6 exponent letter, 7 exponent sign, 8 exponent, 9 integer then
+# white space, 10 float then white space, 11 invalid
+_X = 11
+_TRANSITIONS = np.array(
+    [
+        # ws, dig, sgn, dot, exp, dexp, oth
+        [0, 2, 1, 4, _X, _X, _X],
+        [_X, 2, _X, 4, _X, _X, _X],
+        [9, 2, 7, 3, 6, 6, _X],
+        [10, 5, 7, _X, 6, 6, _X],
+        [_X, 5, _X, _X, _X, _X, _X],
+        [10, 5, 7, _X, 6, 6, _X],
+        [_X, 8, 7, _X, _X, _X, _X],
+        [_X, 8, _X, _X, _X, _X, _X],
+        [10, 8, _X, _X, _X, _X, _X],
+        [9, _X, _X, _X, _X, _X, _X],
+        [10, _X, _X, _X, _X, _X, _X],
+        [_X, _X, _X, _X, _X, _X, _X],
+    ],
+    np.int8,
+)
+
+
+def _scan_fields(chars, keep_string, cls=None):
+    """
+    Vectorized version of :func:`nas_sscanf` for many fields
+
+    Parameters
+    ----------
+    chars : 2d ndarray
+        Character codes (np.uint8 for ascii or np.uint32 for unicode)
+        of the fields, one field per row.
+    keep_string : bool
+        Passed to :func:`nas_sscanf` for fields that are not numbers.
+    cls : 2d ndarray or None; optional
+        ``_charclass(chars)`` if already available.
+
+    Returns
+    -------
+    kind : 1d ndarray
+        For each field: 0 if blank, 1 if integer, 2 if float and 3
+        for anything else.
+    ints, floats : 1d ndarrays
+        The values of the integer and float fields, in order.
+    others : list
+        For each field of kind 3, the output of :func:`nas_sscanf`.
+
+    Notes
+    -----
+    All fields are scanned together, one character column at a
+    time. Only fields that are not simple numbers (strings, "nan",
+    etc) are passed to :func:`nas_sscanf`, so the results are the
+    same as calling :func:`nas_sscanf` on each field.
+    """
+    n, w = chars.shape
+    if cls is None:
+        cls = _charclass(chars)
+    table = _TRANSITIONS.ravel()
+    state = np.zeros(n, np.int8)
+    shpos = np.full(n, w)
+    for j, c in enumerate(np.ascontiguousarray(cls.T)):
+        prev = state
+        state = table.take(prev * 7 + c)
+        sign = c == _SGN
+        if sign.any():
+            # exponent sign without letter, as in "1.7-4":
+            shpos[sign & ((prev == 2) | (prev == 3) | (prev == 5))] = j
+
+    isint = (state == 2) | (state == 9)
+    if isint.any():
+        isint[isint] = (cls[isint] == _DIG).sum(axis=1) <= 18
+    isflt = (state == 3) | (state == 5) | (state == 8) | (state == 10)
+    kind = np.full(n, 3, np.int8)
+    kind[state == 0] = 0
+    kind[isint] = 1
+    kind[isflt] = 2
+
+    sdtype = f"S{w}" if chars.dtype == np.uint8 else f"U{w}"
+    ints = chars[isint].view(sdtype).ravel().astype(np.int64)
+
+    floats = np.empty(isflt.sum())
+    # "d" -> "e" and insert "e" before shortcut exponent sign:
+    hasd = (cls[isflt] == _DEXP).any(axis=1)
+    p = shpos[isflt]
+    fix = hasd | (p < w)
+    floats[~fix] = chars[isflt][~fix].view(sdtype).ravel().astype(np.float64)
+    if fix.any():
+        rows = np.nonzero(isflt)[0][fix]
+        fc = chars[rows]
+        fc[cls[rows] == _DEXP] = 101
+        p = p[fix, None]
+        col = np.arange(w + 1)
+        fc = fc[
+            np.arange(len(rows))[:, None],
+            np.minimum(np.where(col < p, col, col - 1), w - 1),
+        ]
+        fc[col == p] = 101
+        fc[(col == w) & (p == w)] = 32
+        sfix = f"S{w + 1}" if chars.dtype == np.uint8 else f"U{w + 1}"
+        floats[fix] = fc.view(sfix).ravel().astype(np.float64)
+
+    others = []
+    rows = kind == 3
+    if rows.any():
+        # card names and other strings repeat a lot; only scan each
+        # unique one:
+        strings, inv = np.unique(chars[rows].view(sdtype).ravel(), return_inverse=True)
+        if chars.dtype == np.uint8:
+            strings = [s.decode("ascii") for s in strings]
+        values = [nas_sscanf(s, keep_string) for s in strings]
+        others = [values[i] for i in inv]
+    return kind, ints, floats, others
+
+
+class _BulkText:
+    """
+    Text of a bulk data file prepared for fast card searches
+
+    The text is stored as an array of character codes (one per
+    character: np.uint8 for ascii files and np.uint32 otherwise)
+    along with the start and length of each line. Tabs are expanded
+    up front, just as :func:`_next_line` does line by line.
+    """
+
+    def __init__(self, text):
+        if "\t" in text:
+            text = text.expandtabs()
+        self.text = text
+        if text.isascii():
+            codes = np.frombuffer(text.encode("ascii"), np.uint8)
+        else:
+            codes = np.frombuffer(text.encode("utf-32-le"), np.uint32)
+        # codes padded with spaces for :func:`window`:
+        self._buf = np.concatenate((codes, np.full(80, 32, codes.dtype)))
+        self.codes = self._buf[: len(codes)]
+        nl = np.nonzero(codes == 10)[0]
+        starts = np.concatenate(([0], nl + 1))
+        ends = np.concatenate((nl, [len(codes)]))
+        if len(codes) == 0 or codes[-1] == 10:
+            # no line after final newline:
+            starts, ends = starts[:-1], ends[:-1]
+        self.starts = starts
+        self.lengths = ends - starts
+        self.nlines = len(starts)
+        # first character of each line (-1 for empty lines):
+        self.first = np.full(self.nlines, -1)
+        pv = self.lengths > 0
+        self.first[pv] = codes[starts[pv]]
+        # True for each line that contains a comma:
+        self.hascomma = np.zeros(self.nlines, bool)
+        if self.nlines:
+            self.hascomma[pv] = np.logical_or.reduceat(codes == 44, starts)[pv]
+        self._lines = None
+
+    def line(self, i):
+        """Return line `i` (without the newline)"""
+        s = self.starts[i]
+        return self.text[s : s + self.lengths[i]]
+
+    def lines(self):
+        """
+        Return list of all lines, including the newline characters,
+        just as iterating over the file would (created on first call)
+        """
+        if self._lines is None:
+            self._lines = self.text.splitlines(keepends=True)
+            if len(self._lines) != self.nlines:
+                self._lines = [
+                    self.text[s : s + n + 1]
+                    for s, n in zip(self.starts.tolist(), self.lengths.tolist())
+                ]
+        return self._lines
+
+    def window(self, lines, width):
+        """
+        Return character matrix of the first `width` (<= 80)
+        characters of each line in `lines`, padded with spaces
+        """
+        size = self._buf.itemsize
+        view = np.lib.stride_tricks.as_strided(
+            self._buf, (len(self.codes) + 1, width), (size, size), writeable=False
+        )
+        win = view[self.starts[lines]]
+        win[np.arange(width) >= self.lengths[lines, None]] = 32
+        return win
+
+    def match(self, name, regex):
+        """
+        Return indices of lines that match `name`; see :func:`rdcards`
+        """
+        if regex:
+            prog = re.compile(name, re.IGNORECASE)
+            return np.nonzero(list(map(bool, map(prog.match, self.lines()))))[0]
+        prog = name.lower()
+        if not (self.codes.dtype == np.uint8 and prog.isascii()):
+            return np.array(
+                [
+                    i
+                    for i, line in enumerate(self.lines())
+                    if line.lower().find(prog) == 0
+                ],
+                dtype=int,
+            )
+        cand = np.nonzero(self.lengths >= len(prog))[0]
+        for k, char in enumerate(prog.encode("ascii")):
+            codes = self.codes[self.starts[cand] + k]
+            # lower case:
+            codes = np.where((codes >= 65) & (codes <= 90), codes + 32, codes)
+            cand = cand[codes == char]
+        return cand
+
+    def continued(self, chars):
+        """
+        Return boolean array that is True for each line that starts
+        with one of the characters in `chars`
+        """
+        return np.isin(self.first, [ord(c) for c in chars])
+
+
+def _get_bulk_text(f):
+    """
+    Return :class:`_BulkText` for file `f`, using the cache if
+    possible; see :func:`clear_bulk_cache`
+    """
+    name = getattr(f, "name", None)
+    stamp = None
+    if isinstance(name, str) and os.path.isfile(name):
+        st = os.stat(name)
+        path = os.path.abspath(name)
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = _BULK_CACHE.pop(path, None)
+        if entry is not None and entry[0] == stamp:
+            _BULK_CACHE[path] = entry  # most recently used
+            return entry[1]
+    f.seek(0, 0)
+    bt = _BulkText(f.read())
+    if stamp is not None:
+        while len(_BULK_CACHE) >= _BULK_CACHE_SIZE:
+            _BULK_CACHE.pop(next(iter(_BULK_CACHE)))
+        _BULK_CACHE[path] = stamp, bt
+    return bt
+
+
+def clear_bulk_cache(filename=None):
+    """
+    Clear the cache used by :func:`rdcards`
+
+    Parameters
+    ----------
+    filename : string or None; optional
+        If None, the entire cache is cleared. Otherwise, only the
+        entry for `filename` is removed (if present) so it will be
+        read again on the next call to :func:`rdcards`.
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    Files are automatically read again when their modification time
+    or size changes. Clearing the cache is only needed if a file is
+    changed without changing either of those or to release the
+    memory.
+    """
+    if filename is None:
+        _BULK_CACHE.clear()
+    else:
+        _BULK_CACHE.pop(os.path.abspath(filename), None)
+
+
+def _rstrip_len(nonws):
+    """
+    Length of each row after ``rstrip()``; `nonws` is a boolean
+    matrix that is False for white space characters
+    """
+    last = nonws.shape[1] - np.argmax(nonws[:, ::-1], axis=1)
+    return np.where(nonws.any(axis=1), last, 0)
+
+
+def _rdcomma_fields(lines, keep_name):
+    """
+    Return the fields of a comma delimited card as strings
+
+    Like :func:`_rdcomma`, but the fields are not converted and
+    blank fields are set to "". `lines` is a list of the lines of the
+    card (the continuation lines are already determined).
+    """
+    vals = []
+    i = -1
+    nfields = -1
+    inc = 8
+    start_field = 0 if keep_name else 1
+    for k, s in enumerate(lines):
+        if k:
+            nfields += inc
+        s = _proc_line(s)
+        for i in range(i, nfields):
+            vals.append("")
+        i = nfields
+        tok = s.split(",")
+        lentok = min(len(tok), 9)
+        for j in range(start_field, lentok):
+            i += 1
+            vals.append(tok[j])
+        # first field for continuation cards will never be retained:
+        start_field = 1
+    return vals
+
+
+def _fixed_fields(bt, starts, ends, n, keep_name):
+    """
+    Return the fields of fixed field cards as a character matrix
+
+    Parameters
+    ----------
+    bt : :class:`_BulkText`
+        The bulk data text.
+    starts, ends : 1d ndarrays
+        Line numbers of the start and end (exclusive) of each card.
+    n : integer
+        The field width, 8 or 16.
+    keep_name : bool
+        If True, the card name is included as the first field.
+
+    Returns
+    -------
+    chars : 2d ndarray
+        Character codes of the fields, one field per row (padded
+        with spaces to width `n`).
+    cls : 2d ndarray
+        ``_charclass(chars)``
+    card, pos : 1d ndarrays
+        Card index (into `starts`) and position on the card of each
+        field.
+    lengths : 1d ndarray
+        Number of fields on each card.
+
+    Notes
+    -----
+    The fields are located exactly as :func:`_rdfixed` does, but for
+    all lines of all cards at once.
+    """
+    inc = 8 if n == 8 else 4
+    nl = ends - starts
+    offsets = np.cumsum(nl) - nl
+    k = np.arange(nl.sum())
+    lines = np.repeat(starts - offsets, nl) + k
+    lk = k - np.repeat(offsets, nl)
+    lcard = np.repeat(np.arange(len(starts)), nl)
+    chars = bt.window(lines, 72)
+    cls = _charclass(chars)
+
+    # remove comments:
+    dollar = chars == 36
+    cpos = np.where(dollar.any(axis=1), np.argmax(dollar, axis=1), 72)
+    comment = np.arange(72) >= cpos[:, None]
+
+    # the length of the first line includes any comment:
+    nonws = cls != _WS
+    length = np.where(lk == 0, _rstrip_len(nonws), _rstrip_len(nonws & ~comment))
+    chars = np.where(comment, 32, chars).astype(chars.dtype)
+    cls[comment] = _WS
+    nf = np.clip((length - 8 + n - 1) // n, 0, inc)
+    first = int(keep_name)
+
+    lengths = np.zeros(len(starts), int)
+    lengths[lcard] = lk * inc + nf + first  # last line of card wins
+    has = np.arange(inc) < nf[:, None]
+    fields = chars[:, 8:72].reshape(-1, inc, n)[has]
+    cls = cls[:, 8:72].reshape(-1, inc, n)[has]
+    card = np.broadcast_to(lcard[:, None], has.shape)[has]
+    pos = ((lk * inc + first)[:, None] + np.arange(inc))[has]
+    if keep_name:
+        names = np.full((len(starts), n), 32, chars.dtype)
+        names[:, :8] = chars[lk == 0, :8]
+        fields = np.vstack((names, fields))
+        cls = _charclass(fields)
+        card = np.concatenate((np.arange(len(starts)), card))
+        pos = np.concatenate((np.zeros(len(starts), int), pos))
+    return fields, cls, card, pos, lengths
+
+
+def _rdcards_fast(f, name, blank, return_var, dtype, regex, keep_name):
+    """
+    Bulk version of :func:`rdcards`; returns None if no cards
+
+    The file is scanned once (and cached; see :func:`_get_bulk_text`)
+    and the matching cards are located and tokenized with numpy.
+    Fixed field cards are split into fields with a reshape and all
+    fields are converted by :func:`_scan_fields`.
+    """
+    bt = _get_bulk_text(f)
+    tolist = return_var == "list"
+    keep_name = tolist and keep_name
+    starts = bt.match(name, regex)
+    if len(starts) == 0:
+        return None
+
+    # format of each card: 0 = 8 char, 1 = 16 char, 2 = comma:
+    fmt = np.where(bt.window(starts, 8) == 42, 1, 0).max(axis=1)
+    fmt[bt.hascomma[starts]] = 2
+    ends = np.empty_like(starts)
+    for i, conchar in enumerate((" +", "*", " +,")):
+        pv = fmt == i
+        if pv.any():
+            stop = np.nonzero(~bt.continued(conchar))[0]
+            stop = np.append(stop, bt.nlines)
+            ends[pv] = stop[np.searchsorted(stop, starts[pv] + 1)]
+
+    # a matching line may be a continuation of a previous card:
+    if np.any(starts[1:] < ends[:-1]):
+        keep = []
+        nxt = 0
+        for j, (s, e) in enumerate(zip(starts, ends)):
+            if s >= nxt:
+                keep.append(j)
+                nxt = e
+        starts, ends, fmt = starts[keep], ends[keep], fmt[keep]
+
+    ncards = len(starts)
+    lengths = np.zeros(ncards, int)
+    groups = []
+    for i, n in enumerate((8, 16)):
+        cards = np.nonzero(fmt == i)[0]
+        if len(cards):
+            chars, cls, card, pos, lens = _fixed_fields(
+                bt, starts[cards], ends[cards], n, keep_name
+            )
+            lengths[cards] = lens
+            groups.append((chars, cls, cards[card], pos, keep_name))
+
+    cards = np.nonzero(fmt == 2)[0]
+    if len(cards):
+        toks = []
+        card = []
+        pos = []
+        for j in cards:
+            lines = [bt.line(i) for i in range(starts[j], ends[j])]
+            vals = _rdcomma_fields(lines, keep_name)
+            toks.extend(vals)
+            card.extend([j] * len(vals))
+            pos.extend(range(len(vals)))
+            lengths[j] = len(vals)
+        if toks:
+            arr = np.array(toks)
+            w = arr.itemsize // 4
+            chars = arr.view(np.uint32).reshape(-1, w).copy()
+            chars[np.arange(w) >= np.array([len(t) for t in toks])[:, None]] = 32
+            if bt.codes.dtype == np.uint8:
+                chars = chars.astype(np.uint8)
+            groups.append((chars, None, np.array(card), np.array(pos), False))
+
+    if tolist:
+        dtype = object
+    if return_var == "array":
+        out = np.empty((ncards, lengths.max()), dtype=dtype)
+        flat = out.reshape(-1)
+    else:
+        offsets = np.cumsum(lengths) - lengths
+        out = flat = np.empty(lengths.sum(), dtype=dtype)
+    out[:] = blank
+    keys = [blank] * ncards
+    for chars, cls, card, pos, has_names in groups:
+        kind, ints, floats, others = _scan_fields(chars, tolist, cls)
+        if return_var == "array":
+            index = card * out.shape[1] + pos
+        else:
+            index = offsets[card] + pos
+        if has_names:
+            # like _rdfixed, keep the name even if it is None:
+            flat[index[pos == 0]] = None
+        for k, values in ((1, ints), (2, floats)):
+            pv = kind == k
+            flat[index[pv]] = values
+            pv0 = pos[pv] == 0
+            for c, v in zip(card[pv][pv0].tolist(), values[pv0].tolist()):
+                keys[c] = v
+        pv = kind == 3
+        found = [v is not None for v in others]
+        if any(found):
+            values = [v for v in others if v is not None]
+            # convert as np.array(vals).astype(dtype) would:
+            flat[index[pv][found]] = np.array(values, dtype=object if tolist else None)
+            for c, p, v in zip(card[pv][found], pos[pv][found], values):
+                if p == 0:
+                    keys[c] = v
+
+    if return_var == "array":
+        return out
+    if return_var == "dict":
+        return {key: out[o : o + n] for key, o, n in zip(keys, offsets, lengths)}
+    out = out.tolist()
+    return [out[o : o + n] for o, n in zip(offsets.tolist(), lengths.tolist())]
+
+
 @ytools.read_text_file
 def rdcards(
     f,
@@ -563,6 +1093,16 @@ def rdcards(
     would return ``[1, 0, 0, 0, 0, 0, 0, 0]`` since it knows the
     number of fields a GRID card has.
 
+    For numeric output (and for lists when `keep_comments` is False),
+    the cards are located and split into fields with vectorized
+    operations over the whole file and the numbers are converted in
+    bulk; only fields that are not simple numbers go through
+    :func:`nas_sscanf`. The text of files read by name is cached
+    (keyed on the modification time and size) so that repeated calls
+    on the same file, as in :func:`rdgrids` followed by
+    :func:`rdcord2cards`, do not read it again. See
+    :func:`clear_bulk_cache`.
+
     Examples
     --------
     Create some bulk data to read (not necessarily valid):
@@ -652,6 +1192,10 @@ def rdcards(
     if blank is None:
         blank = "" if tolist else 0
 
+    if not (tolist and keep_comments) and (tolist or np.dtype(dtype).kind in "biufc"):
+        Vals = _rdcards_fast(f, name, blank, return_var, dtype, regex, keep_name)
+        return no_data_return if Vals is None else Vals
+
     mxlen = 0
     f.seek(0, 0)
 
@@ -700,7 +1244,15 @@ def rdcards(
     return no_data_return
 
 
-def rddmig(f, dmig_names=None, *, expanded=False, square=False):
+def rddmig(
+    f,
+    dmig_names=None,
+    *,
+    expanded=False,
+    square=False,
+    sparse=False,
+    index_cache=False,
+):
     """
     Read DMIG entries from a Nastran punch (bulk) or output2 file.
 
@@ -725,6 +1277,15 @@ def rddmig(f, dmig_names=None, *, expanded=False, square=False):
         Only used for "square" matrices (``form=1``). If True, ensures
         that the row and column indices are the same by filling in
         zeros as necessary.
+    sparse : bool; optional; must be named
+        If True, the matrices are built directly in
+        :class:`scipy.sparse.csc_matrix` form instead of as (dense)
+        pandas DataFrames; see below. This is recommended for large
+        matrices that are mostly zero (like stiffness matrices).
+    index_cache : bool; optional; must be named
+        Only used for output2 files. If True, use and update the
+        sidecar index file for the op2 file; see
+        :class:`pyyeti.nastran.op2.OP2`.
 
     Returns
     -------
@@ -736,6 +1297,12 @@ def rddmig(f, dmig_names=None, *, expanded=False, square=False):
         the column index in that case is just the column number (as
         specified by Nastran).
 
+        If `sparse` is True, each entry is instead a 3-tuple:
+        ``(matrix, rowindex, colindex)``, where `matrix` is a
+        :class:`scipy.sparse.csc_matrix` and `rowindex` and
+        `colindex` are the indices that would have been used for the
+        DataFrame. This tuple can be written with :func:`wtdmig`.
+
     Notes
     -----
     For the punch format, this routine first reads all DMIG entries
@@ -747,6 +1314,11 @@ def rddmig(f, dmig_names=None, *, expanded=False, square=False):
     For the output2 format, this routine scans through the file
     looking for matching DMIG data-blocks and only reads those in.
 
+    With the `sparse` option, the row and column DOF for all terms
+    are gathered into arrays first and the indices and matrix are
+    formed with vectorized operations; no dense matrix is ever
+    created.
+
     .. note::
         This routine is more lenient than Nastran. Nastran will issue
         a FATAL message if a symmetric matrix has entries for element
@@ -862,6 +1434,78 @@ def rddmig(f, dmig_names=None, *, expanded=False, square=False):
         ind = index.to_frame().values
         return ind[:, 0] * 10 + ind[:, 1]
 
+    def _sparse_index(ids, dofs):
+        # ids, dofs are in order of appearance; returns index & the
+        # sorted 1d id*10 + dof keys for searchsorted
+        if expanded:
+            ids, first = np.unique(ids, return_index=True)
+            isgrid = dofs[first] > 0
+            n = np.where(isgrid, 6, 1)
+            start = np.cumsum(n) - n
+            ids = np.repeat(ids, n)
+            dofs = np.arange(len(ids)) - np.repeat(start, n) + 1
+            dofs[np.repeat(~isgrid, n)] = 0
+        else:
+            keys = np.unique(ids * 10 + dofs)
+            ids, dofs = keys // 10, keys % 10
+        index = pd.MultiIndex.from_arrays([ids, dofs], names=["id", "dof"])
+        return index, ids * 10 + dofs
+
+    def _mk_sparse(form, mtype, ncol, col_id, col_dof, nterms, row_id, row_dof, vals):
+        # col_id, col_dof: one per column (DMIG entry)
+        # row_id, row_dof, vals: one per term; nterms: terms per column
+        dtype = float if mtype < 3 else complex
+        if form != 9:
+            if form == 6 or (form == 1 and square):
+                rowindex, r_id_dof = _sparse_index(
+                    np.concatenate((row_id, col_id)),
+                    np.concatenate((row_dof, col_dof)),
+                )
+                colindex, c_id_dof = rowindex, r_id_dof
+            else:
+                rowindex, r_id_dof = _sparse_index(row_id, row_dof)
+                colindex, c_id_dof = _sparse_index(col_id, col_dof)
+            ci = np.searchsorted(c_id_dof, col_id * 10 + col_dof)
+        else:
+            rowindex, r_id_dof = _sparse_index(row_id, row_dof)
+            if expanded:
+                colindex = np.arange(1, ncol + 1)
+            else:
+                colindex = np.unique(col_id)
+            c_id_dof = colindex
+            ci = np.searchsorted(c_id_dof, col_id)
+        ci = np.repeat(ci, nterms)
+        ri = np.searchsorted(r_id_dof, row_id * 10 + row_dof)
+        if form == 6:
+            ri, ci = (
+                np.column_stack((ri, ci)).ravel(),
+                np.column_stack((ci, ri)).ravel(),
+            )
+            vals = np.repeat(vals, 2)
+
+        # last value wins for repeated (i, j) terms:
+        nrows, ncols = len(r_id_dof), len(c_id_dof)
+        ij = ci * nrows + ri
+        last = len(ij) - 1 - np.unique(ij[::-1], return_index=True)[1]
+        mat = sp.csc_matrix(
+            (vals[last], (ri[last], ci[last])), shape=(nrows, ncols), dtype=dtype
+        )
+        return mat, rowindex, colindex
+
+    def _cards_to_sparse(c, form, mtype, ncol):
+        # c is the list of DMIG column entries for one matrix
+        col_id = np.array([col[1] for col in c], np.int64)
+        col_dof = np.array([col[2] for col in c], np.int64)
+        nterms = np.array([len(col[4::4]) for col in c], np.int64)
+        row_id = np.array([v for col in c for v in col[4::4]], np.int64)
+        row_dof = np.array([v for col in c for v in col[5::4]], np.int64)
+        vals = np.array([v for col in c for v in col[6::4]], float)
+        if mtype > 2:
+            vals = vals + 1j * np.array([v for col in c for v in col[7::4]], float)
+        return _mk_sparse(
+            form, mtype, ncol, col_id, col_dof, nterms, row_id, row_dof, vals
+        )
+
     def _cards_to_df(c, dmig_names):
         # punch file
         def _next_i(c, i):
@@ -884,6 +1528,14 @@ def rddmig(f, dmig_names=None, *, expanded=False, square=False):
             mtype = c[i][3]
             ncol = c[i][7] if form == 9 else None
 
+            if sparse:
+                j = i + 1
+                while j < len(c) and c[j][0].lower() == name:
+                    j += 1
+                dct[name] = _cards_to_sparse(c[i + 1 : j], form, mtype, ncol)
+                i = j
+                continue
+
             # Count DOF for DMIG name
             j = i + 1
             row_ids = set()
@@ -961,6 +1613,42 @@ def rddmig(f, dmig_names=None, *, expanded=False, square=False):
             name, trailer, dbtype = o2.rdop2nt()
         return dct
 
+    def _rec_to_sparse(rec, form, mtype, ncol, step, ints_per_number, dtype):
+        # find start and number of terms of each column; see
+        # _recs_to_df for format
+        cols = []
+        nterms = []
+        j = 12
+        while j < len(rec) - 2:
+            cols.append(j)
+            j += 2
+            rowids = rec[j::step]
+            n = 64
+            while True:
+                end = np.flatnonzero(rowids[:n] == -1)
+                if end.size or n >= len(rowids):
+                    break
+                n *= 2
+            nterms.append(end[0])
+            j += step * end[0] + 2
+        cols = np.array(cols, np.int64)
+        nterms = np.array(nterms, np.int64)
+        start = np.cumsum(nterms) - nterms
+        pv = np.repeat(cols + 2 - step * start, nterms) + step * np.arange(nterms.sum())
+        words = rec[pv[:, None] + np.arange(2, 2 + ints_per_number)]
+        vals = np.ascontiguousarray(words).view(dtype).ravel()
+        return _mk_sparse(
+            form,
+            mtype,
+            ncol,
+            rec[cols].astype(np.int64),
+            rec[cols + 1].astype(np.int64),
+            nterms,
+            rec[pv].astype(np.int64),
+            rec[pv + 1].astype(np.int64),
+            vals,
+        )
+
     def _recs_to_df(recs):
         dct = {}
         for name, rec in recs.items():
@@ -977,6 +1665,12 @@ def rddmig(f, dmig_names=None, *, expanded=False, square=False):
                 dtype = np.float64 if mtype == 2 else np.float32
             step = 2 + ints_per_number  # row id, dof, <number>
 
+            if sparse:
+                dct[name] = _rec_to_sparse(
+                    rec, form, mtype, ncol, step, ints_per_number, dtype
+                )
+                continue
+
             # Count DOF for DMIG
             row_ids = set()
             col_ids = set()
@@ -1062,7 +1756,7 @@ def rddmig(f, dmig_names=None, *, expanded=False, square=False):
     # read op2 or punch ... try op2, if that fails, assume punch:
     dmigfile = guitools.get_file_name(f, read=True)
     try:
-        o2 = op2.OP2(dmigfile)
+        o2 = op2.OP2(dmigfile, index_cache)
     except ValueError:
         cards = rdcards(dmigfile, name="dmig", return_var="list", blank="")
         dct = _cards_to_df(cards, dmig_names)
@@ -1152,6 +1846,13 @@ def wtdmig(f, dct):
         for Nastran). Use an OrderedDict from the standard Python
         "collections" module to write the entries in a specific order.
 
+        Instead of a DataFrame, an entry can also be a 3-tuple:
+        ``(matrix, rowindex, colindex)`` as returned by
+        :func:`rddmig` with the `sparse` option. `matrix` may be a
+        :mod:`scipy.sparse` matrix or an ndarray; the indices are
+        either pandas indices as described above or 2-column (or,
+        for form 9 columns, 1-d) integer arrays of [id, dof].
+
     Returns
     -------
     None
@@ -1169,6 +1870,9 @@ def wtdmig(f, dct):
 
     The type is determined by the numpy 'dtype' attribute.
 
+    Matrices are written from their compressed sparse column form,
+    so :mod:`scipy.sparse` matrices are never converted to dense.
+
     Currently, both 'POLAR' and 'TOUT' header card values are set to
     0. That means that complex numbers are written in real/imaginary
     parts and the resulting precision in Nastran is automatically
@@ -1229,32 +1933,40 @@ def wtdmig(f, dct):
     """
     for name, value in dct.items():
         name = name.upper()
-        rowids = value.index
-        colids = value.columns
+        if isinstance(value, tuple):
+            m, rowids, colids = value
+        else:
+            m, rowids, colids = value.values, value.index, value.columns
+        rowids = _iddof_array(rowids)
+        colids = _iddof_array(colids)
         # row index must be 2-level MultiIndex:
-        if rowids.nlevels != 2:
+        if rowids.ndim != 2 or rowids.shape[1] != 2:
+            nlevels = rowids.shape[1] if rowids.ndim == 2 else 1
             raise ValueError(
-                f'"{name}" must have a 2-level row index but has '
-                f"{rowids.nlevels} levels"
+                f'"{name}" must have a 2-level row index but has ' f"{nlevels} levels"
             )
 
-        if colids.nlevels > 2:
+        if colids.ndim == 2 and colids.shape[1] > 2:
             raise ValueError(
                 f'"{name}" must have a 1 or 2-level column index but has '
-                f"{colids.nlevels} levels"
+                f"{colids.shape[1]} levels"
             )
 
-        m = value.values
-        ncol = value.shape[1]
+        m = sp.csc_matrix(m)
+        m.sort_indices()
+        ncol = m.shape[1]
 
         # determine form of matrix:
-        if colids.nlevels == 1:
+        if colids.ndim == 1:
             form = 9
             ncol = colids.max()
-        elif value.shape[0] != value.shape[1]:
+        elif m.shape[0] != m.shape[1]:
             form = 2
         else:
-            if np.allclose(m.transpose(), m):
+            # same test as np.allclose(m.T, m):
+            mt = m.T.tocsc()
+            diff = abs(m - mt) - 1e-5 * abs(mt)
+            if diff.nnz == 0 or diff.max() <= 1e-8:
                 form = 6
             else:
                 form = 1
@@ -1276,26 +1988,40 @@ def wtdmig(f, dct):
         )
 
         # write a column at a time:
-        for col in range(m.shape[1]):
-            if m[:, col].any():
-                start_row = col if form == 6 else 0
-                if colids.nlevels == 2:
-                    gj, cj = colids[col]
-                else:
-                    gj = colids[col]
-                    cj = 0
-                f.write(f"{'DMIG*':<8s}{name:<16s}{gj:16d}{cj:16d}\n")
-                for row in range(start_row, m.shape[0]):
-                    num = m[row, col]
-                    if num != 0.0:
-                        gi, ci = rowids[row]
-                        if mtype < 3:  # real
-                            num_str = f"{num:16.9E}"
-                        else:  # complex
-                            num_str = f"{num.real:16.9E}{num.imag:16.9E}"
-                        if mtype & 1 == 0:  # if even
-                            num_str = num_str.replace("E", "D")
-                        f.write(f"{'*':<8s}{gi:16d}{ci:16d}{num_str:s}\n")
+        nz = m.data != 0.0
+        cols = np.repeat(np.arange(m.shape[1]), np.diff(m.indptr))
+        colnz = np.bincount(cols[nz], minlength=m.shape[1]) > 0
+        keep = nz & (m.indices >= cols) if form == 6 else nz
+        nums = m.data[keep]
+        if mtype < 3:  # real
+            nums = [f"{num:16.9E}" for num in nums]
+        else:  # complex
+            nums = [f"{num.real:16.9E}{num.imag:16.9E}" for num in nums]
+        if mtype & 1 == 0:  # if even
+            nums = [num.replace("E", "D") for num in nums]
+        rows = [f"{'*':<8s}{gi:16d}{ci:16d}" for gi, ci in rowids]
+        lines = [f"{rows[row]}{num}\n" for row, num in zip(m.indices[keep], nums)]
+        ptr = np.concatenate(([0], np.cumsum(keep)))[m.indptr]
+        for col in np.nonzero(colnz)[0]:
+            if colids.ndim == 2:
+                gj, cj = colids[col]
+            else:
+                gj = colids[col]
+                cj = 0
+            f.write(f"{'DMIG*':<8s}{name:<16s}{gj:16d}{cj:16d}\n")
+            f.write("".join(lines[ptr[col] : ptr[col + 1]]))
+
+
+def _iddof_array(index):
+    """
+    Return DMIG row or column index as an integer array: 2-columns
+    [id, dof] for a 2-level index, 1-d otherwise
+    """
+    if isinstance(index, pd.MultiIndex):
+        return np.column_stack(
+            [index.get_level_values(i) for i in range(index.nlevels)]
+        )
+    return np.asarray(index)
 
 
 def rdgrids(f):
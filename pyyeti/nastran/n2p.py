@@ -28,6 +28,7 @@ from types import SimpleNamespace
 import numpy as np
 import pandas as pd
 import scipy.linalg as linalg
+import scipy.sparse as sp
 from pyyeti import locate, ytools
 
 
@@ -62,6 +63,7 @@ __all__ = [
     "replace_basic_cs",
     "upasetpv",
     "upqsetpv",
+    "UsetIndex",
     "usetprt",
 ]
 
@@ -157,7 +159,8 @@ def rbgeom_uset(uset, refpoint=np.array([[0, 0, 0]])):
     in the q-set or in the "left over" c-set will have 0's.
 
     This routine will handle grids in rectangular, cylindrical, and
-    spherical coordinates.
+    spherical coordinates. The transformations are done for all grids
+    at once with batched array operations.
 
     See also
     --------
@@ -193,6 +196,7 @@ def rbgeom_uset(uset, refpoint=np.array([[0, 0, 0]])):
            [  0.,   0.,   0.,   0.,  -1.,   0.],
            [  0.,   0.,   0.,   1.,   0.,   0.]])
     """
+    uset = _uset_df(uset)
     # find the grids (ignore spoints and epoints)
     r = uset.shape[0]
     grids = uset.index.get_level_values("id")
@@ -213,66 +217,60 @@ def rbgeom_uset(uset, refpoint=np.array([[0, 0, 0]])):
     uset = uset.iloc[grid_rows]
     ngrids = uset.shape[0] // 6
 
+    # coordinate info for each grid (6x3 each; see
+    # :func:`make_uset`):
+    info = uset.iloc[:, 1:].values.reshape(ngrids, 6, 3)
+    xyz = info[:, 0]
+    ctype = info[:, 1, 1]
+    T = info[:, 3:]  # T[g] transforms from local to basic
+
     # rigid-body modes in basic coordinate system:
-    uset_dof1 = uset.iloc[::6, :]
     if np.size(refpoint) == 1:
-        refpoint = uset_dof1.index.get_loc((refpoint, 1))
-    xyz = uset_dof1.loc[:, "x":"z"].values
-    rb = rbgeom(xyz, refpoint)
+        refpoint = uset.iloc[::6].index.get_loc((refpoint, 1))
+    rb = rbgeom(xyz, refpoint).reshape(ngrids, 2, 3, 6)
 
     # treat as rectangular here; fix cylindrical & spherical below
-    rb2 = np.zeros((np.shape(rb)))
-    for j in range(ngrids):
-        i = 6 * j
-        t = uset.iloc[i + 3 : i + 6, 1:].values.T
-        rb2[i : i + 3] = t @ rb[i : i + 3]
-        rb2[i + 3 : i + 6] = t @ rb[i + 3 : i + 6]
-
-    # fix up cylindrical:
-    grid_loc = np.arange(0, uset.shape[0], 6)
-    cyl = (uset.loc[(slice(None), 2), "y"] == 2).values
-    if cyl.any():
-        grid_loc_cyl = grid_loc[cyl]
-        for i in grid_loc_cyl:
-            t = uset.iloc[i + 3 : i + 6, 1:].values.T
-            loc = uset.iloc[i, 1:]
-            loc2 = t @ (loc - uset.iloc[i + 2, 1:]).values
-            if abs(loc2[1]) + abs(loc2[0]) > 1e-8:
-                th = math.atan2(loc2[1], loc2[0])
-                c = math.cos(th)
-                s = math.sin(th)
-                t = np.array([[c, s], [-s, c]])
-                rb2[i : i + 2] = t @ rb2[i : i + 2]
-                rb2[i + 3 : i + 5] = t @ rb2[i + 3 : i + 5]
-
-    # fix up spherical:
-    sph = (uset.loc[(slice(None), 2), "y"] == 3).values
+    # ... all grids at once: rb2[g] = T[g].T @ rb[g]
+    rb2 = np.einsum("gji,gkjl->gkil", T, rb)
+
+    # for cylindrical & spherical, need location in local
+    # rectangular:
+    loc2 = np.einsum("gji,gj->gi", T, xyz - info[:, 2])
+
+    # fix up cylindrical & 1st rotation for spherical:
+    pv = ((ctype == 2) | (ctype == 3)) & (abs(loc2[:, 1]) + abs(loc2[:, 0]) > 1e-8)
+    if pv.any():
+        th = np.arctan2(loc2[pv, 1], loc2[pv, 0])
+        c = np.cos(th)
+        s = np.sin(th)
+        t = np.stack((np.column_stack((c, s)), np.column_stack((-s, c))), axis=1)
+        rb2[pv, :, :2] = np.einsum("gij,gkjl->gkil", t, rb2[pv, :, :2])
+        loc2[pv, :2] = np.einsum("gij,gj->gi", t, loc2[pv, :2])
+
+    # 2nd rotation for spherical:
+    sph = ctype == 3
     if sph.any():
-        grid_loc_sph = grid_loc[sph]
-        for i in grid_loc_sph:
-            t = uset.iloc[i + 3 : i + 6, 1:].values.T
-            loc = uset.iloc[i, 1:]
-            loc2 = t @ (loc - uset.iloc[i + 2, 1:]).values
-            if abs(loc2[1]) + abs(loc2[0]) > 1e-8:
-                phi = math.atan2(loc2[1], loc2[0])
-                c = math.cos(phi)
-                s = math.sin(phi)
-                t = np.array([[c, s], [-s, c]])
-                rb2[i : i + 2] = t @ rb2[i : i + 2]
-                rb2[i + 3 : i + 5] = t @ rb2[i + 3 : i + 5]
-                loc2[:2] = t @ loc2[:2]
-            if abs(loc2[2]) + abs(loc2[0]) > 1e-8:
-                th = math.atan2(loc2[0], loc2[2])
-            else:
-                th = 0
-            c = math.cos(th)
-            s = math.sin(th)
-            t = np.array([[s, 0, c], [c, 0, -s], [0, 1, 0]])
-            rb2[i : i + 3] = t @ rb2[i : i + 3]
-            rb2[i + 3 : i + 6] = t @ rb2[i + 3 : i + 6]
+        loc2 = loc2[sph]
+        th = np.where(
+            abs(loc2[:, 2]) + abs(loc2[:, 0]) > 1e-8,
+            np.arctan2(loc2[:, 0], loc2[:, 2]),
+            0.0,
+        )
+        c = np.cos(th)
+        s = np.sin(th)
+        zero = np.zeros_like(th)
+        t = np.stack(
+            (
+                np.column_stack((s, zero, c)),
+                np.column_stack((c, zero, -s)),
+                np.column_stack((zero, zero + 1.0, zero)),
+            ),
+            axis=1,
+        )
+        rb2[sph] = np.einsum("gij,gkjl->gkil", t, rb2[sph])
 
     # prepare final output:
-    rbmodes[grid_rows] = rb2
+    rbmodes[grid_rows] = rb2.reshape(-1, 6)
     return rbmodes
 
 
@@ -445,6 +443,7 @@ def replace_basic_cs(uset, new_cs_id, new_cs_in_basic=None):
        5    2097154   0.0  -1.0   0.0
        6    2097154   1.0   0.0   0.0
     """
+    uset = _uset_df(uset)
     new_cs_id = np.atleast_2d(new_cs_id)
     if new_cs_id.shape == (4, 3):
         if new_cs_id[0, 1] != 0:
@@ -941,7 +940,15 @@ def expanddof(dof):
         return np.array([[n, i] for n in dof.ravel() for i in range(1, 7)])
     elif dof[:, 1].max() <= 6:
         return dof
-    edof = np.array([[node, int(i)] for node, arg in dof for i in str(arg)])
+    # split each DOF into its digits, most significant first:
+    arg = dof[:, 1]
+    maxd = len(str(arg.max()))
+    ndig = np.ones(len(arg), np.int64)
+    for k in range(1, maxd):
+        ndig += arg >= 10 ** k
+    digits = arg[:, None] // 10 ** np.arange(maxd - 1, -1, -1) % 10
+    keep = np.arange(maxd) >= maxd - ndig[:, None]
+    edof = np.column_stack((np.repeat(dof[:, 0], ndig), digits[keep]))
     if (edof[:, 1] > 6).any():
         raise ValueError("found DOF > 6?")
     return edof
@@ -1061,6 +1068,158 @@ def mkusetmask(nasset=None):
     return usetmask
 
 
+class UsetIndex:
+    """
+    Precomputed lookups for a Nastran USET table
+
+    Parameters
+    ----------
+    uset : pandas DataFrame or UsetIndex
+        A DataFrame as output by
+        :func:`pyyeti.nastran.op2.OP2.rdn2cop2`. If a
+        :class:`UsetIndex`, its DataFrame is used.
+
+    Attributes
+    ----------
+    uset : pandas DataFrame
+        The USET table. It must not be modified after the index is
+        created.
+    ids, dofs, nasset : 1d ndarrays
+        The node IDs, DOF numbers and set bitmasks of each row of
+        `uset`.
+    iddof : 2d ndarray
+        2-column [id, dof] array; same as
+        ``uset.iloc[:, :0].reset_index().values``.
+
+    Notes
+    -----
+    Routines like :func:`mksetpv` and :func:`mkdofpv` scan the USET
+    DataFrame on every call. When many calls are made on the same
+    table (for example, when forming data recovery matrices for many
+    node groups), create a :class:`UsetIndex` once and pass it
+    instead of the DataFrame: all routines in this module that
+    accept a USET table also accept a :class:`UsetIndex`. That
+    includes the ``nas["uset"]`` entries used by :func:`formtran`,
+    :func:`formdrm`, :func:`upasetpv`, etc.
+
+    Set membership vectors and the sorted DOF lookup tables used by
+    :meth:`mkdofpv` are computed when first needed and cached.
+    :meth:`row` provides a constant time (id, dof) to row lookup.
+
+    Examples
+    --------
+    >>> from pyyeti import nastran
+    >>> uset = nastran.addgrid(
+    ...     None, [100, 200], ['b', 'm'], 0,
+    ...     [[5, 10, 15], [32, 90, 10]], 0)
+    >>> ui = nastran.UsetIndex(uset)
+    >>> ui.row(200, 3)
+    8
+    >>> nastran.mkdofpv(ui, "p", [[200, 3], [100, 12]])[0]
+    array([8, 0, 1])
+    >>> nastran.mksetpv(ui, "g", "m").nonzero()[0]
+    array([ 6,  7,  8,  9, 10, 11])
+    """
+
+    def __init__(self, uset):
+        if isinstance(uset, UsetIndex):
+            uset = uset.uset
+        self.uset = uset
+        self.ids = uset.index.get_level_values("id").values.astype(np.int64)
+        self.dofs = uset.index.get_level_values("dof").values.astype(np.int64)
+        self.nasset = uset["nasset"].values
+        self._iddof = None
+        self._rowdct = None
+        self._setpv = {}
+        self._sorted = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def iddof(self):
+        if self._iddof is None:
+            self._iddof = np.column_stack((self.ids, self.dofs))
+        return self._iddof
+
+    def setpv(self, nasset):
+        """
+        Return (cached) True/False vector of the `nasset` DOF
+
+        Parameters
+        ----------
+        nasset : integer or string
+            An integer bitmask or a set letter or letters; see
+            :func:`mkusetmask`.
+
+        Returns
+        -------
+        pv : 1d ndarray
+            Read-only True/False vector for partitioning `nasset`
+            from the p-set (all DOF in the table).
+        """
+        if isinstance(nasset, str):
+            nasset = mkusetmask(nasset)
+        try:
+            return self._setpv[nasset]
+        except KeyError:
+            pv = (self.nasset & nasset) != 0
+            pv.flags.writeable = False
+            self._setpv[nasset] = pv
+            return pv
+
+    def mksetpv(self, major, minor):
+        """
+        Make a set partition vector; see :func:`mksetpv`
+        """
+        pvmajor = self.setpv(major)
+        pvminor = self.setpv(minor)
+        if np.any(~pvmajor & pvminor):
+            raise ValueError("`minorset` is not completely containedin `majorset`")
+        return pvminor[pvmajor]
+
+    def row(self, nid, dof):
+        """
+        Return row number of (`nid`, `dof`)
+
+        Raises
+        ------
+        KeyError
+            When (`nid`, `dof`) is not in the table.
+        """
+        if self._rowdct is None:
+            keys = (self.ids * 10 + self.dofs).tolist()
+            self._rowdct = dict(zip(keys, range(len(keys))))
+        return self._rowdct[nid * 10 + dof]
+
+    def mkdofpv(self, nasset, dof, strict=True):
+        """
+        Make a DOF partition vector; see :func:`mkdofpv`
+        """
+        try:
+            keys, i = self._sorted[nasset]
+        except KeyError:
+            if nasset == "p":
+                keys = self.ids * 10 + self.dofs
+            else:
+                setpv = self.mksetpv("p", nasset)
+                keys = self.ids[setpv] * 10 + self.dofs[setpv]
+            i = np.argsort(keys)
+            keys = keys[i]
+            self._sorted[nasset] = keys, i
+        return _mkdofpv_sorted(keys, i, nasset, dof, strict)
+
+
+def _uset_index(uset):
+    # return `uset` as a UsetIndex
+    return uset if isinstance(uset, UsetIndex) else UsetIndex(uset)
+
+
+def _uset_df(uset):
+    # return `uset` as a DataFrame
+    return uset.uset if isinstance(uset, UsetIndex) else uset
+
+
 def usetprt(file, uset, printsets="m,s,o,q,r,c,b,e,l,t,a,f,n,g"):
     r"""
     Print Nastran DOF set membership information from USET table.
@@ -1191,6 +1350,7 @@ def usetprt(file, uset, printsets="m,s,o,q,r,c,b,e,l,t,a,f,n,g"):
         5   11    0  0  0  0  0  5  0  0  11  11  11  11  11  11
         6   12    0  0  0  0  0  6  0  0  12  12  12  12  12  12
     """
+    uset = _uset_df(uset)
     usetmask = mkusetmask()
     nasset = uset.iloc[:, 0].values
     allsets = list("msoqrcbeltadf") + [
@@ -1315,9 +1475,10 @@ def mksetpv(uset, major, minor):
 
     Parameters
     ----------
-    uset : pandas DataFrame
+    uset : pandas DataFrame or UsetIndex
         A DataFrame as output by
-        :func:`pyyeti.nastran.op2.OP2.rdn2cop2`
+        :func:`pyyeti.nastran.op2.OP2.rdn2cop2` or a
+        :class:`UsetIndex` made from one.
     majorset : integer or string
         An integer bitmask or a set letter or letters (see below).
     minorset : integer or string
@@ -1389,6 +1550,8 @@ def mksetpv(uset, major, minor):
     array([False, False, False, False, False, False, False, False, False,
            False, False, False], dtype=bool)
     """
+    if isinstance(uset, UsetIndex):
+        return uset.mksetpv(major, minor)
     if isinstance(major, str):
         major = mkusetmask(major)
     if isinstance(minor, str):
@@ -1409,9 +1572,10 @@ def mkdofpv(uset, nasset, dof, strict=True):
 
     Parameters
     ----------
-    uset : pandas DataFrame or ndarray
+    uset : pandas DataFrame or UsetIndex or ndarray
         A DataFrame as output by
-        :func:`pyyeti.nastran.op2.OP2.rdn2cop2`. It can also be an
+        :func:`pyyeti.nastran.op2.OP2.rdn2cop2` or a
+        :class:`UsetIndex` made from one. It can also be an
         ndarray with at least 2-columns of [id, dof]; any other
         columns are quietly ignored. If ndarray, `nasset` must be 'p'
         (so no set partitions are needed).
@@ -1485,29 +1649,30 @@ def mkdofpv(uset, nasset, dof, strict=True):
            [100,   2],
            [100,   3]]...))
     """
-    if isinstance(uset, pd.DataFrame):
-        if nasset != "p":
-            setpv = mksetpv(uset, "p", nasset)
-            uset = uset.loc[setpv]
-        uset_set = uset.index.get_level_values("id") * 10 + uset.index.get_level_values(
-            "dof"
-        )
-    else:
-        if nasset == "p":
-            uset_set = (uset[:, 0] * 10 + uset[:, 1]).astype(np.int64)
-        else:
-            raise ValueError('`nasset` must be "p" if `uset` is not a pandas DataFrame')
+    if isinstance(uset, (pd.DataFrame, UsetIndex)):
+        return _uset_index(uset).mkdofpv(nasset, dof, strict)
+    if nasset != "p":
+        raise ValueError('`nasset` must be "p" if `uset` is not a pandas DataFrame')
+    uset_set = (uset[:, 0] * 10 + uset[:, 1]).astype(np.int64)
+    i = np.argsort(uset_set)
+    return _mkdofpv_sorted(uset_set[i], i, nasset, dof, strict)
 
+
+def _mkdofpv_sorted(uset_set, i, nasset, dof, strict):
+    """
+    Routine for :func:`mkdofpv`: `uset_set` is the sorted id*10 + dof
+    array for the DOF in `nasset` and `i` is the argsort vector that
+    sorted it.
+    """
     dof = expanddof(dof)
     _dof = dof[:, 0] * 10 + dof[:, 1]
 
-    i = np.argsort(uset_set)
-    pvi = np.searchsorted(uset_set, _dof, sorter=i)
+    pvi = np.searchsorted(uset_set, _dof)
     # since searchsorted can return length as index:
     pvi[pvi == i.size] -= 1
     pv = i[pvi]
 
-    chk = uset_set[pv] != _dof
+    chk = uset_set[pvi] != _dof
     if chk.any():
         if strict:
             msg = (
@@ -1649,6 +1814,7 @@ def mkcordcardinfo(uset, cid=None):
     ...             uset.loc[(2003, 1), 'x':'z'])
     True
     """
+    uset = _uset_df(uset)
     if cid == 0:
         return [
             "CORD2R",
@@ -1793,6 +1959,7 @@ def mkusetcoordinfo(cord, uset=None, coordref=None):
            [  0.,  -1.,   0.],
            [  1.,   0.,   0.]])
     """
+    uset = _uset_df(uset)
     if coordref is None:
         coordref = {}
 
@@ -1972,9 +2139,11 @@ def getcoordinates(uset, gid, csys, coordref=None):
     uset : pandas DataFrame
         A DataFrame as output by
         :func:`pyyeti.nastran.op2.OP2.rdn2cop2`
-    gid : integer or 3 element vector
+    gid : integer or 3 element vector or 2d array
         If integer, it is a grid id in `uset`. Otherwise, it is a 3
-        element vector:  [x, y, z] specifiy location in basic.
+        element vector:  [x, y, z] specifiy location in basic. It
+        can also be an n x 3 array of locations in basic; all
+        locations are converted together.
     csys : integer or 4x3 matrix
         Specifies coordinate system to get coordinates of `gid` in.
         If integer, it is the id of the coordinate system which must
@@ -1997,7 +2166,8 @@ def getcoordinates(uset, gid, csys, coordref=None):
     Returns
     -------
     coords : ndarray
-        3-element ndarray of location in `csys`::
+        3-element ndarray of location in `csys` (or n x 3 if `gid`
+        is n x 3 with n > 1)::
 
             - Rectangular: [x, y, z]
             - Cylindrical: [R, theta, z]    (theta is in deg)
@@ -2177,10 +2347,14 @@ def getcoordinates(uset, gid, csys, coordref=None):
     >>> nastran.getcoordinates(uset, 200, 2) - np.array([r, th, phi])
     array([ 0.,  0.,  0.])
     """
+    uset = _uset_df(uset)
     if np.size(gid) == 1:
         xyz_basic = uset.loc[(gid, 1), "x":"z"].values
     else:
-        xyz_basic = np.asarray(gid).ravel()
+        xyz_basic = np.asarray(gid)
+        if xyz_basic.ndim < 2 or xyz_basic.shape[0] == 1:
+            # a single location gives a 3-element vector:
+            xyz_basic = xyz_basic.ravel()
     if np.size(csys) == 1 and csys == 0:
         return xyz_basic
     # get input "coordinfo" [ cid type 0; location(1x3); T(3x3) ]:
@@ -2189,54 +2363,62 @@ def getcoordinates(uset, gid, csys, coordref=None):
     coordinfo = mkusetcoordinfo(csys, uset, coordref)
     xyz_coord = coordinfo[1]
     T = coordinfo[2:]  # transform to basic for coordinate system
-    g = T.T @ (xyz_basic - xyz_coord)
+    # g = T.T @ (xyz_basic - xyz_coord) for each location:
+    g = (xyz_basic - xyz_coord) @ T
     ctype = coordinfo[0, 1].astype(np.int64)
     if ctype == 1:
         return g
+    x, y, z = np.atleast_2d(g).T
     if ctype == 2:
-        R = math.hypot(g[0], g[1])
-        theta = math.atan2(g[1], g[0])
-        return np.array([R, theta * 180 / math.pi, g[2]])
-    R = linalg.norm(g)
-    phi = math.atan2(g[1], g[0])
-    s = math.sin(phi)
-    c = math.cos(phi)
-    if abs(s) > abs(c):
-        theta = math.atan2(g[1] / s, g[2])
+        R = np.hypot(x, y)
+        theta = np.arctan2(y, x)
+        coords = np.column_stack((R, theta * 180 / math.pi, z))
     else:
-        theta = math.atan2(g[0] / c, g[2])
-    return np.array([R, theta * 180 / math.pi, phi * 180 / math.pi])
+        R = np.sqrt(x ** 2 + y ** 2 + z ** 2)
+        phi = np.arctan2(y, x)
+        s = np.sin(phi)
+        c = np.cos(phi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            theta = np.where(
+                abs(s) > abs(c), np.arctan2(y / s, z), np.arctan2(x / c, z)
+            )
+        coords = np.column_stack((R, theta * 180 / math.pi, phi * 180 / math.pi))
+    return coords if g.ndim == 2 else coords[0]
 
 
 def _get_loc_a_basic(coordinfo, a):
     """
-    Function for getting location of point "a" in basic; called by
+    Function for getting location of points "a" in basic; called by
     :func:`addgrid`.
 
-    `coordinfo` is 5x3 and `a` is [x, y, z]
+    `coordinfo` is 5x3 and `a` is n x 3: [x, y, z] for each point
     """
     # tranformation from global to basic:
     Tg = coordinfo[2:]
     coordloc = coordinfo[1]
     if coordinfo[0, 1] == 1:
-        location = coordloc + Tg @ a
+        vec = a
     else:
-        a2r = math.pi / 180.0
+        r = a[:, 0]
+        a1 = np.radians(a[:, 1])
         if coordinfo[0, 1] == 2:  # cylindrical
-            vec = np.array(
-                [a[0] * math.cos(a[1] * a2r), a[0] * math.sin(a[1] * a2r), a[2]]
-            )
+            vec = np.column_stack((r * np.cos(a1), r * np.sin(a1), a[:, 2]))
         else:  # spherical
-            s = math.sin(a[1] * a2r)
-            vec = a[0] * np.array(
-                [
-                    s * math.cos(a[2] * a2r),
-                    s * math.sin(a[2] * a2r),
-                    math.cos(a[1] * a2r),
-                ]
-            )
-        location = coordloc + Tg @ vec
-    return location
+            a2 = np.radians(a[:, 2])
+            s = r * np.sin(a1)
+            vec = np.column_stack((s * np.cos(a2), s * np.sin(a2), r * np.cos(a1)))
+    return coordloc + vec @ Tg.T
+
+
+def _group_by_object(objs):
+    """
+    Yield (index array, obj) for each distinct object in `objs`
+    """
+    groups = {}
+    for i, obj in enumerate(objs):
+        groups.setdefault(id(obj), (obj, []))[1].append(i)
+    for obj, pv in groups.values():
+        yield np.array(pv), obj
 
 
 def _ensure_iter(obj):
@@ -2637,6 +2819,7 @@ def addgrid(uset, gid, nasset, coordin, xyz, coordout, coordref=None):
         6    2097154  0.0  1.0  0.0
     >>> pd.options.display.float_format = None
     """
+    uset = _uset_df(uset)
     # if uset is not None and np.any(uset[:, 0] == gid):
     gid = _ensure_iter(gid)
     if uset is not None:
@@ -2676,23 +2859,25 @@ def addgrid(uset, gid, nasset, coordin, xyz, coordout, coordref=None):
     xyz = np.atleast_2d(xyz)
 
     # cols = ['nasset', 'x', 'y', 'z']
+    cin_info = []
+    cout_info = []
     i = 0
     for g, u, _cin, _xyz, _cout in zip(gid, nasset, cin, xyz, cout):
-        _uset = _addgrid_get_uset(u, mask, smap)
-
-        # get location of point in basic:
-        _cin = mkusetcoordinfo(_cin, uset, coordref)
-        loc = _get_loc_a_basic(_cin, _xyz)
-
-        # form x, y, z columns of dataframe:
-        _cout = mkusetcoordinfo(_cout, uset, coordref)
-
-        # put in dataframe:
-        nd_nasset[i : i + 6] = _uset
-        nd_xyz[i] = loc
-        nd_xyz[i + 1 : i + 6] = _cout
+        nd_nasset[i : i + 6] = _addgrid_get_uset(u, mask, smap)
+        cin_info.append(mkusetcoordinfo(_cin, uset, coordref))
+        cout_info.append(mkusetcoordinfo(_cout, uset, coordref))
         i += 6
 
+    # location of points in basic and output coordinate system info
+    # ... one group of grids per coordinate system:
+    nd_xyz = nd_xyz.reshape(-1, 6, 3)
+    xyz = xyz[: len(cin_info)]
+    for pv, ci in _group_by_object(cin_info):
+        nd_xyz[pv, 0] = _get_loc_a_basic(ci, xyz[pv])
+    for pv, ci in _group_by_object(cout_info):
+        nd_xyz[pv, 1:] = ci
+    nd_xyz = nd_xyz.reshape(-1, 3)
+
     # turn back into dataframe:
     usetid.iloc[:, 0] = nd_nasset
     usetid.iloc[:, 1:] = nd_xyz
@@ -2716,7 +2901,7 @@ def _solve(a, b):
     return linalg.solve(a, b)
 
 
-def formrbe3(uset, GRID_dep, DOF_dep, Ind_List, UM_List=None):
+def formrbe3(uset, GRID_dep, DOF_dep, Ind_List, UM_List=None, sparse=False):
     """
     Form a least squares interpolation matrix, like RBE3 in Nastran.
 
@@ -2770,10 +2955,15 @@ def formrbe3(uset, GRID_dep, DOF_dep, Ind_List, UM_List=None):
         original amount defined in `GRID_dep`, `DOF_dep` (max of
         6). All m-set DOF must be within the the set of previously
         entered DOF (either dependent or independent).
+    sparse : bool; optional
+        If True, return `rbe3` as a :class:`scipy.sparse.csr_matrix`
+        (exact zeros are not stored). This is convenient for
+        assembling many interpolation matrices into a large sparse
+        constraint matrix.
 
     Returns
     -------
-    rbe3 : ndarray
+    rbe3 : ndarray or scipy.sparse.csr_matrix
         The interpolation matrix. Size is # dependent DOF rows by #
         independent DOF columns. The order of rows and columns
         corresponds to the order the DOF occur in the USET table
@@ -2803,6 +2993,12 @@ def formrbe3(uset, GRID_dep, DOF_dep, Ind_List, UM_List=None):
     Simplifications are made if the m-set is completely contained
     within either the dependent or independent set.
 
+    Only the rows and columns of `uset` for the grids of the RBE3 are
+    used and the matrices that are inverted are at most 6 x 6, so
+    the cost grows only linearly with the number of independent
+    grids. Interface rings with thousands of independent grids are
+    handled in a fraction of a second.
+
     When the `UM_List` option is used, there will be a matrix
     inversion, unless the m-set is equal to the dependent set (which
     would be the same as not including the `UM_List` input). This
@@ -2874,6 +3070,16 @@ def formrbe3(uset, GRID_dep, DOF_dep, Ind_List, UM_List=None):
      [ 0.    0.25  0.25  0.    0.5  -0.25  0.25  0.    0.    0.    0.    1.  ]
      [ 0.5   0.    0.    0.    0.    0.    0.    0.5   0.    0.5   0.5   0.  ]]
     """
+    rbe3 = _formrbe3(_uset_df(uset), GRID_dep, DOF_dep, Ind_List, UM_List)
+    if sparse:
+        return sp.csr_matrix(rbe3)
+    return rbe3
+
+
+def _formrbe3(uset, GRID_dep, DOF_dep, Ind_List, UM_List):
+    """
+    Routine for :func:`formrbe3`; returns dense `rbe3`
+    """
     # form dependent DOF table:
     ddof = expanddof([[GRID_dep, DOF_dep]])
 
@@ -2892,7 +3098,9 @@ def formrbe3(uset, GRID_dep, DOF_dep, Ind_List, UM_List=None):
             wtcur = 1.0
 
         DOF_ind = DOF_ind[0]
-        newdof = expanddof([[n, DOF_ind] for n in GRIDS_ind])
+        newdof = expanddof(
+            np.column_stack((GRIDS_ind, np.full(len(GRIDS_ind), DOF_ind)))
+        )
         idof.extend(newdof)
         wtdof.extend([wtcur for i in range(len(newdof))])
 
@@ -3053,9 +3261,7 @@ def _findse(nas, se):
 
 
 def _get_node_ids(uset):
-    ids = uset.index.get_level_values("id")
-    dof = uset.index.get_level_values("dof")
-    return ids[dof <= 1]
+    return uset.ids[uset.dofs <= 1]
 
 
 def upasetpv(nas, seup):
@@ -3098,12 +3304,12 @@ def upasetpv(nas, seup):
     """
     r = _findse(nas, seup)
     sedn = nas["selist"][r, 1]
-    usetdn = nas["uset"][sedn]
+    usetdn = _uset_index(nas["uset"][sedn])
     dnids = nas["dnids"][seup]
     maps = nas["maps"][seup]
 
     # number of rows in pv should equal size of upstream a-set
-    pv = usetdn.index.isin(dnids, level=0).nonzero()[0]
+    pv = np.isin(usetdn.ids, dnids).nonzero()[0]
     if len(pv) < len(dnids):
         # must be an external se, but non-csuper type (the extseout,
         # seconct, etc, type)
@@ -3113,7 +3319,7 @@ def upasetpv(nas, seup):
         ids = _get_node_ids(usetdn)
 
         # number of rows should equal size of upstream a-set
-        pv = usetdn.index.isin(ids[pv], level="id").nonzero()[0]
+        pv = np.isin(usetdn.ids, ids[pv]).nonzero()[0]
         if len(pv) < len(dnids):  # pragma: no cover
             raise ValueError("not all upstream DOF could be found in downstream")
     if len(maps) > 0:
@@ -3181,22 +3387,21 @@ def upqsetpv(nas, sedn=0):
         )
         raise ValueError(msg)
 
-    usetdn = nas["uset"][sedn]
-    pv = np.zeros(usetdn.shape[0], bool)
+    usetdn = _uset_index(nas["uset"][sedn])
+    pv = np.zeros(len(usetdn), bool)
 
     for r in rows:
         seup = selist[r, 0]
         if seup == sedn:
             continue
-        usetup = nas["uset"][seup]
+        usetup = _uset_index(nas["uset"][seup])
         dnids = nas["dnids"][seup]
         maps = nas["maps"][seup]
 
         qup = mksetpv(usetup, "a", "q")
         if not qup.any():
             # assume any a-set spoints are q-set
-            dof = usetup.index.get_level_values("dof")
-            qup = dof[mksetpv(usetup, "p", "a")] == 0
+            qup = usetup.dofs[mksetpv(usetup, "p", "a")] == 0
             # qup = usetup[mksetpv(usetup, 'p', 'a'), 1] == 0
 
         # check to see if the upstream se has upstreams;
@@ -3209,7 +3414,7 @@ def upqsetpv(nas, sedn=0):
             # expand downstream ids to include all dof:
             # number of rows in pv1 should equal size of
             # upstream a-set
-            pv1 = usetdn.index.isin(dnids, level="id")
+            pv1 = np.isin(usetdn.ids, dnids)
 
             if np.count_nonzero(pv1) < dnids.size:
                 # must be an external se, but non-csuper type (the
@@ -3228,7 +3433,7 @@ def upqsetpv(nas, sedn=0):
                 ids = _get_node_ids(usetdn)
 
                 # length of pv1 should equal size of upstream a-set
-                pv1 = usetdn.index.isin(ids[pv1], level="id")
+                pv1 = np.isin(usetdn.ids, ids[pv1])
                 cnt = np.count_nonzero(pv1)
                 if cnt < dnids.size:  # pragma: no cover
                     raise ValueError(
@@ -3246,20 +3451,19 @@ def upqsetpv(nas, sedn=0):
     return pv
 
 
-def _proc_mset(nas, se, dof):
+def _proc_mset(nas, se, dof, uset):
     """
     Private utility routine to get m-set information for
-    :func:`formtran`.
+    :func:`formtran`. `uset` is the :class:`UsetIndex` for `se`.
 
     Returns: (hasm, m, pvdofm, gm)
     """
     # see if any of the DOF are in the m-set
     hasm = 0
-    uset = nas["uset"][se]
     m = np.nonzero(mksetpv(uset, "g", "m"))[0]
     pvdofm = gm = None
     if m.size > 0:
-        iddof = uset.iloc[m, :0].reset_index().values
+        iddof = uset.iddof[m]
         pvdofm = locate.mat_intersect(iddof, dof)[0]
 
         if pvdofm.size > 0:
@@ -3276,7 +3480,7 @@ def _formtran_0(nas, dof, gset):
     Utility routine called by :func:`formtran` when se == 0. See that
     routine for more information.
     """
-    uset = nas["uset"][0]
+    uset = _uset_index(nas["uset"][0])
     pvdof, dof = mkdofpv(uset, "g", dof)
 
     if gset:
@@ -3292,7 +3496,7 @@ def _formtran_0(nas, dof, gset):
         raise RuntimeError("neither nas['phg'][0] nor nas['pha'][0] are available.")
 
     o = np.nonzero(mksetpv(uset, "g", "o"))[0]
-    iddof = uset.iloc[:, :0].reset_index().values
+    iddof = uset.iddof
     if o.size > 0:  # pragma: no cover
         v = locate.mat_intersect(iddof[o], dof)[0]
         if v.size > 0:
@@ -3309,7 +3513,7 @@ def _formtran_0(nas, dof, gset):
         a = []
         sets = np.zeros(0, np.int64)
 
-    hasm, m, pvdofm, gm = _proc_mset(nas, 0, dof)
+    hasm, m, pvdofm, gm = _proc_mset(nas, 0, dof, uset)
 
     if hasm:
         o_n = mksetpv(uset, "n", "o")
@@ -3423,7 +3627,7 @@ def formtran(nas, se, dof, gset=False):
     if se == 0:
         return _formtran_0(nas, dof, gset)
 
-    uset = nas["uset"][se]
+    uset = _uset_index(nas["uset"][se])
     pvdof, dof = mkdofpv(uset, "g", dof)
     t_a = np.nonzero(mksetpv(uset, "a", "t"))[0]
     q_a = np.nonzero(mksetpv(uset, "a", "q"))[0]
@@ -3438,7 +3642,7 @@ def formtran(nas, se, dof, gset=False):
 
     sets = np.zeros(0, np.int64)
     t = np.nonzero(mksetpv(uset, "g", "t"))[0]
-    iddof = uset.iloc[:, :0].reset_index().values
+    iddof = uset.iddof
     pvdoft = locate.mat_intersect(iddof[t], dof)[0]
     hast = 0
     if pvdoft.size > 0:
@@ -3486,7 +3690,7 @@ def formtran(nas, se, dof, gset=False):
 
     ct = got.shape[1]
     cq = goq.shape[1]
-    hasm, m, pvdofm, gm = _proc_mset(nas, se, dof)
+    hasm, m, pvdofm, gm = _proc_mset(nas, se, dof, uset)
     if hasm:
         t_n = np.nonzero(mksetpv(uset, "n", "t"))[0]
         o_n = np.nonzero(mksetpv(uset, "n", "o"))[0]
@@ -3639,10 +3843,10 @@ def formulvs(nas, seup, sedn=0, keepcset=True, shortcut=True, gset=False):
         return nas["ulvs"][seup]
     ulvs = 1.0
     while True:
-        usetup = nas["uset"][seup]
-        usetdn = nas["uset"][sedown]
+        usetup = _uset_index(nas["uset"][seup])
+        usetdn = _uset_index(nas["uset"][sedown])
         tqup = upasetpv(nas, seup)
-        iddof = usetdn.iloc[tqup, :0].reset_index().values
+        iddof = usetdn.iddof[tqup]
         ulvs1 = formtran(nas, sedown, iddof, gset)[0]
         # get rid of c-set if required
         if not keepcset:
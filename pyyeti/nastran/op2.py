@@ -19,6 +19,7 @@ import sys
 import os
 import struct
 import warnings
+import json
 import numpy as np
 from pyyeti import guitools
 from pyyeti.nastran import op4, n2p
@@ -141,16 +142,65 @@ def _expanddof(ids, pvgrids):
     return np.vstack((expids[V], dof[V])).T
 
 
+def _index_filename(filename):
+    """Returns name of sidecar index file for op2 file `filename`;
+    see :class:`OP2`"""
+    return f"{filename}.pyyeti.idx"
+
+
 class OP2:
-    """Class for reading Nastran op2 files and nas2cam data files."""
+    """
+    Class for reading Nastran op2 files and nas2cam data files.
+
+    If `index_cache` is True, the directory of datablocks (see
+    :func:`OP2.directory`) is cached in a small sidecar file next to
+    the op2 file (the op2 file name with ".pyyeti.idx" appended). The
+    sidecar is keyed on the size
+    and modification time of the op2 file: later opens of an
+    unchanged file read the directory from the sidecar instead of
+    scanning the entire op2 file. A stale or unreadable sidecar is
+    quietly ignored and rewritten. If the sidecar cannot be written
+    (for example, in a read-only directory), the directory is simply
+    not cached.
+
+    Data records and matrices are read through a read-only memory
+    map of the op2 file: the record markers are walked to locate the
+    data and the values are then assembled with a few numpy
+    operations per record (or per matrix) rather than one read per
+    physical record. If the file cannot be memory-mapped, or if
+    `_use_mmap` is False, the records are read one at a time from the
+    file handle instead.
+    """
+
+    # version of the sidecar index file format:
+    _INDEX_VERSION = 1
 
-    def __init__(self, filename):
+    # read records via a memory map of the file (see `_getmm`):
+    _use_mmap = True
+
+    def __init__(self, filename, index_cache=False):
+        """
+        Open op2 file and scan (or load) the datablock directory
+
+        Parameters
+        ----------
+        filename : string
+            Name of op2 file
+        index_cache : bool; optional
+            If True, use and update the sidecar index file; see
+            :class:`OP2`. If False, the op2 file is always scanned
+            and no sidecar file is read or written.
+        """
         self._fileh = None
+        self._mm = None
         self._CodeFuncs = None
+        self._filename = filename
+        self._index_cache = index_cache
         # if isinstance(filename, str):
         self._op2open(filename)
 
     def __del__(self):
+        self._mm = None
         if self._fileh:
             self._fileh.close()
             self._fileh = None
@@ -159,6 +209,7 @@ class OP2:
         return self
 
     def __exit__(self, type_, value, traceback):
+        self._mm = None
         if self._fileh:
             self._fileh.close()
             self._fileh = None
@@ -341,6 +392,61 @@ class OP2:
         """Skips `n` key triplets ([reclen, key, endrec])."""
         self._fileh.read(n * (8 + self._ibytes))
 
+    def _getmm(self):
+        """
+        Returns read-only uint8 memory map of the op2 file or None
+
+        None is returned if `_use_mmap` is False or if the file cannot
+        be memory-mapped. The map is created on first use.
+        """
+        if not self._use_mmap:
+            return None
+        if self._mm is None:
+            try:
+                self._mm = np.memmap(self._filename, dtype=np.uint8, mode="r")
+            except (OSError, ValueError, TypeError):
+                self._mm = False
+        return self._mm if self._mm is not False else None
+
+    def _record_spans(self, mm, key):
+        """
+        Locate the physical records of a logical record via `mm`
+
+        Parameters
+        ----------
+        mm : 1d ndarray
+            Memory map of the file from :func:`_getmm`.
+        key : integer
+            The key that was just read (first key of the record);
+            must be > 0.
+
+        Returns
+        -------
+        spans : list
+            List of ``(offset, reclen)`` tuples, one for each physical
+            record: `offset` is the byte offset of the data and
+            `reclen` is the number of data bytes.
+
+        Notes
+        -----
+        Only the record markers are read. On return, the file is
+        positioned after the key that ends the logical record, just
+        as it would be after reading the records one at a time.
+        """
+        unpack4 = self._Str4.unpack_from
+        unpack = self._Str.unpack_from
+        pos = self._fileh.tell()
+        keylen = 8 + self._ibytes
+        spans = []
+        while key > 0:
+            reclen = unpack4(mm, pos)[0]
+            spans.append((pos + 4, reclen))
+            pos += reclen + 8
+            key = unpack(mm, pos + 4)[0]
+            pos += keylen
+        self._fileh.seek(pos)
+        return spans
+
     def file_handle(self):
         """Returns the op2 file handle"""
         return self._fileh
@@ -516,6 +622,13 @@ class OP2:
 
         matrix = np.zeros((rows, trailer[1]), order="F")
         intsize = self._ibytes
+        mm = self._getmm()
+        if mm is not None:
+            self._rdop2matrix_mm(mm, matrix, mtype, frm, bytes_per)
+            self.rdop2eot()
+            if mtype > 2:
+                matrix.dtype = complex
+            return matrix
         col = 0
         while dtype > 0:  # read in matrix columns
             # key is number of elements in next record (row # followed
@@ -544,6 +657,58 @@ class OP2:
             matrix.dtype = complex
         return matrix
 
+    def _rdop2matrix_mm(self, mm, matrix, mtype, frm, bytes_per):
+        """
+        Fill `matrix` from the matrix strings located via `mm`
+
+        The record markers of all columns are walked first to find
+        each string (column, starting row, offset and length); the
+        values are then gathered with a single concatenate and
+        scattered into the Fortran-ordered `matrix` with one fancy
+        index assignment. On return, the file is positioned just like
+        the record-by-record reader in :func:`rdop2matrix` leaves it
+        (before the end-of-table marker).
+        """
+        unpack4 = self._Str4.unpack_from
+        unpack = self._Str.unpack_from
+        intsize = self._ibytes
+        keylen = 8 + intsize
+        pos = self._fileh.tell()
+        cols, rowstarts, pieces = [], [], []
+        col = 0
+        dtype = 1
+        while dtype > 0:  # walk matrix columns
+            key = unpack(mm, pos + 4)[0]
+            pos += keylen
+            while key > 0:
+                reclen = unpack4(mm, pos)[0]
+                r = unpack(mm, pos + 4)[0] - 1
+                if mtype > 2:
+                    r *= 2
+                n = (reclen - intsize) // bytes_per
+                start = pos + 4 + intsize
+                pieces.append(mm[start : start + n * bytes_per].view(frm))
+                cols.append(col)
+                rowstarts.append(r)
+                pos += reclen + 8
+                key = unpack(mm, pos + 4)[0]
+                pos += keylen
+            col += 1
+            pos += keylen
+            dtype = unpack(mm, pos + 4)[0]
+            pos += keylen
+        self._fileh.seek(pos)
+        if not pieces:
+            return
+        values = np.concatenate(pieces)
+        lengths = np.array([p.size for p in pieces])
+        # flat (Fortran-order) index of the first value of each string:
+        first = np.array(cols) * matrix.shape[0] + np.array(rowstarts)
+        # offset of each string within `values`:
+        offsets = np.cumsum(lengths) - lengths
+        index = np.arange(values.size) + np.repeat(first - offsets, lengths)
+        matrix.reshape(-1, order="F")[index] = values
+
     def skipop2matrix(self, trailer):
         """
         Skip Nastran op2 matrix at current position.
@@ -713,6 +878,16 @@ class OP2:
                 self.dbstops,
                 self.headers,
             )
+        if not redo and self._load_index():
+            if verbose:
+                self.prtdir(with_headers=with_headers)
+            return (
+                self.dbnames,
+                self.dblist,
+                self.dbstarts,
+                self.dbstops,
+                self.headers,
+            )
         dbnames = {}
         dblist = []
         dbstarts = []
@@ -750,10 +925,97 @@ class OP2:
         self.dbstarts = np.array(dbstarts)
         self.dbstops = np.array(dbstops)
         self.headers = headers
+        self._save_index()
         if verbose:
             self.prtdir(with_headers=with_headers)
         return dbnames, dblist, self.dbstarts, self.dbstops, self.headers
 
+    def _index_key(self):
+        """Returns the key identifying the op2 file for the sidecar
+        index, or None if the file cannot be stat'ed"""
+        try:
+            st = os.stat(self._filename)
+        except (OSError, TypeError):
+            return None
+        return dict(
+            version=self._INDEX_VERSION,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            ibytes=self._ibytes,
+            endian=self._endian,
+            postheaderpos=self._postheaderpos,
+        )
+
+    def _load_index(self):
+        """Load directory from the sidecar index if it is current;
+        returns True if successful"""
+        if not self._index_cache:
+            return False
+        key = self._index_key()
+        if key is None:
+            return False
+        try:
+            with open(_index_filename(self._filename), "r") as f:
+                index = json.load(f)
+            if index["key"] != key:
+                return False
+            dbnames = {
+                name: [[list(fpos), nbytes, list(size)] for fpos, nbytes, size in v]
+                for name, v in index["dbnames"].items()
+            }
+            headers = [
+                [[tuple(header), reclen] for header, reclen in h]
+                for h in index["headers"]
+            ]
+            dblist = index["dblist"]
+            dbstarts = np.array(index["dbstarts"], dtype=np.int64)
+            dbstops = np.array(index["dbstops"], dtype=np.int64)
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        self.dbnames = dbnames
+        self.dblist = dblist
+        self.dbstarts = dbstarts
+        self.dbstops = dbstops
+        self.headers = headers
+        return True
+
+    def _save_index(self):
+        """Write the directory to the sidecar index; failures are
+        quietly ignored"""
+        if not self._index_cache:
+            return
+        key = self._index_key()
+        if key is None:
+            return
+        index = dict(
+            key=key,
+            dbnames={
+                name: [
+                    [[int(i) for i in fpos], int(nbytes), [int(i) for i in size]]
+                    for fpos, nbytes, size in v
+                ]
+                for name, v in self.dbnames.items()
+            },
+            dblist=self.dblist,
+            dbstarts=[int(i) for i in self.dbstarts],
+            dbstops=[int(i) for i in self.dbstops],
+            headers=[
+                [[[int(i) for i in header], int(reclen)] for header, reclen in h]
+                for h in self.headers
+            ],
+        )
+        idxfile = _index_filename(self._filename)
+        tmpfile = f"{idxfile}.{os.getpid()}.tmp"
+        try:
+            with open(tmpfile, "w") as f:
+                json.dump(index, f)
+            os.replace(tmpfile, idxfile)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(tmpfile)
+            except OSError:
+                pass
+
     def rdop2dynamics(self):
         """
         Reads the TLOAD data from a DYNAMICS datablock.
@@ -888,6 +1150,11 @@ class OP2:
             frmu = self._endian + "%df"
             bytes_per = 4
         elif form == "bytes":
+            mm = self._getmm()
+            if mm is not None:
+                spans = self._record_spans(mm, key)
+                self._skipkey(2)
+                return b"".join(mm[i : i + n].tobytes() for i, n in spans)
             data = []
             while key > 0:
                 reclen = self._Str4.unpack(f.read(4))[0]
@@ -902,6 +1169,24 @@ class OP2:
                 "form must be one of:  None, 'int', "
                 "'uint', 'double', 'single' or 'bytes'"
             )
+        mm = self._getmm()
+        if mm is not None:
+            spans = self._record_spans(mm, key)
+            self._skipkey(2)
+            pieces = [
+                mm[i : i + (n // bytes_per) * bytes_per].view(frm) for i, n in spans
+            ]
+            if N:
+                data = np.empty(N, dtype=frm)
+                i = 0
+                for cur in pieces:
+                    data[i : i + cur.size] = cur
+                    i += cur.size
+            elif pieces:
+                data = np.concatenate(pieces)
+            else:
+                data = np.empty(0, dtype=frm)
+            return data
         if N:
             data = np.empty(N, dtype=frm)
             i = 0
@@ -2034,7 +2319,7 @@ class OP2:
         return nas
 
 
-def rdmats(filename=None, names=None):
+def rdmats(filename=None, names=None, index_cache=False):
     """
     Read all matrices from Nastran output2 file.
 
@@ -2046,6 +2331,9 @@ def rdmats(filename=None, names=None):
     names : list_like; optional
         Iterable of names to read in. If None, read all. These can
         be input in lower case.
+    index_cache : bool; optional
+        If True, use and update the sidecar index file for the op2
+        file; see :class:`OP2`.
 
     Returns
     -------
@@ -2060,10 +2348,10 @@ def rdmats(filename=None, names=None):
     This routine is for convenience; this is what it does::
 
         filename = guitools.get_file_name(filename, read=True)
-        return OP2(filename).rdop2mats(names)
+        return OP2(filename, index_cache).rdop2mats(names)
     """
     filename = guitools.get_file_name(filename, read=True)
-    return OP2(filename).rdop2mats(names)
+    return OP2(filename, index_cache).rdop2mats(names)
 
 
 def _get_op2_op4(op2file, op4file):
@@ -2076,7 +2364,7 @@ def _get_op2_op4(op2file, op4file):
     return op2file, op4file
 
 
-def rdnas2cam(op2file="nas2cam", op4file=None):
+def rdnas2cam(op2file="nas2cam", op4file=None, index_cache=False):
     """
     Read op2/op4 data written by the DMAP NAS2CAM.
 
@@ -2089,6 +2377,9 @@ def rdnas2cam(op2file="nas2cam", op4file=None):
     op4file : string or None
         The name of the .op4 file or, if None, builds name from the
         `op2file` input.
+    index_cache : bool; optional
+        If True, use and update the sidecar index file for the op2
+        file; see :class:`OP2`.
 
     Returns
     -------
@@ -2160,7 +2451,7 @@ def rdnas2cam(op2file="nas2cam", op4file=None):
     op2file, op4file = _get_op2_op4(op2file, op4file)
 
     # read op2 file:
-    with OP2(op2file) as o2:
+    with OP2(op2file, index_cache) as o2:
         nas = o2.rdn2cop2()
 
     # read op4 file:
@@ -2793,7 +3084,7 @@ def _get_drm(drminfo, otm, drms, drmkeys, dr, desc):
                     otm[_desc][j] = _s
 
 
-def procdrm12(op2file=None, op4file=None, dosort=True):
+def procdrm12(op2file=None, op4file=None, dosort=True, index_cache=False):
     """
     Process op2/op4 file2 output from DRM1/DRM2 DMAPs to form data
     recovery matrices.
@@ -2810,6 +3101,9 @@ def procdrm12(op2file=None, op4file=None, dosort=True):
     dosort : bool
         If True, sort data recovery rows in ascending order by ID/DOF.
         Otherwise, return in order requested in Nastran run.
+    index_cache : bool; optional
+        If True, use and update the sidecar index file for the op2
+        file; see :class:`OP2`.
 
     Returns
     -------
@@ -2872,7 +3166,7 @@ def procdrm12(op2file=None, op4file=None, dosort=True):
     # read op4 file:
     drms = op4.read(op4file)
 
-    with OP2(op2file) as o2:
+    with OP2(op2file, index_cache) as o2:
         drmkeys = o2.rddrm2op2()
     N = drmkeys["drs"].shape[1]
 
@@ -2974,7 +3268,12 @@ def procdrm12(op2file=None, op4file=None, dosort=True):
 
 
 def rdpostop2(
-    op2file=None, verbose=False, getougv1=False, getoef1=False, getoes1=False
+    op2file=None,
+    verbose=False,
+    getougv1=False,
+    getoef1=False,
+    getoes1=False,
+    index_cache=False,
 ):
     """
     Reads PARAM,POST,-1 op2 file and returns dictionary of data.
@@ -2991,6 +3290,9 @@ def rdpostop2(
         If True, read the OEF1* matrices, if any
     getoes1 : bool
         If True, read the OES1* matrices, if any
+    index_cache : bool; optional
+        If True, use and update the sidecar index file for the op2
+        file; see :class:`OP2`.
 
     Returns
     -------
@@ -3024,7 +3326,7 @@ def rdpostop2(
     """
     # read op2 file:
     op2file = guitools.get_file_name(op2file, read=True)
-    with OP2(op2file) as o2:
+    with OP2(op2file, index_cache) as o2:
         mats = {}
         selist = uset = cstm2 = sebulk = seload = seconct = None
         se = 0
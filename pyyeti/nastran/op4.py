@@ -25,7 +25,10 @@ Notes on sparse matrices:
     the source Jupyter notebook at the top of the tutorial.
 """
 
+import io
 import itertools as it
+import multiprocessing as mp
+from multiprocessing.pool import ThreadPool
 import struct
 import sys
 import warnings
@@ -105,6 +108,9 @@ class OP4:
         string = "%.1E" % 1.2
         self._expdigits = len(string) - (string.find("E") + 2)
         self._rows4bigmat = 65536
+        # approximate number of values encoded at a time when
+        # writing binary files (see `_encode_binary`):
+        self._encode_block = 2 ** 20
         # Tunable value ... if number of values exceeds this, read
         # with numpy.fromfile instead of struct.unpack.
         self._rowsCutoff = 3000
@@ -1342,228 +1348,259 @@ class OP4:
         f.write(struct.pack(endian + "5i8si", 24, cols, rows, form, mtype, name, 24))
         return cols, multiplier
 
-    def _write_binary(self, f, name, matrix, endian, form):
+    @staticmethod
+    def _col_strings(matrix, dense):
         """
-        Write a matrix to a file in double precision binary format.
+        Find the data strings of each column of a matrix.
 
         Parameters
         ----------
-        f : file handle
-            Output of open() using binary mode.
-        name : string
-            Name of matrix.
-        matrix : matrix
-            Matrix to write.
-        endian : string
-            Endian setting for binary output:  '' for native, '>' for
-            big-endian and '<' for little-endian.
-        form : integer or None
-            The matrix form. If None, the form will be determined
-            automatically.
-        """
-        cols, multiplier = self._write_binary_header(
-            f, name, matrix, endian, bigmat=False, form=form
-        )
+        matrix : 2d ndarray or tuple
+            Matrix to write; as in :func:`_get_header_info`, a sparse
+            matrix is input as the tuple ``(m, r, c, v)``.
+        dense : bool
+            If True, each column with data has one string that spans
+            from the first to the last non-zero row (zeros included);
+            this is for the "dense" format. Otherwise, each run of
+            consecutive non-zero rows is a string; this is for the
+            sparse "bigmat" and "nonbigmat" formats.
 
-        def _write_col_data(f, v, c, s, elems, endian, colHeader, colTrailer):
-            reclen = 3 * 4 + elems * 8
-            f.write(colHeader.pack(reclen, c + 1, s + 1, 2 * elems))
-            f.write(struct.pack(endian + ("%dd" % elems), *v))
-            f.write(colTrailer.pack(reclen))
+        Returns
+        -------
+        col, r0, length : 1d ndarrays
+            The column, starting row and number of rows (each
+            0-offset) of each string. The strings are sorted by
+            column, then by row.
+        values : 1d ndarray
+            The values of all strings, one after the other (``sum
+            (length)`` values).
 
-        colHeader = struct.Struct(endian + "4i")
-        colTrailer = struct.Struct(endian + "i")
-        if isinstance(matrix, np.ndarray):
-            for c in range(cols):
-                v = matrix[:, c]
-                if np.any(v):
-                    pv = np.nonzero(v)[0]
-                    s = pv[0]
-                    e = pv[-1]
-                    elems = (e - s + 1) * multiplier
-                    v = np.asarray(v[s : e + 1]).ravel()
-                    v.dtype = float
-                    _write_col_data(f, v, c, s, elems, endian, colHeader, colTrailer)
+        Notes
+        -----
+        The strings are found for all columns at once from the
+        column-sorted (CSC order) non-zeros; there is no loop over
+        columns. For a dense format ndarray, only the first and last
+        non-zero row of each column are located.
+        """
+        if dense and not isinstance(matrix, tuple):
+            nz = matrix != 0
+            col = np.nonzero(nz.any(axis=0))[0]
+            nz = nz[:, col]
+            r0 = nz.argmax(axis=0)
+            length = matrix.shape[0] - nz[::-1].argmax(axis=0) - r0
+            values = matrix[:, col].T
+            if (length == matrix.shape[0]).all():
+                return col, r0, length, values.ravel()
+            rows = np.arange(matrix.shape[0])
+            keep = (rows >= r0[:, None]) & (rows < (r0 + length)[:, None])
+            return col, r0, length, values[keep]
+        if isinstance(matrix, tuple):
+            r, c, v = matrix[1:]
+            pv = np.lexsort((r, c))  # sort by column, then by row
+            r, c, v = r[pv], c[pv], v[pv]
         else:
-            # sparse matrix:
-            rs, cs, vs, cols_with_data = OP4._sparse_sort(matrix)
-            dt = float if multiplier == 1 else complex
-            for c in cols_with_data:
-                pv = (cs == c).nonzero()[0]  # find data for column c
-                s = rs[pv[0]]  # first row with value
-                e = rs[pv[-1]]  # last row with value
-                elems = e - s + 1
-                vec = np.zeros(elems, dt)
-                vec[rs[pv] - s] = vs[pv]
-                elems *= multiplier
-                vec.dtype = float
-                _write_col_data(f, vec, c, s, elems, endian, colHeader, colTrailer)
-        reclen = 3 * 4 + 8
-        f.write(colHeader.pack(reclen, cols + 1, 1, 2))
-        f.write(struct.pack(endian + "d", 2 ** 0.5))
-        f.write(colTrailer.pack(reclen))
-
-    @staticmethod
-    def _write_binary_sparse(
-        f,
-        matrix,
-        cols,
-        _write_col_header,
-        _write_data_string,
-        multiplier,
-        colHeader,
-        colTrailer,
-        LrStruct,
-        endian,
-    ):
-        if isinstance(matrix, np.ndarray):
-            for c in range(cols):
-                v = matrix[:, c]
-                if np.any(v):
-                    v = np.asarray(v).ravel()
-                    ind = OP4._sparse_col_stats(v.nonzero()[0])
-                    reclen = _write_col_header(f, ind, c, multiplier, colHeader)
-                    for r0, r1 in ind:
-                        string = v[r0 : r0 + r1]
-                        string.dtype = float
-                        _write_data_string(
-                            f, string, r0, r1, multiplier, LrStruct, endian
-                        )
-                    f.write(colTrailer.pack(reclen))
+            c, r = np.nonzero(matrix.T)
+            v = matrix[r, c]
+        if dense:
+            brk = np.ones(len(c), bool)
+            brk[1:] = c[1:] != c[:-1]
         else:
-            # sparse matrix:
-            rs, cs, vs, cols_with_data = OP4._sparse_sort(matrix)
-            for c in cols_with_data:
-                pv = (cs == c).nonzero()[0]  # find data for column c
-                ind = OP4._sparse_col_stats(rs[pv])
-                reclen = _write_col_header(f, ind, c, multiplier, colHeader)
-                coldata = vs[pv]
-                j = 0
-                for r0, r1 in ind:
-                    string = coldata[j : j + r1]
-                    j += r1
-                    string.dtype = float
-                    _write_data_string(f, string, r0, r1, multiplier, LrStruct, endian)
-                f.write(colTrailer.pack(reclen))
-        reclen = 3 * 4 + 8
-        f.write(colHeader.pack(reclen, cols + 1, 1, 2))
-        f.write(struct.pack(endian + "d", 2 ** 0.5))
-        f.write(colTrailer.pack(reclen))
-
-    def _write_binary_nonbigmat(self, f, name, matrix, endian, form):
+            brk = np.ones(len(c), bool)
+            brk[1:] = (c[1:] != c[:-1]) | (r[1:] != r[:-1] + 1)
+        first = np.nonzero(brk)[0]
+        last = np.empty_like(first)
+        last[:-1] = first[1:] - 1
+        last[-1:] = len(c) - 1
+        col = c[first]
+        r0 = r[first]
+        length = r[last] - r0 + 1
+        if not dense:
+            return col, r0, length, v
+        # scatter non-zeros into the zero-filled strings:
+        string = np.cumsum(brk) - 1
+        start = np.cumsum(length) - length
+        values = np.zeros(length.sum(), v.dtype)
+        values[start[string] + r - r0[string]] = v
+        return col, r0, length, values
+
+    def _encode_binary(self, name, matrix, endian, form, fmt):
         """
-        Write a matrix to a file in double precision binary,
-        non-bigmat sparse format.
+        Split a matrix into pieces for double precision binary output
 
         Parameters
         ----------
-        f : file handle
-            Output of open() using binary mode.
         name : string
             Name of matrix.
-        matrix : matrix
-            Matrix to write.
+        matrix : 2d ndarray or tuple
+            Matrix to write; a sparse matrix is input as the tuple
+            ``(m, r, c, v)`` (see :func:`write`).
         endian : string
             Endian setting for binary output:  '' for native, '>' for
             big-endian and '<' for little-endian.
         form : integer or None
             The matrix form. If None, the form will be determined
             automatically.
+        fmt : string
+            One of 'dense', 'nonbigmat' or 'bigmat'. If 'nonbigmat'
+            and the number of rows is > 65535, 'bigmat' is used (a
+            Nastran rule).
 
-        Note: if rows > 65535, bigmat is turned on and the
-        :func:`write_binary_bigmat` function is called ...
-        that's a Nastran rule.
-        """
-        if isinstance(matrix, tuple):
-            rows, cols = matrix[0].shape
-        else:
-            rows, cols = matrix.shape
-
-        if rows >= self._rows4bigmat:
-            self._write_binary_bigmat(f, name, matrix, endian, form)
-            return
+        Returns
+        -------
+        list
+            List of functions that take no arguments; each returns a
+            bytes object. Calling them in order and writing the
+            results gives the complete matrix record: header, column
+            records and the trailing record.
 
+        Notes
+        -----
+        The column records are encoded in blocks of columns (see
+        :func:`_encode_columns`) so that the memory needed does not
+        depend on the size of the matrix. Each block holds roughly
+        `_encode_block` matrix values (or non-zeros for sparse
+        input).
+        """
+        sparse_input = isinstance(matrix, tuple)
+        rows, cols = (matrix[0] if sparse_input else matrix).shape
+        if fmt == "nonbigmat" and rows >= self._rows4bigmat:
+            fmt = "bigmat"
+        f = io.BytesIO()
         cols, multiplier = self._write_binary_header(
-            f, name, matrix, endian, bigmat=False, form=form
+            f, name, matrix, endian, bigmat=fmt == "bigmat", form=form
         )
-        colHeader = struct.Struct(endian + "4i")
-        colTrailer = struct.Struct(endian + "i")
-
-        def _write_col_header(f, ind, c, multiplier, colHeader):
-            nwords = ind.shape[0] + 2 * sum(ind[:, 1]) * multiplier
-            reclen = (3 + nwords) * 4
-            f.write(colHeader.pack(reclen, c + 1, 0, nwords))
-            return reclen
-
-        def _write_data_string(f, string, r0, r1, multiplier, colTrailer, endian):
-            L = r1 * 2 * multiplier
-            IS = (r0 + 1) + ((L + 1) << 16)
-            f.write(colTrailer.pack(IS))
-            f.write(struct.pack(endian + ("%dd" % len(string)), *string))
+        header = f.getvalue()
+        pieces = [lambda: header]
+
+        def _piece(block, c0):
+            return lambda: self._encode_columns(block, c0, endian, multiplier, fmt)
+
+        if sparse_input:
+            r, c, v = matrix[1:]
+            pv = np.lexsort((r, c))  # sort by column, then by row
+            r, c, v = r[pv], c[pv], v[pv]
+            # block boundaries by number of non-zeros, adjusted to
+            # start at a column:
+            edges = np.unique(np.append(c[:: self._encode_block], cols))
+            starts = np.searchsorted(c, edges)
+            for c0, i0, i1 in zip(edges[:-1], starts[:-1], starts[1:]):
+                block = (None, r[i0:i1], c[i0:i1] - c0, v[i0:i1])
+                pieces.append(_piece(block, c0))
+        else:
+            ncol = max(1, self._encode_block // max(rows, 1))
+            for c0 in range(0, cols, ncol):
+                pieces.append(_piece(matrix[:, c0 : c0 + ncol], c0))
 
-        OP4._write_binary_sparse(
-            f,
-            matrix,
-            cols,
-            _write_col_header,
-            _write_data_string,
-            multiplier,
-            colHeader,
-            colTrailer,
-            colTrailer,
-            endian,
-        )
+        # trailing record:
+        trailer = struct.pack(endian + "4idi", 20, cols + 1, 1, 2, 2 ** 0.5, 20)
+        pieces.append(lambda: trailer)
+        return pieces
 
-    def _write_binary_bigmat(self, f, name, matrix, endian, form):
+    def _encode_columns(self, matrix, c0, endian, multiplier, fmt):
         """
-        Write a matrix to a file in double precision binary, bigmat
-        sparse format.
+        Encode a block of columns in double precision binary format
 
         Parameters
         ----------
-        f : file handle
-            Output of open() using binary mode.
-        name : string
-            Name of matrix.
-        matrix : matrix
-            Matrix to write.
+        matrix : 2d ndarray or tuple
+            Block of columns to write; a sparse block is input as the
+            tuple ``(None, r, c, v)`` with `c` relative to `c0`.
+        c0 : integer
+            Column number (0-offset) of the first column in `matrix`.
         endian : string
             Endian setting for binary output:  '' for native, '>' for
             big-endian and '<' for little-endian.
-        form : integer or None
-            The matrix form. If None, the form will be determined
-            automatically.
-        """
-        cols, multiplier = self._write_binary_header(
-            f, name, matrix, endian, bigmat=True, form=form
-        )
-        colHeader = struct.Struct(endian + "4i")
-        colTrailer = struct.Struct(endian + "i")
-        LrStruct = struct.Struct(endian + "ii")
+        multiplier : integer
+            2 for complex, 1 for real.
+        fmt : string
+            One of 'dense', 'nonbigmat' or 'bigmat'.
 
-        def _write_col_header(f, ind, c, multiplier, colHeader):
-            nwords = 2 * ind.shape[0] + 2 * sum(ind[:, 1]) * multiplier
-            reclen = (3 + nwords) * 4
-            f.write(colHeader.pack(reclen, c + 1, 0, nwords))
-            return reclen
+        Returns
+        -------
+        bytes
+            The column records for all columns in the block that have
+            data.
 
-        def _write_data_string(f, string, r0, r1, multiplier, LrStruct, endian):
-            L = r1 * 2 * multiplier
-            f.write(LrStruct.pack(L + 1, r0 + 1))
-            f.write(struct.pack(endian + ("%dd" % len(string)), *string))
+        Notes
+        -----
+        The block is built as an array of 4-byte words: integers are
+        stored directly and each double occupies two words. The
+        location of every column header, string header and data
+        word is computed with numpy from the strings found by
+        :func:`_col_strings`, so the work done in Python does not
+        depend on the number of columns or strings.
+        """
+        i4 = endian + "i4"
+        col, r0, length, values = self._col_strings(matrix, fmt == "dense")
+        nstr = len(col)
+        if nstr == 0:
+            return b""
+        col = col + c0
+
+        # number of header words per string:
+        h = {"dense": 0, "nonbigmat": 1, "bigmat": 2}[fmt]
+
+        # first string of each column, and number of strings and
+        # doubles in each column:
+        ndbl = length * multiplier
+        colbrk = np.ones(nstr, bool)
+        colbrk[1:] = col[1:] != col[:-1]
+        kfirst = np.nonzero(colbrk)[0]
+        colstr = np.diff(np.append(kfirst, nstr))
+        coldbl = np.add.reduceat(ndbl, kfirst)
+        nwords = h * colstr + 2 * coldbl
+        reclen = (3 + nwords) * 4
+
+        # each column record: 4 header words, data, 1 trailer word:
+        colwords = nwords + 5
+        cstart = np.cumsum(colwords) - colwords
+        words = np.zeros(colwords.sum(), i4)
+        words[cstart] = reclen
+        words[cstart + 1] = col[kfirst] + 1
+        if fmt == "dense":
+            words[cstart + 2] = r0 + 1
+        words[cstart + 3] = nwords
+        words[cstart + colwords - 1] = reclen
+
+        # start word of each string:
+        k_in_col = np.arange(nstr) - np.repeat(kfirst, colstr)
+        dstart = np.cumsum(ndbl) - ndbl
+        dcol = np.repeat(dstart[kfirst], colstr)
+        sstart = np.repeat(cstart, colstr) + 4 + h * k_in_col + 2 * (dstart - dcol)
+        L = 2 * ndbl
+        if fmt == "nonbigmat":
+            words[sstart] = (r0 + 1) + ((L + 1) << 16)
+        elif fmt == "bigmat":
+            words[sstart] = L + 1
+            words[sstart + 1] = r0 + 1
+
+        # the data (2 words per double):
+        data = np.ascontiguousarray(values).view(float).astype(endian + "f8")
+        index = np.arange(2 * len(data)) + np.repeat(sstart + h - 2 * dstart, L)
+        words[index] = data.view(i4)
+        return words.tobytes()
 
-        OP4._write_binary_sparse(
-            f,
-            matrix,
-            cols,
-            _write_col_header,
-            _write_data_string,
-            multiplier,
-            colHeader,
-            colTrailer,
-            LrStruct,
-            endian,
-        )
+    @staticmethod
+    def _write_pieces(f, pieces, ncpu):
+        """
+        Write output of the functions in `pieces` to `f` in order
+
+        `pieces` is a list of functions as returned by
+        :func:`_encode_binary`. With ``ncpu > 1``, `ncpu` of them at a
+        time are run concurrently in a thread pool.
+        """
+        if ncpu is None:
+            ncpu = mp.cpu_count()
+        ncpu = max(1, min(ncpu, len(pieces)))
+        if ncpu == 1:
+            for piece in pieces:
+                f.write(piece())
+        else:
+            # run `ncpu` pieces concurrently, write in order:
+            with ThreadPool(ncpu) as pool:
+                for j in range(0, len(pieces), ncpu):
+                    for buf in pool.map(lambda piece: piece(), pieces[j : j + ncpu]):
+                        f.write(buf)
 
     def dctload(self, filename, namelist=None, justmatrix=False, sparse=False):
         """
@@ -1806,6 +1843,142 @@ class OP4:
             return self.listload(filename, namelist, sparse)
         raise ValueError('invalid "into" option')
 
+    def lazyload(self, filename, namelist=None):
+        """
+        Index a binary op4 file and return lazy, memory-mapped matrix
+        proxies
+
+        Parameters
+        ----------
+        filename : string
+            Name of binary op4 file to read.
+        namelist : list, string, or None; optional
+            List of variable names to index, or string with name of
+            the single variable to index, or None. If None, all
+            matrices are indexed.
+
+        Returns
+        -------
+        dct : :class:`collections.OrderedDict`
+            Keys are the lower-case matrix names and the values are
+            :class:`LazyMatrix` instances. If the file has duplicate
+            names, the last one is kept.
+
+        Notes
+        -----
+        The file is scanned once, reading only the matrix headers and
+        the column record headers; no matrix data is read. The
+        offset, starting row and length of every column record is
+        saved in the proxies. The data is read through a shared
+        :class:`numpy.memmap` of the file only when a proxy is
+        indexed or converted to an array. So, only the requested
+        matrices -- or even just the requested columns -- are read
+        from disk. See :class:`LazyMatrix` for more information.
+
+        Only binary op4 files can be lazily loaded.
+
+        Raises
+        ------
+        ValueError
+            If `filename` is an ascii op4 file.
+
+        See also
+        --------
+        :func:`dctload`, :func:`dir`.
+        """
+        if isinstance(namelist, str):
+            namelist = [namelist]
+        self._op4open_read(filename)
+        dct = collections.OrderedDict()
+        try:
+            if self._ascii:
+                raise ValueError(
+                    f"{filename!r} is an ascii op4 file; lazy loading is only "
+                    "supported for binary op4 files"
+                )
+            mm = np.memmap(filename, np.uint8, mode="r")
+            while 1:
+                info = self._index_op4_binary()
+                if info is None:
+                    break
+                if not namelist or info["name"] in namelist:
+                    dct[info["name"]] = LazyMatrix(mm, **info)
+        finally:
+            self._op4close()
+        return dct
+
+    def _index_op4_binary(self):
+        """
+        Index the next matrix in a binary op4 file for
+        :func:`lazyload`; returns None if at end-of-file.
+        """
+        fp = self._fileh
+        if len(fp.read(4)) == 0:
+            return None
+        cols, rows, form, mtype = self._Str_iiii.unpack(fp.read(self._bytes_iiii))
+        if self._bit64:
+            name = fp.read(16).decode()
+        else:
+            name = fp.read(8).decode()
+        name = self._check_name(name)
+        fp.read(4)
+
+        # scan column records, saving the location of each:
+        bi = self._bytes_i
+        wordsize = 8 if self._bit64 else 4
+        colnum = []
+        rowstart = []
+        nwords = []
+        offsets = []
+        while True:
+            pos = fp.tell()
+            rec = fp.read(4 + self._bytes_iii)
+            if len(rec) < 4 + self._bytes_iii:
+                warnings.warn(
+                    f"Premature end-of-file after matrix {name!r}. Nastran "
+                    "will likely FATAL on this file.",
+                    RuntimeWarning,
+                )
+                break
+            reclen = self._Str_i4.unpack(rec[:4])[0]
+            c, r, nw = self._Str_iii.unpack(rec[4:])
+            fp.seek(pos + 4 + reclen + 4)
+            if c > cols:
+                break
+            colnum.append(c - 1)
+            rowstart.append(r)
+            nwords.append(nw)
+            offsets.append(pos + 4 + 3 * bi)
+
+        if rows > 0 and rowstart and rowstart[0] > 0:
+            fmt = "dense"
+        elif rows < 0 or rows >= self._rows4bigmat:
+            fmt = "bigmat"
+        else:
+            fmt = "nonbigmat"
+
+        if mtype & 1:
+            vdtype = self._str_sr_fromfile
+            wper = 1
+        else:
+            vdtype = self._str_dr_fromfile
+            wper = self._wordsperdouble
+        return dict(
+            name=name,
+            shape=(abs(rows), cols),
+            form=form,
+            mtype=mtype,
+            fmt=fmt,
+            colnum=np.array(colnum, dtype=np.int64),
+            rowstart=np.array(rowstart, dtype=np.int64),
+            nwords=np.array(nwords, dtype=np.int64),
+            offsets=np.array(offsets, dtype=np.int64),
+            vdtype=vdtype,
+            idtype=np.dtype(self._endian + ("i8" if self._bit64 else "i4")),
+            wper=wper,
+            wordsize=wordsize,
+        )
+
     def dir(self, filename, verbose=True):
         """
         Directory of all matrices in op4 file.
@@ -1871,6 +2044,7 @@ class OP4:
         endian="",
         sparse="auto",
         forms=None,
+        ncpu=1,
     ):
         """
         Write op4 file.
@@ -1948,6 +2122,15 @@ class OP4:
                 The validity of the values in `forms` is not checked
                 in any way.
 
+        ncpu : integer or None; optional
+            Number of threads used to encode binary matrices. Each
+            matrix is encoded in blocks of columns; with ``ncpu >
+            1``, `ncpu` blocks at a time are encoded concurrently
+            into memory buffers which are then written to the file in
+            order. If None, it is set to
+            :func:`multiprocessing.cpu_count`. Ignored for ascii
+            files.
+
         Returns
         -------
         None.
@@ -2023,22 +2206,18 @@ class OP4:
         matrices = [ensure_2d_dp(matrix) for matrix in matrices]
 
         if binary:
-            if sparse == "dense":
-                wrtfunc = self._write_binary
-            elif sparse == "bigmat":
-                wrtfunc = self._write_binary_bigmat
-            elif sparse == "nonbigmat":
-                wrtfunc = self._write_binary_nonbigmat
-            elif sparse != "auto":
+            if sparse not in ("auto", "dense", "bigmat", "nonbigmat"):
                 raise ValueError("invalid sparse option")
+
+            pieces = []
+            for name, matrix, form in zip(names, matrices, forms):
+                fmt = sparse
+                if fmt == "auto":
+                    fmt = "bigmat" if isinstance(matrix, tuple) else "dense"
+                pieces.extend(self._encode_binary(name, matrix, endian, form, fmt))
+
             with open(filename, "wb") as f:
-                for name, matrix, form in zip(names, matrices, forms):
-                    if sparse == "auto":
-                        if isinstance(matrix, tuple):
-                            wrtfunc = self._write_binary_bigmat
-                        else:
-                            wrtfunc = self._write_binary
-                    wrtfunc(f, name, matrix, endian, form)
+                self._write_pieces(f, pieces, ncpu)
         else:
             if sparse == "dense":
                 wrtfunc = self._write_ascii
@@ -2058,6 +2237,251 @@ class OP4:
                     wrtfunc(f, name, matrix, digits, form)
 
 
+class LazyMatrix:
+    """
+    Lazy, memory-mapped proxy for a matrix in a binary op4 file
+
+    Instances are created by :func:`lazyload` (or
+    :func:`OP4.lazyload`). No matrix data is read until the proxy is
+    indexed or converted to an array; then, only the needed column
+    records are read via a :class:`numpy.memmap` of the file. All
+    op4 storage formats (dense, bigmat and non-bigmat sparse) and
+    matrix types are supported. The data is always returned as
+    double precision, like :func:`load`.
+
+    Attributes
+    ----------
+    name : string
+        Lower-case name of the matrix
+    shape : tuple
+        ``(rows, cols)`` of the matrix
+    form : integer
+        Nastran form of matrix
+    mtype : integer
+        Nastran matrix type
+    dtype : numpy dtype
+        Either float or complex
+    ndim : integer
+        Always 2
+
+    Notes
+    -----
+    Indexing follows the usual numpy rules, but is done in two
+    steps: the column index is applied first so that only those
+    columns are read, then the row index is applied to the
+    resulting dense array::
+
+        kaa = dct['kaa'][:]           # all of KAA
+        drm = dct['drm'][:, 10:20]    # reads only 10 columns
+        x = dct['drm'][3, 5]          # reads only column 5
+
+    Use :func:`toarray` or :func:`numpy.asarray` to read the entire
+    matrix and :func:`tosparse` to read it into a
+    :class:`scipy.sparse.csc_matrix` without forming the dense
+    matrix. The memory map stays open as long as any proxy from the
+    file is alive.
+    """
+
+    ndim = 2
+
+    def __init__(
+        self,
+        mm,
+        name,
+        shape,
+        form,
+        mtype,
+        fmt,
+        colnum,
+        rowstart,
+        nwords,
+        offsets,
+        vdtype,
+        idtype,
+        wper,
+        wordsize,
+    ):
+        self._mm = mm
+        self.name = name
+        self.shape = shape
+        self.form = form
+        self.mtype = mtype
+        self.dtype = np.dtype(float if mtype < 3 else complex)
+        self._fmt = fmt
+        self._colnum = colnum
+        self._rowstart = rowstart
+        self._nwords = nwords
+        self._offsets = offsets
+        self._vdtype = vdtype
+        self._idtype = idtype
+        self._wper = wper
+        self._wordsize = wordsize
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}({self.name!r}, shape={self.shape}, "
+            f"form={self.form}, mtype={self.mtype})"
+        )
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None):
+        X = self.toarray()
+        return X if dtype is None else X.astype(dtype, copy=False)
+
+    def __getitem__(self, index):
+        if not isinstance(index, tuple):
+            index = (index,)
+        if len(index) > 2:
+            raise IndexError("too many indices for 2d matrix")
+        rowindex = index[0]
+        colindex = index[1] if len(index) == 2 else slice(None)
+        cols = np.arange(self.shape[1])[colindex]
+        if cols.ndim == 0:
+            return self._read_columns(cols.reshape(1))[rowindex, 0]
+        return self._read_columns(cols)[rowindex]
+
+    def toarray(self):
+        """Read entire matrix into a dense 2d ndarray"""
+        return self._read_columns(np.arange(self.shape[1]))
+
+    def tosparse(self):
+        """
+        Read entire matrix into a :class:`scipy.sparse.csc_matrix`
+
+        For the sparse op4 formats, only the nonzero strings are
+        read; the dense matrix is never formed.
+        """
+        rows = []
+        cols = []
+        vals = []
+        for j, (r, Y) in self._iter_strings(np.arange(len(self._colnum))):
+            c = self._colnum[j]
+            rows.append(np.arange(r, r + len(Y)))
+            cols.append(np.full(len(Y), c))
+            vals.append(Y)
+        if rows:
+            rows = np.concatenate(rows)
+            cols = np.concatenate(cols)
+            vals = np.concatenate(vals)
+        return sp.csc_matrix((vals, (rows, cols)), shape=self.shape, dtype=self.dtype)
+
+    def _values(self, offset, nvalues):
+        Y = np.frombuffer(self._mm, self._vdtype, nvalues, offset)
+        if self.mtype > 2:
+            Y = Y.astype(float).view(complex)
+        return Y
+
+    def _iter_strings(self, records):
+        """Yield ``(record, (row, values))`` for all strings of
+        values in the column `records` (index into `_colnum`)"""
+        mm = self._mm
+        wper = self._wper
+        ws = self._wordsize
+        idtype = self._idtype
+        bytesreal = self._vdtype.itemsize
+        for j in records:
+            offset = self._offsets[j]
+            nwords = self._nwords[j]
+            if self._fmt == "dense":
+                yield j, (self._rowstart[j] - 1, self._values(offset, nwords // wper))
+                continue
+            while nwords > 0:
+                if self._fmt == "bigmat":
+                    L, r = np.frombuffer(mm, idtype, 2, offset)
+                    offset += 2 * ws
+                    nwords -= L + 1
+                    L = (L - 1) // wper
+                    r -= 1
+                else:
+                    IS = int(np.frombuffer(mm, idtype, 1, offset)[0])
+                    offset += ws
+                    L = (IS >> 16) - 1
+                    r = IS - ((L + 1) << 16) - 1
+                    nwords -= L + 1
+                    L //= wper
+                yield j, (int(r), self._values(offset, int(L)))
+                offset += int(L) * bytesreal
+
+    def _read_columns(self, cols):
+        """Read columns `cols` (0-based) into a dense matrix"""
+        X = np.zeros((self.shape[0], len(cols)), self.dtype, order="F")
+        if len(self._colnum) == 0:
+            return X
+        # map the requested columns to the column records:
+        pos = np.searchsorted(self._colnum, cols)
+        pos[pos >= len(self._colnum)] = 0
+        have = self._colnum[pos] == cols
+        k = np.nonzero(have)[0]
+        # read each record once, even if it is requested more than
+        # once, and copy it to all output columns that need it:
+        upos, inv = np.unique(pos[k], return_inverse=True)
+        groups = np.split(
+            k[np.argsort(inv, kind="stable")], np.cumsum(np.bincount(inv))[:-1]
+        )
+        outcols = dict(zip(upos, groups))
+        for j, (r, Y) in self._iter_strings(upos):
+            X[r : r + len(Y), outcols[j]] = Y[:, None]
+        return X
+
+
+def lazyload(filename=None, namelist=None):
+    """
+    Index a binary op4 file and return lazy, memory-mapped matrix
+    proxies; non-member version of :func:`OP4.lazyload`.
+
+    Parameters
+    ----------
+    filename : string or None; optional
+        Name of binary op4 file to read. Can also be the name of a
+        directory or None; in these cases, a GUI is opened for file
+        selection.
+    namelist : list, string, or None; optional
+        List of variable names to index, or string with name of the
+        single variable to index, or None. If None, all matrices are
+        indexed.
+
+    Returns
+    -------
+    dct : :class:`collections.OrderedDict`
+        Keys are the lower-case matrix names and the values are
+        :class:`LazyMatrix` instances.
+
+    Notes
+    -----
+    This is useful for very large op4 files when only a few matrices
+    (or parts of matrices) are needed: the file is indexed once
+    and nothing else is read until a matrix is accessed. See
+    :func:`OP4.lazyload` and :class:`LazyMatrix`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pyyeti.nastran import op4
+    >>> a = np.arange(12.).reshape(3, 4)
+    >>> op4.write('lazy.op4', dict(a=a, b=2*a))
+    >>> dct = op4.lazyload('lazy.op4')
+    >>> dct['a']
+    LazyMatrix('a', shape=(3, 4), form=2, mtype=2)
+    >>> dct['a'][:, 2:]
+    array([[  2.,   3.],
+           [  6.,   7.],
+           [ 10.,  11.]])
+    >>> np.all(np.asarray(dct['b']) == 2*a)
+    True
+    >>> del dct
+    >>> import os
+    >>> os.remove('lazy.op4')
+
+    See also
+    --------
+    :func:`load`, :func:`dir`.
+    """
+    filename = guitools.get_file_name(filename, read=True)
+    return OP4().lazyload(filename, namelist)
+
+
 def load(filename=None, namelist=None, into="dct", justmatrix=False, sparse=False):
     """
     Read all matching matrices from op4 file into dictionary or list;
@@ -2294,6 +2718,7 @@ def write(
     endian="",
     sparse="auto",
     forms=None,
+    ncpu=1,
 ):
     """
     Write op4 file; non-member version of :func:`OP4.write`.
@@ -2370,6 +2795,13 @@ def write(
             The validity of the values in `forms` is not checked in
             any way.
 
+    ncpu : integer or None; optional
+        Number of threads used to encode binary matrices. With ``ncpu
+        > 1``, blocks of columns are encoded concurrently into memory
+        buffers which are then written to the file in order; see
+        :func:`OP4.write`. If None, it is set to
+        :func:`multiprocessing.cpu_count`. Ignored for ascii files.
+
     Returns
     -------
     None.
@@ -2460,7 +2892,7 @@ def write(
     :func:`load`, :func:`dir`.
     """
     filename = guitools.get_file_name(filename, read=False)
-    OP4().write(filename, names, matrices, binary, digits, endian, sparse, forms)
+    OP4().write(filename, names, matrices, binary, digits, endian, sparse, forms, ncpu)
 
 
 # create `save` as an alias for `write`
@@ -75,9 +75,170 @@ class _BaseODE:
             sol.force = f
         return sol
 
+    def fsolve_batch(self, force, freq, incrb=2, rf_disp_only=False):
+        """
+        Solve frequency-domain equations for a batch of force cases
+
+        Parameters
+        ----------
+        force : 3d ndarray
+            The force cases; ncases x ndof x freq
+        freq : 1d ndarray
+            Frequency vector in Hz; solution will be computed at all
+            frequencies in `freq` for all cases
+        incrb : 0, 1, or 2; optional
+            Specifies how to handle rigid-body responses; see
+            :func:`fsolve`.
+        rf_disp_only : bool; optional
+            Specifies how to handle the velocity and acceleration
+            terms for residual-flexibility modes; see :func:`fsolve`.
+
+        Returns
+        -------
+        A SimpleNamespace with the members:
+
+        d : 3d ndarray
+            Displacement; ncases x ndof x freq
+        v : 3d ndarray
+            Velocity; ncases x ndof x freq
+        a : 3d ndarray
+            Acceleration; ncases x ndof x freq
+        f : 1d ndarray
+            Frequency vector (same as the input `freq`)
+
+        Notes
+        -----
+        All cases are solved in a single call to :func:`fsolve` by
+        stacking the cases column-wise (see :func:`_batch_force`)
+        and repeating each frequency once per case. The results are
+        the same as calling :func:`fsolve` for each case.
+        """
+        freq = np.atleast_1d(freq)
+        force, nc = self._batch_force(force)
+        sol = self.fsolve(force, np.repeat(freq, nc), incrb, rf_disp_only)
+        return SimpleNamespace(
+            d=self._unbatch(sol.d, nc),
+            v=self._unbatch(sol.v, nc),
+            a=self._unbatch(sol.a, nc),
+            f=freq,
+        )
+
+    def _fsolve_chunked(
+        self, force, freq, incrb, rf_disp_only, chunk, max_memory, sink, **kwargs
+    ):
+        """
+        Solve frequency-domain equations in blocks of frequencies
+
+        Routine used by the `fsolve` methods when the `chunk`,
+        `max_memory` or `sink` option is used; see, for example,
+        :func:`pyyeti.ode.SolveUnc.fsolve`. Any `kwargs` are passed
+        through to `fsolve`.
+        """
+        force = np.atleast_2d(force)
+        freq = np.atleast_1d(freq)
+        self._force_freq_compat_chk(force, freq)
+        nf = len(freq)
+        if nf == 0 and sink is None:
+            return self.fsolve(force, freq, incrb, rf_disp_only, **kwargs)
+        if chunk is None:
+            if max_memory is None:
+                chunk = nf
+            else:
+                # d, v, a and the intermediate arrays, all complex:
+                chunk = int(max_memory // (16 * 12 * max(self.n, 1)))
+        chunk = max(1, min(int(chunk), nf))
+
+        out = []
+        d = v = a = None
+        for j in range(0, nf, chunk):
+            pv = slice(j, min(j + chunk, nf))
+            sol = self.fsolve(force[:, pv], freq[pv], incrb, rf_disp_only, **kwargs)
+            if sink is not None:
+                out.append(sink(sol, pv))
+                continue
+            if d is None:
+                shape = (sol.d.shape[0], nf)
+                d = np.empty(shape, sol.d.dtype, order="F")
+                v = np.empty(shape, sol.v.dtype, order="F")
+                a = np.empty(shape, sol.a.dtype, order="F")
+            d[:, pv] = sol.d
+            v[:, pv] = sol.v
+            a[:, pv] = sol.a
+        if sink is not None:
+            return out
+        return SimpleNamespace(d=d, v=v, a=a, f=freq)
+
     #
     # Utility routines follow:
     #
+    def _batch_force(self, force):
+        """
+        Stack a 3d ncases x ndof x time (or freq) force array into a
+        2d matrix for the batch solvers
+
+        The columns are interleaved so that all cases for one time
+        step are adjacent: column ``i*nc + c`` holds step `i` of case
+        `c`, where `nc` is the number of cases. The solution of case
+        `c` is then the strided view ``x[:, c::nc]`` and the slab
+        ``x[:, i*nc:(i+1)*nc]`` holds all cases at step `i`. Returns
+        ``(force2d, nc)``.
+        """
+        force = np.asarray(force)
+        if force.ndim != 3:
+            raise ValueError(
+                "`force` must be 3d for batch solutions (ncases x ndof x time);"
+                f" input has {force.ndim} dimension(s)"
+            )
+        nc, n, nt = force.shape
+        return force.transpose(1, 2, 0).reshape(n, nt * nc), nc
+
+    @staticmethod
+    def _unbatch(x, nc):
+        """Inverse of :func:`_batch_force`; returns ncases x ndof x
+        time view of `x`"""
+        n = x.shape[0]
+        return x.reshape(n, -1, nc).transpose(2, 0, 1)
+
+    def _batch_ic(self, x0, nc, name):
+        """Returns initial conditions for the batch solvers as an
+        ncases x ndof array, or None"""
+        if x0 is None:
+            return None
+        x0 = np.atleast_1d(x0)
+        if x0.ndim == 1:
+            return np.broadcast_to(x0, (nc, x0.shape[0]))
+        if x0.shape[0] != nc:
+            raise ValueError(
+                f"`{name}` has {x0.shape[0]} rows but there are {nc} force cases"
+            )
+        return x0
+
+    def _init_dv_batch(self, d, v, d0, v0, force, static_ic, nc):
+        """Set initial conditions for each case of a batch solution;
+        see :func:`_batch_force`"""
+        d0 = self._batch_ic(d0, nc, "d0")
+        v0 = self._batch_ic(v0, nc, "v0")
+        for c in range(nc):
+            self._init_dv(
+                d[:, c::nc],
+                v[:, c::nc],
+                None if d0 is None else d0[c],
+                None if v0 is None else v0[c],
+                force[:, c],
+                static_ic,
+            )
+
+    def _solution_batch(self, d, v, a, nc):
+        """Returns SimpleNamespace object with d, v, a, h, t for batch
+        solutions; d, v, a are ncases x ndof x time"""
+        sol = self._solution(d, v, a)
+        sol.d = self._unbatch(sol.d, nc)
+        sol.v = self._unbatch(sol.v, nc)
+        sol.a = self._unbatch(sol.a, nc)
+        if self.h:
+            sol.t = self.h * np.arange(sol.a.shape[2])
+        return sol
+
     def _solution(self, d, v, a):
         """Returns SimpleNamespace object with d, v, a, h, t"""
         if self.h:
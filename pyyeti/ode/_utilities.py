@@ -891,10 +891,11 @@ def make_A(M, B, K):
     return A
 
 
-def solvepsd(fs, forcepsd, t_frc, freq, drmlist, rbduf=1.0, elduf=1.0, **kwargs):
+def solvepsd(
+    fs, forcepsd, t_frc, freq, drmlist, rbduf=1.0, elduf=1.0, batch=False, **kwargs
+):
     """
-    Solve equations of motion in frequency domain with uncorrelated
-    PSD forces.
+    Solve equations of motion in frequency domain with PSD forces.
 
     See also :func:`pyyeti.cla.DR_Results.solvepsd` for a very similar
     routine, but one that is designed for use within the pyYeti
@@ -906,8 +907,13 @@ def solvepsd(fs, forcepsd, t_frc, freq, drmlist, rbduf=1.0, elduf=1.0, **kwargs)
     fs : class instance
         An instance of :class:`SolveUnc` or :class:`FreqDirect` (or
         similar ... must have `.fsolve` method)
-    forcepsd : 2d array_like
-        The matrix of force psds; each row is a force PSD
+    forcepsd : 2d or 3d array_like
+        If 2d, the matrix of uncorrelated force psds; each row is a
+        force PSD. If 3d, the full cross-spectral density matrix of
+        the forces: ``forcepsd[i, j]`` is the CSD of force `i` with
+        force `j` (so ``forcepsd[i, i]`` is the PSD of force `i`);
+        shape is ``(nforces, nforces, len(freq))`` and each
+        ``forcepsd[:, :, f]`` should be Hermitian.
     t_frc : 2d array_like
         Transform to put `forcepsd` into the coordinates of the
         equations of motion: ``t_frc @ forcepsd``. Commonly, `t_frc`
@@ -951,6 +957,15 @@ def solvepsd(fs, forcepsd, t_frc, freq, drmlist, rbduf=1.0, elduf=1.0, **kwargs)
         Rigid-body uncertainty factor
     elduf : scalar; optional
         Dynamic uncertainty factor
+    batch : bool or integer; optional
+        Specifies how many unit forces are solved together. If False,
+        each force is solved separately. If True, all forces are
+        solved in one call to ``fs.fsolve`` (stacked as in
+        :func:`SolveUnc.fsolve_batch`) and the response PSDs are
+        formed from the resulting 3d FRF arrays. If an integer, it is
+        the number of forces per ``fs.fsolve`` call; this limits the
+        memory needed for the ``ndof x nforces*len(freq)`` solution
+        arrays.
     **kwargs : keyword arguments for ``fs.fsolve``; optional
         Currently, there are two arguments available:
 
@@ -999,6 +1014,28 @@ def solvepsd(fs, forcepsd, t_frc, freq, drmlist, rbduf=1.0, elduf=1.0, **kwargs)
     In that example, the data recovery uses all four drms. Also, the
     looping over the `drmlist` is not included for simplicity.
 
+    When `batch` is True (or an integer), the unit FRFs for several
+    forces are computed together: ``frf`` is then a 3d array
+    ``ndrm x len(freq) x nforces``, and the response PSD is::
+
+        resp_psd += np.einsum("fi,rfi->rf", forcepsd.T, abs(frf)**2)
+
+    For uncoupled equations (``fs.unc`` is True), the batch mode
+    does not solve for each force at all: since each DOF only
+    responds to its own force, the response to a unit force on every
+    DOF is computed once and scaled by the columns of `t_frc`.
+
+    For cross-correlated forces (3d `forcepsd`), the FRFs for all
+    forces are kept and the response PSD is the diagonal of
+    ``H @ forcepsd @ H^H`` at each frequency, where ``H = frf[:, f]``
+    (``ndrm x nforces``)::
+
+        resp_psd = np.einsum("rfi,ijf,rfj->rf",
+                             frf, forcepsd, frf.conj()).real
+
+    With uncorrelated forces (a diagonal CSD matrix), that reduces
+    to the equation above.
+
     Examples
     --------
     .. plot::
@@ -1043,23 +1080,34 @@ def solvepsd(fs, forcepsd, t_frc, freq, drmlist, rbduf=1.0, elduf=1.0, **kwargs)
         >>> fig.tight_layout()
     """
     ndrms = len(drmlist)
-    forcepsd, t_frc = np.atleast_2d(forcepsd, t_frc)
+    forcepsd = np.asarray(forcepsd)
+    csd = forcepsd.ndim == 3
+    if not csd:
+        forcepsd = np.atleast_2d(forcepsd)
+    t_frc = np.atleast_2d(t_frc)
     freq = np.atleast_1d(freq)
-    rpsd, cpsd = forcepsd.shape
-    unitforce = np.ones((1, cpsd))
+    rpsd, cpsd = forcepsd.shape[0], forcepsd.shape[-1]
     psd = [0.0] * ndrms
     rms = [0.0] * ndrms
 
-    if t_frc.shape[1] != rpsd:
+    if t_frc.shape[1] != rpsd or (csd and forcepsd.shape[1] != rpsd):
         raise ValueError(
             "`forcepsd` and `t_frc` are incompatibly "
             f"sized: {forcepsd.shape} vs {t_frc.shape}"
         )
 
-    for i in range(rpsd):
-        # solve for unit frequency response function for i'th force:
-        genforce = t_frc[:, i : i + 1] @ unitforce
-        sol = fs.fsolve(genforce, freq, **kwargs)
+    if batch is True:
+        nbatch = rpsd
+    elif batch is False:
+        nbatch = 1
+    else:
+        nbatch = max(1, int(batch))
+
+    if csd:
+        # the FRFs for all forces are needed for the cross terms:
+        frfs = [None] * ndrms
+
+    def _apply_uf(sol):
         if rbduf != 1.0:
             sol.a[fs.rb] *= rbduf
             sol.v[fs.rb] *= rbduf
@@ -1068,6 +1116,39 @@ def solvepsd(fs, forcepsd, t_frc, freq, drmlist, rbduf=1.0, elduf=1.0, **kwargs)
             sol.a[fs.el] *= elduf
             sol.v[fs.el] *= elduf
             sol.d[fs.el] *= elduf
+
+    unitsol = None
+    if nbatch > 1 and getattr(fs, "unc", False) and not fs.pre_eig:
+        # for uncoupled equations, each DOF responds only to its own
+        # force; the response to a unit force on every DOF can be
+        # scaled by `t_frc` instead of solving for each force (not
+        # if `pre_eig` is True: the equations are uncoupled in modal
+        # space only):
+        unitsol = fs.fsolve(np.ones((t_frc.shape[0], cpsd)), freq, **kwargs)
+        _apply_uf(unitsol)
+        unitsol = {
+            name: np.ascontiguousarray(getattr(unitsol, name))[:, :, None]
+            for name in "avd"
+        }
+
+    for i in range(0, rpsd, nbatch):
+        # solve for unit frequency response functions for forces
+        # i:i+nc in one call; the forces are stacked column-wise so
+        # column f*nc + c is force i+c at frequency f (the same
+        # layout as in :func:`SolveUnc.fsolve_batch`):
+        nc = min(nbatch, rpsd - i)
+        if unitsol is None:
+            genforce = np.tile(t_frc[:, i : i + nc], cpsd)
+            sol = fs.fsolve(genforce, np.repeat(freq, nc), **kwargs)
+            _apply_uf(sol)
+        else:
+            tf = np.ascontiguousarray(t_frc[:, i : i + nc])[:, None, :]
+            sol = SimpleNamespace(
+                **{
+                    name: (unit * tf).reshape(tf.shape[0], -1)
+                    for name, unit in unitsol.items()
+                }
+            )
         for j, (drma, drmv, drmd, drmf) in enumerate(drmlist):
             frf = 0.0
             if drma is not None:
@@ -1077,8 +1158,22 @@ def solvepsd(fs, forcepsd, t_frc, freq, drmlist, rbduf=1.0, elduf=1.0, **kwargs)
             if drmd is not None:
                 frf += drmd @ sol.d
             if drmf is not None:
-                frf += drmf[:, i : i + 1] @ unitforce
-            psd[j] += forcepsd[i] * abs(frf) ** 2
+                frf += np.tile(drmf[:, i : i + nc], cpsd)
+            # 3d FRF: ndrm x freq x nc
+            frf = frf.reshape(frf.shape[0], cpsd, nc)
+            if csd:
+                if frfs[j] is None:
+                    frfs[j] = np.empty((cpsd, frf.shape[0], rpsd), frf.dtype)
+                frfs[j][:, :, i : i + nc] = frf.transpose(1, 0, 2)
+            else:
+                psd[j] += np.einsum("fi,rfi->rf", forcepsd[i : i + nc].T, abs(frf) ** 2)
+
+    if csd:
+        for j, frf in enumerate(frfs):
+            # diag(H @ forcepsd @ H^H) at each frequency; frf is
+            # freq x ndrm x nforces:
+            hs = frf @ forcepsd.transpose(2, 0, 1)
+            psd[j] = np.einsum("frj,frj->rf", hs, frf.conj()).real
 
     # compute area under curve:
     freqstep = np.diff(freq)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-import scipy.linalg as la
+import multiprocessing as mp
+from multiprocessing.pool import ThreadPool
 import numpy as np
 from ._base_ode_class import _BaseODE
 
@@ -11,6 +12,11 @@ except TypeError:
     pass
 
 
+# approximate memory limit in bytes for each block of frequencies
+# solved together in the coupled case (see :func:`FreqDirect.fsolve`)
+_BATCH_MEMORY = 2 ** 27
+
+
 class FreqDirect(_BaseODE):
     """
     2nd order ODE frequency domain solver
@@ -160,7 +166,17 @@ class FreqDirect(_BaseODE):
         self._common_precalcs(m, b, k, h=None, rb=rb, rf=rf)
         self._mk_slices()  # dorbel=False)
 
-    def fsolve(self, force, freq, incrb=2, rf_disp_only=False):
+    def fsolve(
+        self,
+        force,
+        freq,
+        incrb=2,
+        rf_disp_only=False,
+        chunk=None,
+        max_memory=None,
+        sink=None,
+        ncpu=1,
+    ):
         """
         Solve equations of motion in frequency domain.
 
@@ -191,6 +207,44 @@ class FreqDirect(_BaseODE):
                 velocity = i * omega * displacement
                 acceleration = -omega ** 2 * displacement
 
+        chunk : integer or None; optional
+            If an integer, the solution is computed in blocks of
+            `chunk` frequencies. This limits the memory needed for
+            the intermediate arrays. See also `max_memory` and
+            `sink`.
+        max_memory : scalar or None; optional
+            Approximate limit in bytes for the memory used to solve
+            each block of frequencies; used to set `chunk` if `chunk`
+            is None. The block size is computed assuming 16 bytes
+            (one complex number) times 12 times the number of DOF
+            for each frequency. The full `d`, `v` and `a` outputs (if
+            `sink` is None) are in addition to this.
+        sink : callable or None; optional
+            If None, the blocks are assembled into full size `d`, `v`
+            and `a` arrays (as if `chunk` were not used). Otherwise,
+            the solution for each block is passed to `sink` as it is
+            computed and then discarded::
+
+                sink(sol, pv)
+
+            where `sol` is the SimpleNamespace solution for the block
+            (as described under "Returns" below) and `pv` is the
+            slice object for the block in `freq`. This routine then
+            returns a list of the return values from `sink`. A
+            typical `sink` is a data recovery function that only
+            keeps the recovered rows::
+
+                def sink(sol, pv):
+                    return atm @ sol.a
+
+        ncpu : integer or None; optional
+            Number of threads used to solve coupled equations. The
+            frequencies are solved in blocks with one stacked call to
+            :func:`numpy.linalg.solve` per block; with ``ncpu > 1``,
+            the blocks are solved concurrently in a thread pool. If
+            None, it is set to :func:`multiprocessing.cpu_count`.
+            Ignored for uncoupled equations.
+
         Returns
         -------
         A SimpleNamespace with the members:
@@ -204,11 +258,25 @@ class FreqDirect(_BaseODE):
         f : 1d ndarray
             Frequency vector (same as the input `freq`)
 
+        If `sink` is not None, the list of return values from the
+        `sink` calls, one for each block of frequencies, is returned
+        instead.
+
         Notes
         -----
         See :class:`FreqDirect` for more discussion on how rigid-body
         response is handled.
+
+        For coupled equations, the complex impedance matrices for a
+        block of frequencies are formed as one (nfreq, n, n) array and
+        solved together. The block size is set so that each block uses
+        roughly 128 MB; it is reduced further if needed so that each
+        of the `ncpu` threads has at least one block to solve.
         """
+        if chunk is not None or max_memory is not None or sink is not None:
+            return self._fsolve_chunked(
+                force, freq, incrb, rf_disp_only, chunk, max_memory, sink, ncpu=ncpu
+            )
         force = np.atleast_2d(force)
         freq = np.atleast_1d(freq)
         d, v, a, force = self._init_dva(
@@ -237,13 +305,11 @@ class FreqDirect(_BaseODE):
                 H = (1j * b)[:, None] @ Omega + k[:, None] - m[:, None] @ Omega ** 2
             d[kdof] = force / H
         else:
-            # equations are coupled, use a loop:
+            # equations are coupled, solve in blocks of frequencies:
             Omega = 2 * np.pi * freq
             if m is None:
                 m = np.eye(self.ksize)
-            for i, O in enumerate(Omega):
-                Hi = 1j * b * O + k - m * O ** 2
-                d[kdof, i] = la.solve(Hi, force[:, i])
+            d[kdof] = self._solve_coupled(m, b, k, force, Omega, ncpu)
         a[kdof] = -(Omega ** 2) * d[kdof]
         v[kdof] = 1j * Omega * d[kdof]
 
@@ -253,3 +319,37 @@ class FreqDirect(_BaseODE):
                 a[self.rb] = 0
                 v[self.rb] = 0
         return self._solution_freq(d, v, a, freq)
+
+    def _solve_coupled(self, m, b, k, force, Omega, ncpu):
+        """
+        Solve the coupled equations at all frequencies in `Omega`
+
+        Each block of frequencies is solved with one stacked call to
+        :func:`numpy.linalg.solve`; blocks are spread over `ncpu`
+        threads. Returns the ksize x len(Omega) displacement.
+        """
+        n = self.ksize
+        nf = len(Omega)
+        d = np.empty((n, nf), complex)
+        if nf == 0:
+            return d
+        if ncpu is None:
+            ncpu = mp.cpu_count()
+        ncpu = max(1, min(ncpu, nf))
+        # impedance matrices plus the copy made by LAPACK:
+        nb = int(_BATCH_MEMORY // (ncpu * 32 * n * n))
+        nb = max(1, min(nb, -(-nf // ncpu)))
+        blocks = [slice(j, min(j + nb, nf)) for j in range(0, nf, nb)]
+
+        def _solve(pv):
+            omega = Omega[pv, None, None]
+            H = 1j * omega * b + k - omega ** 2 * m
+            d[:, pv] = np.linalg.solve(H, force[:, pv].T[..., None])[..., 0].T
+
+        if ncpu == 1 or len(blocks) == 1:
+            for pv in blocks:
+                _solve(pv)
+        else:
+            with ThreadPool(ncpu) as pool:
+                pool.map(_solve, blocks)
+        return d
@@ -217,7 +217,18 @@ class SolveCDF(SolveUnc):
         >>> fig.tight_layout()
     """
 
-    def __init__(self, m, b, k, h=None, rb=None, rf=None, order=1, pre_eig=False):
+    def __init__(
+        self,
+        m,
+        b,
+        k,
+        h=None,
+        rb=None,
+        rf=None,
+        order=1,
+        pre_eig=False,
+        engine="python",
+    ):
         """
         Instantiates a :class:`SolveCDF` solver.
 
@@ -225,7 +236,9 @@ class SolveCDF(SolveUnc):
         `cd_as_force` option set to True; see that function for more
         information.
         """
-        super().__init__(m, b, k, h, rb, rf, order, pre_eig, cd_as_force=True)
+        super().__init__(
+            m, b, k, h, rb, rf, order, pre_eig, cd_as_force=True, engine=engine
+        )
 
     def generator(self, nt, F0, d0=None, v0=None, static_ic=False):
         """
@@ -240,7 +253,16 @@ class SolveCDF(SolveUnc):
         """
         return super().generator(nt, F0, d0, v0, static_ic)
 
-    def fsolve(self, force, freq, incrb=2, rf_disp_only=False):
+    def fsolve(
+        self,
+        force,
+        freq,
+        incrb=2,
+        rf_disp_only=False,
+        chunk=None,
+        max_memory=None,
+        sink=None,
+    ):
         """
         Solve frequency-domain modal equations of motion using
         uncoupled equations.
@@ -258,4 +280,4 @@ class SolveCDF(SolveUnc):
             :class:`SolveUnc`), :func:`SolveUnc.fsolve` will raise
             a ``NotImplementedError`` exception.
         """
-        return super().fsolve(force, freq, incrb, rf_disp_only)
+        return super().fsolve(force, freq, incrb, rf_disp_only, chunk, max_memory, sink)
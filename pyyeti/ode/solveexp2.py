@@ -348,9 +348,65 @@ class SolveExp2(_BaseODE):
         """
         force = np.atleast_2d(force)
         d, v, a, force = self._init_dva(force, d0, v0, static_ic)
+        self._solve(d, v, a, force)
+        return self._solution(d, v, a)
+
+    def tsolve_batch(self, force, d0=None, v0=None, static_ic=False):
+        """
+        Solve time-domain 2nd order ODE equations for a batch of
+        force cases
+
+        Parameters
+        ----------
+        force : 3d ndarray
+            The force cases; ncases x ndof x time
+        d0 : 1d or 2d ndarray; optional
+            Displacement initial conditions; either a vector (used for
+            all cases) or an ncases x ndof matrix. If None, zero ic's
+            are used unless `static_ic` is True.
+        v0 : 1d or 2d ndarray; optional
+            Velocity initial conditions; see `d0`. If None, zero ic's
+            are used.
+        static_ic : bool; optional
+            If True and `d0` is None, then `d0` is calculated for each
+            case such that static (steady-state) initial conditions
+            are used; see :func:`SolveExp2.tsolve`.
+
+        Returns
+        -------
+        A record (SimpleNamespace class) with the members:
+
+        d : 3d ndarray
+            Displacement; ncases x ndof x time
+        v : 3d ndarray
+            Velocity; ncases x ndof x time
+        a : 3d ndarray
+            Acceleration; ncases x ndof x time
+        h : scalar
+            Time-step
+        t : 1d ndarray
+            Time vector: np.arange(d.shape[2])*h
+
+        Notes
+        -----
+        The results are the same as calling :func:`SolveExp2.tsolve`
+        for each case, but all cases are advanced together so each
+        time step uses matrix-matrix products with the transition
+        matrices instead of one matrix-vector product per case.
+        """
+        force, nc = self._batch_force(force)
+        d, v, a, force = self._init_dva(force, None, None, False)
+        self._init_dv_batch(d, v, d0, v0, force, static_ic, nc)
+        self._solve(d, v, a, force, nc)
+        return self._solution_batch(d, v, a, nc)
+
+    def _solve(self, d, v, a, force, nc=1):
+        """Solve the equations for :func:`SolveExp2.tsolve` and
+        :func:`SolveExp2.tsolve_batch`; the equations are advanced in
+        slabs of `nc` columns, one column per force case"""
         ksize = self.ksize
         if ksize > 0:
-            nt = force.shape[1]
+            nt = force.shape[1] // nc
             if nt > 1:
                 kdof = self.kdof
                 D = d[kdof]
@@ -363,23 +419,23 @@ class SolveExp2(_BaseODE):
                 else:
                     imf = force[kdof]
                 if self.order == 1:
-                    PQF = self.P @ imf[:, :-1] + self.Q @ imf[:, 1:]
+                    PQF = self.P @ imf[:, :-nc] + self.Q @ imf[:, nc:]
                 else:
-                    PQF = self.P @ imf[:, :-1]
+                    PQF = self.P @ imf[:, :-nc]
                 E_dd = self.E_dd
                 E_dv = self.E_dv
                 E_vd = self.E_vd
                 E_vv = self.E_vv
-                for i in range(nt - 1):
-                    d0 = D[:, i]
-                    v0 = V[:, i]
-                    D[:, i + 1] = E_dd @ d0 + E_dv @ v0 + PQF[ksize:, i]
-                    V[:, i + 1] = E_vd @ d0 + E_vv @ v0 + PQF[:ksize, i]
+                for i in range(0, (nt - 1) * nc, nc):
+                    j = i + nc
+                    d0 = D[:, i:j]
+                    v0 = V[:, i:j]
+                    D[:, j : j + nc] = E_dd @ d0 + E_dv @ v0 + PQF[ksize:, i:j]
+                    V[:, j : j + nc] = E_vd @ d0 + E_vv @ v0 + PQF[:ksize, i:j]
                 if not self.slices:
                     d[kdof] = D
                     v[kdof] = V
             self._calc_acce_kdof(d, v, a, force)
-        return self._solution(d, v, a)
 
     def generator(self, nt, F0, d0=None, v0=None, static_ic=False):
         """
@@ -282,86 +282,11 @@ class SolveNewmark(_BaseODE):
             D = d[self.kdof]
             V = v[self.kdof]
             A = a[self.kdof]
-            nt = D.shape[1]
-            h = self.h
-            h2 = 2 * h
-            sqh = h * h
-            A1 = self.A1
-            A0 = self.A0
-            # For the last velocity and acceleration, extrapolate
-            # force to run 1 more step (so we can calculate the final
-            # v and a): Fe = 2*F[:, -1] - F[:, -2] ... when added to
-            # other 2 force terms (F[:, -1] + F[:, -2]), we get 3 *
-            # F[:, -1].
             if self.nonlin_terms == 0:
-                if self.unc:
-                    for j in range(2, nt):
-                        D[:, j] = (
-                            F[:, j]
-                            + F[:, j - 1]
-                            + F[:, j - 2]
-                            + A1 * D[:, j - 1]
-                            + A0 * D[:, j - 2]
-                        )
-                    De = 3 * F[:, -1] + A1 * D[:, -1] + A0 * D[:, -2]
-                else:
-                    for j in range(2, nt):
-                        D[:, j] = (
-                            F[:, j]
-                            + F[:, j - 1]
-                            + F[:, j - 2]
-                            + A1 @ D[:, j - 1]
-                            + A0 @ D[:, j - 2]
-                        )
-                    De = 3 * F[:, -1] + A1 @ D[:, -1] + A0 @ D[:, -2]
+                De = self._solve_linear(D, F)
             else:
-
-                def _get_nonlin(j):
-                    N = 0.0
-                    for key, (func, T, args) in self.nl_dct.items():
-                        z = func(D, j, h, **args)
-                        self.z[key][:, j] = z
-                        N += T @ z
-                    return N
-
-                if self.unc:
-                    for j in range(2, nt):
-                        D[:, j] = (
-                            F[:, j]
-                            + F[:, j - 1]
-                            + F[:, j - 2]
-                            + _get_nonlin(j - 1)
-                            + A1 * D[:, j - 1]
-                            + A0 * D[:, j - 2]
-                        )
-                    De = (
-                        3 * F[:, -1]
-                        + _get_nonlin(nt - 1)
-                        + A1 * D[:, -1]
-                        + A0 * D[:, -2]
-                    )
-                else:
-                    for j in range(2, nt):
-                        D[:, j] = (
-                            F[:, j]
-                            + F[:, j - 1]
-                            + F[:, j - 2]
-                            + _get_nonlin(j - 1)
-                            + A1 @ D[:, j - 1]
-                            + A0 @ D[:, j - 2]
-                        )
-                    De = (
-                        3 * F[:, -1]
-                        + _get_nonlin(nt - 1)
-                        + A1 @ D[:, -1]
-                        + A0 @ D[:, -2]
-                    )
-
-            # calculate velocity and acceleration
-            V[:, 1:-1] = (D[:, 2:] - D[:, :-2]) / h2
-            V[:, -1] = (De - D[:, -2]) / h2
-            A[:, 1:-1] = (D[:, 2:] - 2 * D[:, 1:-1] + D[:, :-2]) / sqh
-            A[:, -1] = (De - 2 * D[:, -1] + D[:, -2]) / sqh
+                De = self._solve_nonlin(D, F)
+            self._calc_velo_acce(D, V, A, De)
 
             if not self.slices:
                 d[self.kdof] = D
@@ -373,6 +298,163 @@ class SolveNewmark(_BaseODE):
             sol.z = self.z
         return sol
 
+    def tsolve_batch(self, force, d0=None, v0=None):
+        """
+        Solve time-domain 2nd order ODE equations for a batch of
+        force cases
+
+        Parameters
+        ----------
+        force : 3d ndarray
+            The force cases; ncases x ndof x time
+        d0 : 1d or 2d ndarray; optional
+            Displacement initial conditions; either a vector (used for
+            all cases) or an ncases x ndof matrix. If None, zero ic's
+            are used.
+        v0 : 1d or 2d ndarray; optional
+            Velocity initial conditions; see `d0`.
+
+        Returns
+        -------
+        A record (SimpleNamespace class) with the members:
+
+        d : 3d ndarray
+            Displacement; ncases x ndof x time
+        v : 3d ndarray
+            Velocity; ncases x ndof x time
+        a : 3d ndarray
+            Acceleration; ncases x ndof x time
+        h : scalar
+            Time-step
+        t : 1d ndarray
+            Time vector: np.arange(d.shape[2])*h
+
+        Raises
+        ------
+        NotImplementedError
+            If nonlinear force terms have been defined (see
+            :func:`def_nonlin`); the nonlinear force functions work
+            on one case at a time.
+
+        Notes
+        -----
+        The results are the same as calling
+        :func:`SolveNewmark.tsolve` for each case, but all cases are
+        advanced together so each time step uses matrix-matrix
+        products instead of one matrix-vector product per case.
+        """
+        if self.nonlin_terms:
+            raise NotImplementedError(
+                "`tsolve_batch` is not implemented for nonlinear force terms"
+            )
+        force, nc = self._batch_force(force)
+        d0 = self._batch_ic(d0, nc, "d0")
+        v0 = self._batch_ic(v0, nc, "v0")
+        d, v, a, F = self._init_dva(force, d0, v0, nc)
+        if self.ksize:
+            D = d[self.kdof]
+            V = v[self.kdof]
+            A = a[self.kdof]
+            De = self._solve_linear(D, F, nc)
+            self._calc_velo_acce(D, V, A, De, nc)
+
+            if not self.slices:
+                d[self.kdof] = D
+                v[self.kdof] = V
+                a[self.kdof] = A
+        return self._solution_batch(d, v, a, nc)
+
+    def _solve_linear(self, D, F, nc=1):
+        """Solve the linear equations in slabs of `nc` columns (one
+        column per force case); returns the extrapolated final
+        displacement slab"""
+        nt = D.shape[1] // nc
+        A1 = self.A1
+        A0 = self.A0
+        # For the last velocity and acceleration, extrapolate
+        # force to run 1 more step (so we can calculate the final
+        # v and a): Fe = 2*F[:, -1] - F[:, -2] ... when added to
+        # other 2 force terms (F[:, -1] + F[:, -2]), we get 3 *
+        # F[:, -1].
+        if self.unc:
+            A1 = A1[:, None]
+            A0 = A0[:, None]
+            for j in range(2 * nc, nt * nc, nc):
+                i = j - nc
+                k = i - nc
+                D[:, j : j + nc] = (
+                    F[:, j : j + nc]
+                    + F[:, i:j]
+                    + F[:, k:i]
+                    + A1 * D[:, i:j]
+                    + A0 * D[:, k:i]
+                )
+            De = 3 * F[:, -nc:] + A1 * D[:, -nc:] + A0 * D[:, -2 * nc : -nc]
+        else:
+            for j in range(2 * nc, nt * nc, nc):
+                i = j - nc
+                k = i - nc
+                D[:, j : j + nc] = (
+                    F[:, j : j + nc]
+                    + F[:, i:j]
+                    + F[:, k:i]
+                    + A1 @ D[:, i:j]
+                    + A0 @ D[:, k:i]
+                )
+            De = 3 * F[:, -nc:] + A1 @ D[:, -nc:] + A0 @ D[:, -2 * nc : -nc]
+        return De
+
+    def _solve_nonlin(self, D, F):
+        """Solve the equations with nonlinear force terms; returns
+        the extrapolated final displacement"""
+        nt = D.shape[1]
+        h = self.h
+        A1 = self.A1
+        A0 = self.A0
+
+        def _get_nonlin(j):
+            N = 0.0
+            for key, (func, T, args) in self.nl_dct.items():
+                z = func(D, j, h, **args)
+                self.z[key][:, j] = z
+                N += T @ z
+            return N
+
+        if self.unc:
+            for j in range(2, nt):
+                D[:, j] = (
+                    F[:, j]
+                    + F[:, j - 1]
+                    + F[:, j - 2]
+                    + _get_nonlin(j - 1)
+                    + A1 * D[:, j - 1]
+                    + A0 * D[:, j - 2]
+                )
+            De = 3 * F[:, -1] + _get_nonlin(nt - 1) + A1 * D[:, -1] + A0 * D[:, -2]
+        else:
+            for j in range(2, nt):
+                D[:, j] = (
+                    F[:, j]
+                    + F[:, j - 1]
+                    + F[:, j - 2]
+                    + _get_nonlin(j - 1)
+                    + A1 @ D[:, j - 1]
+                    + A0 @ D[:, j - 2]
+                )
+            De = 3 * F[:, -1] + _get_nonlin(nt - 1) + A1 @ D[:, -1] + A0 @ D[:, -2]
+        return De[:, None]
+
+    def _calc_velo_acce(self, D, V, A, De, nc=1):
+        """Calculate velocity and acceleration from the displacement
+        by central differences; `De` is the extrapolated final
+        displacement slab"""
+        h2 = 2 * self.h
+        sqh = self.h * self.h
+        V[:, nc:-nc] = (D[:, 2 * nc :] - D[:, : -2 * nc]) / h2
+        V[:, -nc:] = (De - D[:, -2 * nc : -nc]) / h2
+        A[:, nc:-nc] = (D[:, 2 * nc :] - 2 * D[:, nc:-nc] + D[:, : -2 * nc]) / sqh
+        A[:, -nc:] = (De - 2 * D[:, -nc:] + D[:, -2 * nc : -nc]) / sqh
+
     def def_nonlin(self, dct):
         r"""
         Define nonlinear force terms
@@ -648,16 +730,26 @@ class SolveNewmark(_BaseODE):
             self.A0 = la.lu_solve(self.Ad, A0, overwrite_b=True)
             self.A1 = la.lu_solve(self.Ad, A1, overwrite_b=True)
 
-    def _init_dva(self, force, d0, v0):
+    def _init_dva(self, force, d0, v0, nc=1):
         """
         Newmark Beta version of _init_dva
+
+        If `nc` > 1, `force` holds `nc` interleaved force cases (see
+        :func:`_BaseODE._batch_force`) and `d0` and `v0` are None or
+        ncases x ndof arrays.
         """
         if force.shape[0] != self.n:
             raise ValueError(
                 f"Force matrix has {force.shape[0]} rows; {self.n} rows are expected"
             )
 
-        d0, v0 = self._set_initial_cond(d0, v0)
+        if nc == 1:
+            d0, v0 = self._set_initial_cond(d0, v0)
+            d0 = None if d0 is None else d0[:, None]
+            v0 = None if v0 is None else v0[:, None]
+        else:
+            d0 = None if d0 is None else d0.T
+            v0 = None if v0 is None else v0.T
         nt = force.shape[1]
         d, v, a = self._alloc_dva(nt, True)
 
@@ -672,9 +764,11 @@ class SolveNewmark(_BaseODE):
         if self.ksize == 0:
             return d, v, a, force
 
-        self._init_dv(d, v, d0, v0, F0=None, static_ic=False)
-        d0 = np.zeros(self.ksize) if d0 is None else d0[self.nonrf]
-        v0 = np.zeros(self.ksize) if v0 is None else v0[self.nonrf]
+        # work with slabs of nc columns; one column per case:
+        d0 = np.zeros((self.ksize, nc)) if d0 is None else d0[self.nonrf]
+        v0 = np.zeros((self.ksize, nc)) if v0 is None else v0[self.nonrf]
+        d[self.nonrf, :nc] = d0
+        v[self.nonrf, :nc] = v0
 
         # to get the algorithm going and stable (see Nastran
         # theoretical manual, section 11.4):
@@ -682,10 +776,10 @@ class SolveNewmark(_BaseODE):
         h = self.h
         u_1 = d0 - v0 * h
 
-        # compute nonlinear force terms:
+        # compute nonlinear force terms (only for nc == 1):
         N = 0.0
         if self.nonlin_terms:
-            d[self.nonrf, -1] = u_1
+            d[self.nonrf, -1] = u_1[:, 0]
             self.z = {}
             for key, (func, T, args) in self.nl_dct.items():
                 z0 = func(d, 0, h, **args)
@@ -693,22 +787,31 @@ class SolveNewmark(_BaseODE):
                 z[:, 0] = z0
                 self.z[key] = z
                 N += T @ z0
+            N = np.reshape(N, (-1, 1))
 
         if self.unc:
-            force[:, 0] = (self.k * d0 + self.b * v0) / 3.0
+            k = self.k[:, None]
+            b = self.b[:, None]
+            Ad = self.Ad[:, None]
+            force[:, :nc] = (k * d0 + b * v0) / 3.0
             # method 2 from theory manual:
             # force[:, 0] = (3 * force[:, 0] + self.k * d0 +
             #                self.b * v0) / 6.0
-            force /= self.Ad[:, None]
-            F_1 = (self.k * u_1 + self.b * v0) / (3 * self.Ad)
+            force /= Ad
+            F_1 = (k * u_1 + b * v0) / (3 * Ad)
 
             # because of the - 1 subscript, do first step outside of
             # the loop:
-            d[self.nonrf, 1] = (
-                force[:, 1] + force[:, 0] + F_1 + N + self.A1 * d0 + self.A0 * u_1
+            d[self.nonrf, nc : 2 * nc] = (
+                force[:, nc : 2 * nc]
+                + force[:, :nc]
+                + F_1
+                + N
+                + self.A1[:, None] * d0
+                + self.A0[:, None] * u_1
             )
         else:
-            force[:, 0] = (self.k @ d0 + self.b @ v0) / 3.0
+            force[:, :nc] = (self.k @ d0 + self.b @ v0) / 3.0
             # force[:, 0] = (3 * force[:, 0] + self.k @ d0 +
             #                self.b @ v0) / 6.0
             force = la.lu_solve(self.Ad, force, overwrite_b=True)
@@ -718,9 +821,14 @@ class SolveNewmark(_BaseODE):
 
             # because of the - 1 subscript, do first step outside of
             # the loop:
-            d[self.nonrf, 1] = (
-                force[:, 1] + force[:, 0] + F_1 + N + self.A1 @ d0 + self.A0 @ u_1
+            d[self.nonrf, nc : 2 * nc] = (
+                force[:, nc : 2 * nc]
+                + force[:, :nc]
+                + F_1
+                + N
+                + self.A1 @ d0
+                + self.A0 @ u_1
             )
 
-        a[self.nonrf, 0] = (d[self.nonrf, 1] - 2 * d0 + u_1) / (h * h)
+        a[self.nonrf, :nc] = (d[self.nonrf, nc : 2 * nc] - 2 * d0 + u_1) / (h * h)
         return d, v, a, force
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from types import SimpleNamespace
+from warnings import warn
 import scipy.linalg as la
 import numpy as np
 from ._base_ode_class import _BaseODE
@@ -13,6 +14,120 @@ except TypeError:
     pass
 
 
+def _real_unc_kernel(D, V, force, F, G, A, B, Fp, Gp, Ap, Bp, order, nc):
+    """
+    Compiled (if Numba is available) version of the time-stepping loop
+    of :func:`SolveUnc._solve_real_unc`
+
+    `D`, `V` and `force` are ``nmodes x (nt*nc)`` and are for the
+    non-rf/elastic modes only; `nc` is the number of cases stored in
+    interleaved columns (see :func:`SolveUnc.tsolve_batch`). `D` and
+    `V` are updated in place. The operations are done in the same
+    order as in the plain Python version so the results are
+    identical.
+    """
+    n, ntc = D.shape
+    for j in range(n):
+        f = F[j]
+        g = G[j]
+        fp = Fp[j]
+        gp = Gp[j]
+        if order == 1:
+            a = A[j]
+            b = B[j]
+            ap = Ap[j]
+            bp = Bp[j]
+        else:
+            a = A[j] + B[j]
+            ap = Ap[j] + Bp[j]
+        for c in range(nc):
+            di = D[j, c]
+            vi = V[j, c]
+            for i in range(c, ntc - nc, nc):
+                if order == 1:
+                    abf = a * force[j, i] + b * force[j, i + nc]
+                    abfp = ap * force[j, i] + bp * force[j, i + nc]
+                else:
+                    abf = a * force[j, i]
+                    abfp = ap * force[j, i]
+                din = f * di + g * vi + abf
+                vi = fp * di + gp * vi + abfp
+                di = din
+                D[j, i + nc] = di
+                V[j, i + nc] = vi
+
+
+def _real_unc_cdforces_kernel(
+    D, V, force, F, G, A, B, Fp, Gp, Ap, Bp, alpha, bo, order, nc
+):
+    """
+    Compiled (if Numba is available) version of the time-stepping loop
+    of :func:`SolveUnc._solve_real_unc_cdforces`
+
+    Same as :func:`_real_unc_kernel` except the off-diagonal damping
+    is treated as a force. `alpha` and `bo` must be C-contiguous.
+    """
+    n, ntc = D.shape
+    v_part = np.empty((n, nc))
+    dmpfrc0 = np.dot(bo, np.ascontiguousarray(V[:, :nc]))
+    for i in range(0, ntc - nc, nc):
+        for j in range(n):
+            for c in range(nc):
+                k0 = i + c
+                k1 = k0 + nc
+                if order == 1:
+                    abfp = Ap[j] * force[j, k0] + Bp[j] * force[j, k1]
+                else:
+                    abfp = (Ap[j] + Bp[j]) * force[j, k0]
+                v_part[j, c] = (
+                    Fp[j] * D[j, k0] + Gp[j] * V[j, k0] + abfp - Ap[j] * dmpfrc0[j, c]
+                )
+        dmpfrc1 = np.dot(alpha, v_part)
+        for j in range(n):
+            for c in range(nc):
+                k0 = i + c
+                k1 = k0 + nc
+                if order == 1:
+                    abf = A[j] * force[j, k0] + B[j] * force[j, k1]
+                else:
+                    abf = (A[j] + B[j]) * force[j, k0]
+                D[j, k1] = (
+                    F[j] * D[j, k0]
+                    + G[j] * V[j, k0]
+                    + abf
+                    - A[j] * dmpfrc0[j, c]
+                    - B[j] * dmpfrc1[j, c]
+                )
+                V[j, k1] = v_part[j, c] - Bp[j] * dmpfrc1[j, c]
+        dmpfrc0 = dmpfrc1
+
+
+try:
+    import numba
+except ImportError:
+    _HAVE_NUMBA = False
+else:
+    _HAVE_NUMBA = True
+    _real_unc_kernel = numba.jit(nopython=True)(_real_unc_kernel)
+    _real_unc_cdforces_kernel = numba.jit(nopython=True)(_real_unc_cdforces_kernel)
+
+
+def _process_engine(engine):
+    """Utility routine for :class:`SolveUnc`; checks `engine`"""
+    if engine not in ("python", "numba"):
+        raise ValueError(
+            f"invalid `engine` ({engine!r}); must be either 'python' or 'numba'"
+        )
+    if engine == "numba" and not _HAVE_NUMBA:
+        warn(
+            "Numba is not available; the 'numba' engine is not available. "
+            "Using the 'python' engine.",
+            RuntimeWarning,
+        )
+        engine = "python"
+    return engine
+
+
 class SolveUnc(_BaseODE):
     r"""
     2nd order ODE time and frequency domain solvers for "uncoupled"
@@ -201,6 +316,7 @@ class SolveUnc(_BaseODE):
         order=1,
         pre_eig=False,
         cd_as_force=False,
+        engine="python",
     ):
         """
         Instantiates a :class:`SolveUnc` solver.
@@ -287,6 +403,28 @@ class SolveUnc(_BaseODE):
             at the highest frequency (``ppc = 1 / (h * freq_high)``).
             However, accuracy is problem dependent and needs to be
             verified before trusting the results.
+        engine : string; optional
+            Selects how the time-stepping loop for real, uncoupled
+            equations is run in :func:`SolveUnc.tsolve`:
+
+            ==========  ==============================================
+            `engine`    Description
+            ==========  ==============================================
+            'python'    Python loop over time steps with vectorized
+                        operations over the modes (the default)
+            'numba'     The entire recurrence is run in compiled code
+                        (requires Numba); this is much faster for
+                        long time histories since the Python
+                        interpreter overhead of each time step is
+                        avoided
+            ==========  ==============================================
+
+            The results are identical to the 'python' engine (to
+            round-off if `cd_as_force` is True). If Numba is not
+            available, a warning is issued and 'python' is used. This
+            option does not affect the generator, coupled systems
+            (which use the complex eigensolution), or frequency domain
+            solutions.
 
         Notes
         -----
@@ -340,6 +478,7 @@ class SolveUnc(_BaseODE):
         bo         Off-diagonal damping terms (present when `cdforces`
                    is True
         systype    float or complex; determined by `m` `b` `k`
+        engine     'python' or 'numba'; see `engine` above
         =========  ===================================================
 
         Unlike for :class:`SolveExp2`, `order` is not used until the
@@ -367,6 +506,7 @@ class SolveUnc(_BaseODE):
             self.pc = None
         self._mk_slices()  # dorbel=True)
         self.order = order
+        self.engine = _process_engine(engine)
 
     def tsolve(self, force, d0=None, v0=None, static_ic=False):
         """Solve time-domain 2nd order ODE equations
@@ -410,19 +550,81 @@ class SolveUnc(_BaseODE):
         """
         force = np.atleast_2d(force)
         d, v, a, force = self._init_dva(force, d0, v0, static_ic)
-        if self.nonrfsz:
-            if self.unc and self.systype is float:
-                # for uncoupled, m, b, k have rb+el (all nonrf)
-                if self.cdforces:
-                    self._solve_real_unc_cdforces(d, v, force)
-                else:
-                    self._solve_real_unc(d, v, force)
-            else:
-                # for coupled, m, b, k have el only
-                self._solve_complex_unc(d, v, a, force)
+        self._solve_nonrf(d, v, a, force)
         self._calc_acce_kdof(d, v, a, force)
         return self._solution(d, v, a)
 
+    def tsolve_batch(self, force, d0=None, v0=None, static_ic=False):
+        """
+        Solve time-domain 2nd order ODE equations for a batch of
+        force cases
+
+        Parameters
+        ----------
+        force : 3d ndarray
+            The force cases; ncases x ndof x time
+        d0 : 1d or 2d ndarray; optional
+            Displacement initial conditions; either a vector (used for
+            all cases) or an ncases x ndof matrix. If None, zero ic's
+            are used unless `static_ic` is True.
+        v0 : 1d or 2d ndarray; optional
+            Velocity initial conditions; see `d0`. If None, zero ic's
+            are used.
+        static_ic : bool; optional
+            If True and `d0` is None, then `d0` is calculated for each
+            case such that static (steady-state) initial conditions
+            are used; see :func:`SolveUnc.tsolve`.
+
+        Returns
+        -------
+        A record (SimpleNamespace class) with the members:
+
+        d : 3d ndarray
+            Displacement; ncases x ndof x time
+        v : 3d ndarray
+            Velocity; ncases x ndof x time
+        a : 3d ndarray
+            Acceleration; ncases x ndof x time
+        h : scalar
+            Time-step
+        t : 1d ndarray
+            Time vector: np.arange(d.shape[2])*h
+
+        Notes
+        -----
+        The results are the same as calling :func:`SolveUnc.tsolve`
+        for each case, but all cases are advanced together, one time
+        step at a time, sharing the integration coefficients. This
+        way the Python overhead of each time step is paid only once
+        for all cases and, for coupled systems, the matrix-vector
+        products of each step become matrix-matrix products. See
+        :func:`pyyeti.ode._base_ode_class._BaseODE._batch_force` for
+        how the cases are stored internally.
+
+        Examples
+        --------
+        >>> from pyyeti import ode
+        >>> import numpy as np
+        >>> m = np.array([10., 30., 30., 30.])    # diag mass
+        >>> k = np.array([0., 6.e5, 6.e5, 6.e5])  # diag stiffness
+        >>> zeta = np.array([0., .05, 1., 2.])    # % damping
+        >>> b = 2.*zeta*np.sqrt(k/m)*m            # diag damping
+        >>> ts = ode.SolveUnc(m, b, k, h=0.001)
+        >>> force = np.random.randn(3, 4, 100)    # 3 cases
+        >>> sol = ts.tsolve_batch(force)
+        >>> sol.d.shape
+        (3, 4, 100)
+        >>> sol1 = ts.tsolve(force[1])
+        >>> np.allclose(sol1.a, sol.a[1])
+        True
+        """
+        force, nc = self._batch_force(force)
+        d, v, a, force = self._init_dva(force, None, None, False)
+        self._init_dv_batch(d, v, d0, v0, force, static_ic, nc)
+        self._solve_nonrf(d, v, a, force, nc)
+        self._calc_acce_kdof(d, v, a, force)
+        return self._solution_batch(d, v, a, nc)
+
     def generator(self, nt, F0, d0=None, v0=None, static_ic=False):
         """
         Python "generator" version of :func:`SolveUnc.tsolve`;
@@ -689,7 +891,16 @@ class SolveUnc(_BaseODE):
                 flex = self._get_f2x_complex_unc(phi, velo)
         return self._flex(flex, phi)
 
-    def fsolve(self, force, freq, incrb=2, rf_disp_only=False):
+    def fsolve(
+        self,
+        force,
+        freq,
+        incrb=2,
+        rf_disp_only=False,
+        chunk=None,
+        max_memory=None,
+        sink=None,
+    ):
         """
         Solve frequency-domain modal equations of motion using
         uncoupled equations.
@@ -721,6 +932,36 @@ class SolveUnc(_BaseODE):
                 velocity = i * omega * displacement
                 acceleration = -omega ** 2 * displacement
 
+        chunk : integer or None; optional
+            If an integer, the solution is computed in blocks of
+            `chunk` frequencies. This limits the memory needed for
+            the intermediate arrays. See also `max_memory` and
+            `sink`.
+        max_memory : scalar or None; optional
+            Approximate limit in bytes for the memory used to solve
+            each block of frequencies; used to set `chunk` if `chunk`
+            is None. The block size is computed assuming 16 bytes
+            (one complex number) times 12 times the number of DOF
+            for each frequency. The full `d`, `v` and `a` outputs (if
+            `sink` is None) are in addition to this.
+        sink : callable or None; optional
+            If None, the blocks are assembled into full size `d`, `v`
+            and `a` arrays (as if `chunk` were not used). Otherwise,
+            the solution for each block is passed to `sink` as it is
+            computed and then discarded::
+
+                sink(sol, pv)
+
+            where `sol` is the SimpleNamespace solution for the block
+            (as described under "Returns" below) and `pv` is the
+            slice object for the block in `freq`. This routine then
+            returns a list of the return values from `sink`. A
+            typical `sink` is a data recovery function that only
+            keeps the recovered rows::
+
+                def sink(sol, pv):
+                    return atm @ sol.a
+
         Returns
         -------
         A SimpleNamespace with the members:
@@ -734,6 +975,10 @@ class SolveUnc(_BaseODE):
         f : 1d ndarray
             Frequency vector (same as the input `freq`)
 
+        If `sink` is not None, the list of return values from the
+        `sink` calls, one for each block of frequencies, is returned
+        instead.
+
         Notes
         -----
         The rigid-body and residual-flexibility modes are solved
@@ -801,6 +1046,10 @@ class SolveUnc(_BaseODE):
             ...     _ = plt.xlabel('Frequency (Hz)')
             >>> fig.tight_layout()
         """
+        if chunk is not None or max_memory is not None or sink is not None:
+            return self._fsolve_chunked(
+                force, freq, incrb, rf_disp_only, chunk, max_memory, sink
+            )
         force = np.atleast_2d(force)
         freq = np.atleast_1d(freq)
         d, v, a, force = self._init_dva(
@@ -821,7 +1070,21 @@ class SolveUnc(_BaseODE):
                 self._solve_freq_coup(d, v, a, force, freq, incrb)
         return self._solution_freq(d, v, a, freq)
 
-    def _solve_real_unc(self, d, v, force):
+    def _solve_nonrf(self, d, v, a, force, nc=1):
+        """Solve the non-rf part of the equations for
+        :func:`SolveUnc.tsolve` and :func:`SolveUnc.tsolve_batch`"""
+        if self.nonrfsz:
+            if self.unc and self.systype is float:
+                # for uncoupled, m, b, k have rb+el (all nonrf)
+                if self.cdforces:
+                    self._solve_real_unc_cdforces(d, v, force, nc)
+                else:
+                    self._solve_real_unc(d, v, force, nc)
+            else:
+                # for coupled, m, b, k have el only
+                self._solve_complex_unc(d, v, a, force, nc)
+
+    def _solve_real_unc(self, d, v, force, nc=1):
         """Solve the real uncoupled equations for :class:`SolveUnc`"""
         # solve:
         # for i in range(nt-1):
@@ -829,7 +1092,7 @@ class SolveUnc(_BaseODE):
         #                A *force[:, i] + B *force[:, i+1]
         #     V[:,i+1] = Fp*D[:, i] + Gp*V[:, i] +
         #                Ap*force[:, i] + Bp*force[:, i+1]
-        nt = force.shape[1]
+        nt = force.shape[1] // nc
         if nt == 1:
             return
         pc = self.pc
@@ -844,23 +1107,46 @@ class SolveUnc(_BaseODE):
         Bp = pc.Bp
         D = d[kdof]
         V = v[kdof]
+        if self.engine == "numba":
+            _real_unc_kernel(
+                D, V, force[kdof], F, G, A, B, Fp, Gp, Ap, Bp, self.order, nc
+            )
+            if not self.slices:
+                d[kdof] = D
+                v[kdof] = V
+            return
         if self.order == 1:
-            ABF = A[:, None] * force[kdof, :-1] + B[:, None] * force[kdof, 1:]
-            ABFp = Ap[:, None] * force[kdof, :-1] + Bp[:, None] * force[kdof, 1:]
+            ABF = A[:, None] * force[kdof, :-nc] + B[:, None] * force[kdof, nc:]
+            ABFp = Ap[:, None] * force[kdof, :-nc] + Bp[:, None] * force[kdof, nc:]
         else:
-            ABF = (A + B)[:, None] * force[kdof, :-1]
-            ABFp = (Ap + Bp)[:, None] * force[kdof, :-1]
-        di = D[:, 0]
-        vi = V[:, 0]
-        for i in range(nt - 1):
-            din = F * di + G * vi + ABF[:, i]
-            vi = V[:, i + 1] = Fp * di + Gp * vi + ABFp[:, i]
-            D[:, i + 1] = di = din
+            ABF = (A + B)[:, None] * force[kdof, :-nc]
+            ABFp = (Ap + Bp)[:, None] * force[kdof, :-nc]
+        if nc == 1:
+            di = D[:, 0]
+            vi = V[:, 0]
+            for i in range(nt - 1):
+                din = F * di + G * vi + ABF[:, i]
+                vi = V[:, i + 1] = Fp * di + Gp * vi + ABFp[:, i]
+                D[:, i + 1] = di = din
+        else:
+            # advance all cases together, one slab of nc columns at
+            # a time:
+            F = F[:, None]
+            G = G[:, None]
+            Fp = Fp[:, None]
+            Gp = Gp[:, None]
+            di = D[:, :nc]
+            vi = V[:, :nc]
+            for i in range(0, (nt - 1) * nc, nc):
+                j = i + nc
+                din = F * di + G * vi + ABF[:, i:j]
+                vi = V[:, j : j + nc] = Fp * di + Gp * vi + ABFp[:, i:j]
+                D[:, j : j + nc] = di = din
         if not self.slices:
             d[kdof] = D
             v[kdof] = V
 
-    def _solve_real_unc_cdforces(self, d, v, force):
+    def _solve_real_unc_cdforces(self, d, v, force, nc=1):
         """Solve the real uncoupled equations for :class:`SolveUnc`"""
         # solve: ... V[:, i+1] needs to be solved for, but these are
         # the starting equations:
@@ -871,7 +1157,7 @@ class SolveUnc(_BaseODE):
         #     V[:,i+1] = Fp*D[:, i] + Gp*V[:, i] +
         #                Ap*force[:, i] + Bp*force[:, i+1]
         #                - Ap * Co @ V[:, i] - Bp * Co @ V[:, i+1]
-        nt = force.shape[1]
+        nt = force.shape[1] // nc
         if nt == 1:
             return
         pc = self.pc
@@ -886,22 +1172,49 @@ class SolveUnc(_BaseODE):
         Bp = pc.Bp
         D = d[kdof]
         V = v[kdof]
+        if self.engine == "numba":
+            _real_unc_cdforces_kernel(
+                D,
+                V,
+                force[kdof],
+                F,
+                G,
+                A,
+                B,
+                Fp,
+                Gp,
+                Ap,
+                Bp,
+                np.ascontiguousarray(self.pc.alpha),
+                np.ascontiguousarray(self.bo),
+                self.order,
+                nc,
+            )
+            if not self.slices:
+                d[kdof] = D
+                v[kdof] = V
+            return
         if self.order == 1:
-            ABF = A[:, None] * force[kdof, :-1] + B[:, None] * force[kdof, 1:]
-            ABFp = Ap[:, None] * force[kdof, :-1] + Bp[:, None] * force[kdof, 1:]
+            ABF = A[:, None] * force[kdof, :-nc] + B[:, None] * force[kdof, nc:]
+            ABFp = Ap[:, None] * force[kdof, :-nc] + Bp[:, None] * force[kdof, nc:]
         else:
-            ABF = (A + B)[:, None] * force[kdof, :-1]
-            ABFp = (Ap + Bp)[:, None] * force[kdof, :-1]
-        di = D[:, 0]
-        vi = V[:, 0]
+            ABF = (A + B)[:, None] * force[kdof, :-nc]
+            ABFp = (Ap + Bp)[:, None] * force[kdof, :-nc]
+        # work on slabs of nc columns (one column per force case):
+        F, G, A, B, Fp, Gp, Ap, Bp = (x[:, None] for x in (F, G, A, B, Fp, Gp, Ap, Bp))
+        di = D[:, :nc]
+        vi = V[:, :nc]
         alpha = self.pc.alpha
         bo = self.bo
         dmpfrc0 = bo @ vi
-        for i in range(nt - 1):
-            v_part = Fp * di + Gp * vi + ABFp[:, i] - Ap * dmpfrc0
+        for i in range(0, (nt - 1) * nc, nc):
+            j = i + nc
+            v_part = Fp * di + Gp * vi + ABFp[:, i:j] - Ap * dmpfrc0
             dmpfrc1 = alpha @ v_part
-            D[:, i + 1] = di = F * di + G * vi + ABF[:, i] - A * dmpfrc0 - B * dmpfrc1
-            V[:, i + 1] = vi = v_part - Bp * dmpfrc1
+            D[:, j : j + nc] = di = (
+                F * di + G * vi + ABF[:, i:j] - A * dmpfrc0 - B * dmpfrc1
+            )
+            V[:, j : j + nc] = vi = v_part - Bp * dmpfrc1
             dmpfrc0 = dmpfrc1
 
         if not self.slices:
@@ -1233,10 +1546,12 @@ class SolveUnc(_BaseODE):
         flex = self._add_rf_flex(flex, phi, velo, True)
         return flex
 
-    def _solve_complex_unc(self, d, v, a, force):
+    def _solve_complex_unc(self, d, v, a, force, nc=1):
         """Solve the complex uncoupled equations for
         :class:`SolveUnc`"""
-        nt = force.shape[1]
+        # the equations are advanced in slabs of `nc` columns, one
+        # column per force case (see :func:`SolveUnc.tsolve_batch`)
+        nt = force.shape[1] // nc
         pc = self.pc
         if self.rbsize:
             # solve:
@@ -1258,18 +1573,19 @@ class SolveUnc(_BaseODE):
                 A = pc.A
                 Ap = pc.Ap
                 if self.order == 1:
-                    AF = A * (rbforce[:, :-1] + rbforce[:, 1:] / 2)
-                    AFp = Ap * (rbforce[:, :-1] + rbforce[:, 1:])
+                    AF = A * (rbforce[:, :-nc] + rbforce[:, nc:] / 2)
+                    AFp = Ap * (rbforce[:, :-nc] + rbforce[:, nc:])
                 else:
-                    AF = (1.5 * A) * rbforce[:, :-1]
-                    AFp = (2 * Ap) * rbforce[:, :-1]
+                    AF = (1.5 * A) * rbforce[:, :-nc]
+                    AFp = (2 * Ap) * rbforce[:, :-nc]
                 drb = d[rb]
                 vrb = v[rb]
-                di = drb[:, 0]
-                vi = vrb[:, 0]
-                for i in range(nt - 1):
-                    di = drb[:, i + 1] = di + G * vi + AF[:, i]
-                    vi = vrb[:, i + 1] = vi + AFp[:, i]
+                di = drb[:, :nc]
+                vi = vrb[:, :nc]
+                for i in range(0, (nt - 1) * nc, nc):
+                    j = i + nc
+                    di = drb[:, j : j + nc] = di + G * vi + AF[:, i:j]
+                    vi = vrb[:, j : j + nc] = vi + AFp[:, i:j]
                 if not self.slices:
                     d[rb] = drb
                     v[rb] = vrb
@@ -1302,27 +1618,29 @@ class SolveUnc(_BaseODE):
                 imf = force[kdof]
             w = ur_inv_v @ imf
             if self.order == 1:
-                ABF = Ae[:, None] * w[:, :-1] + Be[:, None] * w[:, 1:]
+                ABF = Ae[:, None] * w[:, :-nc] + Be[:, None] * w[:, nc:]
             else:
-                ABF = (Ae + Be)[:, None] * w[:, :-1]
-
-            y = np.empty((ur_inv_v.shape[0], nt), complex, order="F")
-            di = y[:, 0] = ur_inv_v @ v[kdof, 0] + ur_inv_d @ d[kdof, 0]
-            for i in range(nt - 1):
-                di = y[:, i + 1] = Fe * di + ABF[:, i]
+                ABF = (Ae + Be)[:, None] * w[:, :-nc]
+
+            Fe = Fe[:, None]
+            y = np.empty((ur_inv_v.shape[0], nt * nc), complex, order="F")
+            di = y[:, :nc] = ur_inv_v @ v[kdof, :nc] + ur_inv_d @ d[kdof, :nc]
+            for i in range(0, (nt - 1) * nc, nc):
+                j = i + nc
+                di = y[:, j : j + nc] = Fe * di + ABF[:, i:j]
             if self.systype is float:
                 # Can do real math for recovery. Note that the
                 # imaginary part of 'd' and 'v' would be zero if no
                 # modes were deleted of the complex conjugate pairs.
                 # The real part is correct however, and that's all we
                 # need.
-                ry = y[:, 1:].real.copy()
-                iy = y[:, 1:].imag.copy()
-                d[kdof, 1:] = rur_d @ ry - iur_d @ iy
-                v[kdof, 1:] = rur_v @ ry - iur_v @ iy
+                ry = y[:, nc:].real.copy()
+                iy = y[:, nc:].imag.copy()
+                d[kdof, nc:] = rur_d @ ry - iur_d @ iy
+                v[kdof, nc:] = rur_v @ ry - iur_v @ iy
             else:
-                d[kdof, 1:] = ur_d @ y[:, 1:]
-                v[kdof, 1:] = ur_v @ y[:, 1:]
+                d[kdof, nc:] = ur_d @ y[:, nc:]
+                v[kdof, nc:] = ur_v @ y[:, nc:]
 
     def _solve_complex_unc_generator(self, d, v, a, F0):
         """Solve the complex uncoupled equations for
@@ -1004,7 +1004,56 @@ def psd2time(
     return F_time, sr
 
 
-def psdmod(sig, sr, nperseg=None, timeslice=1.0, tsoverlap=0.5, getmap=False, **kwargs):
+def _psdmod_incremental(sig, sr, nperseg, timeslice, tsoverlap, **kwargs):
+    """
+    Utility routine for :func:`psdmod` when `incremental` is True
+
+    Each Welch segment spectrum is computed only once (via
+    :func:`scipy.signal.spectrogram`) and the average for each time
+    slice is formed from a cumulative sum over the segments.
+    """
+    if kwargs.pop("average", "mean") != "mean":
+        raise ValueError("`average` must be 'mean' when `incremental` is True")
+    kwargs.setdefault("window", "hann")
+    noverlap = kwargs.pop("noverlap", None)
+    if noverlap is None:
+        noverlap = nperseg // 2
+    nstep = nperseg - noverlap
+    sig = np.atleast_1d(sig)
+    ntimeslice, inc, tlen, t = dsp._slice_layout(timeslice, tsoverlap, sr, sig.size)
+    if inc % nstep != 0:
+        raise ValueError(
+            "when `incremental` is True, the distance between time slices "
+            f"({inc} points) must be a multiple of the Welch segment step "
+            f"({nstep} points)"
+        )
+    nused = (tlen - 1) * inc + ntimeslice
+    f, _, sxx = signal.spectrogram(
+        sig[:nused],
+        fs=sr,
+        nperseg=nperseg,
+        noverlap=noverlap,
+        mode="psd",
+        **kwargs,
+    )
+    csum = np.zeros((sxx.shape[0], sxx.shape[1] + 1))
+    np.cumsum(sxx, axis=1, out=csum[:, 1:])
+    nseg = (ntimeslice - noverlap) // nstep
+    m0 = np.arange(tlen) * (inc // nstep)
+    pmap = (csum[:, m0 + nseg] - csum[:, m0]) / nseg
+    return pmap, t, f
+
+
+def psdmod(
+    sig,
+    sr,
+    nperseg=None,
+    timeslice=1.0,
+    tsoverlap=0.5,
+    getmap=False,
+    incremental=False,
+    **kwargs,
+):
     """
     Modified method for PSD estimation via FFT.
 
@@ -1032,6 +1081,15 @@ def psdmod(sig, sr, nperseg=None, timeslice=1.0, tsoverlap=0.5, getmap=False, **
     getmap : bool, optional
         If True, get the PSD map output (the `Pmap` and `t` variables
         described below).
+    incremental : bool, optional
+        If True, the FFT of each Welch segment is computed only once
+        and shared by all overlapping time slices that contain it
+        (via :func:`scipy.signal.spectrogram` and a running sum).
+        The results are the same as for the default method, but the
+        cost no longer grows with the amount of slice overlap. The
+        distance between slice starts must be a multiple of the
+        Welch segment step (``nperseg - noverlap``) and only the
+        'mean' `average` is supported.
     *kwargs : optional
         Named arguments to pass to :func:`scipy.signal.welch`.
 
@@ -1113,17 +1171,22 @@ def psdmod(sig, sr, nperseg=None, timeslice=1.0, tsoverlap=0.5, getmap=False, **
             "`nperseg` too big for current `timeslice` setting;"
             " either decrease `nperseg` or increase `timeslice`"
         )
-    welch_inputs = dict(fs=sr, nperseg=nperseg, **kwargs)
-    pmap, t, f = dsp.waterfall(
-        sig,
-        sr,
-        timeslice,
-        tsoverlap,
-        signal.welch,
-        which=1,
-        freq=0,
-        kwargs=welch_inputs,
-    )
+    if incremental:
+        pmap, t, f = _psdmod_incremental(
+            sig, sr, nperseg, timeslice, tsoverlap, **kwargs
+        )
+    else:
+        welch_inputs = dict(fs=sr, nperseg=nperseg, **kwargs)
+        pmap, t, f = dsp.waterfall(
+            sig,
+            sr,
+            timeslice,
+            tsoverlap,
+            signal.welch,
+            which=1,
+            freq=0,
+            kwargs=welch_inputs,
+        )
     p = pmap.max(axis=1)
     if getmap:
         return f, p, pmap, t
@@ -2,6 +2,7 @@
 #define NPY_NO_DEPRECATED_API NPY_API_VERSION
 #include <numpy/arrayobject.h>
 #include <math.h>
+#include <string.h>
 
 /* Docstrings */
 static char module_docstring[] =
@@ -86,14 +87,111 @@ static char rainflow_docstring[] =
     "       [6, 7],\n"
     "       [7, 8]]...)\n";
 
+static char rainflow_csr_docstring[] =
+    "Rainflow cycle counting of many channels, compiled C version.\n"
+    "\n"
+    "**Usage:**\n"
+    "\n"
+    "rf, rfptr = rainflow_csr(peaks, indptr)\n"
+    "\n"
+    "Parameters\n"
+    "----------\n"
+    "peaks : 1d array_like\n"
+    "    The alternating peaks of all channels, concatenated. The\n"
+    "    peaks for channel `i` are ``peaks[indptr[i]:indptr[i+1]]``.\n"
+    "indptr : 1d array_like\n"
+    "    Integer vector of length ``nchannels + 1`` defining where\n"
+    "    each channel starts in `peaks`. Must start with 0, end with\n"
+    "    ``len(peaks)`` and be non-decreasing.\n"
+    "\n"
+    "Returns\n"
+    "-------\n"
+    "rf : 2d ndarray\n"
+    "    ncycles x 3 matrix with the rainflow cycle count information\n"
+    "    ``[amp, mean, count]`` for all channels; see :func:`rainflow`.\n"
+    "rfptr : 1d ndarray\n"
+    "    Integer vector of length ``nchannels + 1``; the cycles for\n"
+    "    channel `i` are ``rf[rfptr[i]:rfptr[i+1]]``.\n"
+    "\n"
+    "Notes\n"
+    "-----\n"
+    "Channels with fewer than 2 peaks have no cycles. The global\n"
+    "interpreter lock is released while counting, so this routine\n"
+    "can be run on groups of channels in parallel threads.\n"
+    "\n"
+    "Examples\n"
+    "--------\n"
+    ">>> from pyyeti.rainflow.c_rain import rainflow_csr\n"
+    ">>> rf, rfptr = rainflow_csr([-2, 1, -3, 5, -1, 3, 0, 2], [0, 5, 8])\n"
+    ">>> rf\n"
+    "array([[ 1.5, -0.5,  0.5],\n"
+    "       [ 2. , -1. ,  0.5],\n"
+    "       [ 4. ,  1. ,  0.5],\n"
+    "       [ 3. ,  2. ,  0.5],\n"
+    "       [ 1.5,  1.5,  0.5],\n"
+    "       [ 1. ,  1. ,  0.5]])\n"
+    ">>> rfptr              # doctest: +ELLIPSIS\n"
+    "array([0, 4, 6]...)\n";
+
+static char findap_csr_docstring[] =
+    "Find the alternating peaks of many channels, compiled C version.\n"
+    "\n"
+    "**Usage:**\n"
+    "\n"
+    "peaks, indptr = findap_csr(sig, tol=1e-6)\n"
+    "\n"
+    "Parameters\n"
+    "----------\n"
+    "sig : 2d array_like\n"
+    "    The signals; each row is a channel.\n"
+    "tol : scalar; optional\n"
+    "    Tolerance value for detecting unique values; see\n"
+    "    :func:`pyyeti.cyclecount.findap`.\n"
+    "\n"
+    "Returns\n"
+    "-------\n"
+    "peaks : 1d ndarray\n"
+    "    The alternating peaks of all channels, concatenated.\n"
+    "indptr : 1d ndarray\n"
+    "    Integer vector of length ``nchannels + 1``; the peaks for\n"
+    "    channel `i` are ``peaks[indptr[i]:indptr[i+1]]``.\n"
+    "\n"
+    "Notes\n"
+    "-----\n"
+    "For each channel, the peaks are the same as\n"
+    "``sig[i, findap(sig[i], tol)]``. The outputs can be passed\n"
+    "directly to :func:`rainflow_csr`. The global interpreter lock is\n"
+    "released while searching, so this routine can be run on groups\n"
+    "of channels in parallel threads.\n"
+    "\n"
+    "Examples\n"
+    "--------\n"
+    ">>> from pyyeti.rainflow.c_rain import findap_csr\n"
+    ">>> peaks, indptr = findap_csr([[1, 2, 3, 4, 4, -2, -2, 0],\n"
+    "...                             [0, 1, 1, 1, 1, 1, 1, 1]])\n"
+    ">>> peaks\n"
+    "array([ 1.,  4., -2.,  0.,  0.,  1.])\n"
+    ">>> indptr              # doctest: +ELLIPSIS\n"
+    "array([0, 4, 6]...)\n";
+
 /* Available functions */
 static PyObject *rainflow(PyObject *self, PyObject *args, PyObject *keywds);
+static PyObject *rainflow_csr(PyObject *self, PyObject *args,
+                              PyObject *keywds);
+static PyObject *findap_csr(PyObject *self, PyObject *args,
+                            PyObject *keywds);
 
 /* Module specification */
 static PyMethodDef module_methods[] = {
     {"rainflow", (PyCFunction)rainflow,
      METH_VARARGS | METH_KEYWORDS, rainflow_docstring},
 
+    {"rainflow_csr", (PyCFunction)rainflow_csr,
+     METH_VARARGS | METH_KEYWORDS, rainflow_csr_docstring},
+
+    {"findap_csr", (PyCFunction)findap_csr,
+     METH_VARARGS | METH_KEYWORDS, findap_csr_docstring},
+
     {NULL, NULL, 0, NULL}  /* sentinel */
 };
 
@@ -450,3 +548,290 @@ fail:
     Py_XDECREF(sos);
     return NULL;
 }
+
+
+/* Counts the cycles of one channel of `L` peaks and stores them in
+   `rf` as [amplitude, mean, count] rows; `pts` is a work buffer of at
+   least `L` values. Does not use the Python API. Returns a pointer
+   to the next row of `rf`. */
+static double *count_cycles(const double *peaks, npy_intp L, double *pts,
+                            double *rf)
+{
+    npy_intp j, k;
+    double X, Y;
+
+    j = -1;
+    for (k=0; k<L; ++k) {
+      /* step 1 from [1]: */
+      pts[++j] = peaks[k];
+      /* step 2 from [1]: */
+      while (j > 1) {
+        /* step 3 from [1]: */
+        Y = fabs(pts[j-2]-pts[j-1]);
+        X = fabs(pts[j-1]-pts[j]);
+        if (X < Y) break;
+        if (j == 2) {
+          /* step 5 from [1]: */
+          /* [count Y as half cycle] */
+          *rf++ = Y/2;
+          *rf++ = (pts[0]+pts[1])/2;
+          *rf++ = 0.5;
+          pts[0] = pts[1];  /* discard j-2 pt */
+          pts[1] = pts[2];
+          j = 1;
+        }
+        else {
+          /* step 4 from [1]: */
+          /* [count Y as full cycle] */
+          *rf++ = Y/2;
+          *rf++ = (pts[j-2]+pts[j-1])/2;
+          *rf++ = 1.0;
+          pts[j-2] = pts[j];  /* discard j-2, j-1 pts */
+          j -= 2;
+        }
+      }
+    }
+    /* step 6 from [1]: */
+    /* [count all ranges in pts as half cycles] */
+    double A=pts[0], B;
+    for (k=0; k<j; ++k) {
+      B = pts[k+1];
+      *rf++ = fabs(A-B)/2;
+      *rf++ = (A+B)/2;
+      *rf++ = 0.5;
+      A = B;
+    }
+    return rf;
+}
+
+/* returns tuple:
+   3-column matrix: [amplitude, mean, count] (double) for all channels
+   vector: channel pointers into the matrix rows (int) */
+static PyObject *rainflow_csr(PyObject *self, PyObject *args,
+                              PyObject *keywds)
+{
+    PyObject *peaks_obj, *indptr_obj;
+    static char *kwlist[] = {"peaks", "indptr", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, keywds, "OO", kwlist,
+                                     &peaks_obj, &indptr_obj))
+      return NULL;
+
+    /* prepare other pointers so the 'fail' section is safe */
+    PyArrayObject *peaks_array=NULL;   /* input peaks */
+    PyArrayObject *indptr_array=NULL;  /* input channel pointers */
+    PyArrayObject *rf_array=NULL;      /* return object for the count */
+    PyArrayObject *rfptr_array=NULL;   /* return object for pointers */
+    PyArrayObject *srf=NULL;           /* sliced version of rf_array */
+    double *pts=NULL;                  /* work buffer for peak values */
+
+    /* Interpret the input objects as numpy arrays. */
+    peaks_array = (PyArrayObject *)PyArray_FROM_OTF(peaks_obj, NPY_DOUBLE,
+                                                    NPY_ARRAY_IN_ARRAY);
+    if (peaks_array == NULL) goto fail;
+    indptr_array = (PyArrayObject *)PyArray_FROM_OTF(indptr_obj, NPY_INTP,
+                                                     NPY_ARRAY_IN_ARRAY);
+    if (indptr_array == NULL) goto fail;
+
+    if (PyArray_NDIM(peaks_array) != 1 || PyArray_NDIM(indptr_array) != 1
+        || PyArray_DIM(indptr_array, 0) < 1) {
+        PyErr_SetString(PyExc_ValueError,
+                        "`peaks` and `indptr` must be vectors and `indptr` "
+                        "must have length >= 1");
+        goto fail;
+    }
+
+    npy_intp L = PyArray_DIM(peaks_array, 0);
+    npy_intp nchan = PyArray_DIM(indptr_array, 0) - 1;
+    const double *peaks = (double *)PyArray_DATA(peaks_array);
+    const npy_intp *indptr = (npy_intp *)PyArray_DATA(indptr_array);
+
+    /* check pointers and get maximum possible number of cycles */
+    npy_intp c, n, total = 0, maxlen = 1;
+    if (indptr[0] != 0 || indptr[nchan] != L) {
+        PyErr_SetString(PyExc_ValueError,
+                        "`indptr` must start at 0 and end at len(`peaks`)");
+        goto fail;
+    }
+    for (c=0; c<nchan; ++c) {
+        n = indptr[c+1] - indptr[c];
+        if (n < 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "`indptr` must be non-decreasing");
+            goto fail;
+        }
+        if (n > 1) total += n - 1;
+        if (n > maxlen) maxlen = n;
+    }
+
+    npy_intp dims[2] = {total, 3};
+    rf_array = (PyArrayObject *) PyArray_SimpleNew(2, dims, NPY_DOUBLE);
+    if (rf_array == NULL) goto fail;
+    dims[0] = nchan + 1;
+    rfptr_array = (PyArrayObject *) PyArray_SimpleNew(1, dims, NPY_INTP);
+    if (rfptr_array == NULL) goto fail;
+    pts = malloc(maxlen * sizeof(double));
+    if (pts == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+
+    double *rf0 = (double *)PyArray_DATA(rf_array);
+    npy_intp *rfptr = (npy_intp *)PyArray_DATA(rfptr_array);
+
+    /* --------------------------------------------------------------- */
+    Py_BEGIN_ALLOW_THREADS
+    double *rf = rf0;
+    rfptr[0] = 0;
+    for (c=0; c<nchan; ++c) {
+        n = indptr[c+1] - indptr[c];
+        if (n > 1)
+            rf = count_cycles(peaks + indptr[c], n, pts, rf);
+        rfptr[c+1] = (rf - rf0) / 3;
+    }
+    Py_END_ALLOW_THREADS
+    /* --------------------------------------------------------------- */
+
+    /* Clean up. */
+    Py_DECREF(peaks_array);
+    Py_DECREF(indptr_array);
+    free(pts);
+
+    if (rfptr[nchan] < total) {
+      /* slice to smaller array and return */
+      PyObject* stop = PyLong_FromSsize_t(rfptr[nchan]);
+      PyObject* slice = PySlice_New(NULL, stop, NULL);
+      srf = (PyArrayObject *)PyObject_GetItem((PyObject *)rf_array, slice);
+      Py_DECREF(stop);
+      Py_DECREF(slice);
+      if (srf == NULL) {
+          Py_DECREF(rf_array);
+          Py_DECREF(rfptr_array);
+          return NULL;
+      }
+      Py_DECREF(rf_array);
+      return Py_BuildValue("NN", srf, rfptr_array);
+    }
+    return Py_BuildValue("NN", rf_array, rfptr_array);
+
+fail:
+    Py_XDECREF(peaks_array);
+    Py_XDECREF(indptr_array);
+    free(pts);
+    Py_XDECREF(rf_array);
+    Py_XDECREF(rfptr_array);
+    return NULL;
+}
+
+
+/* Stores the alternating peaks of the `L` values in `y` in `peaks`
+   (same as ``y[findap(y, tol)]``) and returns the number of peaks.
+   Does not use the Python API. */
+static npy_intp find_peaks(const double *y, npy_intp L, double tol,
+                           double *peaks)
+{
+    npy_intp i, n = 0, nu = 1;
+    double d, mx = 0.0, stol, prev, cur;
+    int s0 = 0, s1;
+
+    if (L < 1) return 0;
+
+    /* values within `stol` of the previous value are not unique: */
+    for (i=1; i<L; ++i) {
+      d = fabs(y[i]-y[i-1]);
+      if (d > mx) mx = d;
+    }
+    stol = fabs(tol*mx);
+
+    /* a unique value is a peak if the slope changes sign there; the
+       first one always is: */
+    prev = y[0];
+    for (i=1; i<L; ++i) {
+      if (fabs(y[i]-y[i-1]) <= stol) continue;
+      cur = y[i];
+      s1 = (cur > prev) - (cur < prev);
+      /* branch-free: always store, but only keep a peak */
+      peaks[n] = prev;
+      n += (nu == 1) | (s1*s0 == -1);
+      ++nu;
+      s0 = s1;
+      prev = cur;
+    }
+
+    /* last unique value: */
+    if (nu <= 2 || s0 != 0) peaks[n++] = prev;
+    return n;
+}
+
+/* returns tuple:
+   vector: the alternating peaks of all channels (double)
+   vector: channel pointers into the peaks (int) */
+static PyObject *findap_csr(PyObject *self, PyObject *args,
+                            PyObject *keywds)
+{
+    PyObject *sig_obj;
+    double tol = 1e-6;
+    static char *kwlist[] = {"sig", "tol", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, keywds, "O|d", kwlist,
+                                     &sig_obj, &tol))
+      return NULL;
+
+    /* prepare other pointers so the 'fail' section is safe */
+    PyArrayObject *sig_array=NULL;     /* input signals */
+    PyArrayObject *peaks_array=NULL;   /* return object for peaks */
+    PyArrayObject *indptr_array=NULL;  /* return object for pointers */
+    double *buf=NULL;                  /* work buffer for the peaks */
+
+    /* Interpret the input object as a numpy array. */
+    sig_array = (PyArrayObject *)PyArray_FROM_OTF(sig_obj, NPY_DOUBLE,
+                                                  NPY_ARRAY_IN_ARRAY);
+    if (sig_array == NULL) goto fail;
+
+    if (PyArray_NDIM(sig_array) != 2) {
+        PyErr_SetString(PyExc_ValueError, "`sig` must be 2d");
+        goto fail;
+    }
+
+    npy_intp nchan = PyArray_DIM(sig_array, 0);
+    npy_intp L = PyArray_DIM(sig_array, 1);
+    const double *sig = (double *)PyArray_DATA(sig_array);
+    npy_intp c, dims[1] = {nchan + 1};
+
+    indptr_array = (PyArrayObject *) PyArray_SimpleNew(1, dims, NPY_INTP);
+    if (indptr_array == NULL) goto fail;
+    /* there cannot be more peaks than values: */
+    buf = malloc((nchan*L > 0 ? nchan*L : 1) * sizeof(double));
+    if (buf == NULL) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+
+    npy_intp *indptr = (npy_intp *)PyArray_DATA(indptr_array);
+
+    /* --------------------------------------------------------------- */
+    Py_BEGIN_ALLOW_THREADS
+    indptr[0] = 0;
+    for (c=0; c<nchan; ++c)
+        indptr[c+1] = indptr[c] + find_peaks(sig + c*L, L, tol,
+                                             buf + indptr[c]);
+    Py_END_ALLOW_THREADS
+    /* --------------------------------------------------------------- */
+
+    dims[0] = indptr[nchan];
+    peaks_array = (PyArrayObject *) PyArray_SimpleNew(1, dims, NPY_DOUBLE);
+    if (peaks_array == NULL) goto fail;
+    memcpy(PyArray_DATA(peaks_array), buf, dims[0] * sizeof(double));
+
+    /* Clean up. */
+    Py_DECREF(sig_array);
+    free(buf);
+    return Py_BuildValue("NN", peaks_array, indptr_array);
+
+fail:
+    Py_XDECREF(sig_array);
+    free(buf);
+    Py_XDECREF(peaks_array);
+    Py_XDECREF(indptr_array);
+    return NULL;
+}
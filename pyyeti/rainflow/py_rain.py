@@ -210,10 +210,255 @@ def _rainflow2(peaks, L):
     return rf[: L - fullcyclesp1], os[: L - fullcyclesp1]
 
 
+def rainflow_csr(peaks, indptr):
+    """
+    Rainflow cycle counting of many channels in plain Python (slow).
+
+    Parameters
+    ----------
+    peaks : 1d array_like
+        The alternating peaks of all channels, concatenated. The peaks
+        for channel `i` are ``peaks[indptr[i]:indptr[i+1]]``.
+    indptr : 1d array_like
+        Integer vector of length ``nchannels + 1`` defining where each
+        channel starts in `peaks`. Must start with 0, end with
+        ``len(peaks)`` and be non-decreasing.
+
+    Returns
+    -------
+    rf : 2d ndarray
+        ncycles x 3 matrix with the rainflow cycle count information
+        ``[amp, mean, count]`` for all channels; see :func:`rainflow`.
+    rfptr : 1d ndarray
+        Integer vector of length ``nchannels + 1``; the cycles for
+        channel `i` are ``rf[rfptr[i]:rfptr[i+1]]``.
+
+    Notes
+    -----
+    Channels with fewer than 2 peaks have no cycles. If Numba is
+    available, the global interpreter lock is released while
+    counting, so this routine can be run on groups of channels in
+    parallel threads (as is the compiled C version).
+
+    Examples
+    --------
+    >>> from pyyeti.rainflow.py_rain import rainflow_csr
+    >>> rf, rfptr = rainflow_csr([-2, 1, -3, 5, -1, 3, 0, 2], [0, 5, 8])
+    >>> rf
+    array([[ 1.5, -0.5,  0.5],
+           [ 2. , -1. ,  0.5],
+           [ 4. ,  1. ,  0.5],
+           [ 3. ,  2. ,  0.5],
+           [ 1.5,  1.5,  0.5],
+           [ 1. ,  1. ,  0.5]])
+    >>> rfptr              # doctest: +ELLIPSIS
+    array([0, 4, 6]...)
+    """
+    peaks = np.ascontiguousarray(peaks, dtype=float)
+    indptr = np.ascontiguousarray(indptr, dtype=np.intp)
+    if peaks.ndim != 1 or indptr.ndim != 1 or indptr.size < 1:
+        raise ValueError(
+            "`peaks` and `indptr` must be vectors and `indptr` must have length >= 1"
+        )
+    if indptr[0] != 0 or indptr[-1] != peaks.size:
+        raise ValueError("`indptr` must start at 0 and end at len(`peaks`)")
+    lens = np.diff(indptr)
+    if (lens < 0).any():
+        raise ValueError("`indptr` must be non-decreasing")
+    rf = np.empty((np.maximum(lens - 1, 0).sum(), 3))
+    rfptr = np.empty(indptr.size, np.intp)
+    n = _rainflow_csr(peaks, indptr, rf, rfptr)
+    return rf[:n], rfptr
+
+
+def _rainflow_csr(peaks, indptr, rf, rfptr):
+    """Utility routine for :func:`rainflow_csr`; returns number of
+    cycles stored in `rf`"""
+    n = 0
+    rfptr[0] = 0
+    for c in range(indptr.size - 1):
+        L = indptr[c + 1] - indptr[c]
+        if L > 1:
+            rfc = _rainflow1(peaks[indptr[c] : indptr[c + 1]], L)
+            rf[n : n + rfc.shape[0]] = rfc
+            n += rfc.shape[0]
+        rfptr[c + 1] = n
+    return n
+
+
+def findap_csr(sig, tol=1e-6):
+    """
+    Find the alternating peaks of many channels in plain Python
+    (slow).
+
+    Parameters
+    ----------
+    sig : 2d array_like
+        The signals; each row is a channel.
+    tol : scalar; optional
+        Tolerance value for detecting unique values; see
+        :func:`pyyeti.cyclecount.findap`.
+
+    Returns
+    -------
+    peaks : 1d ndarray
+        The alternating peaks of all channels, concatenated.
+    indptr : 1d ndarray
+        Integer vector of length ``nchannels + 1``; the peaks for
+        channel `i` are ``peaks[indptr[i]:indptr[i+1]]``.
+
+    Notes
+    -----
+    For each channel, the peaks are the same as
+    ``sig[i, findap(sig[i], tol)]``. The outputs can be passed
+    directly to :func:`rainflow_csr`. If Numba is available, the
+    global interpreter lock is released while searching, so this
+    routine can be run on groups of channels in parallel threads (as
+    is the compiled C version).
+
+    Examples
+    --------
+    >>> from pyyeti.rainflow.py_rain import findap_csr
+    >>> peaks, indptr = findap_csr([[1, 2, 3, 4, 4, -2, -2, 0],
+    ...                             [0, 1, 1, 1, 1, 1, 1, 1]])
+    >>> peaks
+    array([ 1.,  4., -2.,  0.,  0.,  1.])
+    >>> indptr              # doctest: +ELLIPSIS
+    array([0, 4, 6]...)
+    """
+    sig = np.ascontiguousarray(sig, dtype=float)
+    if sig.ndim != 2:
+        raise ValueError("`sig` must be 2d")
+    peaks = np.empty(max(sig.size, 1))
+    indptr = np.empty(sig.shape[0] + 1, np.intp)
+    n = _findap_csr(sig, float(tol), peaks, indptr)
+    return peaks[:n].copy(), indptr
+
+
+def _findap_csr(sig, tol, peaks, indptr):
+    """Utility routine for :func:`findap_csr`; returns number of
+    peaks stored in `peaks`"""
+    n = 0
+    indptr[0] = 0
+    for c in range(sig.shape[0]):
+        y = sig[c]
+        L = y.size
+        if L > 0:
+            # values within `stol` of the previous value are not
+            # unique:
+            mx = 0.0
+            for i in range(1, L):
+                d = abs(y[i] - y[i - 1])
+                if d > mx:
+                    mx = d
+            stol = abs(tol * mx)
+
+            # a unique value is a peak if the slope changes sign
+            # there; the first one always is:
+            prev = y[0]
+            s0 = 0
+            nu = 1
+            for i in range(1, L):
+                if abs(y[i] - y[i - 1]) <= stol:
+                    continue
+                cur = y[i]
+                s1 = 1 if cur > prev else (-1 if cur < prev else 0)
+                if nu == 1 or abs(s1 - s0) == 2:
+                    peaks[n] = prev
+                    n += 1
+                nu += 1
+                s0 = s1
+                prev = cur
+
+            # last unique value:
+            if nu <= 2 or s0 != 0:
+                peaks[n] = prev
+                n += 1
+        indptr[c + 1] = n
+    return n
+
+
+def _push_peak(p, pts, j, amp, cnt, n):
+    """Utility routine for :func:`_rainflow_amps`; adds peak `p` to
+    the rainflow stack `pts` and counts any closed cycles. Returns the
+    updated ``(j, n)``."""
+    # /* step 1 from [1]: */
+    j += 1
+    pts[j] = p
+    # /* step 2 from [1]: */
+    while j > 1:
+        # /* step 3 from [1]: */
+        Y = abs(pts[j - 2] - pts[j - 1])
+        X = abs(pts[j - 1] - pts[j])
+        if X < Y:
+            break
+        n += 1
+        amp[n] = Y / 2
+        if j == 2:
+            # /* step 5 from [1]: */
+            cnt[n] = 0.5
+            pts[0] = pts[1]
+            pts[1] = pts[2]
+            j = 1
+        else:
+            # /* step 4 from [1]: */
+            cnt[n] = 1.0
+            pts[j - 2] = pts[j]
+            j -= 2
+    return j, n
+
+
+def _rainflow_amps(y, stol, amp, cnt):
+    """
+    Fused peak finding and rainflow counting of a signal
+
+    Does the same as ``rainflow(y[findap(y)])`` but in one pass over
+    `y` and only keeping the cycle amplitudes and counts. `stol` is the
+    absolute tolerance for detecting unique values (see
+    :func:`pyyeti.locate.find_unique`). `amp` and `cnt` must each have
+    at least ``len(y)`` elements; the return value is the number of
+    cycles stored in them.
+    """
+    L = y.size
+    pts = np.empty(L)
+    j = -1
+    n = -1
+    prev = y[0]  # previous unique value
+    s0 = 0  # sign of slope into `prev`
+    nu = 1  # number of unique values so far
+    for i in range(1, L):
+        if abs(y[i] - y[i - 1]) <= stol:
+            continue
+        cur = y[i]
+        s1 = 1 if cur > prev else (-1 if cur < prev else 0)
+        if nu == 1 or abs(s1 - s0) == 2:
+            j, n = _push_peak(prev, pts, j, amp, cnt, n)
+        nu += 1
+        s0 = s1
+        prev = cur
+
+    # last unique value:
+    if nu <= 2 or s0 != 0:
+        j, n = _push_peak(prev, pts, j, amp, cnt, n)
+
+    # /* step 6 from [1]: */
+    # /* [count all ranges in pts as half cycles] */
+    for k in range(j):
+        n += 1
+        amp[n] = abs(pts[k] - pts[k + 1]) / 2
+        cnt[n] = 0.5
+    return n + 1
+
+
 try:
     import numba
 except ImportError:
-    pass
+    _HAVE_NUMBA = False
 else:
+    _HAVE_NUMBA = True
     _rainflow1 = numba.jit(nopython=True)(_rainflow1)
     _rainflow2 = numba.jit(nopython=True)(_rainflow2)
+    _push_peak = numba.jit(nopython=True)(_push_peak)
+    _rainflow_amps = numba.jit(nopython=True)(_rainflow_amps)
+    _rainflow_csr = numba.jit(nopython=True, nogil=True)(_rainflow_csr)
+    _findap_csr = numba.jit(nopython=True, nogil=True)(_findap_csr)
@@ -122,6 +122,190 @@ def copyToSharedArray(arr, ctype=ctypes.c_double):
     return shared_arr
 
 
+# shared memory segments attached in the current (worker) process;
+# see :func:`_attach`:
+_SHM_ = {}
+
+
+class SharedExecutor:
+    """
+    Persistent process pool with shared-memory data transport
+
+    A :class:`SharedExecutor` can be passed to :func:`srs`,
+    :func:`srsmap`, :func:`vrs` and :func:`pyyeti.fdepsd.fdepsd` via
+    their `executor` argument. The worker processes are started once
+    (on first use) and the shared-memory buffers used to transport
+    the signal and results are reused (and only reallocated when a
+    larger one is needed). That way, the cost of starting the pool
+    and allocating the shared data is paid once per session instead
+    of once per call.
+
+    Use it as a context manager or call :func:`close` when done::
+
+        with srs.SharedExecutor() as ex:
+            for sig in signals:
+                sh = srs.srs(sig, sr, freq, Q, executor=ex)
+
+    On Windows, be sure the code that uses the executor is contained
+    within ``if __name__ == "__main__":``.
+
+    Attributes
+    ----------
+    ncpu : integer
+        The number of worker processes.
+    """
+
+    def __init__(self, ncpu=None, maxcpu=14):
+        """
+        Initialize the executor (the worker processes are started
+        on first use).
+
+        Parameters
+        ----------
+        ncpu : integer or None; optional
+            Number of worker processes. If None, it is set to 4/5 of
+            the available CPUs (as determined from
+            :func:`multiprocessing.cpu_count`), limited by `maxcpu`.
+        maxcpu : integer or None; optional
+            Specifies maximum number of CPUs to use when `ncpu` is
+            None.
+        """
+        from multiprocessing import shared_memory  # Python >= 3.8
+
+        self._shared_memory = shared_memory
+        if ncpu is None:
+            ncpu = mp.cpu_count()
+            if maxcpu and ncpu > maxcpu:
+                ncpu = maxcpu
+            elif ncpu > 4:
+                ncpu = (ncpu * 4) // 5
+        self.ncpu = ncpu
+        self._pool = None
+        self._shm = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def shared(self, key, shape, dtype=float):
+        """
+        Get an array in shared memory
+
+        Parameters
+        ----------
+        key : string
+            Name for the buffer; the buffer for `key` is reused from
+            call to call if it is large enough.
+        shape : tuple
+            Shape of the array.
+        dtype : data-type; optional
+            Data type of the array.
+
+        Returns
+        -------
+        arr : ndarray
+            The uninitialized array; it is a view into the shared
+            buffer, so copy any results out of it before the next
+            request for `key`.
+        desc : tuple
+            Picklable description of `arr` for the workers; see
+            :func:`_attach`.
+        """
+        dtype = np.dtype(dtype)
+        shape = tuple(int(i) for i in shape)
+        nbytes = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        shm = self._shm.get(key)
+        if shm is None or shm.size < nbytes:
+            if shm is not None:
+                self._release(shm)
+            shm = self._shared_memory.SharedMemory(
+                create=True, size=nbytes + nbytes // 2
+            )
+            self._shm[key] = shm
+        arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        return arr, (key, shm.name, shape, dtype.str)
+
+    def share(self, key, arr):
+        """
+        Copy an array into shared memory
+
+        Same as :func:`shared` except `arr` is copied into the shared
+        buffer and only the description is returned.
+        """
+        arr = np.asarray(arr)
+        sh, desc = self.shared(key, arr.shape, arr.dtype)
+        sh[...] = arr
+        return desc
+
+    def map(self, func, iterable, chunksize=1):
+        """
+        Apply `func` to each item of `iterable` in the worker
+        processes; returns list of results (in order)
+        """
+        if self._pool is None:
+            self._pool = mp.Pool(processes=self.ncpu)
+        return self._pool.map(func, iterable, chunksize)
+
+    def ranges(self, n):
+        """
+        Split ``range(n)`` into about 4 contiguous pieces per worker
+
+        Returns list of ``(start, stop)`` tuples.
+        """
+        ntasks = max(1, min(n, 4 * self.ncpu))
+        edges = np.linspace(0, n, ntasks + 1).astype(int)
+        return [(i, j) for i, j in zip(edges[:-1], edges[1:]) if j > i]
+
+    @staticmethod
+    def _release(shm):
+        try:
+            shm.close()
+        except BufferError:
+            # a view is still alive somewhere; the memory is freed
+            # when it goes away
+            pass
+        shm.unlink()
+
+    def close(self):
+        """
+        Shut down the worker processes and free the shared memory
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        for shm in self._shm.values():
+            self._release(shm)
+        self._shm = {}
+
+
+def _attach(desc):
+    """
+    Get view of shared array described by `desc` (see
+    :func:`SharedExecutor.shared`)
+
+    Used in the worker processes; the attached segments are kept in
+    the global `_SHM_` dictionary so they are opened only once.
+    """
+    if desc is None:
+        return None
+    key, name, shape, dtype = desc
+    shm = _SHM_.get(key)
+    if shm is None or shm.name != name:
+        if shm is not None:
+            try:
+                shm.close()
+            except BufferError:
+                pass
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(name=name)
+        _SHM_[key] = shm
+    return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
 def absacce(Q, dT, wn):
     """
     Utility routine used by :func:`srs` to get absolute acceleration
@@ -302,6 +486,17 @@ def _rmsmeth(resp):
     return np.sqrt((resp ** 2).mean(axis=0))
 
 
+# peak methods the 'batch' engine of srs can accumulate on the fly:
+_PEAK_METHODS = (_absmeth, _posmeth, _negmeth, _possmeth, _negsmeth, _rmsmeth)
+
+# maximum number of history values the 'batch' engine holds at once
+# when `peak` is a user-defined function:
+_BATCH_HIST_SIZE = 2 ** 24
+
+# number of history values processed at a time by incremental srsmap:
+_MAP_CHUNK_SIZE = 2 ** 20
+
+
 def fftroll(sig, sr, ppc, frq):
     """
     Increase sample rate using FFT for :func:`srs`.
@@ -536,6 +731,302 @@ def _dosrs_ic(args):
     HIST_[:, :, j] = resphist[S:]
 
 
+def _batch_coefs(coeffunc, Q, dT, wn):
+    """Utility routine for the 'batch' engine of :func:`srs`
+
+    Returns ``(b, a)``, each ``len(wn) x 3``. Filters with only two
+    coefficients (relvelo at zero frequency) are padded with zeros.
+    """
+    LF = len(wn)
+    b = np.zeros((LF, 3))
+    a = np.zeros((LF, 3))
+    for j in range(LF):
+        bj, aj = coeffunc(Q, dT, wn[j])
+        b[j, : len(bj)] = bj
+        a[j, : len(aj)] = aj
+    return b, a
+
+
+def _batch_offsets(icvals, wn, stype):
+    """Utility routine for the 'batch' engine of :func:`srs`
+
+    Returns the ``nsignals x len(wn)`` initial condition offsets that
+    the lfilter engine adds to each response history.
+    """
+    if icvals is None:
+        return np.zeros((1, len(wn)))
+    icvals = icvals.reshape(-1, 1)
+    with np.errstate(divide="ignore"):
+        if stype == "reldisp":
+            return icvals / wn ** 2
+        if stype == "pvelo":
+            return icvals / wn
+    # stype == 'pacce' or 'absacce'
+    return icvals + 0.0 * wn
+
+
+def _srs_hist_block(sig, b, a, off, S, zi0, zi1, hist):
+    """
+    Run all SDOF filters over `sig` in one pass, storing histories
+
+    `sig` is ``time x nsignals``; `zi0` and `zi1` (each ``nsignals x
+    nfreq``) are the filter states (transposed direct form II, as in
+    :func:`scipy.signal.lfilter`) and are updated in place. Time steps
+    from `S` on are stored in `hist` (``time-S x nsignals x nfreq``).
+    """
+    N, H = sig.shape
+    LF = b.shape[0]
+    b0, b1, b2 = b[:, 0].copy(), b[:, 1].copy(), b[:, 2].copy()
+    a1, a2 = a[:, 1].copy(), a[:, 2].copy()
+    ho = off.shape[0] - 1
+    S = min(max(S, 0), N)
+    for i in range(S):
+        for h in range(H):
+            x = sig[i, h]
+            z0 = zi0[h]
+            z1 = zi1[h]
+            for j in range(LF):
+                y = b0[j] * x + z0[j]
+                z0[j] = b1[j] * x - a1[j] * y + z1[j]
+                z1[j] = b2[j] * x - a2[j] * y
+    for i in range(S, N):
+        for h in range(H):
+            x = sig[i, h]
+            z0 = zi0[h]
+            z1 = zi1[h]
+            oh = off[min(h, ho)]
+            hh = hist[i - S, h]
+            for j in range(LF):
+                y = b0[j] * x + z0[j]
+                z0[j] = b1[j] * x - a1[j] * y + z1[j]
+                z1[j] = b2[j] * x - a2[j] * y
+                hh[j] = y + oh[j]
+
+
+def _srs_peak_block(sig, b, a, off, S, zi0, zi1, mx, mn, ssq):
+    """
+    Run all SDOF filters over `sig` in one pass, accumulating peaks
+
+    Same as :func:`_srs_hist_block` except, instead of storing the
+    histories, the running maximum, minimum and sum of squares
+    (each ``nsignals x nfreq``) are updated in place.
+    """
+    N, H = sig.shape
+    LF = b.shape[0]
+    b0, b1, b2 = b[:, 0].copy(), b[:, 1].copy(), b[:, 2].copy()
+    a1, a2 = a[:, 1].copy(), a[:, 2].copy()
+    ho = off.shape[0] - 1
+    S = min(max(S, 0), N)
+    for i in range(S):
+        for h in range(H):
+            x = sig[i, h]
+            z0 = zi0[h]
+            z1 = zi1[h]
+            for j in range(LF):
+                y = b0[j] * x + z0[j]
+                z0[j] = b1[j] * x - a1[j] * y + z1[j]
+                z1[j] = b2[j] * x - a2[j] * y
+    for i in range(S, N):
+        for h in range(H):
+            x = sig[i, h]
+            z0 = zi0[h]
+            z1 = zi1[h]
+            oh = off[min(h, ho)]
+            mxh = mx[h]
+            mnh = mn[h]
+            ssqh = ssq[h]
+            for j in range(LF):
+                y = b0[j] * x + z0[j]
+                z0[j] = b1[j] * x - a1[j] * y + z1[j]
+                z1[j] = b2[j] * x - a2[j] * y
+                y += oh[j]
+                mxh[j] = max(mxh[j], y)
+                mnh[j] = min(mnh[j], y)
+                ssqh[j] += y * y
+
+
+def _srs_hist_block_np(sig, b, a, off, S, zi0, zi1, hist):
+    """
+    Non-numba version of :func:`_srs_hist_block`
+
+    Runs one :func:`scipy.signal.lfilter` call per frequency over the
+    whole block so the loop over time is in compiled code. Used when
+    :mod:`numba` is not available.
+    """
+    # filter along rows so that time is contiguous:
+    sig = np.ascontiguousarray(sig.T)
+    for j in range(b.shape[0]):
+        zi = np.column_stack((zi0[:, j], zi1[:, j]))
+        resphist, zf = signal.lfilter(b[j], a[j], sig, axis=1, zi=zi)
+        zi0[:, j], zi1[:, j] = zf[:, 0], zf[:, 1]
+        hist[:, :, j] = resphist[:, S:].T + off[:, j]
+
+
+def _srs_peak_block_np(sig, b, a, off, S, zi0, zi1, mx, mn, ssq):
+    """
+    Non-numba version of :func:`_srs_peak_block`
+
+    Same as :func:`_srs_hist_block_np` except the peaks are
+    accumulated instead of storing the histories.
+    """
+    sig = np.ascontiguousarray(sig.T)
+    for j in range(b.shape[0]):
+        zi = np.column_stack((zi0[:, j], zi1[:, j]))
+        resphist, zf = signal.lfilter(b[j], a[j], sig, axis=1, zi=zi)
+        zi0[:, j], zi1[:, j] = zf[:, 0], zf[:, 1]
+        if S < sig.shape[1]:
+            resphist = resphist[:, S:]
+            resphist += off[:, j, None]
+            mx[:, j] = np.fmax(mx[:, j], resphist.max(axis=1))
+            mn[:, j] = np.fmin(mn[:, j], resphist.min(axis=1))
+            ssq[:, j] += np.einsum("ij,ij->i", resphist, resphist)
+
+
+# kernels used by the 'batch' engine:
+try:
+    import numba
+except ImportError:
+    _batch_hist_block = _srs_hist_block_np
+    _batch_peak_block = _srs_peak_block_np
+else:
+    _batch_hist_block = numba.jit(nopython=True)(_srs_hist_block)
+    _batch_peak_block = numba.jit(nopython=True)(_srs_peak_block)
+
+
+def _finish_peaks(methfunc, mx, mn, ssq, n):
+    """Utility routine for the 'batch' engine of :func:`srs`; returns
+    the ``nfreq x nsignals`` peaks from the accumulators"""
+    if methfunc is _absmeth:
+        pk = np.maximum(abs(mx), abs(mn))
+    elif methfunc is _posmeth:
+        pk = abs(mx)
+    elif methfunc is _negmeth:
+        pk = abs(mn)
+    elif methfunc is _possmeth:
+        pk = mx
+    elif methfunc is _negsmeth:
+        pk = mn
+    else:
+        # methfunc is _rmsmeth
+        pk = np.sqrt(ssq / n)
+    return pk.T.copy()
+
+
+def _dosrs_batch(coeffunc, Q, dT, wn, sig, methfunc, S, stype, icvals, hist):
+    """
+    Utility routine for the 'batch' engine of :func:`srs`
+
+    Computes all frequencies together in one pass over `sig`. If
+    `hist` is not None, the response histories are stored in it.
+    Returns the ``len(wn) x nsignals`` SRS.
+    """
+    N, H = sig.shape
+    LF = len(wn)
+    sig = np.ascontiguousarray(sig, dtype=float)
+    b, a = _batch_coefs(coeffunc, Q, dT, wn)
+    off = _batch_offsets(icvals, wn, stype)
+    zi0 = np.zeros((H, LF))
+    zi1 = np.zeros((H, LF))
+    if hist is not None:
+        _batch_hist_block(sig, b, a, off, S, zi0, zi1, hist)
+        SRSmax = np.empty((LF, H))
+        for j in range(LF):
+            SRSmax[j] = methfunc(hist[:, :, j])
+        return SRSmax
+
+    if methfunc in _PEAK_METHODS:
+        mx = np.full((H, LF), -np.inf)
+        mn = np.full((H, LF), np.inf)
+        ssq = np.zeros((H, LF))
+        _batch_peak_block(sig, b, a, off, S, zi0, zi1, mx, mn, ssq)
+        return _finish_peaks(methfunc, mx, mn, ssq, N - S)
+
+    # user-defined peak function: it needs the histories, so process
+    # a block of frequencies at a time to bound the memory
+    SRSmax = np.empty((LF, H))
+    nf = max(1, _BATCH_HIST_SIZE // max(1, (N - S) * H))
+    for j in range(0, LF, nf):
+        pv = slice(j, min(j + nf, LF))
+        bj = np.ascontiguousarray(b[pv])
+        aj = np.ascontiguousarray(a[pv])
+        offj = np.ascontiguousarray(off[:, pv])
+        nj = bj.shape[0]
+        histj = np.empty((N - S, H, nj))
+        _batch_hist_block(
+            sig, bj, aj, offj, S, np.zeros((H, nj)), np.zeros((H, nj)), histj
+        )
+        for k in range(nj):
+            SRSmax[j + k] = methfunc(histj[:, :, k])
+    return SRSmax
+
+
+def _dosrs_lfilter(coeffunc, Q, dT, wn, sig, methfunc, S, stype, icvals, hist):
+    """
+    Utility routine for :func:`_dosrs_shared`
+
+    Same as :func:`_dosrs_batch` but uses one
+    :func:`scipy.signal.lfilter` call per frequency.
+    """
+    SRSmax = np.empty((len(wn), sig.shape[1]))
+    for j in range(len(wn)):
+        b, a = coeffunc(Q, dT, wn[j])
+        resphist = signal.lfilter(b, a, sig, axis=0)
+        if icvals is not None:
+            if stype == "reldisp":
+                resphist += icvals / wn[j] ** 2
+            elif stype == "pvelo":
+                resphist += icvals / wn[j]
+            else:
+                # stype == 'pacce' or 'absacce'
+                resphist += icvals
+        SRSmax[j] = methfunc(resphist[S:])
+        if hist is not None:
+            hist[:, :, j] = resphist[S:]
+    return SRSmax
+
+
+def _dosrs_shared(args):
+    """Utility routine for processing a range of frequencies in a
+    :class:`SharedExecutor` worker"""
+    (j0, j1, descs, (engine, coeffunc, Q, dT, wn, methfunc, S, stype, icvals)) = args
+    sig, SRSmax, hist = (_attach(desc) for desc in descs)
+    if hist is not None:
+        hist = hist[:, :, j0:j1]
+    dosrs = _dosrs_batch if engine == "batch" else _dosrs_lfilter
+    SRSmax[j0:j1] = dosrs(
+        coeffunc, Q, dT, wn[j0:j1], sig, methfunc, S, stype, icvals, hist
+    )
+
+
+def _dosrs_executor(
+    executor, engine, coeffunc, Q, dT, wn, sig, methfunc, S, stype, icvals, hist
+):
+    """
+    Utility routine for :func:`srs` when an `executor` is provided
+
+    The signal and results are transported through the shared memory
+    buffers of `executor` and each worker processes a range of
+    frequencies. If `hist` is not None, the response histories are
+    copied into it. Returns the ``len(wn) x nsignals`` SRS.
+    """
+    LF = len(wn)
+    H = sig.shape[1]
+    sigd = executor.share("srs_sig", sig)
+    SRSmax, srsd = executor.shared("srs_max", (LF, H))
+    if hist is not None:
+        HIST, histd = executor.shared("srs_hist", hist.shape)
+    else:
+        histd = None
+    args = (engine, coeffunc, Q, dT, wn, methfunc, S, stype, icvals)
+    executor.map(
+        _dosrs_shared,
+        [(j0, j1, (sigd, srsd, histd), args) for j0, j1 in executor.ranges(LF)],
+    )
+    if hist is not None:
+        hist[...] = HIST
+    return SRSmax.copy()
+
+
 def _process_inputs(stype, peak, rolloff, time):
     """Utility routine for srs"""
     coefs = {
@@ -602,6 +1093,13 @@ def _process_parallel(parallel, LF, size, maxcpu, getresp):
     return parallel, ncpu
 
 
+def _process_engine(engine):
+    """Utility routine for srs"""
+    if engine not in ("lfilter", "batch"):
+        raise ValueError("invalid engine option")
+    return engine
+
+
 def _process_ic(sig, ic, stype):
     """Utility routine for srs"""
     doic = 0
@@ -656,6 +1154,8 @@ def srs(
     getresp=False,
     parallel="auto",
     maxcpu=14,
+    engine="lfilter",
+    executor=None,
 ):
     r"""
     Shock response spectrum - response of single DOF systems to base
@@ -827,6 +1327,41 @@ def srs(
         Specifies maximum number of CPUs to use. If None, it is
         internally set to 4/5 of available CPUs (as determined from
         :func:`multiprocessing.cpu_count`.
+    engine : string; optional
+        Selects how the SDOF filters are run:
+
+           ==========   ============================================
+           `engine`     Notes
+           ==========   ============================================
+           'lfilter'    Make one :func:`scipy.signal.lfilter` pass
+                        over the signal(s) per frequency. This is
+                        the only engine that uses `parallel`.
+           'batch'      Run the recursions for all frequencies
+                        together in a single pass over the
+                        signal(s); each time step is read once and
+                        all filter states stay in cache. This is
+                        typically many times faster than 'lfilter'
+                        for a large number of frequencies. This
+                        needs :mod:`numba` (``pip install
+                        pyyeti[numba]``); without it, one
+                        :func:`scipy.signal.lfilter` call per
+                        frequency is used with the peaks accumulated
+                        as the signal is filtered, which is about as
+                        fast as 'lfilter' or somewhat faster.
+                        `parallel` is ignored.
+           ==========   ============================================
+
+        Unless `getresp` is True or `peak` is a function, the 'batch'
+        engine does not store the response histories; it only
+        accumulates the peaks.
+    executor : :class:`SharedExecutor` or None; optional
+        If not None, the frequencies are split up among the
+        persistent worker processes of `executor`, with the signal
+        and results transported through its reusable shared memory
+        buffers. This is done regardless of the size of the problem
+        and of `getresp`; `parallel` and `maxcpu` are ignored. Both
+        engines are supported. Note that `peak` must be picklable
+        (so, not a lambda function).
 
     Returns
     -------
@@ -1021,7 +1556,11 @@ def srs(
             )
         sr = 1.0  # can be anything, just needed for calculations
 
-    parallel, ncpu = _process_parallel(parallel, LF, N * H, maxcpu, getresp)
+    engine = _process_engine(engine)
+    if engine == "batch" or executor is not None:
+        parallel, ncpu = "no", 1
+    else:
+        parallel, ncpu = _process_parallel(parallel, LF, N * H, maxcpu, getresp)
 
     if parallel == "yes":
         # global shared vars will be:
@@ -1069,7 +1608,35 @@ def srs(
     # S is starting time for calcs; only non-zero if residual only:
     S = M if ptr == 2 else 0
 
-    if doic:
+    if executor is not None:
+        SRSmax = _dosrs_executor(
+            executor,
+            engine,
+            coeffunc,
+            Q,
+            1 / sr,
+            wn,
+            sig,
+            methfunc,
+            S,
+            stype,
+            icvals if doic else None,
+            resp["hist"] if getresp else None,
+        )
+    elif engine == "batch":
+        SRSmax = _dosrs_batch(
+            coeffunc,
+            Q,
+            1 / sr,
+            wn,
+            sig,
+            methfunc,
+            S,
+            stype,
+            icvals if doic else None,
+            resp["hist"] if getresp else None,
+        )
+    elif doic:
         if parallel == "yes":
             SIG = (copyToSharedArray(sig), sig.shape)
             ICVALS = (copyToSharedArray(icvals), icvals.shape)
@@ -1136,7 +1703,282 @@ def srs(
     return SRSmax
 
 
-def vrs(spec, freq, Q, linear, Fn=None, getmiles=False, getresp=False):
+def _stream_block(engine, blk, b, a, off, S, zi, mx, mn, ssq):
+    """
+    Utility routine for :func:`srs_stream`
+
+    Runs one block of the signal(s) through all SDOF filters,
+    carrying the filter states in `zi` (``2 x nsignals x nfreq``)
+    and accumulating the peaks from time step `S` of the block on.
+    """
+    if engine == "batch":
+        _batch_peak_block(blk, b, a, off, S, zi[0], zi[1], mx, mn, ssq)
+        return
+    for j in range(b.shape[0]):
+        # lfilter wants the states as: 2 x nsignals
+        resphist, zf = signal.lfilter(b[j], a[j], blk, axis=0, zi=zi[:, :, j])
+        zi[:, :, j] = zf
+        resphist = resphist[S:] + off[:, j]
+        if resphist.shape[0] > 0:
+            mx[:, j] = np.fmax(mx[:, j], resphist.max(axis=0))
+            mn[:, j] = np.fmin(mn[:, j], resphist.min(axis=0))
+            ssq[:, j] += (resphist ** 2).sum(axis=0)
+
+
+def _check_ppc(sr, freq, ppc):
+    """Utility routine for the routines that do not upsample; warns if
+    `ppc` is not met"""
+    mf = np.max(freq)
+    if mf != 0 and sr / mf < ppc:
+        warn(
+            f"Sample rate gives only {sr / mf:.2f} points per cycle at "
+            f"{mf} Hz; upsample the signal to meet `ppc` = {ppc}",
+            RuntimeWarning,
+        )
+
+
+def _filter_block(engine, blk, b, a, off, zi):
+    """
+    Utility routine for :func:`srsmap`
+
+    Same as :func:`_stream_block` except the ``time x nsignals x
+    nfreq`` response histories are returned instead of accumulating
+    peaks.
+    """
+    hist = np.empty((blk.shape[0], blk.shape[1], b.shape[0]))
+    if engine == "batch":
+        _batch_hist_block(blk, b, a, off, 0, zi[0], zi[1], hist)
+        return hist
+    for j in range(b.shape[0]):
+        resphist, zf = signal.lfilter(b[j], a[j], blk, axis=0, zi=zi[:, :, j])
+        zi[:, :, j] = zf
+        hist[:, :, j] = resphist + off[:, j]
+    return hist
+
+
+def srs_stream(
+    blocks,
+    sr,
+    freq,
+    Q,
+    ic="zero",
+    stype="absacce",
+    peak="abs",
+    ppc=12,
+    eqsine=False,
+    time="primary",
+    engine="lfilter",
+):
+    r"""
+    Shock response spectrum of signal(s) supplied block by block
+
+    This is a streaming version of :func:`srs` for signals that are
+    too large to hold in memory: the signal(s) are read one block at
+    a time from `blocks` and the state of every SDOF filter is
+    carried from block to block. The results are the same as from
+    :func:`srs` on the full signal(s) with ``rolloff='none'``.
+
+    Parameters
+    ----------
+    blocks : iterable
+        Iterable (for example, a generator) of consecutive blocks of
+        the base acceleration signal(s). Each block is a 1d or 2d
+        array_like; if 2d, each column is a signal (so each block is
+        ``time x nsignals``). All blocks must have the same number of
+        signals. Blocks may have different lengths.
+    sr : scalar
+        Sample rate.
+    freq : 1d array_like
+        Frequency vector in Hz. This defines the single DOF systems
+        to use.
+    Q : scalar > 0.5
+        Dynamic amplification factor :math:`Q = 1/(2\zeta)` where
+        :math:`\zeta` is the fraction of critical damping.
+    ic : string; optional
+        Specifies how to handle the initial conditions; same as for
+        :func:`srs` except 'mshift' is not available (the mean is not
+        known until the end): 'zero', 'shift' or 'steady'.
+    stype : string; optional
+        Specifies the type of response to recover; see :func:`srs`.
+    peak : string; optional
+        Specifies the type of peak to return; see :func:`srs`. Since
+        the response histories are never stored, `peak` cannot be a
+        function.
+    ppc : scalar; optional
+        Specifies the minimum points per cycle. The signal is not
+        upsampled (that would need the whole signal); instead, a
+        warning is issued if `sr` is too low to meet `ppc` at the
+        highest frequency in `freq`. In that case, upsample the
+        blocks before passing them in or accept the error (see the
+        `ppc` table in :func:`srs`).
+    eqsine : bool; optional
+        If true, resulting peaks are divided by Q.
+    time : string; optional
+        Specifies the time-frame for SRS calculation; see
+        :func:`srs`. For 'total' and 'residual', the extra cycle of
+        the lowest frequency is appended after the last block.
+    engine : string; optional
+        Either 'lfilter' or 'batch'; see :func:`srs`.
+
+    Returns
+    -------
+    sh : 1d or 2d ndarray
+        The SRS results; ``sh.shape = (len(freq), nsignals)``. If the
+        blocks are 1d, `sh` will also be 1d:
+        ``sh.shape = (len(freq),)``.
+
+    Notes
+    -----
+    Only one block (plus the ``nsignals x len(freq)`` filter states
+    and peak accumulators) is in memory at a time, so the signal
+    length is not limited by memory. Larger blocks reduce the
+    per-block overhead.
+
+    Raises
+    ------
+    ValueError
+        If `ic` is 'mshift', if `peak` is not a string, or if
+        `blocks` is empty.
+
+    See also
+    --------
+    :func:`srs`
+
+    Examples
+    --------
+    Compute an SRS of a long signal from a memory-mapped file, 10000
+    points at a time, and compare to :func:`srs`:
+
+    >>> import os
+    >>> import tempfile
+    >>> import numpy as np
+    >>> from pyyeti import srs
+    >>> sr = 1000.0
+    >>> sig = np.random.randn(45000, 2)
+    >>> frq = np.arange(1.0, 80.1)
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     fname = os.path.join(tmpdir, 'sig.npy')
+    ...     np.save(fname, sig)
+    ...     mm = np.load(fname, mmap_mode='r')
+    ...     blocks = (mm[i:i + 10000] for i in range(0, len(mm), 10000))
+    ...     sh = srs.srs_stream(blocks, sr, frq, 20)
+    ...     del mm, blocks
+    >>> np.allclose(sh, srs.srs(sig, sr, frq, 20, rolloff='none'))
+    True
+    """
+    if ic not in ("zero", "shift", "steady"):
+        raise ValueError("`ic` must be one of 'zero', 'shift', or 'steady'")
+    if not isinstance(peak, str):
+        raise ValueError("`peak` must be a string for :func:`srs_stream`")
+    (coeffunc, methfunc, rollfunc, ptr) = _process_inputs(stype, peak, "none", time)
+    engine = _process_engine(engine)
+    freq = np.atleast_1d(freq)
+    wn = 2 * pi * freq
+    LF = len(freq)
+
+    _check_ppc(sr, freq, ppc)
+    b, a = _batch_coefs(coeffunc, Q, 1 / sr, wn)
+    # S is starting time for calcs; only non-zero if residual only:
+    S = 0
+    n = 0
+    for blk in blocks:
+        blk = np.atleast_1d(blk)
+        if blk.shape[0] == 0:
+            # nothing to filter; also, the initial conditions are
+            # taken from the first non-empty block:
+            continue
+        if n == 0:
+            oneD = blk.ndim == 1
+            H = 1 if oneD else blk.shape[1]
+            zi = np.zeros((2, H, LF))
+            mx = np.full((H, LF), -np.inf)
+            mn = np.full((H, LF), np.inf)
+            ssq = np.zeros((H, LF))
+            blk = np.asarray(blk, dtype=float).reshape(-1, H)
+            blk, s1, doic, icvals = _process_ic(blk, ic, stype)
+            off = _batch_offsets(icvals if doic else None, wn, stype)
+        else:
+            blk = np.asarray(blk, dtype=float).reshape(-1, H)
+            if ic != "zero":
+                blk = blk - s1
+        blk = np.ascontiguousarray(blk)
+        S = blk.shape[0] if ptr == 2 else 0
+        _stream_block(engine, blk, b, a, off, S, zi, mx, mn, ssq)
+        n += blk.shape[0]
+
+    if n == 0:
+        raise ValueError("`blocks` is empty")
+
+    M = n
+    if ptr:
+        tail, nzeros = _add_one_cycle(np.empty((0, H)), freq, sr, H, ic, s1)
+        _stream_block(engine, tail, b, a, off, 0, zi, mx, mn, ssq)
+        n += nzeros
+    if ptr == 2:
+        n -= M
+
+    SRSmax = _finish_peaks(methfunc, mx, mn, ssq, n)
+    if oneD:
+        SRSmax = SRSmax.ravel()
+    if eqsine:
+        SRSmax /= Q
+    return SRSmax
+
+
+def _vrs_rows(i0, i1, Fn, freq, df, zeta, psdfull, z_vrs, psd_vrs):
+    """Utility routine for :func:`vrs`; computes rows `i0` to `i1` of
+    `z_vrs` and, if it is not None, `psd_vrs`"""
+    for i in range(i0, i1):
+        p = freq / Fn[i]
+        p2z2 = (2 * zeta * p) ** 2
+        if psd_vrs is not None:
+            t = ((1 + p2z2) / ((1 - p ** 2) ** 2 + p2z2)) * psdfull.T
+            psd_vrs[i] = t  # npsds x len(freq)
+            z_vrs[i] = np.sqrt(np.sum(df * t, axis=1))
+        else:
+            t = ((1 + p2z2) / ((1 - p ** 2) ** 2 + p2z2) * df) * psdfull.T
+            z_vrs[i] = np.sqrt(np.sum(t, axis=1))
+
+
+def _dovrs_shared(args):
+    """Utility routine for processing a range of frequencies in a
+    :class:`SharedExecutor` worker for :func:`vrs`"""
+    (i0, i1, descs, zeta) = args
+    Fn, freq, df, psdfull, z_vrs, psd_vrs = (_attach(desc) for desc in descs)
+    _vrs_rows(i0, i1, Fn, freq, df, zeta, psdfull, z_vrs, psd_vrs)
+
+
+def _dovrs_executor(executor, Fn, freq, df, zeta, psdfull, getresp):
+    """
+    Utility routine for :func:`vrs` when an `executor` is provided;
+    returns `z_vrs` and, if `getresp` is True, `psd_vrs` (else None)
+    """
+    npsds = psdfull.shape[1]
+    descs = [
+        executor.share("vrs_Fn", Fn),
+        executor.share("vrs_freq", freq),
+        executor.share("vrs_df", df),
+        executor.share("vrs_psd", psdfull),
+    ]
+    z_vrs, desc = executor.shared("vrs_z", (len(Fn), npsds))
+    descs.append(desc)
+    if getresp:
+        psd_vrs, desc = executor.shared("vrs_resp", (len(Fn), npsds, len(freq)))
+        descs.append(desc)
+    else:
+        descs.append(None)
+    executor.map(
+        _dovrs_shared,
+        [(i0, i1, descs, zeta) for i0, i1 in executor.ranges(len(Fn))],
+    )
+    if getresp:
+        return z_vrs.copy(), psd_vrs.copy()
+    return z_vrs.copy(), None
+
+
+def vrs(
+    spec, freq, Q, linear, Fn=None, getmiles=False, getresp=False, executor=None
+):
     r"""
     Vibration response specturm - RMS response of single DOF systems
     to base PSD(s).
@@ -1186,6 +2028,9 @@ def vrs(spec, freq, Q, linear, Fn=None, getmiles=False, getresp=False):
         If True, return the PSD response curves at the frequency(s) in
         `Fn`. Note: internally, this will also set `getmiles` to
         True.
+    executor : :class:`SharedExecutor` or None; optional
+        If not None, the frequencies in `Fn` are split up among the
+        persistent worker processes of `executor`.
 
     Returns
     -------
@@ -1368,30 +2213,23 @@ def vrs(spec, freq, Q, linear, Fn=None, getmiles=False, getresp=False):
             z_miles = z_miles.ravel()
 
     # Compute VRS at each frequency
-    z_vrs = np.empty((len(Fn), npsds))
     zeta = 1 / 2 / Q
+    if executor is not None:
+        z_vrs, psd_vrs = _dovrs_executor(
+            executor, Fn, freq, df, zeta, psdfull, getresp
+        )
+    else:
+        z_vrs = np.empty((len(Fn), npsds))
+        psd_vrs = np.empty((len(Fn), npsds, len(freq))) if getresp else None
+        _vrs_rows(0, len(Fn), Fn, freq, df, zeta, psdfull, z_vrs, psd_vrs)
+
+    if PSD.ndim == 1:
+        z_vrs = z_vrs.ravel()
     if getresp:
-        psd_vrs = np.empty((len(Fn), npsds, len(freq)))
-        for i, fn in enumerate(Fn):
-            p = freq / fn
-            p2z2 = (2 * zeta * p) ** 2
-            t = ((1 + p2z2) / ((1 - p ** 2) ** 2 + p2z2)) * psdfull.T
-            psd_vrs[i] = t  # npsds x len(freq)
-            z_vrs[i] = np.sqrt(np.sum(df * t, axis=1))
         resp = {}
         resp["f"] = freq
         resp["psd"] = psd_vrs
-        if PSD.ndim == 1:
-            z_vrs = z_vrs.ravel()
         return z_vrs, z_miles, resp
-
-    for i, fn in enumerate(Fn):
-        p = freq / fn
-        p2z2 = (2 * zeta * p) ** 2
-        t = ((1 + p2z2) / ((1 - p ** 2) ** 2 + p2z2) * df) * psdfull.T
-        z_vrs[i] = np.sqrt(np.sum(t, axis=1))
-    if PSD.ndim == 1:
-        z_vrs = z_vrs.ravel()
     if getmiles:
         return z_vrs, z_miles
     return z_vrs
@@ -1598,7 +2436,90 @@ def srs_frf(frf, frf_frq, srs_frq, Q, getresp=False):
     return shk
 
 
-def srsmap(timeslice, tsoverlap, sig, sr, freq, Q, wep=0, **srsargs):
+def _srsmap_incremental(
+    timeslice,
+    tsoverlap,
+    sig,
+    sr,
+    freq,
+    Q,
+    ic="zero",
+    stype="absacce",
+    peak="abs",
+    ppc=12,
+    eqsine=False,
+    engine="lfilter",
+):
+    """
+    Utility routine for :func:`srsmap` when `incremental` is True
+
+    The signal is filtered once, in chunks, carrying the filter
+    states. Peak accumulators are kept for each interval between
+    consecutive slice boundaries so that the overlapped portions of
+    the slices are processed only once.
+    """
+    if not isinstance(peak, str):
+        raise ValueError("`peak` must be a string when `incremental` is True")
+    (coeffunc, methfunc, rollfunc, ptr) = _process_inputs(
+        stype, peak, "none", "primary"
+    )
+    engine = _process_engine(engine)
+    sig = np.atleast_1d(sig)
+    if sig.ndim > 1:
+        if max(sig.shape) < sig.size:
+            raise ValueError("`sig` must be a vector")
+        sig = sig.ravel()
+    freq = np.atleast_1d(freq)
+    wn = 2 * pi * freq
+    LF = len(freq)
+    _check_ppc(sr, freq, ppc)
+
+    ntimeslice, inc, tlen, t = dsp._slice_layout(timeslice, tsoverlap, sr, sig.size)
+    starts = np.arange(tlen) * inc
+    nsig = starts[-1] + ntimeslice
+    sig, s1, doic, icvals = _process_ic(sig[:nsig].reshape(-1, 1), ic, stype)
+    sig = np.ascontiguousarray(sig, dtype=float)
+
+    b, a = _batch_coefs(coeffunc, Q, 1 / sr, wn)
+    off = _batch_offsets(icvals if doic else None, wn, stype)
+    zi = np.zeros((2, 1, LF))
+
+    # intervals between all slice boundaries and chunk boundaries:
+    nchunk = max(ntimeslice, _MAP_CHUNK_SIZE // LF)
+    bounds = np.unique(
+        np.hstack((starts, starts + ntimeslice, np.arange(0, nsig, nchunk)))
+    )
+    mx = np.empty((len(bounds) - 1, LF))
+    mn = np.empty((len(bounds) - 1, LF))
+    ssq = np.empty((len(bounds) - 1, LF))
+    k = 0
+    for j in range(0, nsig, nchunk):
+        hist = _filter_block(engine, sig[j : j + nchunk], b, a, off, zi)[:, 0]
+        idx = bounds[:-1][(bounds[:-1] >= j) & (bounds[:-1] < j + nchunk)] - j
+        n = len(idx)
+        mx[k : k + n] = np.maximum.reduceat(hist, idx, axis=0)
+        mn[k : k + n] = np.minimum.reduceat(hist, idx, axis=0)
+        ssq[k : k + n] = np.add.reduceat(hist ** 2, idx, axis=0)
+        k += n
+
+    # combine the intervals for each slice:
+    mxs = np.empty((tlen, LF))
+    mns = np.empty((tlen, LF))
+    ssqs = np.empty((tlen, LF))
+    i0 = np.searchsorted(bounds, starts)
+    i1 = np.searchsorted(bounds, starts + ntimeslice)
+    for j in range(tlen):
+        mxs[j] = mx[i0[j] : i1[j]].max(axis=0)
+        mns[j] = mn[i0[j] : i1[j]].min(axis=0)
+        ssqs[j] = ssq[i0[j] : i1[j]].sum(axis=0)
+
+    pk = _finish_peaks(methfunc, mxs, mns, ssqs, ntimeslice)
+    if eqsine:
+        pk /= Q
+    return pk, t, freq
+
+
+def srsmap(timeslice, tsoverlap, sig, sr, freq, Q, wep=0, incremental=False, **srsargs):
     r"""
     Make a shock response spectral map ('waterfall') over time and
     frequency.
@@ -1630,10 +2551,24 @@ def srsmap(timeslice, tsoverlap, sig, sr, freq, Q, wep=0, **srsargs):
         Argument for the :func:`pyyeti.dsp.windowends`; specifies the
         window-ends portion. Each time slice is passed through
         :func:`pyyeti.dsp.windowends` if wep > 0.
+    incremental : bool; optional
+        If True, the signal is filtered only once with the filter
+        states carried from slice to slice, so overlapped portions of
+        the slices are not recomputed and the cost grows only with the
+        signal length. In this mode, each column of the map is the
+        peak of the SDOF responses to the entire signal within that
+        slice's time window (rather than the response to the slice
+        alone starting from rest). Therefore, `wep` must be 0 and
+        only the `ic`, `stype`, `peak` (string only), `ppc`,
+        `eqsine`, and `engine` options of :func:`srs` are
+        available. As with :func:`srs_stream`, there is no
+        upsampling; a warning is issued if `ppc` is not met.
     **srsargs : miscellaneous options for :func:`srs`
         Allows the setting of `ic`, `stype`, `peak`, `eqsine`, etc
         options for :func:`srs`.  See :func:`srs` for more
-        information.
+        information. In particular, passing an `executor`
+        (:class:`SharedExecutor`) lets every time slice reuse the
+        same worker processes and shared memory buffers.
 
     Returns
     -------
@@ -1708,6 +2643,10 @@ def srsmap(timeslice, tsoverlap, sig, sr, freq, Q, wep=0, **srsargs):
         >>> _ = ax.set_zlabel('Amplitude')
         >>> _ = plt.title(ttl)
     """
+    if incremental:
+        if wep:
+            raise ValueError("`wep` must be 0 when `incremental` is True")
+        return _srsmap_incremental(timeslice, tsoverlap, sig, sr, freq, Q, **srsargs)
     return dsp.waterfall(
         sig,
         sr,
@@ -96,6 +96,7 @@ def run_setup(with_binary):
         license="BSD",
         author="Tim Widrick",
         install_requires=install_requires,
+        extras_require={"numba": ["numba"]},
         author_email="twmacro@gmail.com",
         description=("Tools mostly related to structural dynamics"),
         long_description=long_description,
@@ -617,6 +617,68 @@ def test_cbcheck_indeterminate_rb_norm2():
     compare_cbcheck_output(s, sy)
 
 
+def test_cbcheck_session():
+    nas = op2.rdnas2cam("tests/nas2cam_csuper/nas2cam")
+    se = 101
+    maa = nas["maa"][se]
+    kaa = nas["kaa"][se]
+    pv = np.any(maa, axis=0)
+    pv = np.ix_(pv, pv)
+    maa = maa[pv]
+    kaa = kaa[pv]
+
+    uset = nas["uset"][se]
+    bset = n2p.mksetpv(uset, "p", "b")
+    usetb = nas["uset"][se].iloc[bset]
+    b = np.nonzero(n2p.mksetpv(uset, "a", "b"))[0]
+    bref = n2p.mkdofpv(usetb, "b", [[3, 12356], [19, 3]])[0]
+
+    outs = []
+    for kwargs in ({}, dict(uref=[600, 150, 150])):
+        with StringIO() as f:
+            cb.cbcheck(f, maa, kaa, b, b[:6], usetb, em_filt=2, **kwargs)
+            s1 = f.getvalue()
+        with StringIO() as f:
+            cb.cbcheck(f, maa, kaa, b, bref, usetb, em_filt=2, **kwargs)
+            s2 = f.getvalue()
+        outs.append((s1, s2))
+
+    chk = cb.CBCheck(maa, kaa, b, usetb)
+    with StringIO() as f:
+        out = chk.run(f, b[:6], em_filt=2)
+        assert f.getvalue() == outs[0][0]
+    eig = chk._eig
+
+    # different reference; eigensolution is reused:
+    with StringIO() as f:
+        out2 = chk.run(f, bref, em_filt=2, ncpu=1)
+        assert f.getvalue() == outs[0][1]
+    assert chk._eig is eig
+    assert len(chk._rbs) == 2
+    assert len(chk._rbg) == 1
+    assert np.allclose(out.rbg, out2.rbg)
+
+    # different geometry reference; only the rbg is new:
+    for bref_, s in zip((b[:6], bref), outs[1]):
+        with StringIO() as f:
+            chk.run(f, bref_, uref=[600, 150, 150], em_filt=2)
+            assert f.getvalue() == s
+    assert chk._eig is eig
+    assert len(chk._rbs) == 2
+    assert len(chk._rbg) == 2
+
+    # cached results are not modified by the caller:
+    out.rbs[:] = 0.0
+    with StringIO() as f:
+        out3 = chk.run(f, b[:6], em_filt=2)
+        assert f.getvalue() == outs[0][0]
+    assert abs(out3.rbs).max() > 0.0
+
+    assert_raises(ValueError, cb.CBCheck, maa, kaa, b, usetb.iloc[:-6])
+    with StringIO() as f:
+        assert_raises(ValueError, chk.run, f, b[:5])
+
+
 def test_rbmultchk():
     nas = op2.rdnas2cam("tests/nas2cam_csuper/nas2cam")
     se = 101
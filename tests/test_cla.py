@@ -684,6 +684,17 @@ def owlab(pth):
             results.solvepsd(nas, caseid, DR, fs, F, T, freq)
             results.psd_data_recovery(caseid, DR, len(rnd), j)
 
+        # batched solutions give the same results:
+        for batch in (True, 2):
+            results_b = DR.prepare_results(sc["mission"], event)
+            for j, ff in enumerate(rnd):
+                caseid = "{} {:2d}".format(event, j + 1)
+                F = interp.interp1d(ff[:, 0], ff[:, 1:].T, axis=1, fill_value=0.0)(freq)
+                results_b.solvepsd(nas, caseid, DR, fs, F, T, freq, batch=batch)
+                results_b.psd_data_recovery(caseid, DR, len(rnd), j)
+            for name in results:
+                assert np.allclose(results[name].ext, results_b[name].ext)
+
         # save results:
         cla.save("results.pgz", results)
         results.srs_plots(Q=10, direc="srs_cases", showall=True, plot=plt.semilogy)
@@ -3606,6 +3617,36 @@ def test_solvepsd_ltmf():
 
     assert np.allclose(rss_md, rss_ma)
 
+    # --------------------------------------------
+    # uncorrelated forces as a (diagonal) cross-spectral density
+    # matrix should give the same answer:
+    fpsd3 = np.zeros((2, 2, n))
+    fpsd3[[0, 1], [0, 1]] = fpsd
+    t_frc = np.eye(stiff.shape[0])[fpv].T
+    DR.Vars[0]["ltmf"] = DR.Vars[0]["ltmf_keep"][:, fpv]
+    for batch in (False, True):
+        results3 = DR.prepare_results("Spring & Damper Forces", event)
+        results3.solvepsd(nas, caseid, DR, ts, fpsd3, t_frc, freq, batch=batch)
+        results3.psd_data_recovery(caseid, DR, 1, 0)
+        assert np.allclose(results["fs_md"].ext, results3["fs_md"].ext)
+        assert np.allclose(results["fs_ma"].ext, results3["fs_ma"].ext)
+
+    # fully correlated forces (fpsd[1] = 1.2*fpsd[0]): same as one
+    # force applied at both DOF:
+    fpsd3[[0, 1], [1, 0]] = np.sqrt(fpsd[0] * fpsd[1])
+    results3 = DR.prepare_results("Spring & Damper Forces", event)
+    results3.solvepsd(nas, caseid, DR, ts, fpsd3, t_frc, freq, batch=True)
+    results3.psd_data_recovery(caseid, DR, 1, 0)
+
+    w = np.array([[1.0], [np.sqrt(1.2)]])
+    DR.Vars[0]["ltmf"] = DR.Vars[0]["ltmf_keep"][:, fpv] @ w
+    results4 = DR.prepare_results("Spring & Damper Forces", event)
+    results4.solvepsd(nas, caseid, DR, ts, fpsd[:1], t_frc @ w, freq)
+    results4.psd_data_recovery(caseid, DR, 1, 0)
+    assert np.allclose(results3["fs_md"].ext, results4["fs_md"].ext)
+    assert np.allclose(results3["fs_ma"].ext, results4["fs_ma"].ext)
+    assert not np.allclose(results3["fs_md"].ext, results["fs_md"].ext)
+
     # --------------------------------------------
     # rerun with a zero psd force for more testing:
     fpsd = np.zeros((3, n))
@@ -3723,3 +3764,95 @@ def test_rptpct_all_na():
     finally:
         # pass
         shutil.rmtree("./temp_cla2", ignore_errors=True)
+
+
+def _run_cases_solver(ts, forces, uf_reds, case, DR, nas):
+    return {uf_reds: ts.tsolve(forces[case])}
+
+
+def test_run_cases():
+    import functools
+
+    (mass, damp, stiff, drms1, uf_reds, defaults, DR) = mass_spring_system()
+    DR.Info["kc_forces"].srsfrq = np.arange(1.0, 30.0)
+    DR.Info["kc_forces"].srsQs = (10, 25)
+    DR.Info["kc_forces"].srspv = np.arange(3)
+    DR.Info["kc_forces"].srsopts = {}
+    DR.Info["kc_forces"].srsconv = 1.0
+    DR.Info["kc_forces"].srsunits = "N"
+    h = 0.01
+    t = np.arange(0, 1.0, h)
+    np.random.seed(3)
+    forces = {f"FFN {i}": np.random.randn(3, len(t)) for i in range(7)}
+    cases = list(forces)
+    ts = ode.SolveUnc(mass, damp, stiff, h, pre_eig=True)
+    solver = functools.partial(_run_cases_solver, ts, forces, uf_reds)
+
+    results = DR.prepare_results("Spring & Damper Forces", "Steps")
+    for j, case in enumerate(cases):
+        sol = solver(case, DR, None)
+        results.time_data_recovery(sol, None, case, DR, len(cases), j)
+
+    res1 = DR.prepare_results("Spring & Damper Forces", "Steps")
+    res1.run_cases(cases, solver, DR, None)
+    with srs.SharedExecutor(ncpu=2) as ex:
+        res2 = DR.prepare_results("Spring & Damper Forces", "Steps")
+        res2.run_cases(cases, solver, DR, None, executor=ex)
+        # second call uses new payload:
+        res3 = DR.prepare_results("Spring & Damper Forces", "Steps")
+        res3.run_cases(cases[:3], solver, DR, None, executor=ex)
+        assert_raises(
+            ValueError, res3.run_cases, cases[3:], solver, DR, None, executor=ex
+        )
+
+    for res in (res1, res2):
+        r0 = results["kc_forces"]
+        r = res["kc_forces"]
+        for attr in ("ext", "ext_x", "mx", "mn", "mx_x", "mn_x", "hist", "time"):
+            assert np.all(getattr(r, attr) == getattr(r0, attr))
+        for attr in ("cases", "maxcase", "mincase"):
+            assert getattr(r, attr) == getattr(r0, attr)
+        for q in (10, 25):
+            assert np.all(r.srs.srs[q] == r0.srs.srs[q])
+            assert np.all(r.srs.ext[q] == r0.srs.ext[q])
+        assert r.srs.type == r0.srs.type
+    assert res3["kc_forces"].cases == cases[:3]
+    assert np.all(res3["kc_forces"].hist == results["kc_forces"].hist[:3])
+
+    assert_raises(ValueError, res1.run_cases, cases, solver, DR, None, domain="bad")
+
+
+def test_get_drfunc_cache():
+    fname = "temp_drfuncs.py"
+    with open(fname, "w") as f:
+        f.write("def func(sol, nas, Vars, se):\n    return 1\n")
+    try:
+        f1 = cla.get_drfunc(fname, "func")
+        assert f1(None, None, None, None) == 1
+        # cached:
+        assert cla.get_drfunc(fname, "func") is f1
+        f2, f2psd = cla.get_drfunc(fname, "func", get_psd=True)
+        assert f2 is f1 and f2psd is None
+
+        # explicit invalidation:
+        cla.clear_drfunc_cache(fname)
+        f3 = cla.get_drfunc(fname, "func")
+        assert f3 is not f1
+        assert cla.get_drfunc(fname, "func") is f3
+
+        # a changed file is reloaded automatically:
+        with open(fname, "w") as f:
+            f.write("def func(sol, nas, Vars, se):\n    return 22\n")
+        f4 = cla.get_drfunc(fname, "func")
+        assert f4(None, None, None, None) == 22
+
+        # string functions are compiled once:
+        s1 = cla.get_drfunc(None, "sol + 1")
+        assert s1 is cla.get_drfunc(None, "sol + 1")
+        assert s1(1, None, None, None) == 2
+        cla.clear_drfunc_cache()
+        assert s1 is not cla.get_drfunc(None, "sol + 1")
+        assert cla.get_drfunc(fname, "func") is not f4
+    finally:
+        os.remove(fname)
+    assert_raises(FileNotFoundError, cla.get_drfunc, fname, "func")
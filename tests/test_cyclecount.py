@@ -164,3 +164,143 @@ def test_sigcount_2():
     assert np.allclose(table.values, [[12.0, 12.5], [12.5, 12.5]])
     assert np.allclose(ampb, [0.500, 49.500, 98.598])
     assert np.allclose(aveb, [-0.500, 0.000, 0.501])
+
+
+def _cumcount_brute(sig, ampbins):
+    rf = rainflow(sig[cyclecount.findap(sig)])
+    ampmax = rf[:, 0].max()
+    amps = ampmax * (np.arange(ampbins, dtype=float) / ampbins)
+    count = np.array([rf[rf[:, 0] >= a, 2].sum() for a in amps])
+    return amps, count, ampmax
+
+
+def test_cumcount():
+    np.random.seed(1)
+    sig = np.random.randn(5000).cumsum()
+    sig[100:110] = sig[100]  # flat spots
+    sig[-5:] = sig[-6]
+    sigs = (
+        sig,
+        np.round(np.random.randn(500)),
+        [-2, 1, -3, 5, -1, 3, -4, 4, -2],
+        [1, 2, 3, 4, 4, -2, -2, 0],
+        [1, 2, 3, 4, 4, -2, -2, -2],
+        [1.0, 3.0],
+    )
+    have_numba = cyclecount._HAVE_NUMBA
+    try:
+        for numba in (have_numba, False):
+            cyclecount._HAVE_NUMBA = numba
+            for s in sigs:
+                s = np.array(s, dtype=float)
+                res = cyclecount.cumcount(s, 50)
+                sb = _cumcount_brute(s, 50)
+                for r, rb in zip(res, sb):
+                    assert np.all(r == rb)
+
+            amps, count, ampmax = cyclecount.cumcount([1.0, 1.0, 1.0], 3)
+            assert ampmax == 0.0
+            assert np.all(amps == 0.0)
+            assert np.all(count == 0.0)
+    finally:
+        cyclecount._HAVE_NUMBA = have_numba
+
+    amps, count, ampmax = cyclecount.cumcount(sig, [0.0, 1.0, 1e6])
+    assert np.all(amps == [0.0, 1.0, 1e6])
+    assert count[0] > count[1] > count[2] == 0.0
+
+
+def test_rainflow_multi():
+    np.random.seed(2)
+    sig = np.random.randn(1000, 13).cumsum(axis=0)
+    sig[:, 5] = 1.0  # no cycles
+    sig[100:120, 3] = sig[100, 3]
+    for ncpu in (1, 3, None):
+        rf, rfptr = cyclecount.rainflow_multi(sig, ncpu=ncpu)
+        assert rfptr.shape == (14,)
+        for i in range(13):
+            y = sig[:, i]
+            pk = y[cyclecount.findap(y)]
+            rfi = rf[rfptr[i] : rfptr[i + 1]]
+            if i == 5:
+                assert rfi.shape == (0, 3)
+            else:
+                assert np.all(rfi == rainflow(pk))
+        rf2, rfptr2 = cyclecount.rainflow_multi(sig.T, axis=1, ncpu=ncpu)
+        assert np.all(rf2 == rf)
+        assert np.all(rfptr2 == rfptr)
+    assert_raises(ValueError, cyclecount.rainflow_multi, sig[:, 0])
+
+    # the py_rain routines, with and without the fast peak search:
+    from unittest import mock
+    from pyyeti.rainflow import py_rain
+
+    for have_numba in (True, False):
+        with mock.patch.multiple(cyclecount, rain=py_rain, _HAVE_NUMBA=have_numba):
+            rf2, rfptr2 = cyclecount.rainflow_multi(sig, ncpu=2)
+        assert np.all(rf2 == rf)
+        assert np.all(rfptr2 == rfptr)
+
+    # no channels:
+    rf, rfptr = cyclecount.rainflow_multi(sig[:, :0])
+    assert rf.shape == (0, 3)
+    assert np.all(rfptr == [0])
+
+
+def test_rainflow_csr():
+    from pyyeti.rainflow import py_rain
+
+    peaks = [-2, 1, -3, 5, -1, 3, -4, 4, -2, 0, 2, 1]
+    indptr = [0, 9, 9, 10, 12]
+    rf, rfptr = py_rain.rainflow_csr(peaks, indptr)
+    assert np.all(rfptr == [0, 7, 7, 7, 8])
+    assert np.all(rf[:7] == rainflow(peaks[:9]))
+    assert np.all(rf[7:] == rainflow(peaks[10:]))
+    assert_raises(ValueError, py_rain.rainflow_csr, peaks, [0, 9])
+    assert_raises(ValueError, py_rain.rainflow_csr, peaks, [1, 12])
+    assert_raises(ValueError, py_rain.rainflow_csr, peaks, [0, 10, 9, 12])
+    assert_raises(ValueError, py_rain.rainflow_csr, [peaks], [0, 12])
+
+
+def test_findap_csr():
+    from pyyeti.rainflow import py_rain
+
+    np.random.seed(4)
+    sig = np.random.randn(9, 300).round(1).cumsum(axis=1)
+    sig[1] = 2.0  # constant
+    sig[2, 100:] = sig[2, 100]  # flat end
+    sig[3, -2:] = sig[3, -3]
+    sig[4, :50] = sig[4, 50]  # flat start
+    sig[5, 1::2] = sig[5, ::2] + 1e-9  # below tolerance
+    sig[6, :] = np.arange(300)  # monotonic
+    findaps = [py_rain.findap_csr, py_rain._findap_csr]
+    try:
+        from pyyeti.rainflow import c_rain
+    except ImportError:
+        pass
+    else:
+        findaps.append(c_rain.findap_csr)
+    for tol in (1e-6, 0.3):
+        for func in findaps:
+            if func is py_rain._findap_csr:
+                # run the plain Python version, even with numba:
+                func = getattr(func, "py_func", func)
+                peaks = np.empty(sig.size)
+                indptr = np.empty(10, np.intp)
+                n = func(sig, tol, peaks, indptr)
+                peaks = peaks[:n]
+            else:
+                peaks, indptr = func(sig, tol)
+            assert indptr[0] == 0 and indptr[-1] == peaks.size
+            for i, y in enumerate(sig):
+                pk = y[cyclecount.findap(y, tol)]
+                assert np.all(peaks[indptr[i] : indptr[i + 1]] == pk)
+        # one value, no channels and no values:
+        for func in (f for f in findaps if f is not py_rain._findap_csr):
+            peaks, indptr = func([[3.0]], tol)
+            assert np.all(peaks == [3.0]) and np.all(indptr == [0, 1])
+            peaks, indptr = func(np.zeros((0, 5)), tol)
+            assert peaks.size == 0 and np.all(indptr == [0])
+            peaks, indptr = func(np.zeros((2, 0)), tol)
+            assert peaks.size == 0 and np.all(indptr == [0, 0, 0])
+            assert_raises(ValueError, func, sig[0], tol)
@@ -146,3 +146,24 @@ def test_fdepsd_error():
     q = 20
     assert_raises(ValueError, fdepsd, sig, sr, freq, q)
     assert_raises(ValueError, fdepsd, freq, sr, freq, q, "badresp")
+
+
+def test_fdepsd_executor():
+    from pyyeti import srs
+
+    TF = 10
+    spec = np.array([[20, 1.0], [50, 1.0]])
+    sig, sr = psd.psd2time(
+        spec, ppc=10, fstart=20, fstop=50, df=1 / TF, winends=dict(portion=10)
+    )
+    freq = np.arange(30.0, 50.1, 2.0)
+    q = 25
+    fde_no = fdepsd(sig, sr, freq, q, parallel="no")
+    with srs.SharedExecutor(ncpu=2) as ex:
+        fde_ex = fdepsd(sig, sr, freq, q, executor=ex)
+        # second call reuses pool and buffers:
+        fde_ex2 = fdepsd(sig[:-100], sr, freq, q, executor=ex)
+    fde_no2 = fdepsd(sig[:-100], sr, freq, q, parallel="no")
+    compare(fde_no, fde_ex)
+    compare(fde_no2, fde_ex2)
+    assert fde_ex.ncpu == 2
@@ -2,6 +2,7 @@ import inspect
 import numpy as np
 import math
 import scipy.linalg as la
+import scipy.sparse as sp
 from scipy.io import matlab
 import io
 import os
@@ -810,6 +811,45 @@ def test_getcoordinates():
     assert np.allclose(n2p.getcoordinates(uset, 100, 1), [R, th, phi])
 
 
+def test_getcoordinates_many():
+    cylcoord = np.array([[1, 2, 0], [0, 0, 0], [1, 0, 0], [0, 1, 0]])
+    sphcoord = np.array([[2, 3, 0], [3, -1, 2], [3, 1, 2], [4, -1, 2]])
+    rctcoord = np.array([[3, 1, 0], [-2, -8, 9], [-2, -8, 10], [0, -8, 9]])
+    # many grids in each coordinate system, added in one call:
+    xyz = np.random.default_rng(1).uniform(1.0, 50.0, (60, 3))
+    cids = np.arange(60) % 4
+    uset0 = n2p.addgrid(
+        None,
+        [1001, 1002, 1003],
+        "b",
+        0,
+        [[0, 0, 0]] * 3,
+        [cylcoord, sphcoord, rctcoord],
+    )
+    uset = n2p.addgrid(uset0, np.arange(1, 61), "b", cids, xyz, cids)
+    rb = n2p.rbgeom_uset(uset, 1001)
+    for i, (gid, cid, loc) in enumerate(zip(np.arange(1, 61), cids, xyz)):
+        uset1 = n2p.addgrid(uset0, gid, "b", cid, loc, cid)
+        assert np.allclose(uset.iloc[18 + 6 * i : 24 + 6 * i], uset1.iloc[18:])
+        assert np.allclose(
+            rb[18 + 6 * i : 24 + 6 * i], n2p.rbgeom_uset(uset1, 1001)[18:]
+        )
+
+    # all grid locations converted at once match one at a time:
+    basic = uset.iloc[18::6, 1:].values
+    for cid in range(4):
+        coords = n2p.getcoordinates(uset, basic, cid)
+        assert coords.shape == (60, 3)
+        for i in range(60):
+            assert np.allclose(coords[i], n2p.getcoordinates(uset, i + 1, cid))
+        assert np.allclose(coords[cids == cid], xyz[cids == cid])
+        # a single location, as a vector or 1 x 3, gives a vector:
+        for loc in (basic[0], basic[:1]):
+            c0 = n2p.getcoordinates(uset, loc, cid)
+            assert c0.shape == (3,)
+            assert np.allclose(c0, coords[0])
+
+
 def test_rbcoords():
     assert_raises(ValueError, n2p.rbcoords, np.random.randn(3, 4))
     assert_raises(ValueError, n2p.rbcoords, np.random.randn(13, 6))
@@ -859,6 +899,54 @@ def test_mksetpv_mkdofpv():
     assert np.all(np.array([[100, 3], [200, 5], [300, 1], [300, 4]]) == dof)
 
 
+def test_usetindex():
+    uset = gettestuset()
+    ui = n2p.UsetIndex(uset)
+    assert n2p.UsetIndex(ui).uset is uset
+    assert len(ui) == uset.shape[0]
+    assert np.all(ui.iddof == uset.iloc[:, :0].reset_index().values)
+    for major, minor in (("p", "b"), ("g", "m"), ("f", "a"), ("p", "r+c+q")):
+        assert np.all(n2p.mksetpv(ui, major, minor) == n2p.mksetpv(uset, major, minor))
+    assert_raises(ValueError, n2p.mksetpv, ui, "m", "b")
+    # cached set vectors cannot be modified:
+    pv = ui.setpv("a")
+    assert ui.setpv(n2p.mkusetmask("a")) is pv
+    assert_raises(ValueError, pv.__setitem__, 0, True)
+
+    dof = [[100, 3], [200, 5], [300, 16], [300, 4]]
+    for nasset in ("p", "f", "a"):
+        pv1, dof1 = n2p.mkdofpv(uset, nasset, dof, strict=False)
+        pv2, dof2 = n2p.mkdofpv(ui, nasset, dof, strict=False)
+        assert np.all(pv1 == pv2)
+        assert np.all(dof1 == dof2)
+    assert_raises(ValueError, n2p.mkdofpv, ui, "f", [[400, 123]])
+
+    for i, (nid, dof) in enumerate(ui.iddof):
+        assert ui.row(nid, dof) == i
+    assert_raises(KeyError, ui.row, 999, 1)
+
+    # other routines accept it too:
+    assert np.allclose(n2p.rbgeom_uset(ui), n2p.rbgeom_uset(uset))
+    assert n2p.usetprt(0, ui).equals(n2p.usetprt(0, uset))
+
+
+def test_usetindex_nas():
+    grids = [[11, 123456], [45, 123456], [60, 123456], [1995002, 0]]
+    nas = op2.rdnas2cam("tests/nas2cam_csuper/nas2cam")
+    drm, dof = n2p.formdrm(nas, 101, grids)
+    ulvs = n2p.formulvs(nas, 101)
+    pva = n2p.upasetpv(nas, 101)
+    pvq = n2p.upqsetpv(nas, 0)
+
+    nas["uset"] = {se: n2p.UsetIndex(uset) for se, uset in nas["uset"].items()}
+    drm2, dof2 = n2p.formdrm(nas, 101, grids)
+    assert np.all(drm2 == drm)
+    assert np.all(dof2 == dof)
+    assert np.all(n2p.formulvs(nas, 101) == ulvs)
+    assert np.all(n2p.upasetpv(nas, 101) == pva)
+    assert np.all(n2p.upqsetpv(nas, 0) == pvq)
+
+
 def test_mkcordcardinfo():
     uset = n2p.addgrid(None, 1, "b", 0, [0, 0, 0], 0)
     ci = n2p.mkcordcardinfo(uset)
@@ -1273,6 +1361,50 @@ def test_formrbe3_UM_6():
     assert np.allclose(gmmod, pygm)
 
 
+def test_expanddof():
+    assert np.all(
+        n2p.expanddof([[1, 34], [2, 1], [3, 156]])
+        == [[1, 3], [1, 4], [2, 1], [3, 1], [3, 5], [3, 6]]
+    )
+    assert np.all(n2p.expanddof([[1, 3], [2, 6]]) == [[1, 3], [2, 6]])
+    # invalid DOF, with single and multiple digits:
+    assert_raises(ValueError, n2p.expanddof, [[1, 7]])
+    assert_raises(ValueError, n2p.expanddof, [[1, 2], [2, 9]])
+    assert_raises(ValueError, n2p.expanddof, [[1, 17], [2, 3]])
+
+
+def test_formrbe3_ring():
+    # ring of many independent grids around a center grid:
+    n = 2000
+    th = np.linspace(0.0, 2 * np.pi, n, endpoint=False)
+    xyz = np.column_stack((100 * np.cos(th), 100 * np.sin(th), 0 * th))
+    cylcoord = np.array([[1, 2, 0], [0, 0, 0], [0, 0, 1], [1, 0, 0]])
+    uset = n2p.addgrid(None, np.arange(1, n + 1), "b", 0, xyz, cylcoord)
+    uset = n2p.addgrid(uset, 9999, "b", 0, [0, 0, 0], 0)
+    ind = [[123, 1.0], np.arange(1, n + 1, 2), [123456, 0.5], np.arange(2, n + 1, 2)]
+    rbe3 = n2p.formrbe3(uset, 9999, 123456, ind)
+    assert rbe3.shape == (6, 3 * n // 2 + 6 * n // 2)
+
+    # rigid-body motion of the ring is rigid-body motion of the
+    # center:
+    ipv = n2p.mkdofpv(uset, "p", np.arange(1, n + 1))[0]
+    rb = n2p.rbgeom_uset(uset, 9999)
+    dof = uset.index.get_level_values("dof")[ipv]
+    keep = (dof <= 3) | (uset.index.get_level_values("id")[ipv] % 2 == 0)
+    assert np.allclose(rbe3 @ rb[ipv[keep]], np.eye(6))
+
+    srbe3 = n2p.formrbe3(uset, 9999, 123456, ind, sparse=True)
+    assert sp.isspmatrix_csr(srbe3)
+    assert np.all(srbe3.toarray() == rbe3)
+    assert srbe3.nnz == np.count_nonzero(rbe3)
+
+    um = [2, 123456]
+    assert np.all(
+        n2p.formrbe3(uset, 9999, 123456, ind, um, sparse=True).toarray()
+        == n2p.formrbe3(uset, 9999, 123456, ind, um)
+    )
+
+
 def test_upasetpv():
     nas = op2.rdnas2cam("tests/nas2cam_csuper/nas2cam")
     pv = n2p.upasetpv(nas, 102)
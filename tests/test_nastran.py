@@ -1,5 +1,8 @@
 import numpy as np
 import os
+import tempfile
+import scipy.sparse as sp
+import pandas as pd
 from io import StringIO
 import matplotlib.pyplot as plt
 from pyyeti import nastran
@@ -107,6 +110,52 @@ $ ending comment
     assert sbe == lst
 
 
+def test_rdcards_formats_and_cache():
+    text = (
+        "$ comment\n"
+        "GRID           1       0   1.7-4   2.5+2    3.d1\n"
+        "GRID*                  2               0      1.00000000      2.00000000\n"
+        "*             -3.0000-1               5\n"
+        "grid, 3, 0, 1.e1, , 1.7-4, 0, 123\n"
+        "GRID           4       0      1.      2.      3.       0\n"
+        "+             7       9\n"
+        "GRID           5              1.      2.  string\n"
+    )
+    sbe = np.array(
+        [
+            [1, 0, 1.7e-4, 2.5e2, 3.0e1, 0, 0, 0, 0, 0],
+            [2, 0, 1.0, 2.0, -0.3, 5, 0, 0, 0, 0],
+            [3, 0, 10.0, 0.0, 1.7e-4, 0, 123, 0, 0, 0],
+            [4, 0, 1.0, 2.0, 3.0, 0, 0, 0, 7, 9],
+            [5, 0, 1.0, 2.0, 0.0, 0, 0, 0, 0, 0],
+        ]
+    )
+    cards = nastran.rdcards(StringIO(text), "grid", blank=0)
+    assert np.allclose(cards, sbe)
+
+    lst = nastran.rdcards(StringIO(text), "grid", return_var="list")
+    assert lst[4] == [5, "", 1.0, 2.0, "string"]
+    assert lst[2] == [3, 0, 10.0, "", 1.7e-4, 0, 123]
+
+    f = tempfile.NamedTemporaryFile(mode="w", suffix=".dat", delete=False)
+    try:
+        f.write(text)
+        f.close()
+        nastran.clear_bulk_cache()
+        dct = nastran.rdcards(f.name, "grid", blank=0, return_var="dict")
+        assert os.path.abspath(f.name) in nastran.bulk._BULK_CACHE
+        assert sorted(dct) == [1, 2, 3, 4, 5]
+        assert np.allclose(dct[2], sbe[1, :6])
+        # second call uses the cache and gives the same answer:
+        cards2 = nastran.rdcards(f.name, "grid", blank=0)
+        assert np.all(cards2 == cards)
+        nastran.clear_bulk_cache(f.name)
+        assert os.path.abspath(f.name) not in nastran.bulk._BULK_CACHE
+    finally:
+        os.remove(f.name)
+        nastran.clear_bulk_cache()
+
+
 def test_wtgrids():
     xyz = np.array([[0.1, 0.2, 0.3], [1.1, 1.2, 1.3]])
     with StringIO() as f:
@@ -1059,3 +1108,50 @@ def test_rddmig2():
         "DMIG*   MRANDM                        12               0\n"
         "*                     12               0 6.122600000D+04\n"
     )
+
+
+def test_rddmig_sparse():
+    for fname in (
+        "tests/nastran_dmig_data/matrix_factory.pch",
+        "tests/nastran_dmig_data/matrix.op2",
+    ):
+        for expanded in (False, True):
+            for square in (False, True):
+                dct = nastran.rddmig(fname, expanded=expanded, square=square)
+                sdct = nastran.rddmig(
+                    fname, expanded=expanded, square=square, sparse=True
+                )
+                assert sorted(dct) == sorted(sdct)
+                for key, df in dct.items():
+                    mat, rowindex, colindex = sdct[key]
+                    assert sp.isspmatrix_csc(mat)
+                    assert df.index.equals(rowindex)
+                    assert np.all(np.asarray(df.columns) == np.asarray(colindex))
+                    assert np.all(mat.toarray() == df.values)
+
+    # symmetric matrix with a zero column, written from sparse form:
+    k = nastran.rddmig("tests/nastran_dmig_data/matrix.op2", "mrandm")["mrandm"]
+    symm = np.arange(1, 22)[:, None] * np.arange(1, 22)
+    symm = symm.T @ symm
+    symm[:, 5] = symm[5] = 0
+    k.iloc[:, :] = symm.astype(float)
+    with StringIO() as f:
+        nastran.wtdmig(f, {"k": k})
+        s = f.getvalue()
+    with StringIO() as f:
+        nastran.wtdmig(f, {"k": (sp.csc_matrix(k.values), k.index, k.columns)})
+        s2 = f.getvalue()
+        k2 = nastran.rddmig(f, sparse=True)["k"]
+    assert s == s2
+    assert s.startswith("DMIG    K              0       6       2")
+    assert np.allclose(k2[0].toarray(), k.drop(index=k.index[5], columns=k.columns[5]))
+
+    # 2-column arrays can be used instead of pandas indices:
+    with StringIO() as f:
+        nastran.wtdmig(
+            f, {"k": (k2[0], k2[1].to_frame().values, k2[2].to_frame().values)}
+        )
+        s3 = f.getvalue()
+    with StringIO() as f:
+        nastran.wtdmig(f, {"k": pd.DataFrame(k2[0].toarray(), k2[1], k2[2])})
+        assert f.getvalue() == s3
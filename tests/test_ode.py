@@ -145,6 +145,95 @@ def test_getEPQ_B():
             assert np.allclose(q, qt)
 
 
+def test_getEPQ2_structured():
+    # 2nd order ODE state-space matrices: coupled (dense) and
+    # uncoupled (sparse, diagonal blocks), plus an unstructured one:
+    rng = np.random.RandomState(11)
+    n = 80
+    k = rng.randn(n, n)
+    k = k @ k.T + n * np.eye(n)
+    kd = (np.arange(n) + 1.0) ** 2 * 10.0
+    As = [
+        ode.SolveExp2(np.eye(n), 0.01 * k, k, None)._build_A(),
+        ode.SolveExp2(np.ones(n), 0.02 * np.sqrt(kd), kd, None)._build_A(),
+        rng.randn(2 * n, 2 * n),
+    ]
+    Bs = [(None, True), (None, False), (rng.randn(2 * n, 3), False)]
+    for A in As:
+        for h in (0.001, 0.1):
+            for order in (0, 1):
+                for B, half in Bs:
+                    e, p, q = expmint.getEPQ2(A, h, order=order, B=B, half=half)
+                    # reference via the matrix exponential of the
+                    # augmented matrix:
+                    if B is None:
+                        B = np.eye(2 * n)[:, : n if half else 2 * n]
+                    i = B.shape[1]
+                    N = 2 * n + (order + 1) * i
+                    M = np.zeros((N, N))
+                    M[: 2 * n, : 2 * n] = A * h
+                    M[: 2 * n, 2 * n : 2 * n + i] = B * h
+                    if order == 1:
+                        M[2 * n : 2 * n + i, 2 * n + i :] = np.eye(i)
+                    EM = la.expm(M)[: 2 * n]
+                    assert np.allclose(e, EM[:, : 2 * n])
+                    if order == 1:
+                        assert np.allclose(q, EM[:, 2 * n + i :])
+                        assert np.allclose(p, EM[:, 2 * n : 2 * n + i] - q)
+                    else:
+                        assert np.allclose(p, EM[:, 2 * n :])
+                        assert q == 0.0
+
+
+def test_getEPQ_cache():
+    import os
+    import tempfile
+
+    A = np.random.randn(20, 20)
+    B = np.random.randn(20, 2)
+    h = 0.01
+    ref = [expmint.getEPQ(A, h, order=order, half=True) for order in (0, 1)]
+    with tempfile.TemporaryDirectory() as path:
+        try:
+            cache = expmint.enable_epq_cache(maxsize=2, path=path)
+            for j in range(2):
+                for order in (0, 1):
+                    e, p, q = expmint.getEPQ(A, h, order=order, half=True)
+                    assert np.allclose(e, ref[order][0])
+                    assert np.allclose(p, ref[order][1])
+                    assert np.allclose(q, ref[order][2])
+                    # returned values are copies:
+                    e[:] = 0.0
+            assert cache.misses == 2 and cache.hits == 2
+            assert len(os.listdir(path)) == 2
+
+            # different B, h and order are different entries, LRU
+            # keeps the last 2:
+            expmint.getEPQ(A, h, order=1, B=B)
+            expmint.getEPQ(A, 2 * h, order=1, half=True)
+            assert cache.misses == 4 and len(cache) == 2
+            e, p, q = expmint.getEPQ(A, h, order=0, half=True)
+            assert cache.misses == 4 and cache.disk_hits == 1
+            assert np.allclose(p, ref[0][1]) and q == 0.0
+
+            # ODE solvers use the cache transparently:
+            m = np.ones(10)
+            k = np.arange(1.0, 11.0) ** 2
+            b = 0.1 * np.sqrt(k)
+            ts1 = ode.SolveExp2(m, b, k, h)
+            misses = cache.misses
+            ts2 = ode.SolveExp2(m, b, k, h)
+            assert cache.misses == misses
+            assert np.all(ts1.E_vv == ts2.E_vv)
+            assert np.all(ts1.P == ts2.P)
+
+            cache.clear(disk=True)
+            assert len(cache) == 0 and len(os.listdir(path)) == 0
+        finally:
+            expmint.disable_epq_cache()
+    assert expmint._EPQ_CACHE is None
+
+
 def check_true_derivatives(sol, tol=5e-3):
     d = integrate.cumtrapz(sol.v, sol.t, initial=0, axis=1)
     v = integrate.cumtrapz(sol.a, sol.t, initial=0, axis=1)
@@ -3115,6 +3204,143 @@ def test_ode_solvepsd():
     assert np.allclose(psdduf[2], adpsdduf)
 
 
+def test_freqdirect_coupled_ncpu():
+    from unittest import mock
+
+    rng = np.random.RandomState(7)
+    n = 12
+    k = rng.randn(n, n)
+    k = k @ k.T + n * np.eye(n)
+    m = np.eye(n) + 0.01 * np.ones((n, n))
+    b = 0.02 * k + 0.1 * np.ones((n, n))
+    freq = np.arange(0.1, 5.0, 0.05)
+    f = rng.randn(n, freq.size)
+
+    # reference: solve one frequency at a time
+    d = np.empty((n, freq.size), complex)
+    for i, O in enumerate(2 * np.pi * freq):
+        d[:, i] = la.solve(k + 1j * O * b - O ** 2 * m, f[:, i])
+
+    fs = ode.FreqDirect(m, b, k)
+    for ncpu in (1, 3, None):
+        sol = fs.fsolve(f, freq, ncpu=ncpu)
+        assert np.allclose(sol.d, d)
+        assert np.allclose(sol.a, -((2 * np.pi * freq) ** 2) * d)
+
+    # force many small blocks:
+    with mock.patch("pyyeti.ode.freqdirect._BATCH_MEMORY", 1):
+        sol = fs.fsolve(f, freq, ncpu=4)
+        assert np.allclose(sol.d, d)
+        sol2 = fs.fsolve(f, freq, ncpu=2, chunk=10)
+        assert np.allclose(sol2.d, d)
+
+
+def test_fsolve_chunked():
+    m = np.array([10.0, 30.0, 30.0, 30.0])  # diagonal of mass
+    k = np.array([0.0, 6.0e5, 6.0e5, 6.0e5])  # diagonal of stiffness
+    zeta = np.array([0.0, 0.05, 1.0, 2.0])  # percent damping
+    b = 2.0 * zeta * np.sqrt(k / m) * m  # diagonal of damping
+    bc = np.diag(b)
+    bc[1:, 1:] += 20.0
+    freq = np.arange(0.1, 35.05, 0.1)
+    rng = np.random.RandomState(5)
+    f = rng.randn(4, freq.size)
+    atm = rng.randn(2, 4)
+
+    for fs, kwargs in (
+        (ode.SolveUnc(m, b, k), {}),
+        (ode.SolveUnc(m, b, k, rf=3), dict(rf_disp_only=True)),
+        (ode.SolveUnc(np.diag(m), bc, k), dict(incrb=1)),
+        (ode.SolveCDF(m, b, k), {}),
+        (ode.FreqDirect(m, bc, k), dict(incrb=0)),
+    ):
+        sol = fs.fsolve(f, freq, **kwargs)
+        for opts in (dict(chunk=37), dict(chunk=1000), dict(max_memory=20000)):
+            sol2 = fs.fsolve(f, freq, **opts, **kwargs)
+            assert np.all(sol2.f == freq)
+            for r in "dva":
+                assert np.allclose(getattr(sol2, r), getattr(sol, r))
+
+        pvs = []
+
+        def sink(sol2, pv):
+            assert np.all(sol2.f == freq[pv])
+            pvs.append(pv)
+            return atm @ sol2.a
+
+        out = fs.fsolve(f, freq, chunk=100, sink=sink, **kwargs)
+        assert len(out) == 4
+        assert pvs[-1] == slice(300, freq.size, None)
+        assert np.allclose(np.hstack(out), atm @ sol.a)
+
+    assert_raises(ValueError, fs.fsolve, f[:, :-1], freq, chunk=10)
+
+
+def test_ode_solvepsd_batch_csd():
+    m = np.array([10.0, 30.0, 30.0, 30.0])  # diagonal of mass
+    k = np.array([0.0, 6.0e5, 6.0e5, 6.0e5])  # diagonal of stiffness
+    zeta = np.array([0.0, 0.05, 1.0, 2.0])  # percent damping
+    b = 2.0 * zeta * np.sqrt(k / m) * m  # diagonal of damping
+    freq = np.arange(0.1, 35, 0.1)
+    rng = np.random.RandomState(3)
+    forcepsd = rng.rand(5, freq.size) * 1000
+    t_frc = rng.randn(4, 5)
+    atm = rng.randn(3, 4)
+    vtm = rng.randn(3, 4)
+    dtm = rng.randn(3, 4)
+    ltmf = rng.randn(3, 5)
+    drms = [[atm, None, None, None], [atm, vtm, dtm, ltmf]]
+
+    bc = np.diag(b)
+    bc[1:, 1:] += 20.0
+    # coupled stiffness; uncoupled by `pre_eig`:
+    kc = np.diag(k)
+    kc[1:, 1:] += 1.0e5 * np.array(
+        [[1.0, -1.0, 0.0], [-1.0, 2.0, -1.0], [0.0, -1.0, 1.0]]
+    )
+    for fs, kwargs in (
+        (ode.SolveUnc(m, b, k), dict(rbduf=1.2, elduf=1.5)),
+        (ode.SolveUnc(m, b, k, rf=3), dict(incrb=1)),
+        (ode.SolveUnc(m, bc, k), {}),
+        (ode.SolveUnc(m, 0.01 * kc, kc, pre_eig=True), {}),
+        (ode.SolveUnc(m, 0.01 * kc, kc, pre_eig=True, rf=[3]), {}),
+        (ode.FreqDirect(m, bc, k), dict(rbduf=1.2, elduf=1.5)),
+    ):
+        rms, psd = ode.solvepsd(fs, forcepsd, t_frc, freq, drms, **kwargs)
+        for batch in (True, 2):
+            rms2, psd2 = ode.solvepsd(
+                fs, forcepsd, t_frc, freq, drms, batch=batch, **kwargs
+            )
+            for j in range(2):
+                assert np.allclose(rms2[j], rms[j])
+                assert np.allclose(psd2[j], psd[j])
+
+        # uncorrelated forces as a diagonal csd matrix:
+        csd = np.zeros((5, 5, freq.size))
+        csd[np.arange(5), np.arange(5)] = forcepsd
+        for batch in (False, True, 2):
+            rms2, psd2 = ode.solvepsd(fs, csd, t_frc, freq, drms, batch=batch, **kwargs)
+            for j in range(2):
+                assert np.allclose(rms2[j], rms[j])
+                assert np.allclose(psd2[j], psd[j])
+
+    # full csd matrix; compare to H @ csd @ H^H at each frequency:
+    fs = ode.SolveUnc(m, b, k)
+    a = rng.randn(5, 5, freq.size) + 1j * rng.randn(5, 5, freq.size)
+    csd = np.einsum("ikf,jkf->ijf", a, a.conj())
+    rms, psd = ode.solvepsd(fs, csd, t_frc, freq, drms, batch=2)
+    H = np.zeros((3, 5, freq.size), complex)
+    for i in range(5):
+        sol = fs.fsolve(t_frc[:, i : i + 1] @ np.ones((1, freq.size)), freq)
+        H[:, i] = atm @ sol.a + vtm @ sol.v + dtm @ sol.d + ltmf[:, i : i + 1]
+    for f in range(freq.size):
+        psdf = H[:, :, f] @ csd[:, :, f] @ H[:, :, f].conj().T
+        assert np.allclose(psd[1][:, f], np.diag(psdf).real)
+    assert_raises(
+        ValueError, ode.solvepsd, fs, csd[:, :4], t_frc, freq, drms, batch=True
+    )
+
+
 def test_ode_solvepsd_rf_disp_only():
     # uncoupled equations
     m = np.array([10.0, 30.0, 30.0, 30.0])  # diagonal of mass
@@ -5699,3 +5925,138 @@ def test_ode_pre_eig_diagdamp():
         assert np.allclose(sol.a, solu.a, atol=1e-6)
         assert np.allclose(sol.v, solu.v)
         assert np.allclose(sol.d, solu.d)
+
+
+def test_solveunc_engine():
+    import contextlib
+    from unittest import mock
+    from pyyeti.ode import solveunc
+
+    np.random.seed(1)
+    n = 12
+    h = 0.001
+    nt = 500
+    m = np.random.rand(n) + 1.0
+    k = np.random.rand(n) * 1e5 + 1e3
+    k[:2] = 0.0
+    b = 2 * 0.05 * np.sqrt(k * m)
+    f = np.random.randn(n, nt)
+    d0 = np.random.randn(n)
+    v0 = np.random.randn(n)
+    bc = np.diag(b) + 0.2 * np.random.randn(n, n)
+
+    # run the kernels as plain Python too so they are exercised with
+    # or without numba:
+    kernels = {}
+    for name in ("_real_unc_kernel", "_real_unc_cdforces_kernel"):
+        func = getattr(solveunc, name)
+        kernels[name] = getattr(func, "py_func", func)
+    python_kernels = mock.patch.multiple(solveunc, _HAVE_NUMBA=True, **kernels)
+
+    for context in (contextlib.nullcontext(), python_kernels):
+        if not solveunc._HAVE_NUMBA and context is not python_kernels:
+            continue
+        with context:
+            for order in (0, 1):
+                # rf in the middle so kdof is an index vector:
+                for rf in (None, [4, 7]):
+                    ts = ode.SolveUnc(m, b, k, h, rf=rf, order=order)
+                    tsn = ode.SolveUnc(m, b, k, h, rf=rf, order=order, engine="numba")
+                    assert tsn.engine == "numba"
+                    sol = ts.tsolve(f, d0, v0)
+                    soln = tsn.tsolve(f, d0, v0)
+                    for attr in ("d", "v", "a"):
+                        assert np.all(getattr(sol, attr) == getattr(soln, attr))
+
+                    ts = ode.SolveCDF(m, bc, k, h, rf=rf, order=order)
+                    tsn = ode.SolveCDF(m, bc, k, h, rf=rf, order=order, engine="numba")
+                    sol = ts.tsolve(f, d0, v0)
+                    soln = tsn.tsolve(f, d0, v0)
+                    for attr in ("d", "v", "a"):
+                        assert np.allclose(getattr(sol, attr), getattr(soln, attr))
+
+    # without numba, the 'python' engine is used:
+    with mock.patch.object(solveunc, "_HAVE_NUMBA", False):
+        with assert_warns(RuntimeWarning):
+            tsn = ode.SolveUnc(m, b, k, h, engine="numba")
+        assert tsn.engine == "python"
+
+    assert_raises(ValueError, ode.SolveUnc, m, b, k, h, engine="bad")
+
+
+def _check_batch(ts, f, d0=None, v0=None, **kwargs):
+    sol = ts.tsolve_batch(f, d0, v0, **kwargs)
+    assert sol.d.shape == f.shape
+    for c in range(f.shape[0]):
+        d0c = d0 if d0 is None or d0.ndim == 1 else d0[c]
+        v0c = v0 if v0 is None or v0.ndim == 1 else v0[c]
+        solc = ts.tsolve(f[c], d0c, v0c, **kwargs)
+        for attr in ("d", "v", "a"):
+            assert np.allclose(getattr(sol, attr)[c], getattr(solc, attr))
+    assert np.allclose(sol.t, solc.t)
+
+
+def test_tsolve_batch():
+    np.random.seed(7)
+    n = 8
+    nc = 3
+    h = 0.001
+    m = np.random.rand(n) + 1.0
+    k = np.random.rand(n) * 1e5 + 1e3
+    k[:2] = 0.0
+    b = 2 * 0.05 * np.sqrt(k * m)
+    bc = np.diag(b) + 0.2 * np.random.randn(n, n)
+    f = np.random.randn(nc, n, 60)
+    d0 = np.random.randn(nc, n)
+    v0 = np.random.randn(n)
+    for rf in (None, [4, 6]):
+        for order in (0, 1):
+            for ts in (
+                ode.SolveUnc(m, b, k, h, rf=rf, order=order),
+                ode.SolveUnc(m, b, k, h, rf=rf, order=order, engine="numba"),
+                ode.SolveUnc(m, bc, k, h, rf=rf, order=order),
+                ode.SolveCDF(m, bc, k, h, rf=rf, order=order),
+                ode.SolveExp2(m, b, k, h, rf=rf, order=order),
+                ode.SolveExp2(np.diag(m), bc, np.diag(k), h, rf=rf, order=order),
+            ):
+                _check_batch(ts, f)
+                _check_batch(ts, f, static_ic=True)
+                _check_batch(ts, f, d0, v0)
+        for ts in (
+            ode.SolveNewmark(m, b, k, h, rf=rf),
+            ode.SolveNewmark(np.diag(m), bc, np.diag(k), h, rf=rf),
+        ):
+            _check_batch(ts, f)
+            _check_batch(ts, f, d0, v0)
+
+    ts = ode.SolveUnc(np.diag(m), bc, np.diag(k), h, pre_eig=True)
+    _check_batch(ts, f)
+
+    assert_raises(ValueError, ts.tsolve_batch, f[0])
+    assert_raises(ValueError, ts.tsolve_batch, f, d0[:2])
+
+    ts = ode.SolveNewmark(m, b, k, h)
+    ts.def_nonlin({"nl": (lambda d, j, h: d[:2, j], np.ones((n, 2)))})
+    assert_raises(NotImplementedError, ts.tsolve_batch, f)
+
+
+def test_fsolve_batch():
+    np.random.seed(8)
+    n = 6
+    m = np.random.rand(n) + 1.0
+    k = np.random.rand(n) * 1e5 + 1e3
+    k[0] = 0.0
+    b = 2 * 0.05 * np.sqrt(k * m)
+    freq = np.arange(0.5, 40.0, 0.5)
+    f = np.random.randn(4, n, freq.size)
+    for ts in (
+        ode.SolveUnc(m, b, k, rf=5),
+        ode.FreqDirect(m, b, k, rf=5),
+        ode.FreqDirect(np.diag(m), np.diag(b) + 1.0, np.diag(k)),
+    ):
+        sol = ts.fsolve_batch(f, freq, incrb=1)
+        assert np.all(sol.f == freq)
+        for c in range(f.shape[0]):
+            solc = ts.fsolve(f[c], freq, incrb=1)
+            for attr in ("d", "v", "a"):
+                assert np.allclose(getattr(sol, attr)[c], getattr(solc, attr))
@@ -462,3 +462,115 @@ def test_rdop2emap():
         o2._rowsCutoff = 0
         nas2 = o2.rdn2cop2()
         compdict(nas1, nas2)
+
+
+def test_index_cache():
+    import os
+    import shutil
+    import tempfile
+    from unittest import mock
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        fname = os.path.join(tempdir, "inboard.op2")
+        shutil.copy("tests/nas2cam_extseout/inboard.op2", fname)
+        idxfile = fname + ".pyyeti.idx"
+        # the index cache is opt-in:
+        with op2.OP2(fname) as o2:
+            ref = o2.directory(verbose=False)
+        op2.rdmats(fname, ["mug1"])
+        assert not os.path.exists(idxfile)
+
+        def _check(o2):
+            d = o2.directory(verbose=False)
+            assert d[0] == ref[0]
+            assert d[1] == ref[1]
+            assert np.all(d[2] == ref[2])
+            assert np.all(d[3] == ref[3])
+            assert d[4] == ref[4]
+
+        with op2.OP2(fname, index_cache=True) as o2:
+            _check(o2)
+        assert os.path.exists(idxfile)
+
+        # second open must not scan the file:
+        with mock.patch.object(op2.OP2, "rdop2nt", side_effect=RuntimeError):
+            with op2.OP2(fname, index_cache=True) as o2:
+                _check(o2)
+        with op2.OP2(fname, index_cache=True) as o2:
+            tload = o2.rdop2tload()
+        with op2.OP2(fname) as o2:
+            assert np.all(tload == o2.rdop2tload())
+
+        # stale index (changed mtime) triggers rescan:
+        st = os.stat(fname)
+        os.utime(fname, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        with mock.patch.object(op2.OP2, "rdop2nt", side_effect=RuntimeError):
+            assert_raises(RuntimeError, op2.OP2, fname, index_cache=True)
+        with op2.OP2(fname, index_cache=True) as o2:
+            _check(o2)
+
+        # corrupt index is ignored and rewritten:
+        with open(idxfile, "w") as f:
+            f.write("not json")
+        with op2.OP2(fname, index_cache=True) as o2:
+            _check(o2)
+        with mock.patch.object(op2.OP2, "rdop2nt", side_effect=RuntimeError):
+            with op2.OP2(fname, index_cache=True) as o2:
+                _check(o2)
+
+        # the module-level readers pass the option through:
+        os.remove(idxfile)
+        mats = op2.rdmats(fname, index_cache=True)
+        assert os.path.exists(idxfile)
+        assert mats.keys() == op2.rdmats(fname).keys()
+
+
+def _assert_same(a, b):
+    if isinstance(a, dict):
+        assert sorted(a) == sorted(b)
+        for k in a:
+            _assert_same(a[k], b[k])
+    elif isinstance(a, (list, tuple)):
+        assert len(a) == len(b)
+        for x, y in zip(a, b):
+            _assert_same(x, y)
+    elif isinstance(a, np.ndarray):
+        assert a.dtype == b.dtype
+        assert np.array_equal(a, b)
+    elif hasattr(a, "equals"):  # pandas
+        assert a.equals(b)
+    else:
+        assert a == b
+
+
+def test_mmap_reading():
+    from unittest import mock
+
+    dr = "tests/nastran_op2_data/"
+    files = [
+        dr + name
+        for name in ("double_le.op2", "double_be.op2", "single_le.op2", "single_be.op2")
+    ]
+    files += ["tests/nas2cam_extseout/inboard.op2", "tests/nas2cam_csuper/nas2cam.op2"]
+    for fname in files:
+        with op2.OP2(fname) as o2:
+            assert o2._getmm() is not None
+            mats = o2.rdop2mats()
+            pos = o2.file_handle().tell()
+        with mock.patch.object(op2.OP2, "_use_mmap", False):
+            with op2.OP2(fname) as o2:
+                assert o2._getmm() is None
+                mats2 = o2.rdop2mats()
+                assert pos == o2.file_handle().tell()
+        _assert_same(mats, mats2)
+
+    for fname in ("tests/nas2cam_extseout/inboard.op2",):
+        post = op2.rdpostop2(fname, 1, 1, 1, 1)
+        with mock.patch.object(op2.OP2, "_use_mmap", False):
+            post2 = op2.rdpostop2(fname, 1, 1, 1, 1)
+        _assert_same(post, post2)
+
+    dsorted = op2.procdrm12("tests/nastran_drm12/drm12", dosort=True)
+    with mock.patch.object(op2.OP2, "_use_mmap", False):
+        dsorted2 = op2.procdrm12("tests/nastran_drm12/drm12", dosort=True)
+    _assert_same(dsorted, dsorted2)
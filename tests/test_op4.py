@@ -606,3 +606,99 @@ def test_premature_eof_warning():
         os.remove(fname)
 
     assert (a2["a"] == a).all()
+
+
+def test_lazyload():
+    import warnings
+
+    filenames = glob("tests/nastran_op4_data/*.op4") + glob(
+        "tests/nastran_op4_data/*.other"
+    )
+    o4 = op4.OP4()
+    nbinary = 0
+    for filename in filenames:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            try:
+                lazy = o4.lazyload(filename)
+            except ValueError:
+                o4._op4open_read(filename)
+                assert o4._ascii
+                o4._op4close()
+                continue
+            dct = o4.dctload(filename)
+        nbinary += 1
+        assert list(lazy) == list(dct)
+        for nm, (mat, form, mtype) in dct.items():
+            lz = lazy[nm]
+            assert lz.shape == mat.shape
+            assert lz.form == form and lz.mtype == mtype
+            assert lz.dtype == mat.dtype
+            assert np.all(lz.toarray() == mat)
+            assert np.all(np.asarray(lz) == mat)
+            assert np.all(lz[:] == mat)
+            assert np.all(lz[:, 1:] == mat[:, 1:])
+            assert np.all(lz[-1:0:-1, ::2] == mat[-1:0:-1, ::2])
+            if mat.shape[0] > 1 and mat.shape[1] > 2:
+                assert np.all(lz[:, [2, 0]] == mat[:, [2, 0]])
+                assert np.all(lz[:, [2, 2, 0, 2]] == mat[:, [2, 2, 0, 2]])
+                assert np.all(lz[1, 2] == mat[1, 2])
+                assert np.all(lz[:, 1] == mat[:, 1])
+            assert np.all(lz.tosparse().toarray() == mat)
+    assert nbinary > 20
+
+    # sparse and zero columns; namelist:
+    a = sp.random(70, 40, density=0.05, format="csc", random_state=3)
+    a[:, 5] = 0.0
+    b = np.zeros((4, 6))
+    b[:, 2] = 1.0
+    with tempfile.TemporaryDirectory() as tempdir:
+        f = os.path.join(tempdir, "lazy.op4")
+        for sparse in ("bigmat", "nonbigmat", "dense"):
+            op4.write(f, dict(a=a, b=b, c=1j * b), sparse=sparse)
+            lazy = op4.lazyload(f, ["a", "c"])
+            assert list(lazy) == ["a", "c"]
+            assert np.all(lazy["a"][:, 3:9] == a.toarray()[:, 3:9])
+            pv = [7, 5, 7, 39, 5, 7]
+            assert np.all(lazy["a"][:, pv] == a.toarray()[:, pv])
+            assert np.all(lazy["c"].toarray() == 1j * b)
+            assert abs(lazy["a"].tosparse() - a).max() == 0.0
+            assert_raises(IndexError, lazy["a"].__getitem__, (1, 2, 3))
+            del lazy
+
+
+def test_wtop4_ncpu():
+    rng = np.random.default_rng(3)
+    a = rng.standard_normal((50, 40))
+    a[abs(a) < 1.0] = 0.0
+    a[:, 5] = 0.0
+    names = ["a", "ac", "z", "s", "sc", "a"]
+    mats = [
+        a,
+        a + 1j * a[::-1],
+        np.zeros((4, 3)),
+        sp.random(300, 60, density=0.05, random_state=1, format="csc"),
+        sp.random(30, 60, density=0.1, random_state=2, format="csr") * (1 - 2j),
+        a.T,
+    ]
+    with tempfile.TemporaryDirectory() as tempdir:
+        f1 = os.path.join(tempdir, "one.op4")
+        f2 = os.path.join(tempdir, "two.op4")
+        for sparse in ("auto", "dense", "bigmat", "nonbigmat"):
+            for endian in ("", ">"):
+                o4 = op4.OP4()
+                o4.write(f1, names, mats, sparse=sparse, endian=endian)
+                o4.write(f2, names, mats, sparse=sparse, endian=endian, ncpu=3)
+                with open(f1, "rb") as fa, open(f2, "rb") as fb:
+                    assert fa.read() == fb.read()
+                # encode in many small blocks of columns:
+                o4._encode_block = 7
+                o4.write(f2, names, mats, sparse=sparse, endian=endian, ncpu=2)
+                with open(f1, "rb") as fa, open(f2, "rb") as fb:
+                    assert fa.read() == fb.read()
+                data = op4.load(f2, into="list")
+                assert data[0] == names
+                for m, m2 in zip(mats, data[1]):
+                    if sp.issparse(m):
+                        m = m.toarray()
+                    assert np.all(m == m2)
@@ -294,3 +294,26 @@ def test_psdmod():
     assert np.allclose(p5, np.max(pmap, axis=1))
     tshouldbe = np.arange(0.5, 30.0 - 0.25, 0.5)
     assert np.allclose(t, tshouldbe)
+
+
+def test_psdmod_incremental():
+    TF = 30
+    spec = [[20, 50], [1, 1]]
+    sig, sr = psd.psd2time(
+        spec, ppc=10, fstart=20, fstop=50, df=1 / TF, winends=dict(portion=10)
+    )
+    for ts, ov in ((4, 0.5), (2, 0.75), ("1000", "500")):
+        res = psd.psdmod(sig, sr, nperseg=100, timeslice=ts, tsoverlap=ov, getmap=1)
+        res2 = psd.psdmod(
+            sig, sr, nperseg=100, timeslice=ts, tsoverlap=ov, getmap=1, incremental=1
+        )
+        for r, r2 in zip(res, res2):
+            assert np.allclose(r, r2)
+
+    # slice step of 375 is not a multiple of segment step of 50:
+    assert_raises(
+        ValueError, psd.psdmod, sig, sr, nperseg=100, timeslice="750", incremental=1
+    )
+    assert_raises(
+        ValueError, psd.psdmod, sig, sr, nperseg=100, average="median", incremental=1
+    )
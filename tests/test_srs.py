@@ -1176,6 +1176,44 @@ def test_srsmap():
     assert np.allclose(sh, mp[:, seg])
 
 
+def test_srsmap_incremental():
+    from pyyeti import ytools
+
+    sig, ts, fs = ytools.gensweep(20, 1, 50, 4)
+    sr = 1 / ts[1]
+    frq = np.arange(1.0, 50.1)
+    Q = 20
+    mp, t, f = srs.srsmap(2, 0.5, sig, sr, frq, Q, incremental=True)
+    mp0, t0, f0 = srs.srsmap(2, 0.5, sig, sr, frq, Q, 0.02)
+    assert np.all(f == frq)
+    assert np.allclose(t, t0)
+
+    # each column is peak of the continuous response in the window:
+    sh, resp = srs.srs(sig, sr, frq, Q, getresp=True, ppc=1)
+    hist = abs(resp["hist"][:, 0, :])
+    n = int(2 * sr)
+    for seg in (0, 17, len(t) - 1):
+        i = seg * n // 2
+        assert np.allclose(mp[:, seg], hist[i : i + n].max(axis=0))
+
+    # chunking and engine do not change the answer:
+    mp2 = srs.srsmap(2, 0.5, sig, sr, frq, Q, incremental=True, engine="batch")[0]
+    assert np.allclose(mp2, mp)
+    chunk = srs._MAP_CHUNK_SIZE
+    try:
+        srs._MAP_CHUNK_SIZE = 1000
+        mp3 = srs.srsmap(2, 0.5, sig, sr, frq, Q, incremental=True, peak="rms")[0]
+    finally:
+        srs._MAP_CHUNK_SIZE = chunk
+    mp4 = srs.srsmap(2, 0.5, sig, sr, frq, Q, incremental=True, peak="rms")[0]
+    assert np.allclose(mp3, mp4)
+
+    assert_raises(ValueError, srs.srsmap, 2, 0.5, sig, sr, frq, Q, 0.02, True)
+    assert_raises(
+        ValueError, srs.srsmap, 2, 0.5, sig, sr, frq, Q, incremental=True, peak=max
+    )
+
+
 def test_zerofreq():
     dt = 0.01
     n = 700
@@ -1204,3 +1242,190 @@ def test_zerofreq():
         sh, resp = srs.srs(f, 1 / dt, frq, 25, stype=stype, getresp=True)
         np.allclose(sh, 0.0)
         np.allclose(resp["hist"], 0.0)
+
+
+def test_srs_batch_engine():
+    rng = np.random.RandomState(4)
+    sr = 500.0
+    sig = rng.randn(1500, 3)
+    frq = np.hstack((0.0, np.linspace(2.0, 60.0, 30)))
+    Q = 15
+    for stype in ["absacce", "relacce", "reldisp", "relvelo", "pvelo", "pacce"]:
+        for ic in ["zero", "shift", "mshift", "steady"]:
+            for time in ["primary", "total", "residual"]:
+                for peak in ["abs", "pos", "neg", "poss", "negs", "rms"]:
+                    kw = dict(stype=stype, ic=ic, time=time, peak=peak)
+                    sh = srs.srs(sig, sr, frq, Q, parallel="no", **kw)
+                    sh2 = srs.srs(sig, sr, frq, Q, engine="batch", **kw)
+                    assert np.allclose(sh, sh2)
+                sh, resp = srs.srs(
+                    sig[:, 0], sr, frq, Q, getresp=True, parallel="no", **kw
+                )
+                sh2, resp2 = srs.srs(
+                    sig[:, 0], sr, frq, Q, getresp=True, engine="batch", **kw
+                )
+                assert sh2.shape == sh.shape
+                assert np.allclose(sh, sh2)
+                assert np.all(resp["t"] == resp2["t"])
+                assert np.allclose(resp["hist"], resp2["hist"])
+
+    # user-defined peak function:
+    def avg(resp):
+        return resp.mean(axis=0)
+
+    sh = srs.srs(sig, sr, frq, Q, peak=avg, parallel="no")
+    sh2 = srs.srs(sig, sr, frq, Q, peak=avg, engine="batch")
+    assert np.allclose(sh, sh2)
+    assert_raises(ValueError, srs.srs, sig, sr, frq, Q, engine="fast")
+
+
+def test_srs_batch_kernels():
+    # exercise the batch kernels directly, with or without numba:
+    from unittest import mock
+
+    rng = np.random.RandomState(6)
+    sr = 400.0
+    sig = rng.randn(300, 2)
+    frq = np.hstack((0.0, np.linspace(2.0, 60.0, 12)))
+    Q = 10
+    wn = 2 * np.pi * frq
+    S = 40
+    for stype in ["absacce", "relvelo", "reldisp"]:
+        coeffunc = getattr(srs, stype)
+        b, a = srs._batch_coefs(coeffunc, Q, 1 / sr, wn)
+        off = rng.randn(2, len(frq))
+        ref = np.empty((sig.shape[0], 2, len(frq)))
+        for j in range(len(frq)):
+            ref[:, :, j] = signal.lfilter(b[j], a[j], sig, axis=0) + off[:, j]
+        for hist_block, peak_block in (
+            (srs._srs_hist_block, srs._srs_peak_block),
+            (srs._srs_hist_block_np, srs._srs_peak_block_np),
+        ):
+            hist = np.empty((sig.shape[0] - S, 2, len(frq)))
+            zi = np.zeros((2, 2, len(frq)))
+            hist_block(sig, b, a, off, S, zi[0], zi[1], hist)
+            assert np.allclose(hist, ref[S:])
+            mx = np.full((2, len(frq)), -np.inf)
+            mn = np.full((2, len(frq)), np.inf)
+            ssq = np.zeros((2, len(frq)))
+            zi = np.zeros((2, 2, len(frq)))
+            peak_block(sig, b, a, off, S, zi[0], zi[1], mx, mn, ssq)
+            assert np.allclose(mx, ref[S:].max(axis=0))
+            assert np.allclose(mn, ref[S:].min(axis=0))
+            assert np.allclose(ssq, (ref[S:] ** 2).sum(axis=0))
+
+    # the srs routines with the non-numba kernels:
+    with mock.patch.multiple(
+        srs,
+        _batch_hist_block=srs._srs_hist_block_np,
+        _batch_peak_block=srs._srs_peak_block_np,
+    ):
+        for kw in (
+            dict(),
+            dict(stype="reldisp", ic="steady", peak="rms", time="residual"),
+            dict(stype="relvelo", ic="shift", peak=lambda r: r.mean(axis=0)),
+        ):
+            sh = srs.srs(sig, sr, frq, Q, parallel="no", **kw)
+            sh2 = srs.srs(sig, sr, frq, Q, engine="batch", **kw)
+            assert np.allclose(sh, sh2)
+        sh, resp = srs.srs(sig[:, 0], sr, frq, Q, getresp=True, parallel="no")
+        sh2, resp2 = srs.srs(sig[:, 0], sr, frq, Q, getresp=True, engine="batch")
+        assert np.allclose(sh, sh2)
+        assert np.allclose(resp["hist"], resp2["hist"])
+        blocks = [sig[:100], sig[100:250], sig[250:]]
+        sh = srs.srs_stream(blocks, sr, frq, Q)
+        sh2 = srs.srs_stream(blocks, sr, frq, Q, engine="batch")
+        assert np.allclose(sh, sh2)
+
+
+def test_srs_executor():
+    rng = np.random.RandomState(5)
+    sr = 400.0
+    sig = rng.randn(900, 2)
+    frq = np.linspace(2.0, 40.0, 17)
+    Q = 20
+    with srs.SharedExecutor(ncpu=2) as ex:
+        assert ex.ncpu == 2
+        for engine in ["lfilter", "batch"]:
+            for kw in [
+                dict(),
+                dict(ic="steady", stype="reldisp", peak="rms"),
+                dict(time="residual", stype="pvelo", ic="steady"),
+            ]:
+                sh = srs.srs(sig, sr, frq, Q, parallel="no", **kw)
+                sh2 = srs.srs(sig, sr, frq, Q, engine=engine, executor=ex, **kw)
+                assert np.allclose(sh, sh2)
+
+            # getresp and 1d signals work with the executor too:
+            sh, resp = srs.srs(sig[:, 0], sr, frq, Q, parallel="no", getresp=True)
+            sh2, resp2 = srs.srs(
+                sig[:, 0], sr, frq, Q, getresp=True, engine=engine, executor=ex
+            )
+            assert sh2.shape == sh.shape
+            assert np.allclose(sh, sh2)
+            assert np.allclose(resp["hist"], resp2["hist"])
+
+        # srsmap passes executor on to srs:
+        mp, t, f = srs.srsmap(1.0, 0.5, sig[:, 0], sr, frq, Q)
+        mp2, t2, f2 = srs.srsmap(1.0, 0.5, sig[:, 0], sr, frq, Q, executor=ex)
+        assert np.allclose(mp, mp2)
+
+        # vrs:
+        spec = np.array([[20, 0.0053], [150, 0.04], [600, 0.04], [2000, 0.0036]])
+        frq = np.arange(20, 2000, 2.0)
+        fn = [100, 200, 1000]
+        v, m, resp = srs.vrs(spec, frq, 10, linear=False, Fn=fn, getresp=True)
+        v2, m2, resp2 = srs.vrs(
+            spec, frq, 10, linear=False, Fn=fn, getresp=True, executor=ex
+        )
+        assert np.allclose(v, v2)
+        assert np.allclose(m, m2)
+        assert np.allclose(resp["psd"], resp2["psd"])
+        v2 = srs.vrs((spec[:, 0], spec[:, 1]), frq, 10, linear=False, executor=ex)
+        v = srs.vrs((spec[:, 0], spec[:, 1]), frq, 10, linear=False)
+        assert v2.shape == v.shape
+        assert np.allclose(v, v2)
+
+
+def test_srs_stream():
+    rng = np.random.RandomState(6)
+    sr = 500.0
+    sig = rng.randn(2300, 3) + 0.5
+    frq = np.hstack((0.0, np.linspace(2.0, 40.0, 20)))
+    Q = 15
+    edges = [0, 1, 700, 701, 1500, 2300]
+
+    def blocks(sig):
+        for i, j in zip(edges[:-1], edges[1:]):
+            yield sig[i:j]
+
+    for engine in ["lfilter", "batch"]:
+        for stype in ["absacce", "relacce", "reldisp", "relvelo", "pvelo", "pacce"]:
+            for ic in ["zero", "shift", "steady"]:
+                for time in ["primary", "total", "residual"]:
+                    for peak in ["abs", "pos", "neg", "poss", "negs", "rms"]:
+                        kw = dict(stype=stype, ic=ic, time=time, peak=peak)
+                        sh = srs.srs(sig, sr, frq, Q, rolloff="none", **kw)
+                        sh2 = srs.srs_stream(
+                            blocks(sig), sr, frq, Q, engine=engine, **kw
+                        )
+                        assert np.allclose(sh, sh2)
+
+        sh = srs.srs(sig[:, 0], sr, frq, Q, rolloff="none", eqsine=True)
+        sh2 = srs.srs_stream(blocks(sig[:, 0]), sr, frq, Q, eqsine=True, engine=engine)
+        assert sh2.shape == sh.shape
+        assert np.allclose(sh, sh2)
+
+    assert_raises(ValueError, srs.srs_stream, blocks(sig), sr, frq, Q, ic="mshift")
+    assert_raises(ValueError, srs.srs_stream, blocks(sig), sr, frq, Q, peak=np.max)
+    assert_raises(ValueError, srs.srs_stream, [], sr, frq, Q)
+    assert_raises(ValueError, srs.srs_stream, [sig[:0], sig[:0]], sr, frq, Q)
+
+    # empty blocks are skipped, even at the start:
+    sh = srs.srs(sig, sr, frq, Q, rolloff="none", ic="steady")
+    blks = [sig[:0], sig[:0], sig[:900], sig[900:900], sig[900:]]
+    sh2 = srs.srs_stream(blks, sr, frq, Q, ic="steady")
+    assert np.allclose(sh, sh2)
+    sh2 = srs.srs_stream([[], sig[:, 0]], sr, frq, Q, ic="steady")
+    assert np.allclose(sh[:, 0], sh2)
+    assert_warns(RuntimeWarning, srs.srs_stream, blocks(sig), sr, [100.0], Q)